@@ -1,38 +1,60 @@
 """Main LangGraph workflow for EASI Bot consultant system."""
 
+from typing import get_args
+
+from langchain_core.runnables import RunnableLambda
 from langgraph.checkpoint.memory import MemorySaver
-from langgraph.graph import END, StateGraph
+from langgraph.graph import END, START, StateGraph
+from langgraph.types import Send
 
-from easibot.agents import (
-    AppRationalizationSpecialist,
-    BCDRSpecialist,
-    ResearchSpecialist,
-    SupervisorAgent,
-)
-from easibot.graph.state import ConsultantState
+from easibot.agents import SpecialistRegistry, create_default_registry
+from easibot.config import settings
+from easibot.graph.state import ConsultantState, SpecialistType
+from easibot.nodes.prefetch import ResearchPrefetcher
 
 
-def create_consultant_graph():
+def create_consultant_graph(
+    *,
+    prefetch_research: bool | None = None,
+    registry: SpecialistRegistry | None = None,
+):
     """Create the multi-agent consultant workflow graph.
 
+    Every registered specialist becomes a node, but agents and their Bedrock
+    clients are only constructed the first time a node runs. Nodes support
+    both ``graph.invoke`` and ``graph.ainvoke``; the async path awaits Bedrock
+    calls instead of holding a thread per request.
+
+    Args:
+        prefetch_research: Search the knowledge base concurrently with routing
+            (defaults to settings.prefetch_research)
+        registry: Specialist registry (defaults to built-ins plus plugins)
+
     Returns:
         Compiled LangGraph workflow
 
     """
-    # Initialize agents
-    supervisor = SupervisorAgent()
-    research = ResearchSpecialist()
-    app_rat = AppRationalizationSpecialist()
-    bcdr = BCDRSpecialist()
+    # Register agents; nothing is constructed until first routed to
+    if registry is None:
+        registry = create_default_registry()
+
+    deliverable_specialists = registry.deliverable_names()
+    registry.configure(
+        "supervisor",
+        parallel_specialists=deliverable_specialists,
+        extra_specialists={
+            name: registry.spec(name).description
+            for name in registry.names()
+            if name not in get_args(SpecialistType)
+        },
+    )
 
     # Create graph
     workflow = StateGraph(ConsultantState)
 
     # Add nodes
-    workflow.add_node("supervisor", supervisor.route)
-    workflow.add_node("research", research.research)
-    workflow.add_node("app_rationalization", app_rat.work)
-    workflow.add_node("bcdr", bcdr.work)
+    for name in registry.names():
+        workflow.add_node(name, registry.node(name))
 
     # Add conditional routing from supervisor
     def route_to_specialist(state: ConsultantState) -> str:
@@ -42,36 +64,59 @@ def create_consultant_graph():
             return "supervisor"  # Loop back to supervisor
         return next_specialist if next_specialist else "END"
 
+    def dispatch_from_supervisor(state: ConsultantState) -> str | list[Send]:
+        """Fan out to several specialists at once, or route to a single one.
+
+        Parallel specialists run in the same step, so wall-clock time is that of
+        the slowest one; their messages and deliverables merge via the state's
+        add reducers.
+        """
+        parallel = state.get("next_specialists") or []
+        if len(parallel) > 1:
+            return [Send(specialist, state) for specialist in parallel]
+        return route_to_specialist(state)
+
     # Set entry point
     workflow.set_entry_point("supervisor")
 
+    # Optionally start retrieval from START so it overlaps the routing call
+    if prefetch_research is None:
+        prefetch_research = settings.prefetch_research
+    if prefetch_research:
+        prefetcher = ResearchPrefetcher(
+            lambda query, offerings: registry.get("research").retrieve(
+                query, offerings
+            ),
+            aretrieve=lambda query, offerings: registry.get("research").aretrieve(
+                query, offerings
+            ),
+        )
+        workflow.add_node(
+            "prefetch",
+            RunnableLambda(
+                prefetcher.prefetch, afunc=prefetcher.aprefetch, name="prefetch"
+            ),
+        )
+        workflow.add_edge(START, "prefetch")
+
     # Add edges from supervisor to specialists
     workflow.add_conditional_edges(
         "supervisor",
-        route_to_specialist,
-        {
-            "research": "research",
-            "app_rationalization": "app_rationalization",
-            "bcdr": "bcdr",
-            "supervisor": "supervisor",
-            "END": END,
-        },
+        dispatch_from_supervisor,
+        {name: name for name in registry.names()} | {"END": END},
     )
 
-    # Add edges from specialists back to supervisor for potential re-routing
+    # Add edges from research back to supervisor for potential re-routing
     workflow.add_conditional_edges(
         "research",
         route_to_specialist,
-        {
-            "supervisor": "supervisor",
-            "app_rationalization": "app_rationalization",
-            "bcdr": "bcdr",
-            "END": END,
-        },
+        {name: name for name in ("supervisor", *deliverable_specialists)}
+        | {"END": END},
     )
 
-    workflow.add_edge("app_rationalization", END)
-    workflow.add_edge("bcdr", END)
+    # Deliverable specialists complete the turn
+    for name in deliverable_specialists:
+        workflow.add_edge(name, END)
 
     # Add memory for conversation persistence
     memory = MemorySaver()
@@ -1,13 +1,42 @@
-"""Agent implementations for EASI Bot."""
+"""Agent implementations for EASI Bot.
 
-from .app_rationalization import AppRationalizationSpecialist
-from .bcdr import BCDRSpecialist
-from .research import ResearchSpecialist
-from .supervisor import SupervisorAgent
+Specialist classes are imported on first access, so importing the package
+for its registry does not load every specialist module.
+"""
+
+import importlib
+from typing import Any
+
+from .registry import SpecialistRegistry, SpecialistSpec, create_default_registry
+
+# Public class -> module defining it, imported by __getattr__ when first used
+_LAZY_CLASSES = {
+    "AppRationalizationSpecialist": ".app_rationalization",
+    "BCDRSpecialist": ".bcdr",
+    "CloudModernizationSpecialist": ".cloud_modernization",
+    "OfferingSpecialist": ".specialist",
+    "ResearchSpecialist": ".research",
+    "SupervisorAgent": ".supervisor",
+    "TechStrategySpecialist": ".tech_strategy",
+}
 
 __all__ = [
     "AppRationalizationSpecialist",
     "BCDRSpecialist",
+    "CloudModernizationSpecialist",
+    "OfferingSpecialist",
     "ResearchSpecialist",
+    "SpecialistRegistry",
+    "SpecialistSpec",
     "SupervisorAgent",
+    "TechStrategySpecialist",
+    "create_default_registry",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import a specialist class from its module the first time it is used."""
+    if name not in _LAZY_CLASSES:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    return getattr(importlib.import_module(_LAZY_CLASSES[name], __name__), name)
@@ -1,31 +1,9 @@
 """Business Continuity and Disaster Recovery specialist."""
 
-from langchain_aws import ChatBedrock
-from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
+from easibot.agents.specialist import OfferingSpecialist
+from easibot.config import get_chat_model
 
-from easibot.config import settings
-from easibot.graph.state import ConsultantState, Deliverable
-
-
-class BCDRSpecialist:
-    """Specialist for Business Continuity and Disaster Recovery planning.
-
-    Deliverables:
-    - BC/DR strategy and plan
-    - RTO/RPO analysis
-    - Risk assessment matrix
-    - Incident response runbooks
-    - Testing and validation plans
-    """
-
-    def __init__(self):
-        """Initialize the BC/DR specialist."""
-        self.llm = ChatBedrock(
-            model_id=settings.bedrock_model_id,
-            region_name=settings.bedrock_region,
-        )
-
-        self.system_prompt = """You are a Business Continuity and Disaster Recovery (BC/DR) Specialist.
+SYSTEM_PROMPT = """You are a Business Continuity and Disaster Recovery (BC/DR) Specialist.
 
 Your expertise includes:
 - Business continuity planning and strategy
@@ -56,54 +34,21 @@ When working on engagements:
 Offering-specific RAG filter: "bcdr"
 """
 
-    def work(self, state: ConsultantState) -> dict:
-        """Perform BC/DR planning work.
 
-        Args:
-            state: Current conversation state
-
-        Returns:
-            Updated state with deliverables and response
-
-        """
-        # Get context
-        user_message = next(
-            (msg for msg in reversed(state["messages"]) if msg.type == "human"), None
-        )
-
-        research_context = ""
-        if state.get("research_findings"):
-            research_context = "\n\nAvailable Research:\n"
-            for finding in state["research_findings"][:3]:
-                research_context += f"- [{finding.source}] {finding.content}\n"
-
-        # Build prompt
-        messages = [
-            SystemMessage(content=self.system_prompt),
-            HumanMessage(
-                content=f"Request: {user_message.content if user_message else 'Continue work'}{research_context}"
-            ),
-        ]
+class BCDRSpecialist(OfferingSpecialist):
+    """Specialist for Business Continuity and Disaster Recovery planning.
 
-        response = self.llm.invoke(messages)
+    Deliverables:
+    - BC/DR strategy and plan
+    - RTO/RPO analysis
+    - Risk assessment matrix
+    - Incident response runbooks
+    - Testing and validation plans
+    """
 
-        # Create deliverable
-        deliverable = Deliverable(
-            title="Business Continuity and Disaster Recovery Plan",
-            type="bc_dr_plan",
-            content=response.content,
-            offering="bcdr",
-            specialist="bcdr",
-        )
+    deliverable_title = "Business Continuity and Disaster Recovery Plan"
+    deliverable_type = "bc_dr_plan"
 
-        return {
-            "messages": [
-                AIMessage(
-                    content=response.content,
-                    name="bcdr_specialist",
-                )
-            ],
-            "deliverables": [deliverable],
-            "active_specialist": "bcdr",
-            "next_specialist": "END",
-        }
+    def __init__(self):
+        """Initialize the BC/DR specialist."""
+        super().__init__("bcdr", SYSTEM_PROMPT, get_chat_model)
@@ -0,0 +1,50 @@
+"""Cloud Modernization specialist."""
+
+from easibot.agents.specialist import OfferingSpecialist
+from easibot.config import get_chat_model
+
+SYSTEM_PROMPT = """You are a Cloud Modernization Specialist.
+
+Your expertise includes:
+- Cloud readiness and discovery assessments
+- Migration strategy (Rehost/Replatform/Refactor/Repurchase/Retire/Retain/Relocate)
+- AWS and Azure landing zones and target architectures
+- Containers, serverless and managed-service modernization
+- Cloud cost modeling and FinOps
+- Migration factory and wave planning
+
+Standard deliverables you create:
+1. Cloud Readiness Assessment: Workload inventory and readiness scores
+2. Migration Wave Plan: 7R disposition and sequencing per workload
+3. Target Architecture: Landing zone, networking, security and services
+4. Cost Model: Current vs. projected cloud run costs
+5. Modernization Backlog: Prioritized refactoring opportunities
+
+When working on engagements:
+- Start with discovery and dependency mapping
+- Use research findings from the knowledge base
+- Choose the simplest migration path that meets the goals
+- Call out security, compliance and cost risks
+- Create structured deliverables
+
+Offering-specific RAG filter: "cloud-modernization"
+"""
+
+
+class CloudModernizationSpecialist(OfferingSpecialist):
+    """Specialist for cloud migration and modernization.
+
+    Deliverables:
+    - Cloud readiness assessment
+    - Migration wave plan (7R dispositions)
+    - Target cloud architecture and landing zone design
+    - Cloud cost model and optimization plan
+    - Modernization backlog
+    """
+
+    deliverable_title = "Cloud Modernization Plan"
+    deliverable_type = "migration_plan"
+
+    def __init__(self):
+        """Initialize the cloud modernization specialist."""
+        super().__init__("cloud_modernization", SYSTEM_PROMPT, get_chat_model)
@@ -0,0 +1,189 @@
+"""Lazy registry of specialist agents, extensible through entry-point plugins."""
+
+from __future__ import annotations
+
+import asyncio
+import importlib
+from dataclasses import dataclass, field, replace
+from importlib.metadata import entry_points
+from threading import Lock
+from typing import TYPE_CHECKING, Any
+
+from langchain_core.runnables import RunnableLambda
+
+from easibot.graph.state import ConsultantState
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+# Entry-point group third-party packages use to contribute specialists
+PLUGIN_GROUP = "easibot.specialists"
+
+
+@dataclass(frozen=True)
+class SpecialistSpec:
+    """How to build a specialist and which of its methods is the graph node.
+
+    ``factory`` is either a callable or a ``"module:attribute"`` path, which is
+    only imported when the specialist is first needed.
+    """
+
+    name: str
+    factory: str | Callable[..., Any]
+    method: str = "work"
+    description: str = ""
+    deliverable: bool = True
+    kwargs: dict[str, Any] = field(default_factory=dict)
+
+
+BUILTIN_SPECIALISTS: tuple[SpecialistSpec, ...] = (
+    SpecialistSpec(
+        name="supervisor",
+        factory="easibot.agents.supervisor:SupervisorAgent",
+        method="route",
+        description="Routes requests to specialists",
+        deliverable=False,
+    ),
+    SpecialistSpec(
+        name="research",
+        factory="easibot.agents.research:ResearchSpecialist",
+        method="research",
+        description="Searches knowledge base across all offerings",
+        deliverable=False,
+    ),
+    SpecialistSpec(
+        name="app_rationalization",
+        factory="easibot.agents.app_rationalization:AppRationalizationSpecialist",
+        description="Application portfolio analysis, rationalization, TCO",
+    ),
+    SpecialistSpec(
+        name="bcdr",
+        factory="easibot.agents.bcdr:BCDRSpecialist",
+        description="Business Continuity and Disaster Recovery planning",
+    ),
+    SpecialistSpec(
+        name="tech_strategy",
+        factory="easibot.agents.tech_strategy:TechStrategySpecialist",
+        description="Technology roadmaps, architecture assessments",
+    ),
+    SpecialistSpec(
+        name="cloud_modernization",
+        factory="easibot.agents.cloud_modernization:CloudModernizationSpecialist",
+        description="Cloud migration, AWS/Azure expertise",
+    ),
+)
+
+
+def _resolve(factory: str | Callable[..., Any]) -> Callable[..., Any]:
+    """Import a ``"module:attribute"`` factory path, or return a callable as-is."""
+    if callable(factory):
+        return factory
+    module_name, _, attribute = factory.partition(":")
+    return getattr(importlib.import_module(module_name), attribute)
+
+
+class SpecialistRegistry:
+    """Registry that constructs each specialist on first use.
+
+    Registering a specialist costs nothing: its module is not imported and its
+    Bedrock client is not created until a graph node first routes to it. Each
+    specialist is built at most once per registry, even under concurrent use.
+    """
+
+    def __init__(self, specs: tuple[SpecialistSpec, ...] = ()):
+        """Initialize the registry.
+
+        Args:
+            specs: Specialists to register up front
+
+        """
+        self._specs: dict[str, SpecialistSpec] = {}
+        self._instances: dict[str, Any] = {}
+        self._lock = Lock()
+        for spec in specs:
+            self.register(spec)
+
+    def register(self, spec: SpecialistSpec) -> None:
+        """Register a specialist, replacing any existing one with the same name."""
+        with self._lock:
+            self._specs[spec.name] = spec
+            self._instances.pop(spec.name, None)
+
+    def configure(self, name: str, **kwargs: Any) -> None:
+        """Add constructor arguments to a registered, not yet built, specialist."""
+        spec = self._specs[name]
+        self.register(replace(spec, kwargs={**spec.kwargs, **kwargs}))
+
+    def load_plugins(self, group: str = PLUGIN_GROUP) -> None:
+        """Register every SpecialistSpec exposed under the entry-point group."""
+        for entry_point in entry_points(group=group):
+            spec = entry_point.load()
+            if not isinstance(spec, SpecialistSpec):
+                msg = f"Entry point {entry_point.name} is not a SpecialistSpec"
+                raise TypeError(msg)
+            self.register(spec)
+
+    def spec(self, name: str) -> SpecialistSpec:
+        """Return the spec registered under name."""
+        return self._specs[name]
+
+    def names(self) -> tuple[str, ...]:
+        """Return registered specialist names in registration order."""
+        return tuple(self._specs)
+
+    def deliverable_names(self) -> tuple[str, ...]:
+        """Return specialists that produce deliverables and end the turn."""
+        return tuple(name for name, spec in self._specs.items() if spec.deliverable)
+
+    def is_loaded(self, name: str) -> bool:
+        """Return True if the specialist has already been constructed."""
+        return name in self._instances
+
+    def get(self, name: str) -> Any:
+        """Return the specialist instance, constructing it on first use."""
+        instance = self._instances.get(name)
+        if instance is not None:
+            return instance
+
+        with self._lock:
+            if name not in self._instances:
+                spec = self._specs[name]
+                self._instances[name] = _resolve(spec.factory)(**spec.kwargs)
+            return self._instances[name]
+
+    def node(self, name: str) -> RunnableLambda:
+        """Return a graph node that builds the specialist when first called.
+
+        The node runs the spec's method under ``invoke`` and its ``a``-prefixed
+        coroutine counterpart under ``ainvoke``. Specialists without an async
+        method run the sync one in a worker thread instead.
+        """
+        method = self._specs[name].method
+
+        def run(state: ConsultantState) -> dict:
+            return getattr(self.get(name), method)(state)
+
+        async def arun(state: ConsultantState) -> dict:
+            specialist = self.get(name)
+            async_method = getattr(specialist, f"a{method}", None)
+            if async_method is None:
+                return await asyncio.to_thread(getattr(specialist, method), state)
+            return await async_method(state)
+
+        return RunnableLambda(run, afunc=arun, name=f"{name}_{method}")
+
+
+def create_default_registry(*, plugins: bool = True) -> SpecialistRegistry:
+    """Create a registry with the built-in specialists and installed plugins.
+
+    Args:
+        plugins: Also register specialists from the entry-point group
+
+    Returns:
+        New specialist registry
+
+    """
+    registry = SpecialistRegistry(BUILTIN_SPECIALISTS)
+    if plugins:
+        registry.load_plugins()
+    return registry
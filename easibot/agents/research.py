@@ -1,10 +1,29 @@
 """Research specialist with access to unified knowledge base."""
 
-from langchain_aws import ChatBedrock
-from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
+from __future__ import annotations
 
-from easibot.config import settings
-from easibot.graph.state import ConsultantState, ResearchFinding
+import asyncio
+from typing import TYPE_CHECKING, Any
+
+from langchain_core.messages import AIMessage, HumanMessage
+
+from easibot.cache import SemanticCache
+from easibot.config import get_chat_model, settings
+from easibot.graph.state import ConsultantState, PrefetchedResearch, ResearchFinding
+from easibot.llm import (
+    ModelTiers,
+    ResearchContext,
+    build_research_context,
+    cached_system_message,
+    context_budget,
+)
+from easibot.nodes.prefetch import consume_prefetch
+from easibot.routing import INTENT_MATCHER
+from easibot.tools.embeddings import get_embedder
+from easibot.tools.rag_search import search_knowledge_base
+
+if TYPE_CHECKING:
+    import numpy as np
 
 
 class ResearchSpecialist:
@@ -14,12 +33,26 @@ class ResearchSpecialist:
     and can filter by offering metadata when needed.
     """
 
-    def __init__(self):
-        """Initialize the research specialist."""
-        self.llm = ChatBedrock(
-            model_id=settings.bedrock_model_id,
-            region_name=settings.bedrock_region,
-        )
+    def __init__(self, semantic_cache: SemanticCache | None = None):
+        """Initialize the research specialist.
+
+        Args:
+            semantic_cache: Cache of earlier answers to similar questions
+                (defaults to one built from settings when enabled)
+
+        """
+        self.models = ModelTiers("research", get_chat_model)
+        self.llm = self.models.llm
+        if semantic_cache is None and settings.research_cache_enabled:
+            semantic_cache = SemanticCache(
+                get_embedder(
+                    settings.research_cache_embedder, settings.research_cache_model
+                ),
+                threshold=settings.research_cache_threshold,
+                maxsize=settings.research_cache_size,
+                ttl_seconds=settings.research_cache_ttl_seconds,
+            )
+        self.semantic_cache = semantic_cache
 
         self.system_prompt = """You are a Research Specialist for an enterprise consulting firm.
 
@@ -59,41 +92,270 @@ If the request needs specialist expertise beyond research, recommend routing to:
         if not user_message:
             return {}
 
-        # TODO: Implement actual RAG search against S3 bucket
-        # For now, returning placeholder research
         query = user_message.content
+        offerings = state.get("offerings", [])
+
+        # Reuse results prefetched while the supervisor was routing, if any
+        prefetched = consume_prefetch(state)
+
+        # Answer paraphrases of earlier questions without retrieval or LLM
+        vector = self._cache_vector(query)
+        cached = self._cached_result(query, offerings, prefetched, vector)
+        if cached is not None:
+            return cached
+
+        if prefetched is not None:
+            findings = prefetched.findings
+        else:
+            findings = self.retrieve(query, offerings)
+
+        context = self._research_context(findings)
+        response, tier = self.models.invoke(self._build_messages(query, context))
+        self._remember(query, offerings, (response.content, findings), vector)
+
+        return self._build_result(
+            query,
+            response,
+            findings,
+            prefetched=prefetched,
+            response_metadata={
+                "context_tokens": context.tokens_used,
+                "model_tier": tier,
+            },
+        )
+
+    async def aresearch(self, state: ConsultantState) -> dict:
+        """Async version of :meth:`research` that never blocks the event loop.
+
+        Args:
+            state: Current conversation state
 
-        # Simulate RAG search (to be implemented with actual vector search)
-        findings = self._simulate_rag_search(query, state.get("offerings", []))
+        Returns:
+            Updated state with research findings and response
 
-        # Build response with LLM
-        context = f"Query: {query}\n\n"
-        if findings:
-            context += "Findings:\n"
-            for i, finding in enumerate(findings, 1):
-                context += f"{i}. [{finding.source}] {finding.content}\n"
+        """
+        user_message = next(
+            (msg for msg in reversed(state["messages"]) if msg.type == "human"), None
+        )
+
+        if not user_message:
+            return {}
 
-        messages = [
-            SystemMessage(content=self.system_prompt),
-            HumanMessage(content=context),
+        query = user_message.content
+        offerings = state.get("offerings", [])
+
+        prefetched = consume_prefetch(state)
+
+        vector = self._cache_vector(query)
+        cached = self._cached_result(query, offerings, prefetched, vector)
+        if cached is not None:
+            return cached
+
+        if prefetched is not None:
+            findings = prefetched.findings
+        else:
+            findings = await self.aretrieve(query, offerings)
+
+        context = self._research_context(findings)
+        response, tier = await self.models.ainvoke(self._build_messages(query, context))
+        self._remember(query, offerings, (response.content, findings), vector)
+
+        return self._build_result(
+            query,
+            response,
+            findings,
+            prefetched=prefetched,
+            response_metadata={
+                "context_tokens": context.tokens_used,
+                "model_tier": tier,
+            },
+        )
+
+    def retrieve(self, query: str, offerings: list[str]) -> list[ResearchFinding]:
+        """Search the knowledge base for a query.
+
+        Args:
+            query: Search query
+            offerings: Optional offering filters
+
+        Returns:
+            List of research findings
+
+        """
+        # Without a configured index, fall back to the simulated search
+        if settings.rag_index_uri is None:
+            return self._simulate_rag_search(query, offerings)
+
+        results = search_knowledge_base(
+            query,
+            {"offering": offerings} if offerings else None,
+            top_k=settings.rag_top_k,
+        )
+        return [
+            ResearchFinding(
+                source=result["source"],
+                content=result["content"],
+                relevance_score=min(max(result["score"], 0.0), 1.0),
+                metadata=result["metadata"],
+            )
+            for result in results
         ]
 
-        response = self.llm.invoke(messages)
+    async def aretrieve(
+        self, query: str, offerings: list[str]
+    ) -> list[ResearchFinding]:
+        """Search the knowledge base in a worker thread.
+
+        Args:
+            query: Search query
+            offerings: Optional offering filters
 
+        Returns:
+            List of research findings
+
+        """
+        return await asyncio.to_thread(self.retrieve, query, offerings)
+
+    def _cache_vector(self, query: str) -> np.ndarray | None:
+        """Embed the query for the semantic cache's lookup and store, if enabled."""
+        if self.semantic_cache is None:
+            return None
+        return self.semantic_cache.embed(query)
+
+    def _cached_result(
+        self,
+        query: str,
+        offerings: list[str],
+        prefetched: PrefetchedResearch | None,
+        vector: np.ndarray | None,
+    ) -> dict | None:
+        """Build the state update from a semantic cache hit, if there is one.
+
+        Args:
+            query: User query
+            offerings: Offerings the answer must have been given for
+            prefetched: Prefetched research for this turn, if any
+            vector: The query's cache embedding
+
+        Returns:
+            Updated state flagged as a cache hit, or None on a miss
+
+        """
+        if self.semantic_cache is None:
+            return None
+
+        hit = self.semantic_cache.lookup(query, tuple(sorted(offerings)), vector)
+        if hit is None:
+            return None
+
+        (content, findings), similarity, matched_query = hit
+        return self._build_result(
+            query,
+            AIMessage(content=content),
+            findings,
+            prefetched=prefetched,
+            response_metadata={
+                "semantic_cache": {
+                    "hit": True,
+                    "similarity": round(similarity, 4),
+                    "matched_query": matched_query,
+                }
+            },
+        )
+
+    def _remember(
+        self,
+        query: str,
+        offerings: list[str],
+        answer: tuple[Any, list[ResearchFinding]],
+        vector: np.ndarray | None,
+    ) -> None:
+        """Store a fresh answer in the semantic cache, if enabled.
+
+        The query's vector from the missed lookup is reused, so the query is
+        embedded once per turn.
+        """
+        if self.semantic_cache is not None:
+            self.semantic_cache.store(query, tuple(sorted(offerings)), answer, vector)
+
+    def _research_context(self, findings: list[ResearchFinding]) -> ResearchContext:
+        """Pack the most relevant findings into the model's token budget.
+
+        Args:
+            findings: Knowledge-base findings to cite
+
+        Returns:
+            Numbered findings section and the tokens it uses
+
+        """
+        return build_research_context(
+            findings,
+            context_budget(getattr(self.llm, "model_id", None)),
+            header="Findings:",
+            numbered=True,
+        )
+
+    def _build_messages(self, query: str, context: ResearchContext) -> list:
+        """Build the prompt that summarizes findings for a query.
+
+        Args:
+            query: User query
+            context: Packed findings to cite
+
+        Returns:
+            System and human messages for the LLM
+
+        """
+        # Stable layout: cached system prompt, then findings, then the query
+        findings_section = f"{context.text}\n" if context.text else ""
+
+        return [
+            cached_system_message(self.system_prompt),
+            HumanMessage(content=f"{findings_section}Query: {query}"),
+        ]
+
+    def _build_result(
+        self,
+        query: str,
+        response: Any,
+        findings: list[ResearchFinding],
+        *,
+        prefetched: PrefetchedResearch | None,
+        response_metadata: dict[str, Any] | None = None,
+    ) -> dict:
+        """Build the state update from the LLM response.
+
+        Args:
+            query: User query
+            response: LLM response message
+            findings: Findings the response was based on
+            prefetched: Prefetched research the findings came from, if any
+            response_metadata: Context token count and model tier, or
+                semantic-cache hit details, to attach to the response message
+
+        Returns:
+            Updated state with response, routing hint and new findings
+
+        """
         # Determine if we should route to a specialist
-        next_specialist = self._suggest_next_specialist(user_message.content)
+        next_specialist = self._suggest_next_specialist(query)
 
-        return {
+        result = {
             "messages": [
                 AIMessage(
                     content=response.content,
+                    usage_metadata=response.usage_metadata,
                     name="research_specialist",
+                    response_metadata=response_metadata or {},
                 )
             ],
-            "research_findings": findings,
             "next_specialist": next_specialist,
             "active_specialist": "research",
         }
+        # Prefetched findings are already in state; only add fresh ones
+        if prefetched is None:
+            result["research_findings"] = findings
+        return result
 
     def _simulate_rag_search(
         self, query: str, offerings: list[str]
@@ -139,20 +401,8 @@ If the request needs specialist expertise beyond research, recommend routing to:
             Suggested next specialist or "supervisor" to let supervisor decide
 
         """
-        query_lower = query.lower()
-
         # If the query asks for deliverables or specific work, route to specialist
-        if any(
-            word in query_lower
-            for word in [
-                "create",
-                "develop",
-                "build",
-                "deliverable",
-                "plan",
-                "strategy",
-            ]
-        ):
+        if INTENT_MATCHER.score(query)["deliverable"]:
             return "supervisor"  # Let supervisor route to appropriate specialist
 
         # Otherwise, research is complete
@@ -0,0 +1,163 @@
+"""Base class for the offering specialists."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from langchain_core.messages import AIMessage, HumanMessage
+
+from easibot.graph.state import ConsultantState, Deliverable
+from easibot.llm import (
+    ModelTiers,
+    ResearchContext,
+    build_research_context,
+    cached_system_message,
+    context_budget,
+)
+from easibot.nodes.prefetch import consume_prefetch
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+class OfferingSpecialist:
+    """Specialist that answers an offering's requests with one deliverable.
+
+    The prompt is the specialist's system prompt, the research findings that
+    fit the model's context budget and the latest request. Subclasses pass
+    their name and prompt and set the deliverable's title and type; the
+    offering is the name with hyphens (``app_rationalization`` answers for
+    ``app-rationalization``).
+    """
+
+    deliverable_title: str
+    deliverable_type: str
+
+    def __init__(self, name: str, system_prompt: str, chat_model: Callable[..., Any]):
+        """Initialize the specialist.
+
+        Args:
+            name: Specialist name, used for its model tiers and messages
+            system_prompt: Static system prompt
+            chat_model: Chat model factory passed to ModelTiers
+
+        """
+        self.name = name
+        self.offering = name.replace("_", "-")
+        self.system_prompt = system_prompt
+        self.models = ModelTiers(name, chat_model)
+        self.llm = self.models.llm
+
+    def work(self, state: ConsultantState) -> dict:
+        """Answer the latest request with a deliverable.
+
+        Args:
+            state: Current conversation state
+
+        Returns:
+            Updated state with deliverables and response
+
+        """
+        context = self._research_context(state)
+        response, tier = self.models.invoke(self._build_messages(state, context))
+        return self._build_result(response, context, tier)
+
+    async def awork(self, state: ConsultantState) -> dict:
+        """Async version of :meth:`work` that awaits the LLM call.
+
+        Args:
+            state: Current conversation state
+
+        Returns:
+            Updated state with deliverables and response
+
+        """
+        context = self._research_context(state)
+        response, tier = await self.models.ainvoke(self._build_messages(state, context))
+        return self._build_result(response, context, tier)
+
+    def _research_context(self, state: ConsultantState) -> ResearchContext:
+        """Pack the most relevant research findings into the model's budget.
+
+        Args:
+            state: Current conversation state
+
+        Returns:
+            Research context section and the tokens it uses
+
+        """
+        # Findings prefetched during routing count as used once read here
+        consume_prefetch(state)
+
+        return build_research_context(
+            state.get("research_findings") or [],
+            context_budget(getattr(self.llm, "model_id", None)),
+        )
+
+    def _build_messages(self, state: ConsultantState, context: ResearchContext) -> list:
+        """Build the prompt from the latest request and research context.
+
+        The static system prompt comes first and is marked for Bedrock prompt
+        caching; the per-turn research context and request follow it.
+
+        Args:
+            state: Current conversation state
+            context: Packed research findings
+
+        Returns:
+            System and human messages for the LLM
+
+        """
+        # Get context
+        user_message = next(
+            (msg for msg in reversed(state["messages"]) if msg.type == "human"), None
+        )
+
+        # Stable layout: cached system prompt, then research, then the request
+        research_context = f"{context.text}\n" if context.text else ""
+
+        # Build prompt
+        return [
+            cached_system_message(self.system_prompt),
+            HumanMessage(
+                content=f"{research_context}Request: {user_message.content if user_message else 'Continue work'}"
+            ),
+        ]
+
+    def _build_result(self, response: Any, context: ResearchContext, tier: str) -> dict:
+        """Build the state update and deliverable from the LLM response.
+
+        Args:
+            response: LLM response message
+            context: Research context the prompt included
+            tier: Model tier that produced the response
+
+        Returns:
+            Updated state with deliverables and response
+
+        """
+        # Create deliverable
+        deliverable = Deliverable(
+            title=self.deliverable_title,
+            type=self.deliverable_type,
+            content=response.content,
+            offering=self.offering,
+            specialist=self.name,
+        )
+
+        return {
+            "messages": [
+                AIMessage(
+                    content=response.content,
+                    usage_metadata=response.usage_metadata,
+                    response_metadata={
+                        "context_tokens": context.tokens_used,
+                        "model_tier": tier,
+                    },
+                    name=f"{self.name}_specialist",
+                )
+            ],
+            "deliverables": [deliverable],
+            "active_specialist": self.name,
+            "next_specialist": "END",  # Work complete unless supervisor routes elsewhere
+        }
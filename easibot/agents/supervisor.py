@@ -1,10 +1,59 @@
 """Supervisor agent that routes requests to appropriate specialists."""
 
-from langchain_aws import ChatBedrock
+import logging
+from typing import Literal, get_args
+
+from botocore.exceptions import BotoCoreError, ClientError
+from langchain_core.exceptions import OutputParserException
 from langchain_core.messages import HumanMessage, SystemMessage
+from pydantic import BaseModel, Field, ValidationError, create_model
+
+from easibot.cache import LRUCache
+from easibot.config import get_chat_model, settings
+from easibot.graph.state import ConsultantState, RoutingDecision, SpecialistType
+from easibot.llm import CircuitOpenError, ModelTiers, cached_system_message
+from easibot.routing import KeywordRouter, SemanticRouter
+from easibot.routing.keywords import PARALLEL_SPECIALISTS
+from easibot.tools.embeddings import get_embedder
+
+logger = logging.getLogger(__name__)
+
+# Specialists the LLM is allowed to route to
+ROUTABLE_SPECIALISTS = frozenset(get_args(SpecialistType)) - {"supervisor"}
+
+# LLM routing failures that fall back to the keyword decision: Bedrock and
+# connection errors, open circuits, and answers that do not parse
+ROUTING_ERRORS = (
+    BotoCoreError,
+    CircuitOpenError,
+    ClientError,
+    OutputParserException,
+    ValidationError,
+)
+
+
+class RouteChoice(BaseModel):
+    """Structured routing answer requested from the LLM."""
 
-from easibot.config import settings
-from easibot.graph.state import ConsultantState
+    next_specialist: SpecialistType = Field(description="Specialist to route to")
+    reasoning: str = Field(description="Why this specialist was chosen")
+    parallel_specialists: list[SpecialistType] = Field(
+        default_factory=list,
+        description=(
+            "Every offering specialist to run at once when the request asks for "
+            "work from more than one offering; empty otherwise"
+        ),
+    )
+
+
+def normalize_request(text: str) -> str:
+    """Normalize request text so near-identical requests share a cache key.
+
+    Only case and whitespace are folded: punctuation and operators can change
+    the question ("RTO < 4h" vs "RTO > 4h"), and the handlers reuse one
+    request's answer for every request with the same key.
+    """
+    return " ".join(text.lower().split())
 
 
 class SupervisorAgent:
@@ -16,12 +65,47 @@ class SupervisorAgent:
     - Complexity and scope of work
     """
 
-    def __init__(self):
-        """Initialize the supervisor with a Bedrock LLM."""
-        self.llm = ChatBedrock(
-            model_id=settings.bedrock_model_id,
-            region_name=settings.bedrock_region,
+    def __init__(
+        self,
+        parallel_specialists: tuple[str, ...] = PARALLEL_SPECIALISTS,
+        extra_specialists: dict[str, str] | None = None,
+    ):
+        """Initialize the supervisor with a Bedrock LLM.
+
+        Args:
+            parallel_specialists: Specialists that may be dispatched concurrently
+            extra_specialists: Plugin specialist names mapped to descriptions,
+                offered to the LLM alongside the built-in specialists
+
+        """
+        self.extra_specialists = extra_specialists or {}
+        self.routable_specialists = ROUTABLE_SPECIALISTS | set(self.extra_specialists)
+        self.route_choice_model = RouteChoice
+        if self.extra_specialists:
+            self.route_choice_model = create_model(
+                "RouteChoice",
+                __base__=RouteChoice,
+                next_specialist=(
+                    Literal[tuple(sorted(self.routable_specialists))],
+                    Field(description="Specialist to route to"),
+                ),
+                parallel_specialists=(
+                    list[Literal[tuple(sorted(self.routable_specialists))]],
+                    RouteChoice.model_fields["parallel_specialists"],
+                ),
+            )
+
+        # Routing answers are tiny, so cap output tokens to keep latency low;
+        # by default a fast model routes and the standard model is the backstop
+        self.models = ModelTiers(
+            "supervisor",
+            get_chat_model,
+            wrap=lambda llm: llm.with_structured_output(self.route_choice_model),
+            max_tokens=settings.routing_max_tokens,
+            temperature=0.0,
         )
+        self.llm = self.models.llm
+        self.router_llm = self.models.runnable()
 
         self.system_prompt = """You are the Supervisor for an enterprise consulting firm's AI assistant.
 
@@ -41,19 +125,103 @@ Available specialists:
 Routing guidelines:
 - For information gathering: route to 'research'
 - For specific offering work: route to that offering's specialist
-- For complex cross-offering work: start with research, then route to primary specialist
+- For work products from several offerings (e.g. a rationalization and a DR
+  plan): list each offering's specialist in parallel_specialists so they run at
+  once, with the first of them as next_specialist
+- For complex cross-offering questions: start with research, then route to primary specialist
 - If uncertain: route to 'research' first
 
-Respond with JSON: {"next_specialist": "specialist_name", "reasoning": "why"}"""
+Respond with JSON: {"next_specialist": "specialist_name", "reasoning": "why", "parallel_specialists": []}"""
+
+        if self.extra_specialists:
+            listed, marker, guidelines = self.system_prompt.partition(
+                "\n\nRouting guidelines:"
+            )
+            extra = "".join(
+                f"\n- {name}: {description}"
+                for name, description in self.extra_specialists.items()
+            )
+            self.system_prompt = listed + extra + marker + guidelines
+
+        self.keyword_router = KeywordRouter(parallel=parallel_specialists)
+        self.semantic_router = (
+            SemanticRouter.load(
+                settings.semantic_router_centroids,
+                get_embedder(
+                    settings.semantic_router_embedder, settings.semantic_router_model
+                ),
+                temperature=settings.semantic_router_temperature,
+            )
+            if settings.semantic_router_centroids
+            else None
+        )
+        self.route_cache = LRUCache(
+            maxsize=settings.routing_cache_size,
+            ttl_seconds=settings.routing_cache_ttl_seconds,
+        )
 
     def route(self, state: ConsultantState) -> dict:
         """Determine next specialist to handle the request.
 
+        Confident keyword matches are routed locally. Ambiguous requests go to
+        the semantic router when centroids are configured, and the LLM is only
+        consulted when neither local classifier is confident.
+
         Args:
             state: Current conversation state
 
         Returns:
-            Updated state with next_specialist set
+            Updated state with next_specialist and routing_decision set, plus
+            next_specialists when several specialists should run concurrently
+
+        """
+        request, update = self._start_route(state)
+        if update is not None:
+            return update
+
+        # Fast path: deterministic keyword routing with no network call
+        decision = self.keyword_router.classify(request)
+
+        # Slow path: only ask the LLM when no local classifier is confident
+        if decision.confidence < settings.routing_confidence_threshold:
+            decision = self._route_semantically(request) or self._route_with_llm(
+                state, request, decision
+            )
+
+        return self._routing_update(state, decision)
+
+    async def aroute(self, state: ConsultantState) -> dict:
+        """Async version of :meth:`route` that awaits the LLM tier.
+
+        Args:
+            state: Current conversation state
+
+        Returns:
+            Updated state with next_specialist and routing_decision set, plus
+            next_specialists when several specialists should run concurrently
+
+        """
+        request, update = self._start_route(state)
+        if update is not None:
+            return update
+
+        decision = self.keyword_router.classify(request)
+
+        if decision.confidence < settings.routing_confidence_threshold:
+            decision = self._route_semantically(request) or await self._aroute_with_llm(
+                state, request, decision
+            )
+
+        return self._routing_update(state, decision)
+
+    def _start_route(self, state: ConsultantState) -> tuple[str, dict | None]:
+        """Find the request to route, or the update that ends the turn.
+
+        Args:
+            state: Current conversation state
+
+        Returns:
+            Latest user request and, if routing should stop, the state update
 
         """
         # Get the latest user message
@@ -62,12 +230,13 @@ Respond with JSON: {"next_specialist": "specialist_name", "reasoning": "why"}"""
         )
 
         if not user_message:
-            return {"next_specialist": "END"}
+            return "", {"next_specialist": "END", "next_specialists": []}
 
         # Check iteration limit
         if state.get("iteration_count", 0) >= state.get("max_iterations", 10):
-            return {
+            return user_message.content, {
                 "next_specialist": "END",
+                "next_specialists": [],
                 "messages": [
                     SystemMessage(
                         content="Maximum iterations reached. Please refine your request."
@@ -75,8 +244,112 @@ Respond with JSON: {"next_specialist": "specialist_name", "reasoning": "why"}"""
                 ],
             }
 
-        # Build context for routing decision
-        context_parts = [f"User request: {user_message.content}"]
+        return user_message.content, None
+
+    def _routing_update(
+        self, state: ConsultantState, decision: RoutingDecision
+    ) -> dict:
+        """Build the state update for a routing decision."""
+        return {
+            "next_specialist": decision.next_specialist,
+            "next_specialists": decision.parallel_specialists,
+            "routing_decision": decision,
+            "iteration_count": state.get("iteration_count", 0) + 1,
+        }
+
+    def _route_semantically(self, request: str) -> RoutingDecision | None:
+        """Route with the embedding-centroid router if it is confident.
+
+        Args:
+            request: Latest user request
+
+        Returns:
+            Semantic routing decision, or None if disabled or unsure
+
+        """
+        if self.semantic_router is None:
+            return None
+
+        decision = self.semantic_router.classify(request)
+        if decision.confidence < settings.semantic_router_threshold:
+            return None
+        return decision
+
+    def _route_with_llm(
+        self, state: ConsultantState, request: str, fallback: RoutingDecision
+    ) -> RoutingDecision:
+        """Ask the LLM for a routing decision, reusing cached decisions.
+
+        Args:
+            state: Current conversation state
+            request: Latest user request
+            fallback: Keyword decision used if the LLM answer is unusable
+
+        Returns:
+            LLM routing decision (method "llm" or "llm_cache"), or the fallback
+            marked as "keyword_fallback"
+
+        Raises:
+            Exception: Errors other than ROUTING_ERRORS, which are bugs rather
+                than an unavailable or confused model
+
+        """
+        cache_key = self._route_cache_key(state, request)
+        cached = self.route_cache.get(cache_key)
+        if cached is not None:
+            return cached.model_copy(update={"method": "llm_cache"})
+
+        try:
+            choice, tier = self.models.invoke(
+                self._routing_messages(state, request), validate=self._is_valid_choice
+            )
+        except ROUTING_ERRORS:
+            logger.warning("LLM routing failed; using keyword routing", exc_info=True)
+            choice, tier = None, None
+
+        return self._accept_choice(choice, cache_key, fallback, tier)
+
+    async def _aroute_with_llm(
+        self, state: ConsultantState, request: str, fallback: RoutingDecision
+    ) -> RoutingDecision:
+        """Async version of :meth:`_route_with_llm`."""
+        cache_key = self._route_cache_key(state, request)
+        cached = self.route_cache.get(cache_key)
+        if cached is not None:
+            return cached.model_copy(update={"method": "llm_cache"})
+
+        try:
+            choice, tier = await self.models.ainvoke(
+                self._routing_messages(state, request), validate=self._is_valid_choice
+            )
+        except ROUTING_ERRORS:
+            logger.warning("LLM routing failed; using keyword routing", exc_info=True)
+            choice, tier = None, None
+
+        return self._accept_choice(choice, cache_key, fallback, tier)
+
+    def _route_cache_key(self, state: ConsultantState, request: str) -> tuple:
+        """Key LLM routing decisions by request, offerings and prior specialist."""
+        return (
+            normalize_request(request),
+            tuple(sorted(state.get("offerings") or [])),
+            state.get("active_specialist"),
+        )
+
+    def _routing_messages(self, state: ConsultantState, request: str) -> list:
+        """Build the prompt asking the LLM for a routing decision.
+
+        Args:
+            state: Current conversation state
+            request: Latest user request
+
+        Returns:
+            System and human messages for the router LLM
+
+        """
+        # Turn-specific context first and the request last, after the cached
+        # system prompt
+        context_parts = []
 
         if state.get("offerings"):
             context_parts.append(
@@ -91,49 +364,58 @@ Respond with JSON: {"next_specialist": "specialist_name", "reasoning": "why"}"""
         if state.get("active_specialist"):
             context_parts.append(f"Previous specialist: {state['active_specialist']}")
 
+        context_parts.append(f"User request: {request}")
         context = "\n".join(context_parts)
 
-        # Get routing decision from LLM
-        messages = [
-            SystemMessage(content=self.system_prompt),
+        return [
+            cached_system_message(self.system_prompt),
             HumanMessage(content=context),
         ]
 
-        response = self.llm.invoke(messages)
-
-        # Parse response (simplified - in production, use structured output)
-        # For now, we'll use basic routing logic
-        content_lower = user_message.content.lower()
-
-        # Simple keyword-based routing (can be enhanced with LLM)
-        if any(
-            word in content_lower
-            for word in ["search", "find", "research", "information", "what is"]
-        ):
-            next_specialist = "research"
-        elif any(
-            word in content_lower
-            for word in ["application", "portfolio", "rationalization"]
-        ):
-            next_specialist = "app_rationalization"
-        elif any(
-            word in content_lower
-            for word in ["disaster", "recovery", "continuity", "bcdr"]
-        ):
-            next_specialist = "bcdr"
-        elif any(
-            word in content_lower for word in ["strategy", "roadmap", "architecture"]
-        ):
-            next_specialist = "tech_strategy"
-        elif any(
-            word in content_lower for word in ["cloud", "aws", "azure", "migration"]
-        ):
-            next_specialist = "cloud_modernization"
-        else:
-            # Default to research for ambiguous requests
-            next_specialist = "research"
+    def _is_valid_choice(self, choice: object) -> bool:
+        """Check that the LLM answered with a specialist it may route to."""
+        return (
+            isinstance(choice, RouteChoice)
+            and choice.next_specialist in self.routable_specialists
+        )
 
-        return {
-            "next_specialist": next_specialist,
-            "iteration_count": state.get("iteration_count", 0) + 1,
-        }
+    def _accept_choice(
+        self,
+        choice: object,
+        cache_key: tuple,
+        fallback: RoutingDecision,
+        tier: str | None,
+    ) -> RoutingDecision:
+        """Turn an LLM answer into a decision, caching it if it is usable.
+
+        Args:
+            choice: Structured LLM answer, or None if the call failed
+            cache_key: Key to cache the decision under
+            fallback: Keyword decision used if the answer is unusable
+            tier: Model tier that produced the answer
+
+        Returns:
+            LLM routing decision, or the fallback marked as "keyword_fallback"
+
+        """
+        if not self._is_valid_choice(choice):
+            return fallback.model_copy(update={"method": "keyword_fallback"})
+
+        # Only deliverable specialists fan out, as with keyword routing
+        parallel = [
+            specialist
+            for specialist in dict.fromkeys(choice.parallel_specialists)
+            if specialist in self.keyword_router.parallel
+        ]
+        if len(parallel) == 1:
+            parallel = []
+        decision = RoutingDecision(
+            next_specialist=parallel[0] if parallel else choice.next_specialist,
+            confidence=1.0,
+            method="llm",
+            reasoning=choice.reasoning,
+            parallel_specialists=parallel,
+            model_tier=tier,
+        )
+        self.route_cache.set(cache_key, decision)
+        return decision
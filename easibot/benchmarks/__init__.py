@@ -0,0 +1,4 @@
+"""Microbenchmarks for EASI Bot hot paths.
+
+Run a benchmark module directly, e.g. ``python -m easibot.benchmarks.intent_matcher``.
+"""
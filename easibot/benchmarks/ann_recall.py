@@ -0,0 +1,85 @@
+"""Report recall@k against latency for IVF search at different nprobe values.
+
+Vectors are drawn around random topic centres so the corpus has the kind of
+cluster structure real document embeddings do.
+
+Usage:
+    python -m easibot.benchmarks.ann_recall [--size 200000] [--nlist 1800]
+"""
+
+import argparse
+import statistics
+import time
+
+import numpy as np
+
+from easibot.retrieval import Chunk, VectorIndex
+from easibot.tools.embeddings import normalize_rows
+
+
+def clustered_index(
+    rng: np.random.Generator, size: int, dim: int, topics: int
+) -> VectorIndex:
+    """Build an index of unit vectors scattered around topic centres."""
+    centres = rng.standard_normal((topics, dim), dtype=np.float32)
+    noise = rng.standard_normal((size, dim), dtype=np.float32)
+    vectors = normalize_rows(centres[rng.integers(topics, size=size)] + 0.5 * noise)
+    chunks = [Chunk(id=str(i), source="bench", content="") for i in range(size)]
+    return VectorIndex(vectors.astype(np.float32, copy=False), chunks)
+
+
+def run(
+    index: VectorIndex, queries: np.ndarray, top_k: int, nprobe: int | None
+) -> tuple[list[set[str]], float]:
+    """Return the ids found per query and the median latency in milliseconds."""
+    found, timings = [], []
+    for query in queries:
+        started = time.perf_counter()
+        results = index.search(query, top_k=top_k, nprobe=nprobe)
+        timings.append((time.perf_counter() - started) * 1000)
+        found.append({r.id for r in results})
+    return found, statistics.median(timings)
+
+
+def main() -> None:
+    """Build an IVF index and print recall@k and latency per nprobe."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=200_000)
+    parser.add_argument("--dim", type=int, default=384)
+    parser.add_argument("--topics", type=int, default=500)
+    parser.add_argument("--nlist", type=int, default=None)
+    parser.add_argument("--nprobes", type=int, nargs="+", default=[1, 4, 8, 16, 32])
+    parser.add_argument("--top-k", type=int, default=10)
+    parser.add_argument("--queries", type=int, default=100)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(7)
+    index = clustered_index(rng, args.size, args.dim, args.topics)
+    started = time.perf_counter()
+    index.build_ivf(args.nlist)
+    build = time.perf_counter() - started
+    queries = index.vectors[rng.choice(args.size, args.queries, replace=False)]
+    queries = normalize_rows(
+        queries + 0.1 * rng.standard_normal(queries.shape, dtype=np.float32)
+    )
+
+    truth, exact_ms = run(index, queries, args.top_k, None)
+    print(
+        f"{args.size} chunks, nlist {index.ivf.nlist} (built in {build:.1f}s), "
+        f"recall@{args.top_k}"
+    )
+    print(f"{'search':<12} {'recall':>7} {'p50 (ms)':>9} {'speedup':>8}")
+    print(f"{'exact':<12} {1.0:>7.3f} {exact_ms:>9.2f} {1.0:>7.1f}x")
+    for nprobe in args.nprobes:
+        found, ms = run(index, queries, args.top_k, nprobe)
+        recall = statistics.mean(
+            len(t & f) / len(t) for t, f in zip(truth, found, strict=True)
+        )
+        print(
+            f"{'nprobe ' + str(nprobe):<12} {recall:>7.3f} {ms:>9.2f} "
+            f"{exact_ms / ms:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
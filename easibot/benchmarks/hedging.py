@@ -0,0 +1,73 @@
+"""Measure how hedged requests cut tail latency on a simulated slow model.
+
+Usage:
+    python -m easibot.benchmarks.hedging [--calls 400] [--hedge-after 0.05]
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+
+from easibot.llm.resilience import CircuitBreaker, Endpoint, ResilientModel
+
+
+class SimulatedModel:
+    """Model whose latency is usually short but occasionally stalls."""
+
+    def __init__(self, rng: random.Random, stall_rate: float, stall: float):
+        """Initialize the model with its latency distribution."""
+        self.rng = rng
+        self.stall_rate = stall_rate
+        self.stall = stall
+
+    async def ainvoke(self, messages: list) -> str:
+        """Answer after a typical or a stalled delay."""
+        delay = self.rng.lognormvariate(-3.5, 0.3)  # ~30 ms median
+        if self.rng.random() < self.stall_rate:
+            delay += self.stall
+        await asyncio.sleep(delay)
+        return "answer"
+
+
+async def measure(model: ResilientModel, calls: int) -> list[float]:
+    """Return per-call latencies in milliseconds for sequential calls."""
+    latencies = []
+    for _ in range(calls):
+        started = time.perf_counter()
+        await model.ainvoke([])
+        latencies.append((time.perf_counter() - started) * 1000)
+    return latencies
+
+
+def main() -> None:
+    """Run the benchmark and print latency percentiles with and without hedging."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=400)
+    parser.add_argument("--hedge-after", type=float, default=0.05)
+    parser.add_argument("--stall-rate", type=float, default=0.03)
+    parser.add_argument("--stall", type=float, default=0.5)
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    primary = SimulatedModel(rng, args.stall_rate, args.stall)
+    hedge = SimulatedModel(rng, args.stall_rate, args.stall)
+    variants = {
+        "no hedge": ResilientModel(Endpoint(primary, CircuitBreaker("primary"))),
+        f"hedge @ {args.hedge_after * 1000:.0f} ms": ResilientModel(
+            Endpoint(primary, CircuitBreaker("primary")),
+            hedge=Endpoint(hedge, CircuitBreaker("hedge")),
+            hedge_after=args.hedge_after,
+        ),
+    }
+
+    print(f"{'variant':<16} {'p50 (ms)':>9} {'p99 (ms)':>9} {'max (ms)':>9}")
+    for label, model in variants.items():
+        latencies = asyncio.run(measure(model, args.calls))
+        p50, p99 = (statistics.quantiles(latencies, n=100)[i] for i in (49, 98))
+        print(f"{label:<16} {p50:>9.1f} {p99:>9.1f} {max(latencies):>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""Measure recall and latency of vector, BM25 and hybrid (RRF) retrieval.
+
+Each synthetic chunk mentions one identifier (such as "ISO 22301") among
+30-120 common words, and its embedding is a random topic vector. Queries name the
+identifier of a target chunk, and their embedding is a noisy copy of the
+target's, so the vector ranking finds the target only some of the time, as
+dense models do with exact codes. Latency is measured for each stage and for
+hybrid search with the keyword stage run sequentially and in a worker thread.
+
+Usage:
+    python -m easibot.benchmarks.hybrid_search [--sizes 10000 100000] [--dim 384]
+"""
+
+import argparse
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from easibot.retrieval import Chunk, VectorIndex, reciprocal_rank_fusion
+from easibot.tools.embeddings import normalize_rows
+
+WORDS = np.array([f"term{i}" for i in range(2000)])
+
+
+def synthetic_index(
+    rng: np.random.Generator, size: int, dim: int
+) -> tuple[VectorIndex, np.ndarray]:
+    """Build an index with BM25 postings and return it with its vectors."""
+    vectors = normalize_rows(rng.standard_normal((size, dim), dtype=np.float32))
+    words = WORDS[rng.integers(0, len(WORDS), (size, 120))].tolist()
+    lengths = rng.integers(30, 120, size)
+    chunks = [
+        Chunk(
+            id=str(i),
+            source="bench",
+            content=f"{' '.join(row[:length])} ISO {10_000 + i}",
+        )
+        for i, (row, length) in enumerate(zip(words, lengths, strict=True))
+    ]
+    index = VectorIndex(vectors, chunks)
+    index.build_bm25()
+    return index, vectors
+
+
+def vector_stage(index: VectorIndex, query: tuple, depth: int) -> list:
+    """Rank by embedding similarity."""
+    return index.search(query[0], depth)
+
+
+def keyword_stage(index: VectorIndex, query: tuple, depth: int) -> list:
+    """Rank by BM25."""
+    return index.keyword_search(query[1], depth)
+
+
+def hybrid_sequential(index: VectorIndex, query: tuple, depth: int) -> list:
+    """Run both stages one after the other and fuse them."""
+    return reciprocal_rank_fusion(
+        [vector_stage(index, query, depth), keyword_stage(index, query, depth)]
+    )
+
+
+def hybrid_concurrent(index: VectorIndex, query: tuple, depth: int) -> list:
+    """Run the keyword stage in a worker thread, as search_knowledge_base does."""
+    keyword = POOL.submit(keyword_stage, index, query, depth)
+    return reciprocal_rank_fusion([vector_stage(index, query, depth), keyword.result()])
+
+
+POOL = ThreadPoolExecutor(max_workers=1)
+MODES = [
+    ("vector", vector_stage),
+    ("BM25", keyword_stage),
+    ("hybrid sequential", hybrid_sequential),
+    ("hybrid concurrent", hybrid_concurrent),
+]
+
+
+def main() -> None:
+    """Print recall@k and median latency per retrieval mode and size."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--dim", type=int, default=384)
+    parser.add_argument("--queries", type=int, default=50)
+    parser.add_argument("--top-k", type=int, default=10)
+    parser.add_argument("--candidates", type=int, default=50)
+    parser.add_argument("--noise", type=float, default=4.0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    print(f"{'chunks':>8} {'BM25 MB':>8} {'mode':<18} {'recall@k':>9} {'ms':>7}")
+    for size in args.sizes:
+        index, vectors = synthetic_index(rng, size, args.dim)
+        targets = rng.choice(size, args.queries, replace=False)
+        noise = rng.standard_normal((args.queries, args.dim), dtype=np.float32)
+        query_vectors = normalize_rows(
+            vectors[targets] + args.noise * noise / np.sqrt(args.dim)
+        )
+        queries = [
+            (vector, f"{' '.join(rng.choice(WORDS, 3))} ISO {10_000 + target}")
+            for vector, target in zip(query_vectors, targets, strict=True)
+        ]
+        for label, search in MODES:
+            hits, timings = 0, []
+            for query, target in zip(queries, targets, strict=True):
+                started = time.perf_counter()
+                results = search(index, query, args.candidates)
+                timings.append((time.perf_counter() - started) * 1000)
+                hits += str(target) in {r.id for r in results[: args.top_k]}
+            print(
+                f"{size:>8} {index.bm25.nbytes / 2**20:>8.1f} {label:<18} "
+                f"{hits / args.queries:>9.2f} {statistics.median(timings):>7.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""Compare cold-start time, resident memory and recall of index storage types.
+
+Each index is opened in a fresh process, once memory-mapped and once read
+fully into memory, and then searched exhaustively. Resident memory is the
+growth after the searches, read from /proc (Linux only).
+
+Usage:
+    python -m easibot.benchmarks.index_storage [--sizes 100000 300000] [--dim 384]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+from easibot.retrieval import Chunk, VectorIndex
+from easibot.tools.embeddings import normalize_rows
+
+# (label, quantization, keep_full, rescore candidates)
+VARIANTS = [
+    ("float32", "float32", False, 0),
+    ("float16", "float16", False, 0),
+    ("int8", "int8", False, 0),
+    ("int8+rescore", "int8", True, 50),
+]
+
+
+def build_indexes(root: Path, size: int, dim: int, queries: int) -> None:
+    """Save one index per storage type, plus shared query vectors."""
+    rng = np.random.default_rng(7)
+    vectors = normalize_rows(rng.standard_normal((size, dim), dtype=np.float32))
+    chunks = [
+        Chunk(id=str(i), source="bench", content=f"chunk {i}") for i in range(size)
+    ]
+    picked = vectors[rng.choice(size, queries, replace=False)]
+    noise = 0.5 * rng.standard_normal(picked.shape, dtype=np.float32)
+    np.save(root / "queries.npy", normalize_rows(picked + noise))
+    for label, quantization, keep_full, _ in VARIANTS:
+        index = VectorIndex(vectors, chunks)
+        index.quantize(quantization, keep_full=keep_full)
+        index.save(root / label)
+
+
+def resident_mb() -> float:
+    """Return this process's resident memory, including mapped file pages (Linux)."""
+    pages = int(Path("/proc/self/statm").read_text().split()[1])
+    return pages * os.sysconf("SC_PAGE_SIZE") / 2**20
+
+
+def probe(path: Path, *, mmap: bool, rescore: int, top_k: int) -> dict:
+    """Open and search one index in this process and report the costs."""
+    baseline = resident_mb()
+    started = time.perf_counter()
+    index = VectorIndex.load(path, mmap=mmap)
+    load_ms = (time.perf_counter() - started) * 1000
+
+    found, timings = [], []
+    for query in np.load(path.parent / "queries.npy"):
+        started = time.perf_counter()
+        results = index.search(query, top_k=top_k, rescore=rescore)
+        timings.append((time.perf_counter() - started) * 1000)
+        found.append([r.id for r in results])
+    return {
+        "load_ms": load_ms,
+        "search_ms": statistics.median(timings),
+        "rss_mb": resident_mb() - baseline,
+        "found": found,
+    }
+
+
+def run_probe(path: Path, *, mmap: bool, rescore: int, top_k: int) -> dict:
+    """Run :func:`probe` in a fresh interpreter so memory is measured cleanly."""
+    command = [sys.executable, "-m", __spec__.name, "--probe", str(path)]
+    command += ["--rescore", str(rescore), "--top-k", str(top_k)]
+    if not mmap:
+        command.append("--eager")
+    output = subprocess.run(command, capture_output=True, check=True, text=True)  # noqa: S603 - our own module
+    return json.loads(output.stdout)
+
+
+def main() -> None:
+    """Build indexes per size and print load time, memory, latency and recall."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100_000, 300_000])
+    parser.add_argument("--dim", type=int, default=384)
+    parser.add_argument("--queries", type=int, default=20)
+    parser.add_argument("--top-k", type=int, default=10)
+    parser.add_argument("--probe", type=Path, help=argparse.SUPPRESS)
+    parser.add_argument("--eager", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--rescore", type=int, default=0, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.probe:
+        report = probe(
+            args.probe, mmap=not args.eager, rescore=args.rescore, top_k=args.top_k
+        )
+        print(json.dumps(report))
+        return
+
+    print(
+        f"{'chunks':>8} {'storage':<13} {'load mmap':>10} {'load eager':>11} "
+        f"{'RSS (MB)':>9} {'search (ms)':>12} {'recall':>7}"
+    )
+    for size in args.sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            build_indexes(root, size, args.dim, args.queries)
+            truth = None
+            for label, _, _, rescore in VARIANTS:
+                mapped = run_probe(
+                    root / label, mmap=True, rescore=rescore, top_k=args.top_k
+                )
+                eager = run_probe(
+                    root / label, mmap=False, rescore=rescore, top_k=args.top_k
+                )
+                truth = truth or mapped["found"]
+                recall = statistics.mean(
+                    len(set(t) & set(f)) / len(t)
+                    for t, f in zip(truth, mapped["found"], strict=True)
+                )
+                print(
+                    f"{size:>8} {label:<13} {mapped['load_ms']:>8.1f}ms "
+                    f"{eager['load_ms']:>9.1f}ms {mapped['rss_mb']:>9.0f} "
+                    f"{mapped['search_ms']:>12.1f} {recall:>7.3f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""Benchmark the compiled intent matcher against the legacy substring scans.
+
+Three inputs: a short request, a pasted inventory full of keywords and one
+with no keywords at all. The compiled matcher always reads the whole text and
+counts every hit. It is compared with the legacy presence scans, where each
+rule stops at its first hit (which favours them on the keyword-rich
+inventory), and with a legacy-style scan that also counts every hit.
+
+Usage:
+    python -m easibot.benchmarks.intent_matcher [--size-kb 50] [--repeat 20]
+"""
+
+import argparse
+import random
+import timeit
+
+from easibot.routing import INTENT_MATCHER
+
+# The keyword lists the supervisor and research agents scanned before the
+# shared matcher existed, reproduced verbatim for comparison.
+LEGACY_RULES = (
+    ["search", "find", "research", "information", "what is"],
+    ["application", "portfolio", "rationalization"],
+    ["disaster", "recovery", "continuity", "bcdr"],
+    ["strategy", "roadmap", "architecture"],
+    ["cloud", "aws", "azure", "migration"],
+    ["create", "develop", "build", "deliverable", "plan", "strategy"],
+)
+
+INVENTORY_COLUMNS = (
+    "app_id,name,owner,tech_stack,hosting,annual_cost,users,criticality,notes"
+)
+NOTES = (
+    "legacy ERP module",
+    "customer portal on AWS",
+    "batch reporting job",
+    "on-prem Oracle database",
+    "SaaS replacement candidate",
+    "needs disaster recovery review",
+    "shared service with finance",
+)
+
+
+def make_inventory(size_kb: int, seed: int = 7) -> str:
+    """Build a pasted CSV app inventory of roughly size_kb kilobytes."""
+    rng = random.Random(seed)
+    lines = [
+        "Please rationalize this application portfolio and flag DR gaps:",
+        INVENTORY_COLUMNS,
+    ]
+    size = sum(len(line) + 1 for line in lines)
+    row = 0
+    while size < size_kb * 1024:
+        row += 1
+        line = (
+            f"APP-{row:05d},App {row},team-{rng.randint(1, 40)},"
+            f"{rng.choice(['java', 'dotnet', 'python', 'cobol'])},"
+            f"{rng.choice(['on-prem', 'aws', 'azure', 'colo'])},"
+            f"{rng.randint(5, 900) * 1000},{rng.randint(10, 20000)},"
+            f"{rng.choice(['high', 'medium', 'low'])},{rng.choice(NOTES)}"
+        )
+        lines.append(line)
+        size += len(line) + 1
+    return "\n".join(lines)
+
+
+def make_keyword_free(size_kb: int, seed: int = 7) -> str:
+    """Build a pasted CSV of roughly size_kb kilobytes that no rule matches."""
+    rng = random.Random(seed)
+    lines = ["asset,owner,site,rack,serial"]
+    while sum(len(line) + 1 for line in lines) < size_kb * 1024:
+        lines.append(
+            f"asset-{len(lines):05d},team-{rng.randint(1, 40)},"
+            f"site-{rng.randint(1, 9)},rack-{rng.randint(1, 99)},"
+            f"sn{rng.randint(10**8, 10**9)}"
+        )
+    return "\n".join(lines)
+
+
+def legacy_score(text: str) -> list[bool]:
+    """Reproduce the old per-call list allocation and substring scans."""
+    content_lower = text.lower()
+    return [any(word in content_lower for word in words) for words in LEGACY_RULES]
+
+
+def legacy_count(text: str) -> list[int]:
+    """Count every substring hit, reading the whole text like the matcher."""
+    content_lower = text.lower()
+    return [sum(content_lower.count(word) for word in words) for words in LEGACY_RULES]
+
+
+def main() -> None:
+    """Run the benchmark and print per-call timings."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size-kb", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    inputs = {
+        "short request": "Help me create a disaster recovery plan for our portfolio",
+        f"{args.size_kb} KB inventory": make_inventory(args.size_kb),
+        f"{args.size_kb} KB no keywords": make_keyword_free(args.size_kb),
+    }
+
+    print(
+        f"{'input':<22} {'legacy any (us)':>16} {'legacy count (us)':>18} "
+        f"{'compiled (us)':>14}"
+    )
+    for label, text in inputs.items():
+        timings = [
+            timeit.timeit(lambda t=text, f=scan: f(t), number=args.repeat)
+            / args.repeat
+            * 1e6
+            for scan in (legacy_score, legacy_count, INTENT_MATCHER.score)
+        ]
+        print(
+            f"{label:<22} {timings[0]:>16.1f} {timings[1]:>18.1f} {timings[2]:>14.1f}"
+        )
+
+    scores = INTENT_MATCHER.score(inputs[f"{args.size_kb} KB inventory"])
+    print(f"score vector: {scores}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""Compare routing accuracy and latency: keywords, semantic centroids, Bedrock.
+
+The labelled example file is split in two: even lines train the centroids,
+odd lines are the evaluation set shared by every router.
+
+The default hashing embedder needs no extra packages; pass
+``--embedder fastembed`` (with the ``semantic`` extra installed) to measure
+the model the semantic router uses in production.
+
+Usage:
+    python -m easibot.benchmarks.routing [--embedder fastembed] [--bedrock]
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import time
+from typing import TYPE_CHECKING
+
+from easibot.config import settings
+from easibot.routing import KeywordRouter, SemanticRouter
+from easibot.routing.semantic import (
+    DEFAULT_EXAMPLES_PATH,
+    load_examples,
+    train_centroids,
+)
+from easibot.tools.embeddings import get_embedder
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def evaluate(
+    classify: Callable[[str], str], examples: list[tuple[str, str]]
+) -> tuple[float, list[float]]:
+    """Return accuracy and per-call latencies (ms) for a routing function."""
+    correct = 0
+    latencies = []
+    for text, label in examples:
+        start = time.perf_counter()
+        predicted = classify(text)
+        latencies.append((time.perf_counter() - start) * 1000)
+        correct += predicted == label
+    return correct / len(examples), latencies
+
+
+def bedrock_classifier() -> Callable[[str], str]:
+    """Build a classifier that asks Bedrock via the supervisor's LLM path."""
+    from langchain_core.messages import HumanMessage, SystemMessage
+
+    from easibot.agents.supervisor import SupervisorAgent
+
+    supervisor = SupervisorAgent()
+
+    def classify(text: str) -> str:
+        choice = supervisor.router_llm.invoke(
+            [
+                SystemMessage(content=supervisor.system_prompt),
+                HumanMessage(content=f"User request: {text}"),
+            ]
+        )
+        return choice.next_specialist
+
+    return classify
+
+
+def main() -> None:
+    """Run the benchmark and print an accuracy/latency table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--examples", default=str(DEFAULT_EXAMPLES_PATH))
+    parser.add_argument(
+        "--embedder", choices=["hashing", "fastembed"], default="hashing"
+    )
+    parser.add_argument("--model", default=settings.semantic_router_model)
+    parser.add_argument(
+        "--bedrock", action="store_true", help="Also time real Bedrock calls"
+    )
+    args = parser.parse_args()
+
+    examples = load_examples(args.examples)
+    train, test = examples[::2], examples[1::2]
+
+    embedder = get_embedder(args.embedder, args.model)
+    try:
+        labels, centroids = train_centroids(train, embedder)
+    except ImportError as e:
+        parser.error(str(e))
+    semantic = SemanticRouter(
+        labels, centroids, embedder, settings.semantic_router_temperature
+    )
+    semantic.classify("warm up")  # exclude model load time from latency
+    keyword = KeywordRouter()
+
+    routers: dict[str, Callable[[str], str]] = {
+        "keyword": lambda text: keyword.classify(text).next_specialist,
+        f"semantic ({embedder.model_name})": lambda text: (
+            semantic.classify(text).next_specialist
+        ),
+    }
+    if args.bedrock:
+        routers[f"bedrock ({settings.bedrock_model_id})"] = bedrock_classifier()
+
+    print(f"{len(train)} training / {len(test)} evaluation examples\n")
+    print(f"{'router':<48} {'accuracy':>8} {'p50 ms':>9} {'p95 ms':>9}")
+    for name, classify in routers.items():
+        accuracy, latencies = evaluate(classify, test)
+        p95 = statistics.quantiles(latencies, n=20)[-1]
+        print(
+            f"{name:<48} {accuracy:>8.0%} "
+            f"{statistics.median(latencies):>9.3f} {p95:>9.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
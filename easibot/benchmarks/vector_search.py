@@ -0,0 +1,99 @@
+"""Measure exact vector search latency at knowledge-base scale.
+
+Compares the ``argpartition`` top-k used by VectorIndex with a full
+``argsort`` of every score, and an unfiltered search with one restricted to a
+single offering (resolved through the metadata index before scoring).
+
+Usage:
+    python -m easibot.benchmarks.vector_search [--sizes 10000 100000 1000000]
+        [--offerings 5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import time
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from easibot.retrieval import Chunk, VectorIndex, top_k_indices
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def random_index(
+    rng: np.random.Generator, size: int, dim: int, offerings: int
+) -> VectorIndex:
+    """Build an index of random unit vectors spread evenly over offerings."""
+    vectors = rng.standard_normal((size, dim), dtype=np.float32)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    chunks = [
+        Chunk(
+            id=str(i),
+            source="bench",
+            content="",
+            metadata={"offering": f"offering-{i % offerings}"},
+        )
+        for i in range(size)
+    ]
+    return VectorIndex(vectors, chunks)
+
+
+def time_ms(fn: Callable[[np.ndarray], object], queries: np.ndarray) -> float:
+    """Return the median milliseconds per call of fn over the queries."""
+    timings = []
+    for query in queries:
+        started = time.perf_counter()
+        fn(query)
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+def measure(
+    index: VectorIndex, queries: np.ndarray, top_k: int
+) -> tuple[float, float, float, float, float]:
+    """Time scoring, both top-k selections, and full and filtered searches."""
+    scores = index.vectors @ queries[0]
+    one_offering = {"offering": "offering-0"}
+    return (
+        time_ms(lambda q: index.vectors @ q, queries),
+        time_ms(lambda _: top_k_indices(scores, top_k), queries),
+        time_ms(lambda _: np.argsort(-scores)[:top_k], queries),
+        time_ms(lambda q: index.search(q, top_k=top_k), queries),
+        time_ms(lambda q: index.search(q, top_k, one_offering), queries),
+    )
+
+
+def main() -> None:
+    """Run the benchmark and print median search latency per corpus size."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000]
+    )
+    parser.add_argument("--dim", type=int, default=384)
+    parser.add_argument("--top-k", type=int, default=5)
+    parser.add_argument("--queries", type=int, default=20)
+    parser.add_argument("--offerings", type=int, default=5)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(7)
+    print(
+        f"{'chunks':>10} {'matmul (ms)':>12} {'argpartition':>13} "
+        f"{'argsort':>9} {'search (ms)':>12} {'1 offering':>11}"
+    )
+    for size in args.sizes:
+        index = random_index(rng, size, args.dim, args.offerings)
+        queries = rng.standard_normal((args.queries, args.dim), dtype=np.float32)
+        queries /= np.linalg.norm(queries, axis=1, keepdims=True)
+        matmul, partial, full, search, filtered = measure(index, queries, args.top_k)
+        print(
+            f"{size:>10} {matmul:>12.2f} {partial:>13.2f} {full:>9.2f} "
+            f"{search:>12.2f} {filtered:>11.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
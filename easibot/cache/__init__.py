@@ -0,0 +1,15 @@
+"""Caching layers for EASI Bot."""
+
+from .lru import LRUCache
+from .response import CacheMissError, ResponseCache, SQLiteResponseStore
+from .semantic import SemanticCache
+from .singleflight import SingleFlight
+
+__all__ = [
+    "CacheMissError",
+    "LRUCache",
+    "ResponseCache",
+    "SQLiteResponseStore",
+    "SemanticCache",
+    "SingleFlight",
+]
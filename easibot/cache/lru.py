@@ -0,0 +1,81 @@
+"""Thread-safe in-process LRU cache with time-to-live expiry."""
+
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Any
+
+
+class LRUCache:
+    """Bounded LRU cache whose entries expire after a fixed TTL.
+
+    Lookups refresh recency but not age: an entry always expires ``ttl_seconds``
+    after it was written, however often it is read.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        ttl_seconds: float | None = None,
+    ):
+        """Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries before the least recent is evicted
+            ttl_seconds: Entry lifetime in seconds, or None to never expire
+
+        """
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[Any, tuple[float, Any]] = OrderedDict()
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        """Return the cached value for key, or default if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                self.misses += 1
+                return default
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Any, value: Any) -> None:
+        """Store value under key, evicting the least recently used entry."""
+        expires_at = (
+            time.monotonic() + self.ttl_seconds
+            if self.ttl_seconds is not None
+            else float("inf")
+        )
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def pop(self, key: Any, default: Any = None) -> Any:
+        """Remove key and return its value, or default if missing."""
+        with self._lock:
+            entry = self._entries.pop(key, None)
+        return default if entry is None else entry[1]
+
+    def clear(self) -> None:
+        """Remove all entries and reset hit/miss counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        """Return the number of stored entries, including expired ones."""
+        return len(self._entries)
@@ -0,0 +1,217 @@
+"""Exact-match LLM response cache with in-process and SQLite tiers."""
+
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+import time
+from threading import Lock
+from typing import TYPE_CHECKING, Any
+
+from langchain_core.caches import RETURN_VAL_TYPE, BaseCache
+from langchain_core.load import dumps, loads
+
+from .lru import LRUCache
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+class CacheMissError(KeyError):
+    """Raised in replay mode when a call has no recorded response."""
+
+
+def response_cache_key(prompt: str, llm_string: str) -> str:
+    """Build the cache key for a chat model call.
+
+    ``llm_string`` identifies the model id and its parameters; ``prompt`` is
+    the serialized message list, i.e. the system prompt and message content.
+
+    Args:
+        prompt: Serialized prompt messages
+        llm_string: Serialized model configuration
+
+    Returns:
+        Hex digest of the model hash and the prompt hash
+
+    """
+    model_hash = hashlib.sha256(llm_string.encode()).hexdigest()
+    prompt_hash = hashlib.sha256(prompt.encode()).hexdigest()
+    return f"{model_hash[:32]}:{prompt_hash}"
+
+
+class SQLiteResponseStore:
+    """Disk tier storing serialized responses in a local SQLite database.
+
+    Entries expire ``ttl_seconds`` after they were written. Once the table
+    holds more than ``max_entries`` rows, the least recently read are deleted.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        max_entries: int = 10_000,
+        ttl_seconds: float | None = None,
+    ):
+        """Open (or create) the store.
+
+        Args:
+            path: SQLite database file
+            max_entries: Maximum number of stored responses
+            ttl_seconds: Entry lifetime in seconds, or None to never expire
+
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._lock = Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+                "created_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS responses_accessed_at "
+                "ON responses (accessed_at)"
+            )
+
+    def get(self, key: str) -> str | None:
+        """Return the stored value for key, or None if missing or expired."""
+        now = time.time()
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT value, created_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            value, created_at = row
+            if self.ttl_seconds is not None and created_at + self.ttl_seconds <= now:
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                return None
+
+            self._conn.execute(
+                "UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key)
+            )
+            return value
+
+    def set(self, key: str, value: str) -> None:
+        """Store value under key, evicting the least recently read entries."""
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?)",
+                (key, value, now, now),
+            )
+            self._conn.execute(
+                "DELETE FROM responses WHERE key IN ("
+                "SELECT key FROM responses ORDER BY accessed_at DESC "
+                "LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+
+    def clear(self) -> None:
+        """Remove all stored responses."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM responses")
+
+    def __len__(self) -> int:
+        """Return the number of stored responses, including expired ones."""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+
+class ResponseCache(BaseCache):
+    """LangChain cache with an in-process LRU tier and an optional disk tier.
+
+    Pass it as ``cache=`` to a chat model. Lookups try memory first, then
+    SQLite, and promote disk hits into memory. In replay mode nothing is
+    written and a miss raises :class:`CacheMissError`, so a recorded cache
+    file makes runs deterministic and keeps them off the network.
+    """
+
+    def __init__(
+        self,
+        memory_size: int = 1024,
+        ttl_seconds: float | None = None,
+        path: str | Path | None = None,
+        max_entries: int = 10_000,
+        *,
+        replay: bool = False,
+    ):
+        """Initialize the cache.
+
+        Args:
+            memory_size: Maximum number of responses held in memory
+            ttl_seconds: Response lifetime in seconds, or None to never expire
+            path: SQLite file for the disk tier, or None for memory only
+            max_entries: Maximum number of responses on disk
+            replay: Only serve recorded responses; raise on a miss
+
+        """
+        self.memory = LRUCache(maxsize=memory_size, ttl_seconds=ttl_seconds)
+        self.disk = (
+            SQLiteResponseStore(path, max_entries=max_entries, ttl_seconds=ttl_seconds)
+            if path is not None
+            else None
+        )
+        self.replay = replay
+        self.hits = 0
+        self.misses = 0
+        self._lock = Lock()
+
+    def lookup(self, prompt: str, llm_string: str) -> RETURN_VAL_TYPE | None:
+        """Return the cached generations for a call, or None on a miss.
+
+        Raises:
+            CacheMissError: In replay mode, when the call was never recorded
+
+        """
+        key = response_cache_key(prompt, llm_string)
+        value = self.memory.get(key)
+        if value is None and self.disk is not None:
+            raw = self.disk.get(key)
+            if raw is not None:
+                value = loads(raw, allowed_objects="core")
+                self.memory.set(key, value)
+
+        with self._lock:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+
+        if value is None and self.replay:
+            raise CacheMissError(key)
+        return value
+
+    def update(self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE) -> None:
+        """Store the generations for a call in every tier."""
+        if self.replay:
+            return
+
+        key = response_cache_key(prompt, llm_string)
+        generations = list(return_val)
+        self.memory.set(key, generations)
+        if self.disk is not None:
+            self.disk.set(key, dumps(generations))
+
+    def clear(self, **kwargs: Any) -> None:
+        """Remove all cached responses and reset counters."""
+        self.memory.clear()
+        if self.disk is not None:
+            self.disk.clear()
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict[str, int]:
+        """Return hit/miss counts and the number of entries per tier."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "memory_entries": len(self.memory),
+                "disk_entries": len(self.disk) if self.disk is not None else 0,
+            }
@@ -0,0 +1,168 @@
+"""Similarity cache that reuses answers to paraphrased questions."""
+
+from __future__ import annotations
+
+import time
+from threading import Lock
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from easibot.tools.embeddings import Embedder
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable
+
+
+class SemanticCache:
+    """Bounded cache keyed by query embeddings instead of exact text.
+
+    Vectors live in one preallocated matrix, so a lookup is a single
+    matrix-vector product masked to the query's scope. Each entry belongs to a
+    scope (e.g. the sorted offerings) and only matches queries in that scope.
+    When full, the least recently used entry is overwritten, and its scope is
+    forgotten once no entry is left in it.
+    """
+
+    def __init__(
+        self,
+        embedder: Embedder,
+        threshold: float = 0.92,
+        maxsize: int = 2048,
+        ttl_seconds: float | None = None,
+    ):
+        """Initialize the cache.
+
+        Args:
+            embedder: Embedder returning L2-normalized vectors
+            threshold: Minimum cosine similarity for a hit
+            maxsize: Maximum number of cached answers
+            ttl_seconds: Entry lifetime in seconds, or None to never expire
+
+        """
+        self.embedder = embedder
+        self.threshold = threshold
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._vectors: np.ndarray | None = None  # (maxsize, dim), allocated lazily
+        self._scope_ids = np.full(maxsize, -1)
+        # Scopes of the cached entries, numbered so slots can store them in
+        # an array; a scope is dropped once no slot holds it
+        self._scope_index: dict[Hashable, int] = {}
+        self._scopes: dict[int, Hashable] = {}
+        self._next_scope_id = 0
+        self._entries: list[tuple[str, Any] | None] = [None] * maxsize
+        self._expires_at = np.full(maxsize, -np.inf)  # -inf marks a free slot
+        self._last_used = np.zeros(maxsize)
+        self._lock = Lock()
+
+    def embed(self, query: str) -> np.ndarray:
+        """Return the query's vector, to pass to :meth:`lookup` and :meth:`store`."""
+        return self.embedder.embed([query])[0]
+
+    def lookup(
+        self, query: str, scope: Hashable, vector: np.ndarray | None = None
+    ) -> tuple[Any, float, str] | None:
+        """Return the answer cached for the most similar query in scope.
+
+        Args:
+            query: Incoming query
+            scope: Scope the answer must have been stored under
+            vector: The query's vector from :meth:`embed`, if already computed
+
+        Returns:
+            (cached value, similarity, matched query), or None on a miss
+
+        """
+        if vector is None:
+            vector = self.embed(query)
+        now = time.monotonic()
+        with self._lock:
+            if self._vectors is None:
+                self.misses += 1
+                return None
+
+            similarities = self._vectors @ vector
+            in_scope = self._scope_ids == self._scope_index.get(scope, -2)
+            similarities[~(in_scope & (self._expires_at > now))] = -np.inf
+
+            best = int(np.argmax(similarities))
+            similarity = float(similarities[best])
+            if similarity < self.threshold:
+                self.misses += 1
+                return None
+
+            self._last_used[best] = now
+            self.hits += 1
+            matched_query, value = self._entries[best]
+            return value, similarity, matched_query
+
+    def store(
+        self,
+        query: str,
+        scope: Hashable,
+        value: Any,
+        vector: np.ndarray | None = None,
+    ) -> None:
+        """Cache value as the answer to query within scope.
+
+        Args:
+            query: Query the value answers
+            scope: Scope the answer applies to
+            value: Answer to cache
+            vector: The query's vector from :meth:`embed`, e.g. the one its
+                missed lookup used, so the query is not embedded twice
+
+        """
+        if vector is None:
+            vector = self.embed(query)
+        now = time.monotonic()
+        with self._lock:
+            if self._vectors is None:
+                self._vectors = np.zeros((self.maxsize, vector.shape[0]), vector.dtype)
+
+            # Reuse a free or expired slot, else evict the least recently used
+            expired = np.flatnonzero(self._expires_at <= now)
+            slot = int(expired[0]) if expired.size else int(np.argmin(self._last_used))
+
+            self._vectors[slot] = vector
+            self._release_scope(slot)
+            if scope not in self._scope_index:
+                self._scope_index[scope] = self._next_scope_id
+                self._scopes[self._next_scope_id] = scope
+                self._next_scope_id += 1
+            self._scope_ids[slot] = self._scope_index[scope]
+            self._entries[slot] = (query, value)
+            self._expires_at[slot] = (
+                now + self.ttl_seconds if self.ttl_seconds is not None else np.inf
+            )
+            self._last_used[slot] = now
+
+    def _release_scope(self, slot: int) -> None:
+        """Forget the scope of an overwritten slot if no other slot uses it.
+
+        This keeps the scope index no larger than the cache; the lock must be
+        held.
+        """
+        scope_id = int(self._scope_ids[slot])
+        self._scope_ids[slot] = -1
+        if scope_id >= 0 and not np.any(self._scope_ids == scope_id):
+            del self._scope_index[self._scopes.pop(scope_id)]
+
+    def clear(self) -> None:
+        """Remove all entries and reset hit/miss counters."""
+        with self._lock:
+            self._expires_at[:] = -np.inf
+            self._entries = [None] * self.maxsize
+            self._scope_ids[:] = -1
+            self._scope_index.clear()
+            self._scopes.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        """Return the number of live entries."""
+        with self._lock:
+            return int(np.count_nonzero(self._expires_at > time.monotonic()))
@@ -0,0 +1,127 @@
+"""Single-flight coalescing of identical concurrent calls."""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+from threading import Event, Lock
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Coroutine, Hashable
+
+
+class _Call:
+    """An in-flight sync call that followers wait on."""
+
+    def __init__(self):
+        self.done = Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+class _Flight:
+    """An in-flight async call and how many callers still await it."""
+
+    def __init__(self, task: asyncio.Task):
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight:
+    """Run at most one call per key at a time and share its outcome.
+
+    The first caller for a key (the leader) runs the call; callers arriving
+    with the same key while it is in flight wait and receive a deep copy of
+    the leader's result, or the same error. Nothing is cached: once the call
+    finishes the next caller for that key runs it again.
+
+    Sync callers (threads) and async callers (coroutines on the same event
+    loop) are coalesced separately. An async call runs in its own task, so a
+    caller that is cancelled, the leader included, stops waiting without
+    cancelling it for the others; it is cancelled once no caller waits.
+    """
+
+    def __init__(self):
+        """Initialize with no calls in flight."""
+        self._calls: dict[Hashable, _Call] = {}
+        self._flights: dict[tuple[int, Hashable], _Flight] = {}
+        self._lock = Lock()
+        self.leaders = 0
+        self.followers = 0
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """Run fn, or wait for the in-flight call with the same key.
+
+        Args:
+            key: Identity of the call
+            fn: Call to run if none is in flight for key
+
+        Returns:
+            fn's result (a deep copy for followers)
+
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.leaders += 1
+            else:
+                self.followers += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return copy.deepcopy(call.result)
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+    async def ado(
+        self, key: Hashable, fn: Callable[[], Coroutine[Any, Any, Any]]
+    ) -> Any:
+        """Async version of :meth:`do`; fn is a coroutine function."""
+        loop = asyncio.get_running_loop()
+        loop_key = (id(loop), key)
+        with self._lock:
+            flight = self._flights.get(loop_key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[loop_key] = _Flight(loop.create_task(fn()))
+                self.leaders += 1
+            else:
+                self.followers += 1
+            flight.waiters += 1
+
+        try:
+            result = await asyncio.shield(flight.task)
+        finally:
+            with self._lock:
+                flight.waiters -= 1
+                finished = flight.task.done()
+                abandoned = not flight.waiters and not finished
+                # Later callers start a new call instead of joining this one
+                if (finished or abandoned) and self._flights.get(loop_key) is flight:
+                    del self._flights[loop_key]
+            if abandoned:
+                flight.task.cancel()
+        return result if leader else copy.deepcopy(result)
+
+    def stats(self) -> dict[str, int]:
+        """Return how many calls ran and how many shared an in-flight call."""
+        with self._lock:
+            return {
+                "leaders": self.leaders,
+                "followers": self.followers,
+                "in_flight": len(self._calls) + len(self._flights),
+            }
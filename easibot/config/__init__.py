@@ -1,5 +1,12 @@
 """Configuration for EASI Bot."""
 
+from .clients import get_bedrock_runtime_client, get_chat_model, get_response_cache
 from .settings import Settings, settings
 
-__all__ = ["Settings", "settings"]
+__all__ = [
+    "Settings",
+    "get_bedrock_runtime_client",
+    "get_chat_model",
+    "get_response_cache",
+    "settings",
+]
@@ -0,0 +1,129 @@
+"""Shared AWS clients and chat model factory.
+
+Every agent gets its chat model from ``get_chat_model`` so the process holds a
+single boto3 session, a single credential resolution and a single HTTP
+connection pool per region, which warm Lambda invocations and multi-threaded
+batch runs reuse.
+"""
+
+from threading import Lock
+from typing import Any
+
+import boto3
+from botocore.config import Config
+from langchain_aws import ChatBedrock
+
+from easibot.cache import ResponseCache
+from easibot.llm.prompt_cache import PROMPT_CACHE_TRACKER
+
+from .settings import settings
+
+_clients: dict[str, Any] = {}
+_clients_lock = Lock()
+_response_cache: ResponseCache | None = None
+
+
+def bedrock_client_config() -> Config:
+    """Build the botocore config for the pooled bedrock-runtime client."""
+    return Config(
+        max_pool_connections=settings.bedrock_max_pool_connections,
+        tcp_keepalive=settings.bedrock_tcp_keepalive,
+        connect_timeout=settings.bedrock_connect_timeout,
+        read_timeout=settings.bedrock_read_timeout,
+        retries={
+            "mode": settings.bedrock_retry_mode,
+            "total_max_attempts": settings.bedrock_max_attempts,
+        },
+    )
+
+
+def get_bedrock_runtime_client(region_name: str | None = None) -> Any:
+    """Return the process-wide bedrock-runtime client for a region.
+
+    boto3 clients are thread-safe, so one client (and its connection pool) is
+    shared by all agents and threads.
+
+    Args:
+        region_name: AWS region (defaults to settings.bedrock_region)
+
+    Returns:
+        Shared boto3 bedrock-runtime client
+
+    """
+    region = region_name or settings.bedrock_region
+    client = _clients.get(region)
+    if client is not None:
+        return client
+
+    with _clients_lock:
+        if region not in _clients:
+            session = boto3.session.Session(region_name=region)
+            _clients[region] = session.client(
+                "bedrock-runtime", config=bedrock_client_config()
+            )
+        return _clients[region]
+
+
+def get_response_cache() -> ResponseCache:
+    """Return the process-wide LLM response cache configured in settings.
+
+    Returns:
+        Shared response cache
+
+    """
+    global _response_cache  # noqa: PLW0603
+    with _clients_lock:
+        if _response_cache is None:
+            _response_cache = ResponseCache(
+                memory_size=settings.response_cache_size,
+                ttl_seconds=settings.response_cache_ttl_seconds,
+                path=settings.response_cache_path,
+                max_entries=settings.response_cache_max_entries,
+                replay=settings.response_cache_replay,
+            )
+        return _response_cache
+
+
+def reset_clients() -> None:
+    """Drop cached clients so the next call rebuilds them (used by tests)."""
+    global _response_cache  # noqa: PLW0603
+    with _clients_lock:
+        _clients.clear()
+        _response_cache = None
+
+
+def get_chat_model(
+    model_id: str | None = None,
+    region_name: str | None = None,
+    *,
+    agent: str | None = None,
+    **kwargs: Any,
+) -> ChatBedrock:
+    """Create a ChatBedrock model backed by the shared runtime client.
+
+    Args:
+        model_id: Bedrock model id (defaults to settings.bedrock_model_id)
+        region_name: AWS region (defaults to settings.bedrock_region)
+        agent: Name of the calling agent; it tags the model's calls, and
+            agents listed in settings.response_cache_agents get the shared
+            response cache
+        **kwargs: Extra ChatBedrock fields (e.g., max_tokens, temperature)
+
+    Returns:
+        Chat model that reuses the pooled client and reports prompt-cache
+        usage to PROMPT_CACHE_TRACKER
+
+    """
+    if agent in settings.response_cache_agents:
+        kwargs.setdefault("cache", get_response_cache())
+    if agent is not None:
+        kwargs.setdefault("tags", [f"agent:{agent}"])
+    kwargs.setdefault("callbacks", [PROMPT_CACHE_TRACKER])
+
+    region = region_name or settings.bedrock_region
+    return ChatBedrock(
+        client=get_bedrock_runtime_client(region),
+        model_id=model_id or settings.bedrock_model_id,
+        region_name=region,
+        **kwargs,
+    )
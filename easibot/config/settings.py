@@ -21,14 +21,122 @@ class Settings(BaseSettings):
     bedrock_model_id: str = "us.anthropic.claude-sonnet-4-5-20250929-v1:0"
     bedrock_region: str = "us-west-2"
 
+    # Model Tiers: each agent tries its tiers in order, escalating when the
+    # output fails validation ("fast", "standard" or a literal model id)
+    bedrock_fast_model_id: str = "us.anthropic.claude-haiku-4-5-20251001-v1:0"
+    agent_model_tiers: dict[str, list[str]] = {"supervisor": ["fast", "standard"]}
+
+    # Bedrock Client Pool (shared by all agents)
+    bedrock_max_pool_connections: int = 50
+    bedrock_tcp_keepalive: bool = True
+    bedrock_connect_timeout: float = 5.0
+    bedrock_read_timeout: float = 120.0
+    # HTTP attempts per call, the first included; 1 leaves retrying to
+    # llm/resilience.py, whose attempts feed the circuit breaker
+    bedrock_retry_mode: str = "standard"
+    bedrock_max_attempts: int = 1
+
+    # LLM Resilience (jittered retries and a circuit breaker per model/region)
+    llm_max_retries: int = 3
+    llm_retry_base_delay: float = 0.5
+    llm_retry_max_delay: float = 8.0
+    circuit_breaker_failure_threshold: int = 5
+    circuit_breaker_reset_seconds: float = 30.0
+
+    # Client-side Bedrock quotas per model (None = unlimited); per-model
+    # overrides as {"<model id>": {"requests_per_minute": .., "tokens_per_minute": ..}}
+    bedrock_requests_per_minute: int | None = None
+    bedrock_tokens_per_minute: int | None = None
+    bedrock_model_quotas: dict[str, dict[str, int]] = {}
+    rate_limit_burst_seconds: float = 10.0
+    rate_limit_output_tokens: int = 1024
+
+    # Hedged Requests (duplicate a slow call, optionally to another region/model)
+    hedge_after_seconds: float | None = None
+    hedge_region: str | None = None
+    hedge_model_id: str | None = None
+
+    # Bedrock Prompt Caching (checkpoint after each agent's static system prompt)
+    bedrock_prompt_caching: bool = True
+
+    # LLM Response Cache (agents listed here reuse identical past responses)
+    response_cache_agents: list[str] = []
+    response_cache_path: str | None = None
+    response_cache_size: int = 1024
+    response_cache_max_entries: int = 10_000
+    response_cache_ttl_seconds: float | None = 86400.0
+    response_cache_replay: bool = False
+
+    # Single-flight: identical concurrent requests / LLM calls share one run
+    single_flight_requests: bool = True
+    single_flight_llm_calls: bool = True
+
+    # Research Semantic Cache (paraphrased questions reuse earlier answers)
+    research_cache_enabled: bool = False
+    research_cache_embedder: str = "fastembed"
+    research_cache_model: str = "BAAI/bge-small-en-v1.5"
+    research_cache_threshold: float = 0.92
+    research_cache_size: int = 2048
+    research_cache_ttl_seconds: float | None = 86400.0
+
+    # Research Context Budget (estimated tokens of findings per prompt)
+    context_token_budget: int = 1500
+    context_token_budgets: dict[str, int] = {}
+
+    # Speculative Retrieval
+    prefetch_research: bool = False
+
+    # Batch Mode (python -m easibot.handlers.batch)
+    batch_concurrency: int = 8
+
     # S3 Configuration
     rag_bucket_name: str = "easibot-rag"
 
+    # RAG Index (local directory or s3:// URI; unset = simulated research)
+    rag_index_uri: str | None = None
+    rag_cache_dir: str = "/tmp/easibot-rag"  # noqa: S108 - Lambda's writable dir
+    rag_embedder: str = "fastembed"
+    rag_embedding_model: str = "BAAI/bge-small-en-v1.5"
+    rag_top_k: int = 5
+    # "exact" scores every chunk; "ivf" scans the rag_ivf_nprobe closest IVF
+    # lists (the index must be saved with one, see VectorIndex.build_ivf)
+    rag_search_backend: str = "exact"
+    rag_ivf_nprobe: int = 8
+    # Re-rank this many top candidates by exact float32 score (0 = off); needs
+    # an index quantized with keep_full=True unless it is stored as float32
+    rag_rescore_candidates: int = 0
+    # "vector" ranks by embedding similarity; "hybrid" also runs BM25 keyword
+    # search concurrently and fuses both rankings with reciprocal rank fusion
+    rag_search_mode: str = "vector"
+    rag_hybrid_vector_weight: float = 1.0
+    rag_hybrid_keyword_weight: float = 1.0
+    rag_hybrid_candidates: int = 50  # results per ranking before fusion
+    rag_rrf_k: int = 60
+    # Document uploads: maximum characters per chunk and chunks per embed call
+    rag_chunk_chars: int = 1500
+    rag_embed_batch_size: int = 64
+    # S3 indexes have one writer at a time: how long its lock is held before
+    # a waiting writer may take it over (and how long waiters wait)
+    rag_writer_lease_seconds: float = 300.0
+
     # Application Configuration
     log_level: str = "INFO"
     environment: str = "development"
     max_iterations: int = 10
 
+    # Routing Configuration
+    routing_confidence_threshold: float = 0.6
+    routing_max_tokens: int = 128
+    routing_cache_size: int = 1024
+    routing_cache_ttl_seconds: float = 3600.0
+
+    # Semantic Routing (disabled unless a centroid file is configured)
+    semantic_router_centroids: str | None = None
+    semantic_router_embedder: str = "fastembed"
+    semantic_router_model: str = "BAAI/bge-small-en-v1.5"
+    semantic_router_threshold: float = 0.6
+    semantic_router_temperature: float = 0.05
+
 
 # Global settings instance
 settings = Settings()
@@ -1,12 +1,21 @@
 """State definitions for the EASI Bot consultant workflow."""
 
 from operator import add
-from typing import Annotated, Literal
+from typing import Annotated, Any, Literal
 
 from langgraph.graph import MessagesState
 from pydantic import BaseModel, Field
 
 
+def keep_latest(current: Any, update: Any) -> Any:
+    """Reducer that keeps the latest value.
+
+    Behaves like a plain field but, unlike one, accepts writes from several
+    specialists running concurrently in the same step.
+    """
+    return update
+
+
 class ResearchFinding(BaseModel):
     """A research finding from the knowledge base."""
 
@@ -26,6 +35,32 @@ class Deliverable(BaseModel):
     specialist: str = Field(description="Specialist who created it")
 
 
+class RoutingDecision(BaseModel):
+    """A supervisor routing decision and how it was reached."""
+
+    next_specialist: str = Field(description="Specialist selected to run next")
+    confidence: float = Field(description="Routing confidence", ge=0.0, le=1.0)
+    method: str = Field(
+        description="How the decision was made (e.g., 'keyword', 'llm')"
+    )
+    reasoning: str = Field(default="", description="Why this specialist was chosen")
+    parallel_specialists: list[str] = Field(
+        default_factory=list,
+        description="Specialists dispatched concurrently, if more than one",
+    )
+    model_tier: str | None = Field(
+        default=None, description="Model tier that made an LLM decision"
+    )
+
+
+class PrefetchedResearch(BaseModel):
+    """Knowledge-base results fetched speculatively while the supervisor routes."""
+
+    key: str = Field(description="Prefetch key ('<thread_id>:<turn>')")
+    turn: int = Field(description="Number of user messages when prefetched")
+    findings: list[ResearchFinding] = Field(default_factory=list)
+
+
 class ConsultantState(MessagesState):
     """State for the EASI Bot multi-agent consultant workflow.
 
@@ -43,18 +78,29 @@ class ConsultantState(MessagesState):
     )
 
     # Routing and orchestration
-    next_specialist: str | None = Field(
+    next_specialist: Annotated[str | None, keep_latest] = Field(
         default=None, description="Next specialist to route to"
     )
-    active_specialist: str | None = Field(
+    next_specialists: list[str] = Field(
+        default_factory=list,
+        description="Specialists the supervisor dispatches concurrently",
+    )
+    active_specialist: Annotated[str | None, keep_latest] = Field(
         default=None, description="Currently active specialist"
     )
+    routing_decision: RoutingDecision | None = Field(
+        default=None, description="Latest supervisor routing decision"
+    )
 
     # Research and knowledge
     research_findings: Annotated[list[ResearchFinding], add] = Field(
         default_factory=list, description="Accumulated research findings"
     )
 
+    prefetch: PrefetchedResearch | None = Field(
+        default=None, description="Speculative research for the current turn"
+    )
+
     # Deliverables and artifacts
     deliverables: Annotated[list[Deliverable], add] = Field(
         default_factory=list, description="Created deliverables"
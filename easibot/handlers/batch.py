@@ -0,0 +1,274 @@
+"""Batch entry point that runs many requests from a JSONL file.
+
+Usage:
+    python -m easibot.handlers.batch requests.jsonl results.jsonl [--concurrency 8]
+
+Each input line is a handler event with an ``id``::
+
+    {"id": "acme-dr", "message": "Create a DR plan", "offerings": ["bcdr"]}
+
+Each output line is written as soon as its request finishes, so a crashed
+run can be restarted with the same arguments and skips ids already done.
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from pathlib import Path
+from typing import Any
+
+from pydantic import BaseModel
+
+from easibot.agent import graph
+from easibot.config import settings
+from easibot.handlers.lambda_handler import (
+    error_status,
+    parse_event,
+    release_thread,
+    response_body,
+)
+from easibot.llm.rate_limit import request_priority
+
+
+class BatchSummary(BaseModel):
+    """Outcome and timing of a batch run."""
+
+    total: int
+    skipped: int
+    succeeded: int
+    failed: int
+    elapsed_seconds: float
+    latency_p50_ms: float | None = None
+    latency_p95_ms: float | None = None
+    latency_max_ms: float | None = None
+
+    @property
+    def throughput_per_minute(self) -> float:
+        """Requests processed per minute of wall-clock time."""
+        processed = self.succeeded + self.failed
+        return processed / self.elapsed_seconds * 60 if self.elapsed_seconds else 0.0
+
+    def format(self) -> str:
+        """Render the summary for the terminal."""
+        lines = [
+            f"requests:   {self.total} ({self.skipped} already done)",
+            f"succeeded:  {self.succeeded}",
+            f"failed:     {self.failed}",
+            (
+                f"elapsed:    {self.elapsed_seconds:.1f}s "
+                f"({self.throughput_per_minute:.1f} requests/min)"
+            ),
+        ]
+        if self.latency_max_ms is not None:
+            lines.append(
+                f"latency:    p50 {self.latency_p50_ms:.0f} ms, "
+                f"p95 {self.latency_p95_ms:.0f} ms, max {self.latency_max_ms:.0f} ms"
+            )
+        return "\n".join(lines)
+
+
+def load_requests(path: str | Path) -> list[dict[str, Any]]:
+    """Read request events from a JSONL file.
+
+    A line that is not a JSON object does not stop the batch: it becomes an
+    event with only its ``id`` and ``invalid_json`` (the parse error), which
+    :func:`arun_batch` records as a failed request.
+
+    Args:
+        path: JSONL file with one event per line; blank lines are ignored
+
+    Returns:
+        Events, each with an ``id`` (``line-<n>`` if the line had none)
+
+    """
+    requests = []
+    with Path(path).open(encoding="utf-8") as f:
+        for number, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            try:
+                event = json.loads(line)
+            except json.JSONDecodeError as e:
+                event = {"invalid_json": str(e)}
+            if not isinstance(event, dict):
+                event = {"invalid_json": "Expected a JSON object"}
+            event.setdefault("id", f"line-{number}")
+            requests.append(event)
+    return requests
+
+
+def completed_ids(path: str | Path) -> set[str]:
+    """Return the ids of requests that already succeeded in an output file.
+
+    Failed requests are not included, so a resumed run retries them. A
+    truncated last line from a crash is ignored.
+    """
+    path = Path(path)
+    if not path.exists():
+        return set()
+
+    done = set()
+    with path.open(encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if record.get("status") == "ok":
+                done.add(record["id"])
+    return done
+
+
+async def arun_batch(
+    input_path: str | Path,
+    output_path: str | Path,
+    *,
+    concurrency: int | None = None,
+    resume: bool = True,
+) -> BatchSummary:
+    """Run every request in input_path through the graph.
+
+    At most ``concurrency`` requests run at once, and their Bedrock calls
+    queue behind interactive traffic in the rate governor. Results are appended to
+    output_path in completion order, one JSON object per line with ``id``,
+    ``status`` ("ok" or "error"), ``latency_ms`` and either ``response`` (the
+    handler's response body) or ``error`` and ``status_code``.
+
+    Args:
+        input_path: JSONL file of request events
+        output_path: JSONL file results are appended to
+        concurrency: Maximum requests in flight (defaults to
+            settings.batch_concurrency)
+        resume: Skip requests that already succeeded in output_path
+
+    Returns:
+        Counts and latency percentiles for this run
+
+    """
+    requests = load_requests(input_path)
+    done = completed_ids(output_path) if resume else set()
+    pending = [event for event in requests if event["id"] not in done]
+    semaphore = asyncio.Semaphore(concurrency or settings.batch_concurrency)
+    records: list[dict[str, Any]] = []
+    started = time.perf_counter()
+
+    # Local appends of one line each; not worth a thread hop per write
+    with Path(output_path).open("a", encoding="utf-8") as out:  # noqa: ASYNC230
+
+        async def run_one(event: dict[str, Any]) -> None:
+            async with semaphore:
+                with request_priority("batch"):
+                    record = await _process(event)
+            out.write(json.dumps(record) + "\n")
+            out.flush()
+            records.append(record)
+
+        await asyncio.gather(*(run_one(event) for event in pending))
+
+    return _summarize(
+        records,
+        total=len(requests),
+        skipped=len(requests) - len(pending),
+        elapsed=time.perf_counter() - started,
+    )
+
+
+def run_batch(
+    input_path: str | Path,
+    output_path: str | Path,
+    *,
+    concurrency: int | None = None,
+    resume: bool = True,
+) -> BatchSummary:
+    """Run :func:`arun_batch` to completion from synchronous code."""
+    return asyncio.run(
+        arun_batch(input_path, output_path, concurrency=concurrency, resume=resume)
+    )
+
+
+async def _process(event: dict[str, Any]) -> dict[str, Any]:
+    """Run one request and build its output record."""
+    started = time.perf_counter()
+    record: dict[str, Any] = {"id": event["id"]}
+
+    if "invalid_json" in event:
+        record.update(
+            status="error",
+            error=f"Invalid JSON: {event['invalid_json']}",
+            status_code=400,
+        )
+    elif "statusCode" in (request := parse_event(event)):
+        record.update(
+            status="error",
+            error=json.loads(request["body"])["error"],
+            status_code=request["statusCode"],
+        )
+    else:
+        try:
+            result = await graph.ainvoke(request["state"], config=request["config"])
+        except Exception as e:
+            record.update(status="error", error=str(e), status_code=error_status(e))
+        else:
+            record.update(status="ok", response=response_body(result))
+        finally:
+            release_thread(graph.checkpointer, request)
+
+    record["latency_ms"] = round((time.perf_counter() - started) * 1000, 1)
+    return record
+
+
+def _summarize(
+    records: list[dict[str, Any]], *, total: int, skipped: int, elapsed: float
+) -> BatchSummary:
+    """Aggregate output records into a summary."""
+    latencies = sorted(record["latency_ms"] for record in records)
+    succeeded = sum(record["status"] == "ok" for record in records)
+    percentiles = {}
+    if latencies:
+        cuts = statistics.quantiles(latencies, n=100) if len(latencies) > 1 else []
+        percentiles = {
+            "latency_p50_ms": statistics.median(latencies),
+            "latency_p95_ms": cuts[94] if cuts else latencies[0],
+            "latency_max_ms": latencies[-1],
+        }
+    return BatchSummary(
+        total=total,
+        skipped=skipped,
+        succeeded=succeeded,
+        failed=len(records) - succeeded,
+        elapsed_seconds=round(elapsed, 3),
+        **percentiles,
+    )
+
+
+def main() -> None:
+    """Run a batch from the command line and print its summary."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("input", help="JSONL file of request events")
+    parser.add_argument("output", help="JSONL file results are appended to")
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=None,
+        help=f"Requests in flight (default {settings.batch_concurrency})",
+    )
+    parser.add_argument(
+        "--no-resume",
+        action="store_true",
+        help="Rerun requests that already succeeded in the output file",
+    )
+    args = parser.parse_args()
+
+    summary = run_batch(
+        args.input,
+        args.output,
+        concurrency=args.concurrency,
+        resume=not args.no_resume,
+    )
+    parser.exit(message=summary.format() + "\n")
+
+
+if __name__ == "__main__":
+    main()
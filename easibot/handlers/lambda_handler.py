@@ -1,10 +1,21 @@
 """AWS Lambda handler for EASI Bot."""
 
 import json
+import math
 from typing import Any
+from uuid import uuid4
+
+from langgraph.checkpoint.base import BaseCheckpointSaver
 
 from easibot.agent import graph
+from easibot.agents.supervisor import normalize_request
+from easibot.cache import SingleFlight
+from easibot.config import settings
 from easibot.graph.state import ConsultantState
+from easibot.llm.resilience import CircuitOpenError, is_throttling_error
+
+# Identical concurrent one-off requests share a single graph run
+REQUEST_FLIGHTS = SingleFlight()
 
 
 def handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
@@ -26,55 +37,253 @@ def handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
 
     """
     try:
-        # Extract request data
-        user_message = event.get("message", "")
-        offerings = event.get("offerings", [])
-        thread_id = event.get("thread_id")
-
-        if not user_message:
-            return {
-                "statusCode": 400,
-                "body": json.dumps({"error": "No message provided"}),
-            }
-
-        # Initialize state
-        state = ConsultantState(
-            messages=[{"role": "user", "content": user_message}],
-            offerings=offerings,
-        )
+        request = parse_event(event)
+        if "statusCode" in request:
+            return request
 
-        # Run graph
-        config = {"configurable": {"thread_id": thread_id}} if thread_id else {}
-        result = graph.invoke(state, config=config)
-
-        # Extract response
-        last_message = result["messages"][-1]
-        response_content = last_message.content
-
-        # Extract deliverables if any
-        deliverables = [
-            {
-                "title": d.title,
-                "type": d.type,
-                "offering": d.offering,
-                "specialist": d.specialist,
-            }
-            for d in result.get("deliverables", [])
-        ]
+        # Run graph, sharing the run with identical in-flight requests
+        key = coalesce_key(event)
 
-        return {
-            "statusCode": 200,
-            "body": json.dumps(
-                {
-                    "message": response_content,
-                    "deliverables": deliverables,
-                    "specialist": result.get("active_specialist"),
-                }
-            ),
-        }
+        def run() -> dict[str, Any]:
+            try:
+                return graph.invoke(request["state"], config=request["config"])
+            finally:
+                release_thread(graph.checkpointer, request)
+
+        result = run() if key is None else REQUEST_FLIGHTS.do(key, run)
+        return _format_response(result)
 
     except Exception as e:
+        return _error_response(e)
+
+
+async def ahandler(event: dict[str, Any], context: Any) -> dict[str, Any]:
+    """Async entry point for EASI Bot requests.
+
+    Runs the graph with ``graph.ainvoke`` so one event loop can serve many
+    conversations concurrently while their Bedrock calls are in flight.
+
+    Args:
+        event: Event containing user message, in the same format as handler
+        context: Lambda context
+
+    Returns:
+        Response with bot message
+
+    """
+    try:
+        request = parse_event(event)
+        if "statusCode" in request:
+            return request
+
+        key = coalesce_key(event)
+
+        async def run() -> dict[str, Any]:
+            try:
+                return await graph.ainvoke(request["state"], config=request["config"])
+            finally:
+                release_thread(graph.checkpointer, request)
+
+        result = await (run() if key is None else REQUEST_FLIGHTS.ado(key, run))
+        return _format_response(result)
+
+    except Exception as e:
+        return _error_response(e)
+
+
+def parse_event(event: dict[str, Any]) -> dict[str, Any]:
+    """Build the graph input and config from an event.
+
+    Args:
+        event: Lambda event containing user message
+
+    Returns:
+        Dict with "state", "config" and "ephemeral" (True when the event has
+        no thread_id), or a 400 response if invalid
+
+    """
+    # Extract request data
+    user_message = event.get("message", "")
+    offerings = event.get("offerings", [])
+    thread_id = event.get("thread_id")
+
+    if not user_message:
         return {
-            "statusCode": 500,
-            "body": json.dumps({"error": str(e)}),
+            "statusCode": 400,
+            "body": json.dumps({"error": "No message provided"}),
+        }
+
+    # Initialize state
+    state = ConsultantState(
+        messages=[{"role": "user", "content": user_message}],
+        offerings=offerings,
+    )
+
+    # The checkpointer needs a thread; one-off requests get a fresh one,
+    # deleted by release_thread once the graph has run
+    config = {"configurable": {"thread_id": thread_id or f"request-{uuid4().hex}"}}
+    return {"state": state, "config": config, "ephemeral": not thread_id}
+
+
+def release_thread(checkpointer: BaseCheckpointSaver | None, request: dict) -> None:
+    """Delete a one-off request's checkpoints after its graph run.
+
+    Nothing will resume a thread the client never named, so keeping its
+    checkpoint would only grow the checkpointer with every request.
+
+    Args:
+        checkpointer: Checkpointer the graph was compiled with, if any
+        request: Request built by parse_event
+
+    """
+    if isinstance(checkpointer, BaseCheckpointSaver) and request.get("ephemeral"):
+        checkpointer.delete_thread(request["config"]["configurable"]["thread_id"])
+
+
+def coalesce_key(event: dict[str, Any]) -> tuple | None:
+    """Return the key identical requests are coalesced under, if any.
+
+    Only requests without a thread_id qualify: they have no history, so the
+    answer depends on the message and offerings alone. Requests on a thread
+    always run, so each thread's checkpoint records its own turn.
+
+    Args:
+        event: Valid request event
+
+    Returns:
+        (normalized message, sorted offerings), or None to run uncoalesced
+
+    """
+    if not settings.single_flight_requests or event.get("thread_id"):
+        return None
+    return (
+        normalize_request(event["message"]),
+        tuple(sorted(event.get("offerings", []))),
+    )
+
+
+def _format_response(result: dict[str, Any]) -> dict[str, Any]:
+    """Build the HTTP response from the final graph state.
+
+    Args:
+        result: Final graph state
+
+    Returns:
+        200 response with message, deliverables, specialist and routing
+
+    """
+    return {
+        "statusCode": 200,
+        "body": json.dumps(response_body(result)),
+    }
+
+
+def response_body(result: dict[str, Any]) -> dict[str, Any]:
+    """Summarize the final graph state for clients.
+
+    When several specialists answered this turn (e.g. a cross-offering
+    request dispatched in parallel), their answers are merged into the
+    message, one section each, in the order they were added.
+
+    Args:
+        result: Final graph state
+
+    Returns:
+        Dict with message, deliverables (the latest per specialist),
+        specialist, routing and, when the answer came from the research
+        semantic cache, the cache hit details
+
+    """
+    # Latest deliverable per specialist; deliverables accumulate over turns
+    latest = {d.specialist: d for d in result.get("deliverables", [])}
+    deliverables = [
+        {
+            "title": d.title,
+            "type": d.type,
+            "offering": d.offering,
+            "specialist": d.specialist,
         }
+        for d in latest.values()
+    ]
+
+    answers = turn_answers(result["messages"]) or [result["messages"][-1]]
+    if len(answers) == 1:
+        message = answers[0].content
+    else:
+        message = "\n\n".join(
+            f"## {_answer_heading(answer.name, latest)}\n\n{answer.content}"
+            for answer in answers
+        )
+
+    routing_decision = result.get("routing_decision")
+
+    return {
+        "message": message,
+        "deliverables": deliverables,
+        "specialist": result.get("active_specialist"),
+        "routing": routing_decision.model_dump() if routing_decision else None,
+        "semantic_cache": next(
+            (
+                answer.response_metadata["semantic_cache"]
+                for answer in answers
+                if "semantic_cache" in getattr(answer, "response_metadata", {})
+            ),
+            None,
+        ),
+    }
+
+
+def turn_answers(messages: list) -> list:
+    """Return the specialist answers added since the latest user message.
+
+    Args:
+        messages: Conversation messages, oldest first
+
+    Returns:
+        Named, non-empty AI messages of the current turn, oldest first
+
+    """
+    answers = []
+    for message in reversed(messages):
+        if message.type == "human":
+            break
+        if message.type == "ai" and message.name and message.content:
+            answers.append(message)
+    return answers[::-1]
+
+
+def _answer_heading(name: str, deliverables: dict[str, Any]) -> str:
+    """Title a specialist's section by its deliverable, or by its name."""
+    specialist = name.removesuffix("_specialist")
+    if specialist in deliverables:
+        return deliverables[specialist].title
+    return specialist.replace("_", " ").capitalize()
+
+
+def error_status(error: Exception) -> int:
+    """Map an error to an HTTP status code.
+
+    Args:
+        error: Error raised while running the graph
+
+    Returns:
+        429 if Bedrock throttled the request, 503 if a model's circuit
+        breaker is open, otherwise 500
+
+    """
+    if isinstance(error, CircuitOpenError):
+        return 503
+    if is_throttling_error(error):
+        return 429
+    return 500
+
+
+def _error_response(error: Exception) -> dict[str, Any]:
+    """Build the error response, telling clients when to retry if overloaded."""
+    response: dict[str, Any] = {
+        "statusCode": error_status(error),
+        "body": json.dumps({"error": str(error)}),
+    }
+    if isinstance(error, CircuitOpenError):
+        response["headers"] = {"Retry-After": str(math.ceil(error.retry_after))}
+    return response
@@ -0,0 +1,190 @@
+"""Streaming handlers that forward specialist tokens as they are generated."""
+
+from __future__ import annotations
+
+import json
+import time
+from typing import TYPE_CHECKING, Any
+
+from langchain_core.messages import AIMessageChunk
+
+from easibot.agent import graph
+from easibot.handlers.lambda_handler import (
+    error_status,
+    parse_event,
+    release_thread,
+    response_body,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+# Nodes whose LLM output is internal (routing JSON) rather than user-facing
+SILENT_NODES = frozenset({"supervisor", "prefetch"})
+
+
+async def astream(event: dict[str, Any]) -> AsyncIterator[dict[str, Any]]:
+    """Run the graph for an event and yield frames as they become available.
+
+    Frames are dicts with a ``type`` of:
+
+    - ``token``: a piece of specialist output, with ``specialist`` and ``content``
+    - ``metadata``: sent last, with the same fields as the non-streaming
+      response body plus ``ttft_ms``, the time to the first token
+    - ``error``: the request failed, with ``error`` and the HTTP ``status``
+      the non-streaming handler would have returned
+
+    Args:
+        event: Event in the same format as ``lambda_handler.handler``
+
+    Yields:
+        Frames in the order they should be sent to the client
+
+    """
+    request = parse_event(event)
+    if "statusCode" in request:
+        yield {
+            "type": "error",
+            **json.loads(request["body"]),
+            "status": request["statusCode"],
+        }
+        return
+
+    started = time.perf_counter()
+    first_token_at = None
+    final_state: dict[str, Any] = {}
+
+    try:
+        async for mode, chunk in graph.astream(
+            request["state"],
+            config=request["config"],
+            stream_mode=["messages", "values"],
+        ):
+            if mode == "values":
+                final_state = chunk
+                continue
+
+            message, metadata = chunk
+            node = metadata.get("langgraph_node")
+            # Completed messages repeat the streamed chunks; forward chunks only
+            if node in SILENT_NODES or not isinstance(message, AIMessageChunk):
+                continue
+            content = _chunk_text(message.content)
+            if not content:
+                continue
+
+            if first_token_at is None:
+                first_token_at = time.perf_counter()
+            yield {"type": "token", "specialist": node, "content": content}
+
+    except Exception as e:
+        yield {"type": "error", "error": str(e), "status": error_status(e)}
+        return
+    finally:
+        release_thread(graph.checkpointer, request)
+
+    yield {
+        "type": "metadata",
+        **response_body(final_state),
+        "ttft_ms": round((first_token_at - started) * 1000, 1)
+        if first_token_at is not None
+        else None,
+    }
+
+
+def sse_encode(frame: dict[str, Any]) -> bytes:
+    """Encode a frame as a Server-Sent Events message."""
+    return f"event: {frame['type']}\ndata: {json.dumps(frame)}\n\n".encode()
+
+
+async def stream_handler(event: dict[str, Any], context: Any) -> AsyncIterator[bytes]:
+    """Lambda response-streaming entry point yielding SSE-encoded frames.
+
+    Args:
+        event: Event in the same format as ``lambda_handler.handler``
+        context: Lambda context
+
+    Yields:
+        SSE messages, one per frame
+
+    """
+    async for frame in astream(event):
+        yield sse_encode(frame)
+
+
+async def app(scope: dict[str, Any], receive: Any, send: Any) -> None:
+    """Minimal ASGI app serving ``POST`` requests as an SSE stream.
+
+    The request body is the same JSON event accepted by the Lambda handlers.
+    Run it with any ASGI server, e.g. ``uvicorn easibot.handlers.streaming:app``.
+
+    Args:
+        scope: ASGI connection scope
+        receive: ASGI receive callable
+        send: ASGI send callable
+
+    """
+    if scope["type"] != "http":
+        return
+
+    if scope["method"] != "POST":
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 405,
+                "headers": [(b"allow", b"POST")],
+            }
+        )
+        await send({"type": "http.response.body", "body": b""})
+        return
+
+    body = b""
+    more_body = True
+    while more_body:
+        message = await receive()
+        body += message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+    await send(
+        {
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [
+                (b"content-type", b"text/event-stream"),
+                (b"cache-control", b"no-cache"),
+            ],
+        }
+    )
+
+    async for frame in _sse_frames(body):
+        await send({"type": "http.response.body", "body": frame, "more_body": True})
+
+    await send({"type": "http.response.body", "body": b"", "more_body": False})
+
+
+async def _sse_frames(body: bytes) -> AsyncIterator[bytes]:
+    """Decode a JSON request body and stream its SSE frames."""
+    try:
+        event = json.loads(body or b"{}")
+    except json.JSONDecodeError:
+        event = None
+
+    if not isinstance(event, dict):
+        yield sse_encode(
+            {"type": "error", "error": "Request body must be a JSON object"}
+        )
+        return
+
+    async for frame in stream_handler(event, None):
+        yield frame
+
+
+def _chunk_text(content: str | list) -> str:
+    """Extract text from a message chunk's content (string or content blocks)."""
+    if isinstance(content, str):
+        return content
+    return "".join(
+        block.get("text", "")
+        for block in content
+        if isinstance(block, dict) and block.get("type") == "text"
+    )
@@ -0,0 +1,49 @@
+"""Chat model helpers shared by all agents."""
+
+from .context import (
+    ResearchContext,
+    build_research_context,
+    context_budget,
+    estimate_tokens,
+)
+from .prompt_cache import (
+    PROMPT_CACHE_TRACKER,
+    PromptCacheTracker,
+    cache_token_usage,
+    cached_system_message,
+)
+from .rate_limit import RATE_GOVERNOR, RateGovernor, request_priority
+from .resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    Endpoint,
+    ResilientModel,
+    get_circuit_breaker,
+    is_retryable_error,
+    is_throttling_error,
+)
+from .tiers import ModelTiers, is_complete_response, resolve_tiers
+
+__all__ = [
+    "PROMPT_CACHE_TRACKER",
+    "RATE_GOVERNOR",
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "Endpoint",
+    "ModelTiers",
+    "PromptCacheTracker",
+    "RateGovernor",
+    "ResearchContext",
+    "ResilientModel",
+    "build_research_context",
+    "cache_token_usage",
+    "cached_system_message",
+    "context_budget",
+    "estimate_tokens",
+    "get_circuit_breaker",
+    "is_complete_response",
+    "is_retryable_error",
+    "is_throttling_error",
+    "request_priority",
+    "resolve_tiers",
+]
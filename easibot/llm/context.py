@@ -0,0 +1,131 @@
+"""Token-budgeted assembly of research findings into prompt context."""
+
+import re
+
+from pydantic import BaseModel, Field
+
+from easibot.config.settings import settings
+from easibot.graph.state import ResearchFinding
+
+# Rough English average for Claude tokenizers; good enough for budgeting
+CHARS_PER_TOKEN = 4
+
+_SENTENCE_BREAK = re.compile(r"(?<=[.!?])\s+")
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the token count of text at about four characters per token."""
+    return -(-len(text) // CHARS_PER_TOKEN)
+
+
+def context_budget(model_id: str | None = None) -> int:
+    """Return the research-context token budget for a model.
+
+    Args:
+        model_id: Bedrock model id the prompt is for
+
+    Returns:
+        Budget from settings.context_token_budgets, or the default budget
+
+    """
+    return settings.context_token_budgets.get(
+        model_id or "", settings.context_token_budget
+    )
+
+
+def truncate_to_sentences(text: str, max_tokens: int) -> str:
+    """Keep as many leading whole sentences of text as fit in max_tokens.
+
+    Args:
+        text: Text to shorten
+        max_tokens: Token limit for the result
+
+    Returns:
+        Leading sentences within the limit, or "" if not even one fits
+
+    """
+    kept = ""
+    for sentence in _SENTENCE_BREAK.split(text.strip()):
+        candidate = f"{kept} {sentence}" if kept else sentence
+        if estimate_tokens(candidate) > max_tokens:
+            break
+        kept = candidate
+    return kept
+
+
+class ResearchContext(BaseModel):
+    """Research findings packed into a prompt section."""
+
+    text: str = ""
+    findings: list[ResearchFinding] = Field(default_factory=list)
+    tokens_used: int = 0
+    budget: int
+    truncated: int = 0  # findings cut at a sentence boundary to fit
+    dropped: int = 0  # duplicates and findings that did not fit
+
+
+def build_research_context(
+    findings: list[ResearchFinding],
+    budget: int,
+    *,
+    header: str = "Available Research:",
+    numbered: bool = False,
+) -> ResearchContext:
+    """Rank, dedupe and pack findings into a token budget.
+
+    Findings are taken in descending relevance. Findings whose normalized
+    content repeats an earlier one are skipped. A finding that does not fit
+    whole is cut at a sentence boundary, or skipped if no sentence fits.
+
+    Args:
+        findings: Candidate findings
+        budget: Maximum estimated tokens for the whole section
+        header: First line of the section
+        numbered: Number the findings instead of bulleting them
+
+    Returns:
+        Packed context with the findings it includes and the tokens used
+
+    """
+    seen: set[str] = set()
+    included: list[ResearchFinding] = []
+    lines: list[str] = []
+    tokens = estimate_tokens(header) + 1
+    truncated = 0
+
+    for finding in sorted(findings, key=lambda f: f.relevance_score, reverse=True):
+        key = " ".join(finding.content.lower().split())
+        if key in seen:
+            continue
+        seen.add(key)
+
+        bullet = f"{len(included) + 1}. " if numbered else "- "
+        prefix = f"{bullet}[{finding.source}] "
+        line = prefix + finding.content
+        fitted = finding
+        if estimate_tokens(line) + 1 > budget - tokens:
+            content = truncate_to_sentences(
+                finding.content, budget - tokens - estimate_tokens(prefix) - 1
+            )
+            if not content:
+                continue
+            fitted = finding.model_copy(update={"content": content})
+            line = prefix + content
+            truncated += 1
+
+        included.append(fitted)
+        lines.append(line)
+        tokens += estimate_tokens(line) + 1
+
+    if not included:
+        return ResearchContext(budget=budget, dropped=len(findings))
+
+    text = "\n".join([header, *lines]) + "\n"
+    return ResearchContext(
+        text=text,
+        findings=included,
+        tokens_used=estimate_tokens(text),
+        budget=budget,
+        truncated=truncated,
+        dropped=len(findings) - len(included),
+    )
@@ -0,0 +1,135 @@
+"""Bedrock prompt caching for the agents' static system prompts.
+
+Agents send their system prompt as a content block ending in a cache
+checkpoint, followed by the per-turn research context and then the user turn.
+Bedrock can then reuse the processed system prompt across calls and only bills
+the variable suffix at the full input rate. Prompts shorter than the model's
+minimum cacheable length are processed normally.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from threading import Lock
+from typing import TYPE_CHECKING, Any
+
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.messages import BaseMessage, SystemMessage
+from langchain_core.outputs import LLMResult  # noqa: TC002 - annotations are evaluated at runtime
+
+from easibot.config.settings import settings
+
+if TYPE_CHECKING:
+    from uuid import UUID
+
+# Marker Bedrock's Anthropic API uses to end a cached prompt prefix
+CACHE_CONTROL = {"type": "ephemeral"}
+
+
+def cached_system_message(prompt: str) -> SystemMessage:
+    """Build a system message whose text is marked as a cacheable prefix.
+
+    Args:
+        prompt: Static system prompt
+
+    Returns:
+        System message with a cache checkpoint after the prompt, or a plain
+        system message when settings.bedrock_prompt_caching is off
+
+    """
+    if not settings.bedrock_prompt_caching:
+        return SystemMessage(content=prompt)
+    return SystemMessage(
+        content=[{"type": "text", "text": prompt, "cache_control": CACHE_CONTROL}]
+    )
+
+
+def cache_token_usage(message: BaseMessage | None) -> dict[str, int] | None:
+    """Return input, cache-read and cache-write token counts for a response.
+
+    Args:
+        message: Chat model response
+
+    Returns:
+        Token counts, or None if the response carries no usage metadata
+
+    """
+    usage = getattr(message, "usage_metadata", None)
+    if not usage:
+        return None
+
+    details = usage.get("input_token_details") or {}
+    return {
+        "input_tokens": usage.get("input_tokens", 0),
+        "cache_read_tokens": details.get("cache_read", 0),
+        "cache_write_tokens": details.get("cache_creation", 0),
+    }
+
+
+class PromptCacheTracker(BaseCallbackHandler):
+    """Callback recording the prompt-cache token counts of each model call.
+
+    ``calls()`` lists the most recent calls with the agent that made them;
+    ``totals()`` sums every call seen since the last reset.
+    """
+
+    def __init__(self, max_calls: int = 1000):
+        """Initialize the tracker.
+
+        Args:
+            max_calls: Number of recent calls to keep for ``calls()``
+
+        """
+        self._calls: deque[dict[str, Any]] = deque(maxlen=max_calls)
+        self._totals = dict.fromkeys(
+            ("calls", "input_tokens", "cache_read_tokens", "cache_write_tokens"), 0
+        )
+        self._lock = Lock()
+
+    def on_llm_end(
+        self,
+        response: LLMResult,
+        *,
+        run_id: UUID,
+        tags: list[str] | None = None,
+        **kwargs: Any,
+    ) -> None:
+        """Record cache usage for a finished model call."""
+        agent = next(
+            (
+                tag.removeprefix("agent:")
+                for tag in tags or []
+                if tag.startswith("agent:")
+            ),
+            None,
+        )
+        for generations in response.generations:
+            for generation in generations:
+                usage = cache_token_usage(getattr(generation, "message", None))
+                if usage is None:
+                    continue
+                with self._lock:
+                    self._calls.append({"run_id": str(run_id), "agent": agent, **usage})
+                    self._totals["calls"] += 1
+                    for key, value in usage.items():
+                        self._totals[key] += value
+
+    def calls(self) -> list[dict[str, Any]]:
+        """Return the recorded calls, oldest first."""
+        with self._lock:
+            return list(self._calls)
+
+    def totals(self) -> dict[str, int]:
+        """Return call count and summed token counts."""
+        with self._lock:
+            return dict(self._totals)
+
+    def reset(self) -> None:
+        """Forget recorded calls and totals."""
+        with self._lock:
+            self._calls.clear()
+            self._totals = dict.fromkeys(self._totals, 0)
+
+
+# Process-wide tracker attached to every chat model by get_chat_model
+PROMPT_CACHE_TRACKER = PromptCacheTracker()
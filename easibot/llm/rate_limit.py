@@ -0,0 +1,271 @@
+"""Client-side rate governor for Bedrock request and token quotas."""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from threading import Condition
+from typing import TYPE_CHECKING
+
+from easibot.config.settings import settings
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+# Lower rank is served first; batch work only runs when no interactive
+# caller is queued for the same model
+PRIORITIES = {"interactive": 0, "batch": 1}
+
+# How often a queued async caller that is not first in line re-checks
+POLL_SECONDS = 0.05
+
+_priority: ContextVar[str] = ContextVar("bedrock_priority", default="interactive")
+
+
+@contextmanager
+def request_priority(priority: str) -> Iterator[None]:
+    """Run Bedrock calls made in this context at the given priority.
+
+    Args:
+        priority: "interactive" (the default) or "batch"
+
+    """
+    if priority not in PRIORITIES:
+        msg = f"Unknown priority {priority!r}; expected one of {list(PRIORITIES)}"
+        raise ValueError(msg)
+    token = _priority.set(priority)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+class TokenBucket:
+    """Token bucket refilled continuously at a per-minute rate."""
+
+    def __init__(self, per_minute: float, burst_seconds: float):
+        """Initialize a full bucket.
+
+        Args:
+            per_minute: Sustained rate, in units per minute
+            burst_seconds: Capacity, in seconds' worth of the rate
+
+        """
+        self.rate = per_minute / 60
+        self.capacity = max(1.0, self.rate * burst_seconds)
+        self.level = self.capacity
+        self.updated = time.monotonic()
+
+    def delay(self, amount: float, now: float) -> float:
+        """Return seconds until amount is available (0 if it is now)."""
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.rate)
+        self.updated = now
+        shortfall = min(amount, self.capacity) - self.level
+        return shortfall / self.rate if shortfall > 0 else 0.0
+
+    def take(self, amount: float) -> None:
+        """Remove amount (capped at capacity) from the bucket."""
+        self.level -= min(amount, self.capacity)
+
+
+class _ModelQueue:
+    """Buckets, waiting callers and wait statistics for one model."""
+
+    def __init__(self, requests_per_minute: int | None, tokens_per_minute: int | None):
+        burst = settings.rate_limit_burst_seconds
+        self.requests = (
+            TokenBucket(requests_per_minute, burst) if requests_per_minute else None
+        )
+        self.tokens = (
+            TokenBucket(tokens_per_minute, burst) if tokens_per_minute else None
+        )
+        self.waiters: list[tuple[int, int]] = []  # heap of (priority rank, seq)
+        self.granted = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+    def delay(self, tokens: int, now: float) -> float:
+        """Return seconds until one request of ``tokens`` fits both buckets."""
+        delay = 0.0
+        if self.requests is not None:
+            delay = self.requests.delay(1, now)
+        if self.tokens is not None:
+            delay = max(delay, self.tokens.delay(tokens, now))
+        return delay
+
+    def take(self, tokens: int) -> None:
+        """Consume one request and ``tokens`` tokens."""
+        if self.requests is not None:
+            self.requests.take(1)
+        if self.tokens is not None:
+            self.tokens.take(tokens)
+
+
+class RateGovernor:
+    """Per-model request and token buckets shared by every Bedrock call.
+
+    Callers queue per model and region, ordered by priority and then arrival,
+    and only the caller at the head of the queue may take capacity. Models
+    with neither a requests-per-minute nor a tokens-per-minute quota are not
+    limited.
+    """
+
+    def __init__(self):
+        """Initialize with no queues; they are created on first use."""
+        self._queues: dict[str, _ModelQueue] = {}
+        self._cond = Condition()
+        self._seq = itertools.count()
+
+    def acquire(self, model_id: str, tokens: int, region: str | None = None) -> float:
+        """Block until a request of ``tokens`` estimated tokens may be sent.
+
+        Args:
+            model_id: Bedrock model id
+            tokens: Estimated input plus reserved output tokens
+            region: AWS region (defaults to settings.bedrock_region)
+
+        Returns:
+            Seconds spent waiting
+
+        """
+        queue = self._queue(model_id, region)
+        if queue is None:
+            return 0.0
+
+        started = time.monotonic()
+        with self._cond:
+            entry = self._enqueue(queue)
+            granted = False
+            try:
+                while (delay := self._try_grant(queue, entry, tokens)) is not None:
+                    self._cond.wait(timeout=delay)
+                granted = True
+            finally:
+                self._leave(queue, entry, started, granted=granted)
+        return time.monotonic() - started
+
+    async def aacquire(
+        self, model_id: str, tokens: int, region: str | None = None
+    ) -> float:
+        """Async version of :meth:`acquire`; waits without blocking the loop."""
+        queue = self._queue(model_id, region)
+        if queue is None:
+            return 0.0
+
+        started = time.monotonic()
+        with self._cond:
+            entry = self._enqueue(queue)
+        granted = False
+        try:
+            while True:
+                with self._cond:
+                    delay = self._try_grant(queue, entry, tokens)
+                if delay is None:
+                    granted = True
+                    break
+                await asyncio.sleep(min(delay, POLL_SECONDS))
+        finally:
+            with self._cond:
+                self._leave(queue, entry, started, granted=granted)
+        return time.monotonic() - started
+
+    def stats(self) -> dict[str, dict[str, float]]:
+        """Return queue depth and wait times per model and region.
+
+        Returns:
+            For each "<model id>@<region>": current ``queue_depth``, queued
+            callers per priority, requests ``granted``, and the average and
+            maximum wait in milliseconds
+
+        """
+        ranks = {rank: name for name, rank in PRIORITIES.items()}
+        with self._cond:
+            return {
+                key: {
+                    "queue_depth": len(queue.waiters),
+                    **{
+                        f"queued_{name}": sum(
+                            1 for rank, _ in queue.waiters if ranks[rank] == name
+                        )
+                        for name in PRIORITIES
+                    },
+                    "granted": queue.granted,
+                    "avg_wait_ms": round(
+                        queue.wait_total / queue.granted * 1000 if queue.granted else 0,
+                        1,
+                    ),
+                    "max_wait_ms": round(queue.wait_max * 1000, 1),
+                }
+                for key, queue in self._queues.items()
+            }
+
+    def reset(self) -> None:
+        """Drop all queues so limits are re-read from settings (used by tests)."""
+        with self._cond:
+            self._queues.clear()
+
+    def _queue(self, model_id: str, region: str | None) -> _ModelQueue | None:
+        """Return the queue for a model and region, or None if it is unlimited."""
+        quota = settings.bedrock_model_quotas.get(model_id, {})
+        requests_per_minute = quota.get(
+            "requests_per_minute", settings.bedrock_requests_per_minute
+        )
+        tokens_per_minute = quota.get(
+            "tokens_per_minute", settings.bedrock_tokens_per_minute
+        )
+        if not requests_per_minute and not tokens_per_minute:
+            return None
+
+        key = f"{model_id}@{region or settings.bedrock_region}"
+        with self._cond:
+            if key not in self._queues:
+                self._queues[key] = _ModelQueue(requests_per_minute, tokens_per_minute)
+            return self._queues[key]
+
+    def _enqueue(self, queue: _ModelQueue) -> tuple[int, int]:
+        """Add a waiter at the current context's priority (lock held)."""
+        entry = (PRIORITIES[_priority.get()], next(self._seq))
+        heapq.heappush(queue.waiters, entry)
+        return entry
+
+    def _try_grant(
+        self, queue: _ModelQueue, entry: tuple[int, int], tokens: int
+    ) -> float | None:
+        """Grant capacity to entry if it is first in line (lock held).
+
+        Returns:
+            None if granted, else the seconds to wait before trying again
+
+        """
+        if queue.waiters[0] != entry:
+            return POLL_SECONDS
+        delay = queue.delay(tokens, time.monotonic())
+        if delay > 0:
+            return delay
+        queue.take(tokens)
+        return None
+
+    def _leave(
+        self,
+        queue: _ModelQueue,
+        entry: tuple[int, int],
+        started: float,
+        *,
+        granted: bool,
+    ) -> None:
+        """Remove a waiter, record its wait and wake the rest (lock held)."""
+        queue.waiters.remove(entry)
+        heapq.heapify(queue.waiters)
+        if granted:
+            waited = time.monotonic() - started
+            queue.granted += 1
+            queue.wait_total += waited
+            queue.wait_max = max(queue.wait_max, waited)
+        self._cond.notify_all()
+
+
+RATE_GOVERNOR = RateGovernor()
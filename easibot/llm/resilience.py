@@ -0,0 +1,455 @@
+"""Retries, circuit breaking and request hedging for Bedrock calls."""
+
+import asyncio
+import random
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextvars import Context, copy_context
+from threading import Lock
+from typing import Any, NamedTuple
+
+from botocore.exceptions import ClientError, HTTPClientError
+from botocore.exceptions import ConnectionError as BotoConnectionError
+from langchain_core.callbacks import BaseCallbackManager
+from langchain_core.runnables.config import var_child_runnable_config
+from langchain_core.tracers._streaming import _StreamingCallbackHandler
+
+from easibot.config.settings import settings
+
+from .context import estimate_tokens
+from .rate_limit import RATE_GOVERNOR
+
+# Bedrock error codes that mean "slow down" rather than "bad request"
+THROTTLING_ERROR_CODES = frozenset({"ThrottlingException", "TooManyRequestsException"})
+TRANSIENT_ERROR_CODES = frozenset(
+    {
+        "ServiceUnavailableException",
+        "ModelNotReadyException",
+        "ModelTimeoutException",
+        "InternalServerException",
+    }
+)
+
+# Threads running hedged calls, shared by all models; a losing call keeps its
+# thread until Bedrock answers
+HEDGE_POOL_SIZE = 32
+_hedge_pool = ThreadPoolExecutor(
+    max_workers=HEDGE_POOL_SIZE, thread_name_prefix="hedge"
+)
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling a model whose circuit breaker is open."""
+
+    def __init__(self, name: str, retry_after: float):
+        """Initialize the error.
+
+        Args:
+            name: Breaker name ("<model id>@<region>")
+            retry_after: Seconds until the breaker lets a trial call through
+
+        """
+        super().__init__(f"Circuit open for {name}; retry in {retry_after:.1f}s")
+        self.name = name
+        self.retry_after = retry_after
+
+
+def error_code(error: BaseException) -> str | None:
+    """Return the AWS error code of a botocore ClientError, if it is one."""
+    if isinstance(error, ClientError):
+        return error.response.get("Error", {}).get("Code")
+    return None
+
+
+def is_throttling_error(error: BaseException) -> bool:
+    """Check whether Bedrock rejected a call for exceeding a rate or quota."""
+    return error_code(error) in THROTTLING_ERROR_CODES
+
+
+def is_retryable_error(error: BaseException) -> bool:
+    """Check whether a call failed for a reason a later attempt may not hit."""
+    return (
+        is_throttling_error(error)
+        or error_code(error) in TRANSIENT_ERROR_CODES
+        or isinstance(error, BotoConnectionError | HTTPClientError)
+    )
+
+
+def backoff_delay(attempt: int, base: float, cap: float) -> float:
+    """Return a "full jitter" delay before retry number ``attempt + 1``.
+
+    Args:
+        attempt: Number of retries already made
+        base: Delay scale in seconds
+        cap: Maximum delay in seconds
+
+    Returns:
+        Uniformly random delay in [0, min(cap, base * 2**attempt)]
+
+    """
+    return random.uniform(0, min(cap, base * 2**attempt))  # noqa: S311
+
+
+class CircuitBreaker:
+    """Fail fast on a model that keeps failing.
+
+    After ``failure_threshold`` consecutive retryable failures the breaker
+    opens and calls raise :class:`CircuitOpenError` without reaching Bedrock.
+    Once ``reset_seconds`` have passed it is half-open: a single trial call is
+    let through while the others keep failing fast. The trial's success closes
+    the breaker and its failure reopens it; a trial that never reports back
+    (e.g. a cancelled task, or one that failed with a non-retryable error) is
+    replaced after another ``reset_seconds``.
+    """
+
+    def __init__(
+        self, name: str, failure_threshold: int = 5, reset_seconds: float = 30.0
+    ):
+        """Initialize a closed breaker.
+
+        Args:
+            name: Name reported in errors
+            failure_threshold: Consecutive failures that open the breaker
+            reset_seconds: Time the breaker stays open before a trial call
+
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._trial_at: float | None = None
+        self._lock = Lock()
+
+    @property
+    def state(self) -> str:
+        """Return "closed", "open" or "half_open"."""
+        with self._lock:
+            if self._opened_at is None:
+                return "closed"
+            if time.monotonic() - self._opened_at < self.reset_seconds:
+                return "open"
+            return "half_open"
+
+    def retry_after(self) -> float:
+        """Return the seconds until a call would be let through (0 if now)."""
+        with self._lock:
+            return self._wait(time.monotonic())
+
+    def check(self) -> None:
+        """Raise CircuitOpenError if calls are currently blocked.
+
+        When the breaker is half-open, the first caller becomes the trial call
+        and is let through; the breaker then blocks others until it reports.
+        """
+        with self._lock:
+            now = time.monotonic()
+            remaining = self._wait(now)
+            if remaining == 0 and self._opened_at is not None:
+                self._trial_at = now
+        if remaining > 0:
+            raise CircuitOpenError(self.name, remaining)
+
+    def record_success(self) -> None:
+        """Close the breaker and reset the failure count."""
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_at = None
+
+    def record_failure(self) -> None:
+        """Count a failure, opening (or reopening) the breaker at the threshold."""
+        with self._lock:
+            self._failures += 1
+            self._trial_at = None
+            if self._failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+
+    def _wait(self, now: float) -> float:
+        """Return the seconds until a call is allowed; the lock must be held."""
+        if self._opened_at is None:
+            return 0.0
+        if self._trial_at is not None:
+            return max(self.reset_seconds - (now - self._trial_at), 0.0)
+        return max(self.reset_seconds - (now - self._opened_at), 0.0)
+
+
+_breakers: dict[str, CircuitBreaker] = {}
+_breakers_lock = Lock()
+
+
+def get_circuit_breaker(
+    model_id: str, region_name: str | None = None
+) -> CircuitBreaker:
+    """Return the process-wide breaker for a model in a region.
+
+    Args:
+        model_id: Bedrock model id
+        region_name: AWS region (defaults to settings.bedrock_region)
+
+    Returns:
+        Shared breaker configured from settings
+
+    """
+    name = f"{model_id}@{region_name or settings.bedrock_region}"
+    with _breakers_lock:
+        if name not in _breakers:
+            _breakers[name] = CircuitBreaker(
+                name,
+                failure_threshold=settings.circuit_breaker_failure_threshold,
+                reset_seconds=settings.circuit_breaker_reset_seconds,
+            )
+        return _breakers[name]
+
+
+def reset_circuit_breakers() -> None:
+    """Drop all breakers so the next call starts closed (used by tests)."""
+    with _breakers_lock:
+        _breakers.clear()
+
+
+class Endpoint(NamedTuple):
+    """A model runnable and what guards calls to it."""
+
+    runnable: Any
+    breaker: CircuitBreaker
+    model_id: str | None = None  # rate-limited when set
+    region: str | None = None
+    max_tokens: int | None = None  # output tokens reserved against the quota
+
+
+def request_tokens(messages: list, max_tokens: int | None = None) -> int:
+    """Estimate the tokens a call counts against a tokens-per-minute quota.
+
+    Args:
+        messages: Prompt messages
+        max_tokens: Output token limit of the call
+
+    Returns:
+        Estimated input tokens plus the reserved output tokens
+
+    """
+    text = "".join(str(getattr(message, "content", message)) for message in messages)
+    return estimate_tokens(text) + (max_tokens or settings.rate_limit_output_tokens)
+
+
+class ResilientModel:
+    """A chat model runnable guarded by retries, a breaker and an optional hedge.
+
+    Each attempt checks the breaker, waits for the model's rate governor,
+    then calls the primary model. With a hedge configured, a primary call
+    still running after ``hedge_after`` seconds is duplicated on the hedge
+    endpoint and the first successful answer wins. Retryable errors are
+    retried with jittered exponential backoff; other errors and open circuits
+    are raised immediately.
+    """
+
+    def __init__(
+        self,
+        primary: Endpoint,
+        *,
+        hedge: Endpoint | None = None,
+        hedge_after: float | None = None,
+    ):
+        """Initialize the wrapper.
+
+        Args:
+            primary: Model (or structured-output runnable) to call
+            hedge: Endpoint to send duplicate requests to
+            hedge_after: Seconds to wait for the primary before hedging, or
+                None to never hedge
+
+        """
+        self.primary = primary
+        self.runnable = primary.runnable
+        self.hedge = hedge if hedge_after is not None else None
+        self.hedge_after = hedge_after
+        self.max_retries = settings.llm_max_retries
+        self.base_delay = settings.llm_retry_base_delay
+        self.max_delay = settings.llm_retry_max_delay
+
+    def invoke(self, messages: list) -> Any:
+        """Call the model, retrying retryable failures.
+
+        Raises:
+            CircuitOpenError: The model's breaker is open
+            Exception: The last error once retries are exhausted
+
+        """
+        attempt = 0
+        while True:
+            try:
+                return self._hedged(messages)
+            except CircuitOpenError:
+                raise
+            except Exception as e:
+                if not is_retryable_error(e) or attempt >= self.max_retries:
+                    raise
+            time.sleep(backoff_delay(attempt, self.base_delay, self.max_delay))
+            attempt += 1
+
+    async def ainvoke(self, messages: list) -> Any:
+        """Async version of :meth:`invoke`."""
+        attempt = 0
+        while True:
+            try:
+                return await self._ahedged(messages)
+            except CircuitOpenError:
+                raise
+            except Exception as e:
+                if not is_retryable_error(e) or attempt >= self.max_retries:
+                    raise
+            await asyncio.sleep(backoff_delay(attempt, self.base_delay, self.max_delay))
+            attempt += 1
+
+    def _hedged(self, messages: list) -> Any:
+        """Call the primary, duplicating the call on the hedge if it is slow.
+
+        Both calls run on a pool shared by all models. The losing call cannot
+        be interrupted once Bedrock has it, so its result is ignored; the
+        hedge streams no tokens, so a client streaming the call sees only
+        the primary's.
+        """
+        if self.hedge is None:
+            return _guarded(self.primary, messages)
+
+        # Copy the context so callbacks (e.g. token streaming) still fire
+        primary = _hedge_pool.submit(
+            copy_context().run, _guarded, self.primary, messages
+        )
+        done, _ = wait([primary], timeout=self.hedge_after)
+        if done or not _allows(self.hedge.breaker):
+            return primary.result()
+
+        secondary = _hedge_pool.submit(
+            _quiet_context().run, _guarded, self.hedge, messages
+        )
+        try:
+            return _first_success({primary, secondary})
+        finally:
+            # Drops the loser only if it has not started yet
+            secondary.cancel()
+
+    async def _ahedged(self, messages: list) -> Any:
+        """Async version of :meth:`_hedged`; the losing call is cancelled."""
+        if self.hedge is None:
+            return await _aguarded(self.primary, messages)
+
+        primary = asyncio.ensure_future(_aguarded(self.primary, messages))
+        done, _ = await asyncio.wait({primary}, timeout=self.hedge_after)
+        if done or not _allows(self.hedge.breaker):
+            return await primary
+
+        secondary = asyncio.get_running_loop().create_task(
+            _aguarded(self.hedge, messages), context=_quiet_context()
+        )
+        pending = {primary, secondary}
+        error: BaseException | None = None
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                    error = task.exception()
+            raise error
+        finally:
+            for task in pending:
+                task.cancel()
+
+
+def _allows(breaker: CircuitBreaker) -> bool:
+    """Return whether the breaker would let a call through, without claiming it."""
+    return breaker.retry_after() == 0
+
+
+def _record(breaker: CircuitBreaker, error: Exception | None) -> None:
+    """Update a breaker with a call outcome.
+
+    Only retryable errors count as failures. Non-retryable ones (e.g.
+    validation) say nothing about the model's health, so they leave the
+    breaker as it was.
+    """
+    if error is None:
+        breaker.record_success()
+    elif is_retryable_error(error):
+        breaker.record_failure()
+
+
+def _quiet_context() -> Context:
+    """Return a copy of the current context without token-streaming callbacks.
+
+    Streaming consumers (e.g. LangGraph's ``stream_mode="messages"``) attach
+    handlers to the run's callbacks; the hedge's duplicate call runs without
+    them so its tokens are not streamed alongside the primary's. Other
+    callbacks, such as tracers, are kept.
+    """
+    context = copy_context()
+    config = var_child_runnable_config.get()
+    if config is None or config.get("callbacks") is None:
+        return context
+    callbacks = config["callbacks"]
+    if isinstance(callbacks, BaseCallbackManager):
+        callbacks = callbacks.copy()
+        for handler in [*callbacks.handlers, *callbacks.inheritable_handlers]:
+            if isinstance(handler, _StreamingCallbackHandler):
+                callbacks.remove_handler(handler)
+    else:
+        callbacks = [
+            handler
+            for handler in callbacks
+            if not isinstance(handler, _StreamingCallbackHandler)
+        ]
+    context.run(var_child_runnable_config.set, {**config, "callbacks": callbacks})
+    return context
+
+
+def _guarded(endpoint: Endpoint, messages: list) -> Any:
+    """Call an endpoint through its breaker and rate governor."""
+    endpoint.breaker.check()
+    if endpoint.model_id is not None:
+        RATE_GOVERNOR.acquire(
+            endpoint.model_id,
+            request_tokens(messages, endpoint.max_tokens),
+            endpoint.region,
+        )
+    try:
+        output = endpoint.runnable.invoke(messages)
+    except Exception as e:
+        _record(endpoint.breaker, e)
+        raise
+    _record(endpoint.breaker, None)
+    return output
+
+
+async def _aguarded(endpoint: Endpoint, messages: list) -> Any:
+    """Async version of :func:`_guarded`."""
+    endpoint.breaker.check()
+    if endpoint.model_id is not None:
+        await RATE_GOVERNOR.aacquire(
+            endpoint.model_id,
+            request_tokens(messages, endpoint.max_tokens),
+            endpoint.region,
+        )
+    try:
+        output = await endpoint.runnable.ainvoke(messages)
+    except Exception as e:
+        _record(endpoint.breaker, e)
+        raise
+    _record(endpoint.breaker, None)
+    return output
+
+
+def _first_success(futures: set[Future]) -> Any:
+    """Return the first successful result, or raise the last error."""
+    error: BaseException | None = None
+    pending = futures
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            if future.exception() is None:
+                return future.result()
+            error = future.exception()
+    raise error
@@ -0,0 +1,224 @@
+"""Per-agent model tiers with escalation on invalid output."""
+
+from __future__ import annotations
+
+from threading import Lock
+from typing import TYPE_CHECKING, Any
+
+from langchain_core.load import dumps
+
+from easibot.cache.singleflight import SingleFlight
+from easibot.config.settings import settings
+
+from .resilience import Endpoint, ResilientModel, get_circuit_breaker
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+# Tier names that map to configured model ids; other names are used as ids
+NAMED_TIERS = ("fast", "standard")
+
+# Identical concurrent LLM calls from any agent instance share one request
+LLM_FLIGHTS = SingleFlight()
+
+
+def resolve_tiers(agent: str) -> list[tuple[str, str]]:
+    """Return the (tier, model id) pairs an agent tries, in order.
+
+    Args:
+        agent: Agent name, e.g. "supervisor" or "bcdr"
+
+    Returns:
+        Tiers from settings.agent_model_tiers, defaulting to ["standard"]
+
+    """
+    model_ids = {
+        "fast": settings.bedrock_fast_model_id,
+        "standard": settings.bedrock_model_id,
+    }
+    tiers = settings.agent_model_tiers.get(agent) or ["standard"]
+    return [(tier, model_ids.get(tier, tier)) for tier in tiers]
+
+
+def is_complete_response(response: Any) -> bool:
+    """Accept a response with text that was not cut off by the token limit."""
+    content = getattr(response, "content", "")
+    stop_reason = (getattr(response, "response_metadata", None) or {}).get(
+        "stop_reason"
+    )
+    return bool(str(content).strip()) and stop_reason != "max_tokens"
+
+
+class ModelTiers:
+    """An agent's chat models, tried in tier order until one answers validly.
+
+    Only the first tier's model is built up front. A later tier is built the
+    first time the tiers before it fail or return output that does not
+    validate, so agents on a single tier cost nothing extra. Every call goes
+    through a :class:`ResilientModel`, so throttling is retried with backoff,
+    a model with an open circuit breaker is skipped in favour of the next
+    tier, and slow calls can be hedged. Identical calls already in flight
+    (same agent, model, parameters and messages) are joined, not repeated.
+    """
+
+    def __init__(
+        self,
+        agent: str,
+        factory: Callable[..., Any],
+        *,
+        wrap: Callable[[Any], Any] | None = None,
+        **kwargs: Any,
+    ):
+        """Initialize the tiers and build the first tier's model.
+
+        Args:
+            agent: Agent name used to look up its tiers
+            factory: Chat model factory called as factory(model_id, agent=..., **kwargs)
+            wrap: Optional transform applied to each model (e.g. structured output)
+            **kwargs: Extra chat model fields passed to the factory
+
+        """
+        self.agent = agent
+        self.tiers = resolve_tiers(agent)
+        self._factory = factory
+        self._wrap = wrap
+        self._kwargs = kwargs
+        self._models: dict[int, tuple[Any, ResilientModel]] = {}
+        self._lock = Lock()
+        self.llm = self._model(0)[0]
+
+    def runnable(self, index: int = 0) -> Any:
+        """Return the (wrapped) model for a tier, building it if needed."""
+        return self._model(index)[1].runnable
+
+    def invoke(
+        self, messages: list, validate: Callable[[Any], bool] = is_complete_response
+    ) -> tuple[Any, str]:
+        """Invoke tiers in order until one returns output that validates.
+
+        Args:
+            messages: Prompt messages
+            validate: Check applied to each tier's output
+
+        Returns:
+            (output, tier name). If no output validates, the last tier's
+            output is returned.
+
+        Raises:
+            Exception: The last tier's error if every tier raised
+
+        """
+        result: tuple[Any, str] | None = None
+        error: Exception | None = None
+        for index, (tier, _) in enumerate(self.tiers):
+            try:
+                output = self._call(index, messages)
+            except Exception as e:
+                error = e
+                continue
+            result = (output, tier)
+            if validate(output):
+                return result
+        return self._final(result, error)
+
+    async def ainvoke(
+        self, messages: list, validate: Callable[[Any], bool] = is_complete_response
+    ) -> tuple[Any, str]:
+        """Async version of :meth:`invoke`."""
+        result: tuple[Any, str] | None = None
+        error: Exception | None = None
+        for index, (tier, _) in enumerate(self.tiers):
+            try:
+                output = await self._acall(index, messages)
+            except Exception as e:
+                error = e
+                continue
+            result = (output, tier)
+            if validate(output):
+                return result
+        return self._final(result, error)
+
+    def _call(self, index: int, messages: list) -> Any:
+        """Invoke one tier, joining an identical call already in flight."""
+        model = self._model(index)[1]
+        if not settings.single_flight_llm_calls:
+            return model.invoke(messages)
+        return LLM_FLIGHTS.do(
+            self._flight_key(index, messages), lambda: model.invoke(messages)
+        )
+
+    async def _acall(self, index: int, messages: list) -> Any:
+        """Async version of :meth:`_call`."""
+        model = self._model(index)[1]
+        if not settings.single_flight_llm_calls:
+            return await model.ainvoke(messages)
+        return await LLM_FLIGHTS.ado(
+            self._flight_key(index, messages), lambda: model.ainvoke(messages)
+        )
+
+    def _flight_key(self, index: int, messages: list) -> tuple:
+        """Identify a call by agent, model, model parameters and messages."""
+        return (
+            self.agent,
+            self.tiers[index][1],
+            repr(sorted(self._kwargs.items())),
+            dumps(messages),
+        )
+
+    def _model(self, index: int) -> tuple[Any, ResilientModel]:
+        """Return (model, resilient wrapped model) for a tier, building it once."""
+        with self._lock:
+            if index not in self._models:
+                _, model_id = self.tiers[index]
+                model = self._factory(model_id, agent=self.agent, **self._kwargs)
+                primary = self._endpoint(model, model_id, settings.bedrock_region)
+                self._models[index] = (
+                    model,
+                    ResilientModel(
+                        primary,
+                        hedge=self._hedge(primary),
+                        hedge_after=settings.hedge_after_seconds,
+                    ),
+                )
+            return self._models[index]
+
+    def _endpoint(self, model: Any, model_id: str, region: str) -> Endpoint:
+        """Wrap a model with the breaker and quota of its id and region."""
+        return Endpoint(
+            self._wrapped(model),
+            get_circuit_breaker(model_id, region),
+            model_id,
+            region,
+            self._kwargs.get("max_tokens"),
+        )
+
+    def _hedge(self, primary: Endpoint) -> Endpoint | None:
+        """Build the endpoint that slow calls to a tier are hedged to.
+
+        Hedges go to settings.hedge_model_id in settings.hedge_region; either
+        defaults to the primary's, and with neither set the duplicate request
+        goes to the primary model itself.
+        """
+        if settings.hedge_after_seconds is None:
+            return None
+
+        hedge_model_id = settings.hedge_model_id or primary.model_id
+        region = settings.hedge_region or primary.region
+        if (hedge_model_id, region) == (primary.model_id, primary.region):
+            return primary
+
+        model = self._factory(
+            hedge_model_id, region_name=region, agent=self.agent, **self._kwargs
+        )
+        return self._endpoint(model, hedge_model_id, region)
+
+    def _wrapped(self, model: Any) -> Any:
+        """Apply the wrap transform, if any, to a model."""
+        return self._wrap(model) if self._wrap is not None else model
+
+    @staticmethod
+    def _final(result: tuple[Any, str] | None, error: Exception | None) -> tuple:
+        """Return the last output, or raise the last error if there was none."""
+        if result is None:
+            raise error or RuntimeError("No model tiers configured")
+        return result
@@ -0,0 +1,192 @@
+"""Speculative knowledge-base prefetch that runs alongside the supervisor."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+from threading import Lock
+from typing import TYPE_CHECKING
+from uuid import uuid4
+
+from langchain_core.runnables import RunnableConfig  # noqa: TC002 - needed at runtime by LangGraph
+
+from easibot.graph.state import ConsultantState, PrefetchedResearch, ResearchFinding
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+
+def current_turn(state: ConsultantState) -> int:
+    """Return the turn number: the count of user messages in the thread."""
+    return sum(1 for msg in state.get("messages", []) if msg.type == "human")
+
+
+class PrefetchTracker:
+    """Count prefetches that were used by a specialist or wasted.
+
+    A prefetch is pending until a specialist consumes it. It is counted as
+    wasted when the next turn of the same thread prefetches again, or when it
+    is evicted from the bounded pending table, without having been used.
+    """
+
+    def __init__(self, max_pending: int = 10_000):
+        """Initialize the tracker.
+
+        Args:
+            max_pending: Maximum number of unconsumed prefetches to remember
+
+        """
+        self.max_pending = max_pending
+        self.issued = 0
+        self.used = 0
+        self.wasted = 0
+        self._pending: OrderedDict[str, str] = OrderedDict()  # thread -> key
+        self._lock = Lock()
+
+    def record_issued(self, thread_id: str, key: str) -> None:
+        """Record a new prefetch, retiring the thread's previous one."""
+        with self._lock:
+            self.issued += 1
+            if self._pending.pop(thread_id, None) is not None:
+                self.wasted += 1
+            self._pending[thread_id] = key
+            while len(self._pending) > self.max_pending:
+                self._pending.popitem(last=False)
+                self.wasted += 1
+
+    def record_used(self, key: str) -> None:
+        """Record that a specialist consumed the prefetch stored under key."""
+        thread_id = key.rpartition(":")[0]
+        with self._lock:
+            if self._pending.get(thread_id) == key:
+                del self._pending[thread_id]
+                self.used += 1
+
+    def stats(self) -> dict[str, int]:
+        """Return issued/used/wasted/pending counts."""
+        with self._lock:
+            return {
+                "issued": self.issued,
+                "used": self.used,
+                "wasted": self.wasted,
+                "pending": len(self._pending),
+            }
+
+
+# Process-wide tracker shared by the prefetch node and the specialists
+PREFETCH_TRACKER = PrefetchTracker()
+
+
+def consume_prefetch(state: ConsultantState) -> PrefetchedResearch | None:
+    """Return this turn's prefetched research, recording that it was used.
+
+    Args:
+        state: Current conversation state
+
+    Returns:
+        Prefetched research for the current turn, or None
+
+    """
+    prefetch = state.get("prefetch")
+    if prefetch is None or prefetch.turn != current_turn(state):
+        return None
+
+    PREFETCH_TRACKER.record_used(prefetch.key)
+    return prefetch
+
+
+class ResearchPrefetcher:
+    """Graph node that searches the knowledge base while routing is decided.
+
+    The node is wired from START next to the supervisor, so retrieval overlaps
+    the routing round trip. Its findings land in ``research_findings`` before
+    any specialist runs.
+    """
+
+    def __init__(
+        self,
+        retrieve: Callable[[str, list[str]], list[ResearchFinding]],
+        tracker: PrefetchTracker = PREFETCH_TRACKER,
+        aretrieve: Callable[[str, list[str]], Awaitable[list[ResearchFinding]]]
+        | None = None,
+    ):
+        """Initialize the prefetcher.
+
+        Args:
+            retrieve: Knowledge-base search taking (query, offerings)
+            tracker: Tracker that counts used and wasted prefetches
+            aretrieve: Async knowledge-base search; defaults to running
+                retrieve in a worker thread
+
+        """
+        self.retrieve = retrieve
+        self.tracker = tracker
+        self.aretrieve = aretrieve or (
+            lambda query, offerings: asyncio.to_thread(retrieve, query, offerings)
+        )
+
+    def prefetch(self, state: ConsultantState, config: RunnableConfig) -> dict:
+        """Search the knowledge base for the latest user message.
+
+        Args:
+            state: Current conversation state
+            config: Run config carrying the thread id
+
+        Returns:
+            Updated state with prefetch and research_findings set
+
+        """
+        request = self._request(state, config)
+        if request is None:
+            return {}
+
+        query, thread_id, turn = request
+        findings = self.retrieve(query, state.get("offerings", []))
+        return self._record(thread_id, turn, findings)
+
+    async def aprefetch(self, state: ConsultantState, config: RunnableConfig) -> dict:
+        """Async version of :meth:`prefetch`.
+
+        Args:
+            state: Current conversation state
+            config: Run config carrying the thread id
+
+        Returns:
+            Updated state with prefetch and research_findings set
+
+        """
+        request = self._request(state, config)
+        if request is None:
+            return {}
+
+        query, thread_id, turn = request
+        findings = await self.aretrieve(query, state.get("offerings", []))
+        return self._record(thread_id, turn, findings)
+
+    def _request(
+        self, state: ConsultantState, config: RunnableConfig
+    ) -> tuple[str, str, int] | None:
+        """Return (query, thread id, turn) to prefetch for, or None."""
+        user_message = next(
+            (msg for msg in reversed(state["messages"]) if msg.type == "human"), None
+        )
+
+        if not user_message:
+            return None
+
+        thread_id = (config.get("configurable") or {}).get("thread_id") or (
+            f"anonymous-{uuid4().hex}"
+        )
+        return user_message.content, thread_id, current_turn(state)
+
+    def _record(
+        self, thread_id: str, turn: int, findings: list[ResearchFinding]
+    ) -> dict:
+        """Record the prefetch and build the state update carrying it."""
+        key = f"{thread_id}:{turn}"
+        self.tracker.record_issued(thread_id, key)
+
+        return {
+            "prefetch": PrefetchedResearch(key=key, turn=turn, findings=findings),
+            "research_findings": findings,
+        }
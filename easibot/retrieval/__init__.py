@@ -0,0 +1,41 @@
+"""Vector retrieval over the RAG knowledge base."""
+
+from .bm25 import BM25Index
+from .fusion import reciprocal_rank_fusion
+from .index import VectorIndex
+from .ingest import Document, IngestResult, chunk_document, ingest_document
+from .ivf import IVFIndex
+from .loader import (
+    IndexConflictError,
+    fetch_index,
+    load_index,
+    local_index_dir,
+    upload_index,
+    writer_lock,
+)
+from .metadata import MetadataIndex
+from .models import Chunk, SearchResult
+from .store import VectorStore
+from .topk import top_k_indices
+
+__all__ = [
+    "BM25Index",
+    "Chunk",
+    "Document",
+    "IVFIndex",
+    "IndexConflictError",
+    "IngestResult",
+    "MetadataIndex",
+    "SearchResult",
+    "VectorIndex",
+    "VectorStore",
+    "chunk_document",
+    "fetch_index",
+    "ingest_document",
+    "load_index",
+    "local_index_dir",
+    "reciprocal_rank_fusion",
+    "top_k_indices",
+    "upload_index",
+    "writer_lock",
+]
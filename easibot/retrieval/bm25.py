@@ -0,0 +1,283 @@
+"""Okapi BM25 keyword index over chunk text.
+
+Dense embeddings blur exact terms such as standard numbers ("ISO 22301"),
+acronyms ("RPO") and product names. BM25 ranks chunks by how often they
+contain the query's terms, weighted by how rare each term is, so it finds
+those chunks reliably. Postings are stored in CSR layout: one array of rows
+and one of term counts, sliced per term by ``offsets``. Both are saved as
+``.npy`` files and memory-mapped when loaded.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import TYPE_CHECKING, Self
+
+import numpy as np
+
+from .store import atomic_write
+from .topk import top_k_indices
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from pathlib import Path
+
+BM25_FILE = "bm25.npz"
+BM25_ROWS_FILE = "bm25_rows.npy"
+BM25_FREQS_FILE = "bm25_freqs.npy"
+
+# Term-frequency saturation and document-length normalization
+K1 = 1.2
+B = 0.75
+
+# Queries whose postings cover more than 1/DENSE_FRACTION of the rows are
+# scored into a dense array instead of merging postings
+DENSE_FRACTION = 8
+
+_TOKEN = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text into lowercase word tokens."""
+    return _TOKEN.findall(text.lower())
+
+
+class BM25Index:
+    """Term postings and chunk lengths for BM25 scoring."""
+
+    def __init__(
+        self,
+        terms: list[str],
+        offsets: np.ndarray,
+        rows: np.ndarray,
+        freqs: np.ndarray,
+        lengths: np.ndarray,
+    ):
+        """Initialize the index.
+
+        Args:
+            terms: Vocabulary, one term per term id
+            offsets: (len(terms) + 1,) start of each term's postings
+            rows: Rows containing each term, ascending within a term
+            freqs: How often the term occurs in each of those rows
+            lengths: Token count of every row
+
+        """
+        self.terms = terms
+        self.offsets = offsets
+        self.rows = rows
+        self.freqs = freqs
+        self.lengths = lengths
+        self.vocabulary = {term: i for i, term in enumerate(terms)}
+        # Length normalization per row, computed once instead of per query
+        average = max(float(lengths.mean()), 1.0) if len(lengths) else 1.0
+        self.norms = (K1 * (1 - B + B * lengths / average)).astype(np.float32)
+
+    def __len__(self) -> int:
+        """Return the number of rows indexed."""
+        return len(self.lengths)
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the postings and lengths (not the vocabulary)."""
+        arrays = (self.offsets, self.rows, self.freqs, self.norms, self.lengths)
+        return sum(a.nbytes for a in arrays)
+
+    @classmethod
+    def build(cls, texts: Iterable[str]) -> Self:
+        """Index texts, numbering rows from 0."""
+        vocabulary: dict[str, int] = {}
+        token_ids: list[int] = []
+        lengths: list[int] = []
+        for text in texts:
+            tokens = tokenize(text)
+            lengths.append(len(tokens))
+            token_ids.extend(
+                [vocabulary.setdefault(t, len(vocabulary)) for t in tokens]
+            )
+
+        # Count (term, row) pairs in one sort: the unique keys come out grouped
+        # by term with rows ascending, which is the CSR order
+        count = len(lengths)
+        rows = np.repeat(np.arange(count, dtype=np.int64), lengths)
+        keys, freqs = np.unique(
+            np.array(token_ids, dtype=np.int64) * count + rows, return_counts=True
+        )
+        return cls.from_postings(
+            list(vocabulary),
+            keys // max(count, 1),
+            keys % max(count, 1),
+            freqs,
+            np.array(lengths, dtype=np.int64),
+        )
+
+    @classmethod
+    def from_postings(
+        cls,
+        terms: list[str],
+        term_ids: np.ndarray,
+        rows: np.ndarray,
+        freqs: np.ndarray,
+        lengths: np.ndarray,
+    ) -> Self:
+        """Build the CSR layout from unordered (term id, row, count) postings.
+
+        Rows must already be ascending for each term; terms left without
+        postings are dropped from the vocabulary.
+        """
+        used = np.bincount(term_ids, minlength=len(terms)) > 0
+        renumbered = np.cumsum(used) - 1
+        term_ids = renumbered[term_ids]
+        order = np.argsort(term_ids, kind="stable")
+        counts = np.bincount(term_ids, minlength=int(used.sum()))
+        return cls(
+            [term for term, kept in zip(terms, used.tolist(), strict=True) if kept],
+            np.concatenate(([0], np.cumsum(counts))).astype(np.int64),
+            rows[order].astype(np.int32),
+            np.minimum(freqs[order], np.iinfo(np.uint16).max).astype(np.uint16),
+            lengths.astype(np.int32),
+        )
+
+    def term_ids(self) -> np.ndarray:
+        """Return the term id of every posting."""
+        return np.repeat(np.arange(len(self.terms)), np.diff(self.offsets))
+
+    def take(self, keep: np.ndarray) -> Self:
+        """Return postings for only the kept rows, renumbered from 0.
+
+        Args:
+            keep: Sorted row numbers to keep
+
+        """
+        renumbered = np.full(len(self), -1, dtype=np.int64)
+        renumbered[keep] = np.arange(len(keep))
+        rows = renumbered[self.rows]
+        kept = rows >= 0
+        return type(self).from_postings(
+            self.terms,
+            self.term_ids()[kept],
+            rows[kept],
+            self.freqs[kept],
+            self.lengths[keep],
+        )
+
+    def extend(self, texts: Iterable[str]) -> Self:
+        """Return postings with more rows numbered after the existing ones."""
+        added = type(self).build(texts)
+        vocabulary = dict(self.vocabulary)
+        for term in added.terms:
+            vocabulary.setdefault(term, len(vocabulary))
+        remap = np.array([vocabulary[term] for term in added.terms], dtype=np.int64)
+        return type(self).from_postings(
+            list(vocabulary),
+            np.concatenate([self.term_ids(), remap[added.term_ids()]]),
+            np.concatenate([self.rows, added.rows.astype(np.int64) + len(self)]),
+            np.concatenate([self.freqs, added.freqs]),
+            np.concatenate([self.lengths, added.lengths]),
+        )
+
+    def search(
+        self, query: str, top_k: int, allowed: np.ndarray | None = None
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Return the rows that best match a keyword query.
+
+        Only the postings of the query's terms are read, so the cost depends
+        on how common those terms are, not on the corpus size.
+
+        Args:
+            query: Query text
+            top_k: Number of rows to return
+            allowed: Sorted rows to restrict the search to (None allows all)
+
+        Returns:
+            Up to top_k rows containing at least one query term, and their
+            BM25 scores, best first
+
+        """
+        term_ids = sorted(
+            {self.vocabulary[t] for t in tokenize(query) if t in self.vocabulary}
+        )
+        if not term_ids:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+
+        rows, contributions = [], []
+        for term_id in term_ids:
+            start, end = self.offsets[term_id], self.offsets[term_id + 1]
+            df = end - start
+            idf = np.float32(np.log1p((len(self) - df + 0.5) / (df + 0.5)))
+            term_rows = self.rows[start:end]
+            tf = self.freqs[start:end].astype(np.float32)
+            rows.append(term_rows)
+            contributions.append(idf * (K1 + 1) * tf / (tf + self.norms[term_rows]))
+
+        # Rare terms: merge their few postings; common terms: accumulate into
+        # a dense array, which avoids sorting postings that span the corpus
+        if sum(map(len, rows)) * DENSE_FRACTION < len(self):
+            matched, inverse = np.unique(np.concatenate(rows), return_inverse=True)
+            scores = np.bincount(inverse, weights=np.concatenate(contributions))
+        else:
+            dense = np.zeros(len(self), dtype=np.float32)
+            for term_rows, contribution in zip(rows, contributions, strict=True):
+                dense[term_rows] += contribution
+            matched = np.flatnonzero(dense)
+            scores = dense[matched]
+        if allowed is not None:
+            position = np.searchsorted(allowed, matched)
+            inside = position < len(allowed)
+            inside[inside] = allowed[position[inside]] == matched[inside]
+            matched, scores = matched[inside], scores[inside]
+        best = top_k_indices(scores, top_k)
+        return matched[best].astype(np.int64), scores[best].astype(np.float32)
+
+    def save(self, path: Path) -> list[str]:
+        """Write the index into an index directory.
+
+        The postings go into ``.npy`` files of their own so :meth:`load` can
+        memory-map them; the vocabulary, offsets and lengths go into
+        BM25_FILE. The vocabulary is stored as newline-separated UTF-8, since
+        tokens never contain whitespace.
+
+        Returns:
+            Names of the files written
+
+        """
+        for name, array in ((BM25_ROWS_FILE, self.rows), (BM25_FREQS_FILE, self.freqs)):
+            with atomic_write(path / name) as f:
+                np.save(f, array)
+        with atomic_write(path / BM25_FILE) as f:
+            np.savez(
+                f,
+                terms=np.frombuffer("\n".join(self.terms).encode(), dtype=np.uint8),
+                offsets=self.offsets,
+                lengths=self.lengths,
+            )
+        return [BM25_FILE, BM25_ROWS_FILE, BM25_FREQS_FILE]
+
+    @classmethod
+    def load(cls, path: Path, *, mmap: bool = True) -> Self:
+        """Open an index written by :meth:`save`.
+
+        Args:
+            path: Index directory
+            mmap: Memory-map the postings instead of reading them into memory
+
+        Returns:
+            Opened index; a search reads only its terms' postings
+
+        """
+        mode = "r" if mmap else None
+        with np.load(path / BM25_FILE) as data:
+            vocabulary = data["terms"].tobytes().decode()
+            if "rows" in data:
+                # Written before the postings had files of their own
+                rows, freqs = data["rows"], data["freqs"]
+            else:
+                rows = np.load(path / BM25_ROWS_FILE, mmap_mode=mode)
+                freqs = np.load(path / BM25_FREQS_FILE, mmap_mode=mode)
+            return cls(
+                vocabulary.split("\n") if vocabulary else [],
+                data["offsets"],
+                rows,
+                freqs,
+                data["lengths"],
+            )
@@ -0,0 +1,62 @@
+"""Reciprocal rank fusion (RRF) of ranked result lists.
+
+Each list contributes ``weight / (k + rank)`` to every result it ranks, so
+fusion needs only the order of each list, not comparable scores: cosine
+similarities and BM25 scores can be combined directly.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from .models import SearchResult
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+# Rank offset: larger values flatten the gap between the top ranks and the rest
+RRF_K = 60
+
+
+def reciprocal_rank_fusion(
+    rankings: Sequence[Sequence[SearchResult]],
+    weights: Sequence[float] | None = None,
+    k: int = RRF_K,
+) -> list[SearchResult]:
+    """Merge ranked lists into one, scored by weighted reciprocal rank.
+
+    Scores are divided by the best possible fused score, so a result ranked
+    first by every list scores 1.0.
+
+    Args:
+        rankings: Result lists, each best first
+        weights: Weight of each list (defaults to 1.0 each)
+        k: Rank offset
+
+    Returns:
+        Every result found by any list, once, best first
+
+    Raises:
+        ValueError: If the weights do not match the lists or none is positive
+
+    """
+    weights = [1.0] * len(rankings) if weights is None else list(weights)
+    if len(weights) != len(rankings) or min(weights, default=0) < 0:
+        msg = f"Expected {len(rankings)} non-negative weights, got {weights}"
+        raise ValueError(msg)
+    best = sum(weights) / (k + 1)
+    if best <= 0:
+        msg = "At least one ranking needs a positive weight"
+        raise ValueError(msg)
+
+    fused: dict[str, float] = {}
+    results: dict[str, SearchResult] = {}
+    for ranking, weight in zip(rankings, weights, strict=True):
+        for rank, result in enumerate(ranking, start=1):
+            fused[result.id] = fused.get(result.id, 0.0) + weight / (k + rank)
+            results.setdefault(result.id, result)
+    order = sorted(fused, key=fused.__getitem__, reverse=True)
+    return [
+        results[chunk_id].model_copy(update={"score": fused[chunk_id] / best})
+        for chunk_id in order
+    ]
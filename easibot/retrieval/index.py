@@ -0,0 +1,360 @@
+"""In-process vector search over a prebuilt embedding matrix."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Self
+
+import numpy as np
+
+from easibot.tools.embeddings import Embedder
+
+from .bm25 import BM25_FILE, BM25Index
+from .ivf import IVF_FILE, IVFIndex
+from .metadata import METADATA_FILE, MetadataIndex
+from .models import Chunk, SearchResult
+from .store import (
+    CHUNKS_FILE,
+    EMBEDDINGS_FILE,
+    ChunkStore,
+    VectorStore,
+    atomic_write,
+)
+from .topk import top_k_indices
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+MANIFEST_FILE = "manifest.json"
+
+
+def manifest_files(manifest: dict[str, Any]) -> list[str]:
+    """Return the data files an index manifest lists.
+
+    Manifests written before the ``files`` entry existed hold the chunks and
+    embeddings only.
+    """
+    return manifest.get("files", [CHUNKS_FILE, EMBEDDINGS_FILE])
+
+
+class VectorIndex:
+    """Cosine-similarity search over L2-normalized chunk embeddings.
+
+    Exact search scores the whole corpus with one matrix-vector product, so
+    its time grows linearly with the number of chunks. With an
+    :class:`IVFIndex` attached, approximate search scores only the chunks in
+    the lists closest to the query. Metadata filters are resolved through a
+    :class:`MetadataIndex` first, so only matching chunks are scored.
+    Embeddings may be stored quantized (see :meth:`quantize`), in which case
+    the top candidates can be re-scored against the float32 originals. With a
+    :class:`BM25Index` attached (see :meth:`build_bm25`),
+    :meth:`keyword_search` ranks chunks by exact query terms instead.
+    """
+
+    def __init__(
+        self,
+        vectors: np.ndarray | VectorStore,
+        chunks: Sequence[Chunk],
+        model_name: str | None = None,
+        ivf: IVFIndex | None = None,
+        metadata_index: MetadataIndex | None = None,
+    ):
+        """Initialize the index.
+
+        Args:
+            vectors: (len(chunks), dim) L2-normalized float32 embeddings, or
+                a store holding them
+            chunks: Chunk for each row of vectors
+            model_name: Embedding model the vectors were made with
+            ivf: Optional IVF lists over vectors for approximate search
+            metadata_index: Postings for chunk metadata (built from chunks
+                if not given)
+
+        """
+        store = vectors if isinstance(vectors, VectorStore) else VectorStore(vectors)
+        if len(store) != len(chunks):
+            msg = f"{len(store)} vectors for {len(chunks)} chunks"
+            raise ValueError(msg)
+        self.store = store
+        self.chunks = chunks
+        self.model_name = model_name
+        self.ivf = ivf
+        self.metadata_index = (
+            MetadataIndex.build(c.metadata for c in chunks)
+            if metadata_index is None
+            else metadata_index
+        )
+        self.bm25: BM25Index | None = None
+
+    def __len__(self) -> int:
+        """Return the number of chunks."""
+        return len(self.chunks)
+
+    @property
+    def vectors(self) -> np.ndarray:
+        """Stored embeddings: float32 unless quantized, then the codes."""
+        return self.store.codes
+
+    def search(
+        self,
+        query_vector: np.ndarray,
+        top_k: int = 5,
+        metadata_filter: dict[str, Any] | None = None,
+        nprobe: int | None = None,
+        rescore: int = 0,
+    ) -> list[SearchResult]:
+        """Return the chunks most similar to a query embedding.
+
+        Args:
+            query_vector: L2-normalized query embedding
+            top_k: Number of results to return
+            metadata_filter: Optional filter, e.g. {"offering": ["bcdr"]}; see
+                :mod:`easibot.retrieval.metadata` for AND/OR/IN
+            nprobe: Search approximately, scanning this many IVF lists;
+                None searches exactly
+            rescore: Re-rank this many top candidates by their exact float32
+                scores (0 keeps the stored-precision scores)
+
+        Returns:
+            Up to top_k results matching the filter, best first
+
+        """
+        query_vector = query_vector.astype(np.float32, copy=False)
+        rows = self._candidate_rows(query_vector, metadata_filter, nprobe)
+        scores = self.store.score(query_vector, rows)
+        best = top_k_indices(scores, max(top_k, rescore))
+        best_rows = best if rows is None else rows[best]
+        best_scores = scores[best]
+        if rescore:
+            exact = self.store.rescore(query_vector, best_rows)
+            order = top_k_indices(exact, top_k)
+            best_rows, best_scores = best_rows[order], exact[order]
+
+        return [
+            self._result(row, score)
+            for row, score in zip(best_rows[:top_k], best_scores[:top_k], strict=True)
+        ]
+
+    def keyword_search(
+        self,
+        query: str,
+        top_k: int = 5,
+        metadata_filter: dict[str, Any] | None = None,
+    ) -> list[SearchResult]:
+        """Return the chunks that best match a query's terms, by BM25.
+
+        Args:
+            query: Query text
+            top_k: Number of results to return
+            metadata_filter: Optional filter, as for :meth:`search`
+
+        Returns:
+            Up to top_k results containing a query term, best first, scored
+            by BM25 (unbounded, unlike cosine similarity)
+
+        Raises:
+            ValueError: If the index has no BM25 postings
+
+        """
+        if self.bm25 is None:
+            msg = "Keyword search needs a BM25 index; call build_bm25()"
+            raise ValueError(msg)
+        allowed = (
+            self.metadata_index.resolve(metadata_filter) if metadata_filter else None
+        )
+        rows, scores = self.bm25.search(query, top_k, allowed)
+        return [
+            self._result(row, score) for row, score in zip(rows, scores, strict=True)
+        ]
+
+    def build_bm25(self) -> None:
+        """Index the chunk text for :meth:`keyword_search`."""
+        self.bm25 = BM25Index.build(c.content for c in self.chunks)
+
+    def build_ivf(self, nlist: int | None = None, **kwargs: Any) -> None:
+        """Cluster the vectors into IVF lists for approximate search.
+
+        Args:
+            nlist: Number of lists (defaults to about 4 * sqrt(len(self)))
+            **kwargs: Passed to :meth:`IVFIndex.build`
+
+        """
+        self.ivf = IVFIndex.build(self.store.dequantize(), nlist, **kwargs)
+
+    def add(self, chunks: Sequence[Chunk], vectors: np.ndarray) -> None:
+        """Append chunks without re-embedding or re-clustering the others.
+
+        New vectors are stored at the index's precision and join their
+        nearest IVF lists.
+
+        Args:
+            chunks: Chunks to add
+            vectors: Their L2-normalized float32 embeddings
+
+        """
+        if len(chunks) != vectors.shape[0]:
+            msg = f"{vectors.shape[0]} vectors for {len(chunks)} chunks"
+            raise ValueError(msg)
+        first_row = len(self)
+        self.store = self.store.append(vectors)
+        self.chunks = [*self.chunks, *chunks]
+        self.metadata_index = self.metadata_index.extend(c.metadata for c in chunks)
+        if self.ivf is not None:
+            self.ivf = self.ivf.extend(vectors, first_row)
+        if self.bm25 is not None:
+            self.bm25 = self.bm25.extend(c.content for c in chunks)
+
+    def remove(self, rows: np.ndarray) -> None:
+        """Drop rows; the rows after them are renumbered.
+
+        Args:
+            rows: Row numbers to remove
+
+        """
+        keep = np.setdiff1d(np.arange(len(self)), rows)
+        self.store = self.store.take(keep)
+        self.chunks = [self.chunks[row] for row in keep]
+        self.metadata_index = self.metadata_index.take(keep)
+        if self.ivf is not None:
+            self.ivf = self.ivf.take(keep)
+        if self.bm25 is not None:
+            self.bm25 = self.bm25.take(keep)
+
+    def quantize(self, quantization: str, *, keep_full: bool = False) -> None:
+        """Store the embeddings at lower precision.
+
+        Args:
+            quantization: "float32", "float16" (half the memory) or "int8"
+                (a quarter, plus a per-row scale)
+            keep_full: Also keep the float32 vectors, on disk once saved, so
+                searches can re-score their top candidates exactly
+
+        """
+        self.store = VectorStore.quantize(
+            self.store.dequantize(), quantization, keep_full=keep_full
+        )
+
+    @classmethod
+    def build(
+        cls, chunks: list[Chunk], embedder: Embedder, batch_size: int = 256
+    ) -> Self:
+        """Embed chunks and build an index, with BM25 postings, over them.
+
+        Args:
+            chunks: Chunks to index
+            embedder: Embedder returning L2-normalized vectors
+            batch_size: Chunks embedded per call
+
+        Returns:
+            New index
+
+        """
+        batches = [
+            embedder.embed([c.content for c in chunks[start : start + batch_size]])
+            for start in range(0, len(chunks), batch_size)
+        ]
+        vectors = (
+            np.vstack(batches).astype(np.float32, copy=False)
+            if batches
+            else np.zeros((0, 0), dtype=np.float32)
+        )
+        index = cls(vectors, chunks, embedder.model_name)
+        index.build_bm25()
+        return index
+
+    def save(self, path: str | Path) -> None:
+        """Write the index to a directory.
+
+        Each file is written under a temporary name and then renamed, so a
+        process that has the old index open keeps reading consistent data.
+
+        Args:
+            path: Directory to create or overwrite files in
+
+        """
+        path = Path(path)
+        path.mkdir(parents=True, exist_ok=True)
+        files = [
+            *ChunkStore.write(path, self.chunks),
+            *self.store.save(path),
+            *self.metadata_index.save(path),
+        ]
+        if self.ivf is not None:
+            self.ivf.save(path / IVF_FILE)
+            files.append(IVF_FILE)
+        if self.bm25 is not None:
+            files.extend(self.bm25.save(path))
+        with atomic_write(path / MANIFEST_FILE) as f:
+            f.write(
+                json.dumps(
+                    {
+                        "model_name": self.model_name,
+                        "count": len(self.chunks),
+                        "dim": int(self.vectors.shape[1]),
+                        "quantization": self.store.quantization,
+                        "files": files,
+                    }
+                ).encode()
+            )
+
+    @classmethod
+    def load(cls, path: str | Path, *, mmap: bool = True) -> Self:
+        """Open an index written by :meth:`save`.
+
+        With ``mmap`` the embeddings and postings are memory-mapped and chunks
+        are parsed only when returned, so opening takes the same time for any
+        corpus size and memory holds only the pages searches touch. The same
+        holds for the BM25 postings, which a search reads only for its terms.
+
+        Args:
+            path: Index directory
+            mmap: Memory-map the arrays instead of reading them into memory
+
+        Returns:
+            Loaded index
+
+        """
+        path = Path(path)
+        manifest = json.loads((path / MANIFEST_FILE).read_text())
+        files = manifest_files(manifest)
+        chunks = ChunkStore.open(path, files)
+        index = cls(
+            VectorStore.load(path, files, mmap=mmap),
+            chunks,
+            manifest.get("model_name"),
+            IVFIndex.load(path / IVF_FILE) if IVF_FILE in files else None,
+            MetadataIndex.load(path, mmap=mmap) if METADATA_FILE in files else None,
+        )
+        if BM25_FILE in files:
+            index.bm25 = BM25Index.load(path, mmap=mmap)
+        return index
+
+    def _candidate_rows(
+        self,
+        query_vector: np.ndarray,
+        metadata_filter: dict[str, Any] | None,
+        nprobe: int | None,
+    ) -> np.ndarray | None:
+        """Return the rows worth scoring, or None to score every row."""
+        allowed = (
+            self.metadata_index.resolve(metadata_filter) if metadata_filter else None
+        )
+        if nprobe is None:
+            return allowed
+        if self.ivf is None:
+            msg = "Approximate search needs an IVF index; call build_ivf()"
+            raise ValueError(msg)
+
+        # A filter leaving fewer rows than the probed lists would hold is
+        # cheaper to score exactly, and exact scoring cannot miss any of them
+        if allowed is not None and len(allowed) * self.ivf.nlist <= len(self) * nprobe:
+            return allowed
+        rows = self.ivf.candidates(query_vector, nprobe)
+        if allowed is None:
+            return rows
+        return np.intersect1d(rows, allowed, assume_unique=True)
+
+    def _result(self, row: int, score: float) -> SearchResult:
+        chunk = self.chunks[row]
+        return SearchResult(**chunk.model_dump(), score=float(score))
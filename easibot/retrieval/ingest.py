@@ -0,0 +1,224 @@
+"""Incremental, deduplicating ingestion of documents into a VectorIndex.
+
+A document is split into chunks whose ids are content hashes, so uploading
+a new version of a document only embeds the chunks whose text changed and
+only touches the index rows of that document.
+"""
+
+import hashlib
+import re
+from typing import Any
+
+import numpy as np
+from pydantic import BaseModel, Field
+
+from easibot.tools.embeddings import Embedder
+
+from .index import VectorIndex
+from .models import Chunk
+
+# A paragraph whose hash is divisible by this ends its chunk early, so chunk
+# boundaries re-align a few paragraphs after an edit instead of shifting for
+# the rest of the document
+ANCHOR_EVERY = 4
+
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+
+
+class Document(BaseModel):
+    """A knowledge-base document to ingest."""
+
+    name: str = Field(description="Document identifier, stored as chunk source")
+    content: str = Field(description="Document text")
+    offering: str = Field(description="Offering the document belongs to")
+    metadata: dict[str, Any] = Field(
+        default_factory=dict,
+        description="Extra metadata for every chunk (values stored as strings)",
+    )
+
+
+class IngestResult(BaseModel):
+    """What an upload changed in the index."""
+
+    document: str
+    chunks: int
+    unchanged: int
+    added: int
+    removed: int
+    embedded: int
+    embedding_calls: int
+
+    @property
+    def changed(self) -> bool:
+        """Whether the index was modified."""
+        return bool(self.added or self.removed)
+
+
+def content_hash(text: str) -> str:
+    """Return the SHA-256 of text with whitespace runs collapsed."""
+    normalized = " ".join(text.split())
+    return hashlib.sha256(normalized.encode()).hexdigest()
+
+
+def _split_long(paragraph: str, max_chars: int) -> list[str]:
+    """Split an over-long paragraph at sentence ends, then at max_chars."""
+    pieces: list[str] = []
+    current = ""
+    for sentence in _SENTENCE_END.split(paragraph):
+        rest = sentence
+        while len(rest) > max_chars:
+            if current:
+                pieces.append(current)
+                current = ""
+            pieces.append(rest[:max_chars])
+            rest = rest[max_chars:]
+        if current and len(current) + 1 + len(rest) > max_chars:
+            pieces.append(current)
+            current = rest
+        else:
+            current = f"{current} {rest}" if current else rest
+    if current:
+        pieces.append(current)
+    return pieces
+
+
+def chunk_document(text: str, max_chars: int = 1500) -> list[str]:
+    """Split a document into chunks of whole paragraphs.
+
+    Paragraphs (separated by blank lines) are packed into chunks of at most
+    max_chars. A paragraph whose content hash is divisible by
+    :data:`ANCHOR_EVERY` always ends its chunk, which keeps later
+    boundaries stable when an earlier paragraph is edited.
+
+    Args:
+        text: Document text
+        max_chars: Maximum characters per chunk
+
+    Returns:
+        Chunk texts in document order
+
+    """
+    pieces = []
+    for block in re.split(r"\n\s*\n", text):
+        paragraph = block.strip()
+        if paragraph:
+            pieces.extend(
+                [paragraph]
+                if len(paragraph) <= max_chars
+                else _split_long(paragraph, max_chars)
+            )
+
+    chunks = []
+    current = ""
+    for piece in pieces:
+        if current and len(current) + 2 + len(piece) > max_chars:
+            chunks.append(current)
+            current = ""
+        current = f"{current}\n\n{piece}" if current else piece
+        if int(content_hash(piece)[:8], 16) % ANCHOR_EVERY == 0:
+            chunks.append(current)
+            current = ""
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def ingest_document(
+    index: VectorIndex,
+    embedder: Embedder,
+    document: Document,
+    *,
+    max_chars: int = 1500,
+    batch_size: int = 64,
+) -> IngestResult:
+    """Add or update a document in an index.
+
+    Chunks already in the index for this document with the same text and
+    metadata are kept as they are; chunks whose text is unchanged but whose
+    metadata changed keep their vectors. Only chunks with new text are
+    embedded, in batches of batch_size. The document's chunks that are no
+    longer present are removed. BM25 postings are updated too, and built
+    for the whole index if it has none yet.
+
+    Args:
+        index: Index to update in place
+        embedder: Embedder the index was built with
+        document: Document to add or replace
+        max_chars: Maximum characters per chunk
+        batch_size: Chunks embedded per call
+
+    Returns:
+        Counts of kept, added, removed and embedded chunks
+
+    Raises:
+        ValueError: If the index was built with a different embedding model
+
+    """
+    if len(index) and index.model_name not in {None, embedder.model_name}:
+        msg = f"Index was built with {index.model_name!r}, not {embedder.model_name!r}"
+        raise ValueError(msg)
+    index.model_name = index.model_name or embedder.model_name
+    if index.bm25 is None:
+        # Keyword search covers every ingested chunk, so index the existing
+        # ones once; later uploads extend the postings
+        index.build_bm25()
+
+    chunk_metadata = {
+        **{key: str(value) for key, value in document.metadata.items()},
+        "offering": document.offering,
+        "document": document.name,
+    }
+    chunks: dict[str, Chunk] = {}
+    for text in chunk_document(document.content, max_chars):
+        chunk_id = f"{document.name}#{content_hash(text)[:16]}"
+        chunks.setdefault(
+            chunk_id,
+            Chunk(
+                id=chunk_id,
+                source=document.name,
+                content=text,
+                metadata=chunk_metadata,
+            ),
+        )
+
+    stale = []
+    reusable: dict[str, int] = {}  # same text, new metadata: keep the vector
+    unchanged = 0
+    for row in index.metadata_index.rows("document", document.name):
+        existing = index.chunks[row]
+        updated = chunks.get(existing.id)
+        if updated == existing:
+            del chunks[existing.id]
+            unchanged += 1
+            continue
+        stale.append(row)
+        if updated is not None and updated.content == existing.content:
+            reusable[existing.id] = row
+
+    reused = [chunks[chunk_id] for chunk_id in reusable]
+    to_embed = [c for c in chunks.values() if c.id not in reusable]
+    vectors = []
+    if reused:
+        vectors.append(index.store.vectors(np.array(list(reusable.values()))))
+    batches = [
+        embedder.embed([c.content for c in to_embed[start : start + batch_size]])
+        for start in range(0, len(to_embed), batch_size)
+    ]
+    vectors.extend(batches)
+
+    if stale:
+        index.remove(np.array(stale, dtype=np.int64))
+    if vectors:
+        index.add(
+            [*reused, *to_embed], np.vstack(vectors).astype(np.float32, copy=False)
+        )
+
+    return IngestResult(
+        document=document.name,
+        chunks=unchanged + len(chunks),
+        unchanged=unchanged,
+        added=len(reused) + len(to_embed),
+        removed=len(stale),
+        embedded=len(to_embed),
+        embedding_calls=len(batches),
+    )
@@ -0,0 +1,205 @@
+"""Inverted-file (IVF) approximate nearest-neighbour index.
+
+Vectors are clustered with spherical k-means into ``nlist`` lists at build
+time. A query scores the centroids, then only the vectors in the ``nprobe``
+closest lists, so raising ``nprobe`` trades latency for recall.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import TYPE_CHECKING, Self
+
+import numpy as np
+
+from easibot.tools.embeddings import normalize_rows
+
+from .store import atomic_write
+from .topk import top_k_indices
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+IVF_FILE = "ivf.npz"
+
+# Training points per centroid; k-means runs on a sample of at most
+# nlist * TRAIN_POINTS_PER_LIST vectors
+TRAIN_POINTS_PER_LIST = 64
+
+# Rows assigned to lists per matrix product when building
+ASSIGN_BATCH = 65_536
+
+
+def default_nlist(count: int) -> int:
+    """Return the list count used when none is given: about 4 * sqrt(count)."""
+    return max(1, min(count, round(4 * math.sqrt(count))))
+
+
+def assign_lists(vectors: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+    """Return the index of the most similar centroid for each vector."""
+    labels = np.empty(vectors.shape[0], dtype=np.int32)
+    for start in range(0, vectors.shape[0], ASSIGN_BATCH):
+        batch = vectors[start : start + ASSIGN_BATCH]
+        labels[start : start + len(batch)] = np.argmax(batch @ centroids.T, axis=1)
+    return labels
+
+
+def train_centroids(
+    vectors: np.ndarray, nlist: int, iterations: int = 10, seed: int = 0
+) -> np.ndarray:
+    """Cluster unit vectors with spherical k-means.
+
+    Args:
+        vectors: (n, dim) L2-normalized vectors, n >= nlist
+        nlist: Number of clusters
+        iterations: k-means iterations
+        seed: Seed for sampling and initialization
+
+    Returns:
+        (nlist, dim) L2-normalized centroids
+
+    """
+    rng = np.random.default_rng(seed)
+    sample_size = min(vectors.shape[0], nlist * TRAIN_POINTS_PER_LIST)
+    sample = vectors[np.sort(rng.choice(vectors.shape[0], sample_size, replace=False))]
+    centroids = sample[rng.choice(sample_size, nlist, replace=False)].copy()
+
+    for _ in range(iterations):
+        labels = assign_lists(sample, centroids)
+        counts = np.bincount(labels, minlength=nlist)
+        order = np.argsort(labels, kind="stable")
+        filled = np.flatnonzero(counts)
+        starts = np.concatenate(([0], np.cumsum(counts)[:-1]))[filled]
+        centroids[filled] = np.add.reduceat(sample[order], starts, axis=0)
+        # Re-seed empty lists from random points so every list stays useful
+        empty = np.flatnonzero(counts == 0)
+        centroids[empty] = sample[rng.choice(sample_size, len(empty), replace=False)]
+        centroids = normalize_rows(centroids)
+    return centroids.astype(np.float32, copy=False)
+
+
+class IVFIndex:
+    """Cluster centroids plus the rows that belong to each cluster.
+
+    Lists are stored CSR-style: the rows of list ``i`` are
+    ``rows[offsets[i]:offsets[i + 1]]``.
+    """
+
+    def __init__(self, centroids: np.ndarray, rows: np.ndarray, offsets: np.ndarray):
+        """Initialize the index.
+
+        Args:
+            centroids: (nlist, dim) L2-normalized centroids
+            rows: Vector row numbers grouped by list
+            offsets: (nlist + 1) start of each list in rows
+
+        """
+        self.centroids = centroids
+        self.rows = rows
+        self.offsets = offsets
+
+    @property
+    def nlist(self) -> int:
+        """Number of lists."""
+        return self.centroids.shape[0]
+
+    @classmethod
+    def build(
+        cls,
+        vectors: np.ndarray,
+        nlist: int | None = None,
+        iterations: int = 10,
+        seed: int = 0,
+    ) -> Self:
+        """Cluster vectors and assign each one to its nearest list.
+
+        Args:
+            vectors: (n, dim) L2-normalized vectors
+            nlist: Number of lists (defaults to :func:`default_nlist`)
+            iterations: k-means iterations
+            seed: Seed for sampling and initialization
+
+        Returns:
+            New index
+
+        """
+        nlist = min(nlist or default_nlist(vectors.shape[0]), vectors.shape[0])
+        centroids = train_centroids(vectors, nlist, iterations, seed)
+        labels = assign_lists(vectors, centroids)
+        return cls.from_labels(
+            centroids, np.arange(vectors.shape[0], dtype=np.int64), labels
+        )
+
+    @classmethod
+    def from_labels(
+        cls, centroids: np.ndarray, rows: np.ndarray, labels: np.ndarray
+    ) -> Self:
+        """Group rows into lists given the list each row belongs to."""
+        order = np.argsort(labels, kind="stable")
+        counts = np.bincount(labels, minlength=centroids.shape[0])
+        offsets = np.concatenate(([0], np.cumsum(counts))).astype(np.int64)
+        return cls(centroids, rows[order].astype(np.int64), offsets)
+
+    def labels(self) -> np.ndarray:
+        """Return the list of each entry of self.rows."""
+        return np.repeat(np.arange(self.nlist), np.diff(self.offsets))
+
+    def take(self, keep: np.ndarray) -> Self:
+        """Return lists holding only the kept rows, renumbered from 0.
+
+        Args:
+            keep: Sorted row numbers to keep
+
+        """
+        renumbered = np.full(int(self.offsets[-1]), -1, dtype=np.int64)
+        renumbered[keep] = np.arange(len(keep))
+        rows = renumbered[self.rows]
+        kept = rows >= 0
+        return type(self).from_labels(self.centroids, rows[kept], self.labels()[kept])
+
+    def extend(self, vectors: np.ndarray, first_row: int) -> Self:
+        """Return lists with new rows added to their nearest existing lists.
+
+        The centroids are not retrained; rebuild the lists if the corpus
+        drifts far from the one they were trained on.
+
+        Args:
+            vectors: L2-normalized vectors of the new rows
+            first_row: Row number of the first new vector
+
+        """
+        rows = np.arange(first_row, first_row + vectors.shape[0], dtype=np.int64)
+        return type(self).from_labels(
+            self.centroids,
+            np.concatenate([self.rows, rows]),
+            np.concatenate([self.labels(), assign_lists(vectors, self.centroids)]),
+        )
+
+    def candidates(self, query_vector: np.ndarray, nprobe: int) -> np.ndarray:
+        """Return the rows in the nprobe lists closest to the query.
+
+        Args:
+            query_vector: L2-normalized query embedding
+            nprobe: Number of lists to scan
+
+        Returns:
+            Candidate row numbers, in ascending order
+
+        """
+        probed = top_k_indices(self.centroids @ query_vector, nprobe)
+        rows = np.concatenate(
+            [self.rows[self.offsets[i] : self.offsets[i + 1]] for i in probed]
+        )
+        rows.sort()
+        return rows
+
+    def save(self, path: Path) -> None:
+        """Write the index to ``path``."""
+        with atomic_write(path) as f:
+            np.savez(f, centroids=self.centroids, rows=self.rows, offsets=self.offsets)
+
+    @classmethod
+    def load(cls, path: str | Path) -> Self:
+        """Read an index written by :meth:`save`."""
+        with np.load(path) as data:
+            return cls(data["centroids"], data["rows"], data["offsets"])
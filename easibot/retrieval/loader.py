@@ -0,0 +1,389 @@
+"""Load a RAG index from a local directory or the RAG S3 bucket."""
+
+from __future__ import annotations
+
+import json
+import time
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+from threading import Lock
+from typing import TYPE_CHECKING, Any
+
+import boto3
+from botocore.exceptions import ClientError
+
+from easibot.config import settings
+
+from .index import MANIFEST_FILE, VectorIndex, manifest_files
+from .store import atomic_write
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+# Kept next to a downloaded index: the S3 ETag of each file it holds
+ETAGS_FILE = "s3_etags.json"
+
+# Each upload stores its files under VERSIONS_DIR/<id>/, and the manifest
+# records the id in VERSION_FIELD
+VERSIONS_DIR = "versions"
+VERSION_FIELD = "version"
+
+# How often a download starts over when the index is replaced meanwhile
+DOWNLOAD_ATTEMPTS = 3
+
+# Object a writer creates under the index prefix while it updates the index
+LOCK_FILE = "writer.lock"
+LOCK_POLL_SECONDS = 0.5
+
+# Writers to local index directories only take turns within this process
+_local_writers = Lock()
+
+# S3 error codes for a conditional write whose condition did not hold
+CONFLICT_CODES = frozenset(
+    {"ConditionalRequestConflict", "NoSuchKey", "PreconditionFailed"}
+)
+
+
+class IndexConflictError(RuntimeError):
+    """Raised when the S3 index changed after it was downloaded for an update."""
+
+
+def parse_s3_uri(uri: str) -> tuple[str, str]:
+    """Split ``s3://bucket/prefix`` into (bucket, prefix without slashes)."""
+    bucket, _, prefix = uri.removeprefix("s3://").partition("/")
+    return bucket, prefix.strip("/")
+
+
+def local_index_dir(uri: str, cache_dir: str | Path | None = None) -> Path:
+    """Return where the index at uri lives on disk.
+
+    Args:
+        uri: Local index directory, or S3 URI of one
+        cache_dir: Where S3 indexes are downloaded (defaults to
+            settings.rag_cache_dir)
+
+    Returns:
+        The directory itself, or its download location for an S3 URI
+
+    """
+    if not uri.startswith("s3://"):
+        return Path(uri)
+    bucket, prefix = parse_s3_uri(uri)
+    return Path(cache_dir or settings.rag_cache_dir) / bucket / prefix
+
+
+def download_index(uri: str, cache_dir: str | Path) -> Path:
+    """Copy an index from S3 into a local directory, skipping unchanged files.
+
+    The ETag of every file downloaded is recorded in ETAGS_FILE. The next call
+    asks for the manifest only if its ETag changed (a conditional GET, so an
+    unchanged index costs one request), and then downloads only the listed
+    files whose ETag differs from the recorded one. If the version being
+    downloaded is replaced and its files removed meanwhile, the download
+    starts over from the new manifest.
+
+    Args:
+        uri: ``s3://bucket/prefix`` holding the manifest and the files it lists
+        cache_dir: Local directory to download into
+
+    Returns:
+        Local index directory
+
+    Raises:
+        IndexConflictError: If the index was replaced during every attempt
+
+    """
+    bucket, prefix = parse_s3_uri(uri)
+    local = local_index_dir(uri, cache_dir)
+    local.mkdir(parents=True, exist_ok=True)
+    s3 = boto3.client("s3", region_name=settings.aws_region)
+    etags = _read_etags(local)
+
+    for _ in range(DOWNLOAD_ATTEMPTS):
+        request = {"Bucket": bucket, "Key": _key(prefix, MANIFEST_FILE)}
+        if MANIFEST_FILE in etags:
+            request["IfNoneMatch"] = etags[MANIFEST_FILE]
+        try:
+            response = s3.get_object(**request)
+        except ClientError as error:
+            if _error_code(error) == "304":
+                return local
+            if _error_code(error) in {"404", "NoSuchKey"}:
+                # Nothing there yet: record that, so an upload creates the
+                # index only if no one else has meanwhile
+                _write_etags(local, {})
+            raise
+        body = response["Body"].read()
+        manifest = json.loads(body)
+
+        # The local files stop matching the recorded manifest from here on
+        (local / ETAGS_FILE).unlink(missing_ok=True)
+        etags.pop(MANIFEST_FILE, None)
+        try:
+            for name in manifest_files(manifest):
+                key = _file_key(prefix, manifest, name)
+                etag = s3.head_object(Bucket=bucket, Key=key)["ETag"]
+                if etag != etags.get(name):
+                    s3.download_file(bucket, key, str(local / name))
+                    etags[name] = etag
+        except ClientError as error:
+            # Replaced by a newer version, whose writer removed this one
+            if _error_code(error) in {"404", "NoSuchKey"}:
+                continue
+            raise
+
+        # Manifest last, so the directory never lists files it does not hold
+        with atomic_write(local / MANIFEST_FILE) as f:
+            f.write(body)
+        etags[MANIFEST_FILE] = response["ETag"]
+        _write_etags(
+            local,
+            {name: etags[name] for name in [*manifest_files(manifest), MANIFEST_FILE]},
+        )
+        return local
+    msg = f"RAG index at {uri} kept changing while it was downloaded"
+    raise IndexConflictError(msg)
+
+
+def upload_index(local: str | Path, uri: str) -> None:
+    """Copy an index directory to S3 as a new version.
+
+    The data files are uploaded under a prefix of their own
+    (``versions/<id>/``), which only the manifest uploaded after them points
+    to, so writing the manifest is the single step that makes the new version
+    visible; readers keep seeing the old one until then. If ``local`` was
+    downloaded from ``uri``, the manifest is written only if S3 still holds
+    the one that was downloaded (``If-Match``), or still holds none if there
+    was none (``If-None-Match: *``), so an update based on a stale copy fails
+    instead of discarding another writer's changes; its files are then
+    removed again. Writers should also hold :func:`writer_lock`. Once the
+    manifest is written, the files of the version it replaced are removed.
+    The uploaded files' ETags are recorded as if they had been downloaded, so
+    the next :func:`download_index` into ``local`` transfers nothing.
+
+    Args:
+        local: Index directory written by :meth:`VectorIndex.save`
+        uri: ``s3://bucket/prefix`` to upload into
+
+    Raises:
+        IndexConflictError: If the manifest in S3 changed since ``local`` was
+            downloaded
+
+    """
+    local = Path(local)
+    bucket, prefix = parse_s3_uri(uri)
+    s3 = boto3.client("s3", region_name=settings.aws_region)
+    manifest_key = _key(prefix, MANIFEST_FILE)
+    condition = {}
+    if (local / ETAGS_FILE).exists():
+        expected = json.loads((local / ETAGS_FILE).read_text()).get(MANIFEST_FILE)
+        condition = {"IfMatch": expected} if expected else {"IfNoneMatch": "*"}
+    # The local files no longer match what was recorded; forget it until the
+    # upload has succeeded
+    (local / ETAGS_FILE).unlink(missing_ok=True)
+    replaced = _get_manifest(s3, bucket, manifest_key)
+
+    manifest = json.loads((local / MANIFEST_FILE).read_text())
+    manifest[VERSION_FIELD] = uuid.uuid4().hex
+    uploaded = {}
+    for name in manifest_files(manifest):
+        key = _file_key(prefix, manifest, name)
+        s3.upload_file(str(local / name), bucket, key)
+        uploaded[name] = _etag(s3, bucket, key)
+    body = json.dumps(manifest).encode()
+    try:
+        response = s3.put_object(
+            Bucket=bucket, Key=manifest_key, Body=body, **condition
+        )
+    except ClientError as error:
+        # Nothing points at this version, so nothing else will remove it
+        _delete_files(s3, bucket, prefix, manifest)
+        if _error_code(error) in CONFLICT_CODES:
+            msg = f"RAG index at {uri} changed since it was downloaded"
+            raise IndexConflictError(msg) from error
+        raise
+    if replaced is not None:
+        _delete_files(s3, bucket, prefix, replaced)
+
+    with atomic_write(local / MANIFEST_FILE) as f:
+        f.write(body)
+    uploaded[MANIFEST_FILE] = response["ETag"]
+    _write_etags(local, uploaded)
+
+
+@contextmanager
+def writer_lock(uri: str, lease_seconds: float) -> Iterator[None]:
+    """Hold the S3 index's writer lock while the block runs.
+
+    The lock is an object under the index prefix created with
+    ``If-None-Match: *``, which S3 lets only one writer do. It records when
+    its lease ends, so a lock left by a writer that crashed is taken over
+    (with ``If-Match``, so by one waiter only) once the lease runs out.
+    Writers to a local directory take turns on a lock in this process.
+
+    Args:
+        uri: Local index directory, or S3 URI of one
+        lease_seconds: How long the lock is held before others may take it
+            over; also how long to wait for another writer's lock
+
+    Raises:
+        TimeoutError: If another writer held the lock for lease_seconds
+
+    """
+    if not uri.startswith("s3://"):
+        with _local_writers:
+            yield
+        return
+    bucket, prefix = parse_s3_uri(uri)
+    key = _key(prefix, LOCK_FILE)
+    s3 = boto3.client("s3", region_name=settings.aws_region)
+    deadline = time.monotonic() + lease_seconds
+    while (etag := _acquire_lock(s3, bucket, key, lease_seconds)) is None:
+        if time.monotonic() >= deadline:
+            msg = f"RAG index at {uri} is locked by another writer"
+            raise TimeoutError(msg)
+        time.sleep(LOCK_POLL_SECONDS)
+    try:
+        yield
+    finally:
+        try:
+            s3.delete_object(Bucket=bucket, Key=key, IfMatch=etag)
+        except ClientError as error:
+            # Our lease ran out and another writer took the lock over
+            if _error_code(error) not in CONFLICT_CODES:
+                raise
+
+
+def _acquire_lock(s3: Any, bucket: str, key: str, lease_seconds: float) -> str | None:
+    """Create or take over an expired lock; return its ETag, or None if held."""
+    body = json.dumps({"expires": time.time() + lease_seconds}).encode()
+    try:
+        return s3.put_object(Bucket=bucket, Key=key, Body=body, IfNoneMatch="*")["ETag"]
+    except ClientError as error:
+        if _error_code(error) not in CONFLICT_CODES:
+            raise
+    try:
+        held = s3.get_object(Bucket=bucket, Key=key)
+        if json.loads(held["Body"].read())["expires"] > time.time():
+            return None
+        return s3.put_object(Bucket=bucket, Key=key, Body=body, IfMatch=held["ETag"])[
+            "ETag"
+        ]
+    except ClientError as error:
+        # Released or taken over in the meantime
+        if _error_code(error) in {*CONFLICT_CODES, "404"}:
+            return None
+        raise
+
+
+def _delete_files(s3: Any, bucket: str, prefix: str, manifest: dict) -> None:
+    """Remove the files a manifest lists from S3."""
+    for name in manifest_files(manifest):
+        s3.delete_object(Bucket=bucket, Key=_file_key(prefix, manifest, name))
+
+
+def _etag(s3: Any, bucket: str, key: str) -> str | None:
+    """Return the ETag of an S3 object, or None if there is no such object."""
+    try:
+        return s3.head_object(Bucket=bucket, Key=key)["ETag"]
+    except ClientError as error:
+        if _error_code(error) in {"404", "NoSuchKey"}:
+            return None
+        raise
+
+
+def _error_code(error: ClientError) -> str | None:
+    """Return the S3 error code of a failed request."""
+    return error.response.get("Error", {}).get("Code")
+
+
+def _file_key(prefix: str, manifest: dict, name: str) -> str:
+    """Return the S3 key of a file listed in a manifest.
+
+    Manifests uploaded before versions were introduced list files stored
+    directly under the prefix.
+    """
+    version = manifest.get(VERSION_FIELD)
+    return _key(prefix, f"{VERSIONS_DIR}/{version}/{name}" if version else name)
+
+
+def _get_manifest(s3: Any, bucket: str, key: str) -> dict | None:
+    """Return the manifest stored at key, or None if there is none."""
+    try:
+        return json.loads(s3.get_object(Bucket=bucket, Key=key)["Body"].read())
+    except ClientError as error:
+        if _error_code(error) in {"404", "NoSuchKey"}:
+            return None
+        raise
+
+
+def _key(prefix: str, name: str) -> str:
+    """Return the S3 key of an index file under prefix."""
+    return f"{prefix}/{name}" if prefix else name
+
+
+def _read_etags(local: Path) -> dict[str, str]:
+    """Return the recorded ETags of files that are still present locally.
+
+    The manifest's ETag is dropped if a file it lists is missing, so the
+    manifest is fetched again and the missing file restored.
+    """
+    path = local / ETAGS_FILE
+    if not path.exists():
+        return {}
+    etags = json.loads(path.read_text())
+    present = {name: etag for name, etag in etags.items() if (local / name).exists()}
+    if MANIFEST_FILE in present:
+        manifest = json.loads((local / MANIFEST_FILE).read_text())
+        if not all(name in present for name in manifest_files(manifest)):
+            del present[MANIFEST_FILE]
+    return present
+
+
+def _write_etags(local: Path, etags: dict[str, str]) -> None:
+    """Record the S3 ETags of the files in a local index directory."""
+    with atomic_write(local / ETAGS_FILE) as f:
+        f.write(json.dumps(etags, indent=2).encode())
+
+
+def fetch_index(uri: str, cache_dir: str | Path | None = None) -> Path | None:
+    """Return a local directory holding the index at uri, if there is one.
+
+    Args:
+        uri: Local index directory, or S3 URI of one
+        cache_dir: Where S3 indexes are downloaded (defaults to
+            settings.rag_cache_dir)
+
+    Returns:
+        Local index directory, or None if no index has been saved there yet
+
+    """
+    if not uri.startswith("s3://"):
+        path = local_index_dir(uri)
+        return path if (path / MANIFEST_FILE).exists() else None
+    try:
+        return download_index(uri, cache_dir or settings.rag_cache_dir)
+    except ClientError as error:
+        if _error_code(error) in {"404", "NoSuchKey"}:
+            return None
+        raise
+
+
+def load_index(uri: str, cache_dir: str | Path | None = None) -> VectorIndex:
+    """Load an index from a directory path or an ``s3://`` URI.
+
+    Args:
+        uri: Local index directory, or S3 URI of one
+        cache_dir: Where S3 indexes are downloaded (defaults to
+            settings.rag_cache_dir)
+
+    Returns:
+        Loaded index
+
+    """
+    if uri.startswith("s3://"):
+        return VectorIndex.load(
+            download_index(uri, cache_dir or settings.rag_cache_dir)
+        )
+    return VectorIndex.load(uri)
@@ -0,0 +1,197 @@
+"""Inverted index from chunk metadata to the rows that carry it.
+
+Filters are resolved to a sorted array of row numbers before any vector is
+scored. A filter is a dict whose keys must all match (AND); a list, tuple or
+set value matches any of its entries (IN), and ``"$and"`` / ``"$or"`` keys
+take a list of nested filters::
+
+    {"offering": ["bcdr", "cloud-modernization"], "type": "playbook"}
+    {"$or": [{"offering": "bcdr"}, {"type": "template"}]}
+"""
+
+from __future__ import annotations
+
+import json
+from collections import defaultdict
+from typing import TYPE_CHECKING, Any, Self
+
+import numpy as np
+
+from .store import atomic_write
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from pathlib import Path
+
+METADATA_FILE = "metadata.json"
+METADATA_ROWS_FILE = "metadata_rows.npy"
+
+_EMPTY = np.empty(0, dtype=np.int64)
+
+
+class MetadataIndex:
+    """Sorted row-number postings for every metadata key and value."""
+
+    def __init__(self, postings: dict[tuple[str, str], np.ndarray], count: int):
+        """Initialize the index.
+
+        Args:
+            postings: Sorted, unique row numbers per (key, value)
+            count: Number of rows indexed
+
+        """
+        self.postings = postings
+        self.count = count
+
+    @classmethod
+    def build(cls, metadata: Iterable[dict[str, str]]) -> Self:
+        """Index the metadata of each row, numbering rows from 0."""
+        rows: dict[tuple[str, str], list[int]] = defaultdict(list)
+        count = 0
+        for row, fields in enumerate(metadata):
+            for item in fields.items():
+                rows[item].append(row)
+            count = row + 1
+        return cls(
+            {item: np.array(found, dtype=np.int64) for item, found in rows.items()},
+            count,
+        )
+
+    def take(self, keep: np.ndarray) -> Self:
+        """Return postings for only the kept rows, renumbered from 0.
+
+        Args:
+            keep: Sorted row numbers to keep
+
+        """
+        renumbered = np.full(self.count, -1, dtype=np.int64)
+        renumbered[keep] = np.arange(len(keep))
+        postings = {}
+        for item, rows in self.postings.items():
+            kept = renumbered[rows]
+            kept = kept[kept >= 0]
+            if len(kept):
+                postings[item] = kept
+        return type(self)(postings, len(keep))
+
+    def extend(self, metadata: Iterable[dict[str, str]]) -> Self:
+        """Return postings with more rows numbered after the existing ones."""
+        added = type(self).build(metadata)
+        postings = dict(self.postings)
+        for item, rows in added.postings.items():
+            postings[item] = np.concatenate(
+                [postings.get(item, _EMPTY), rows + self.count]
+            )
+        return type(self)(postings, self.count + added.count)
+
+    def save(self, path: Path) -> list[str]:
+        """Write the postings into an index directory.
+
+        All postings go into one array file; a small JSON file holds each
+        key/value and where its rows start.
+
+        Returns:
+            Names of the files written
+
+        """
+        items = list(self.postings)
+        lengths = [len(self.postings[item]) for item in items]
+        with atomic_write(path / METADATA_ROWS_FILE) as f:
+            np.save(
+                f,
+                np.concatenate([self.postings[item] for item in items])
+                if items
+                else np.empty(0, dtype=np.int64),
+            )
+        with atomic_write(path / METADATA_FILE) as f:
+            f.write(
+                json.dumps(
+                    {
+                        "count": self.count,
+                        "items": items,
+                        "offsets": np.concatenate(([0], np.cumsum(lengths))).tolist(),
+                    }
+                ).encode()
+            )
+        return [METADATA_FILE, METADATA_ROWS_FILE]
+
+    @classmethod
+    def load(cls, path: Path, *, mmap: bool = True) -> Self:
+        """Open postings written by :meth:`save`.
+
+        Args:
+            path: Index directory
+            mmap: Memory-map the rows instead of reading them into memory
+
+        Returns:
+            Loaded index whose postings are views into the rows file
+
+        """
+        layout = json.loads((path / METADATA_FILE).read_text())
+        rows = np.load(path / METADATA_ROWS_FILE, mmap_mode="r" if mmap else None)
+        offsets = layout["offsets"]
+        return cls(
+            {
+                (key, value): rows[offsets[i] : offsets[i + 1]]
+                for i, (key, value) in enumerate(layout["items"])
+            },
+            layout["count"],
+        )
+
+    def rows(self, key: str, value: str) -> np.ndarray:
+        """Return the rows whose metadata has key set to value."""
+        return self.postings.get((key, value), _EMPTY)
+
+    def resolve(self, metadata_filter: dict[str, Any]) -> np.ndarray:
+        """Return the sorted rows matching a filter.
+
+        Args:
+            metadata_filter: Filter as described in the module docstring
+
+        Returns:
+            Sorted, unique row numbers
+
+        Raises:
+            ValueError: If ``"$and"`` or ``"$or"`` is not given a list
+
+        """
+        clauses = []
+        for key, allowed in metadata_filter.items():
+            if key in {"$and", "$or"}:
+                if not isinstance(allowed, list | tuple):
+                    msg = f"{key} takes a list of filters, got {allowed!r}"
+                    raise ValueError(msg)
+                resolved = [self.resolve(clause) for clause in allowed]
+                clauses.append(
+                    _intersect(resolved) if key == "$and" else _union(resolved)
+                )
+            elif isinstance(allowed, list | tuple | set | frozenset):
+                clauses.append(_union([self.rows(key, value) for value in allowed]))
+            else:
+                clauses.append(self.rows(key, allowed))
+        if not clauses:
+            return np.arange(self.count, dtype=np.int64)
+        return _intersect(clauses)
+
+
+def _intersect(arrays: list[np.ndarray]) -> np.ndarray:
+    """Intersect sorted unique arrays, smallest first so the work shrinks."""
+    if not arrays:
+        return _EMPTY
+    arrays = sorted(arrays, key=len)
+    result = arrays[0]
+    for other in arrays[1:]:
+        if not len(result):
+            break
+        result = np.intersect1d(result, other, assume_unique=True)
+    return result
+
+
+def _union(arrays: list[np.ndarray]) -> np.ndarray:
+    """Union sorted unique arrays."""
+    arrays = [a for a in arrays if len(a)]
+    if not arrays:
+        return _EMPTY
+    if len(arrays) == 1:
+        return arrays[0]
+    return np.unique(np.concatenate(arrays))
@@ -0,0 +1,22 @@
+"""Data models for knowledge-base chunks and search results."""
+
+from pydantic import BaseModel, Field
+
+
+class Chunk(BaseModel):
+    """A piece of a knowledge-base document, one row of the index."""
+
+    id: str = Field(description="Stable chunk identifier")
+    source: str = Field(description="Source document name")
+    content: str = Field(description="Chunk text")
+    metadata: dict[str, str] = Field(default_factory=dict)
+
+
+class SearchResult(BaseModel):
+    """A chunk returned by a search, with its similarity to the query."""
+
+    id: str
+    source: str
+    content: str
+    metadata: dict[str, str] = Field(default_factory=dict)
+    score: float = Field(description="Cosine similarity to the query")
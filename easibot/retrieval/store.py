@@ -0,0 +1,389 @@
+"""On-disk storage for index embeddings and chunks, opened without copying.
+
+Embeddings are stored as float32, float16 or int8 codes with a per-row scale
+and opened with ``numpy.load(mmap_mode="r")``. Chunk text is read by byte
+offset when a result needs it. Opening an index therefore reads no corpus
+data up front, and only the pages a search touches become resident.
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+from collections.abc import Iterable, Iterator, Sequence
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, BinaryIO, Self
+
+import numpy as np
+
+from .models import Chunk
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+EMBEDDINGS_FILE = "embeddings.npy"
+SCALES_FILE = "scales.npy"
+FULL_EMBEDDINGS_FILE = "embeddings_full.npy"
+CHUNKS_FILE = "chunks.jsonl"
+CHUNK_OFFSETS_FILE = "chunk_offsets.npy"
+
+QUANTIZATIONS = ("float32", "float16", "int8")
+
+# int8 codes use [-127, 127] so every code has a negation
+INT8_MAX = 127
+
+# Rows converted or gathered per block when scoring; small enough that each
+# float32 block stays in cache for its matrix product
+SCORE_BLOCK_ROWS = 256
+
+
+class RowFile:
+    """Rows of a 2-D ``.npy`` file, read on demand with ``os.pread``.
+
+    Memory-mapping faults in whole pages (and often their neighbours) for
+    every row touched; reading only the requested bytes keeps a few scattered
+    rows per query from growing resident memory.
+    """
+
+    def __init__(self, path: Path):
+        """Open the file and read its header."""
+        readers = {
+            (1, 0): np.lib.format.read_array_header_1_0,
+            (2, 0): np.lib.format.read_array_header_2_0,
+        }
+        with path.open("rb") as f:
+            self.shape, _, self.dtype = readers[np.lib.format.read_magic(f)](f)
+            self.offset = f.tell()
+        self.path = path
+        self.row_bytes = self.shape[1] * self.dtype.itemsize
+        self._fd = os.open(path, os.O_RDONLY)
+
+    def __del__(self):
+        """Close the file descriptor."""
+        if hasattr(self, "_fd"):
+            os.close(self._fd)
+
+    def __len__(self) -> int:
+        """Return the number of rows."""
+        return self.shape[0]
+
+    def __getitem__(self, rows: np.ndarray) -> np.ndarray:
+        """Return the given rows as an array."""
+        out = np.empty((len(rows), self.shape[1]), self.dtype)
+        for i, row in enumerate(rows):
+            data = os.pread(
+                self._fd, self.row_bytes, self.offset + int(row) * self.row_bytes
+            )
+            out[i] = np.frombuffer(data, self.dtype)
+        return out
+
+    def read(self) -> np.ndarray:
+        """Read the whole file into memory."""
+        return np.load(self.path)
+
+
+@contextmanager
+def atomic_write(path: Path) -> Iterator[BinaryIO]:
+    """Write a file under a temporary name and move it into place when done.
+
+    Readers that memory-mapped the old file keep a consistent view of it.
+    """
+    tmp = path.with_name(f".{path.name}.tmp")
+    with tmp.open("wb") as f:
+        yield f
+    tmp.replace(path)
+
+
+class VectorStore:
+    """Embedding matrix, optionally quantized, scored block by block."""
+
+    def __init__(
+        self,
+        codes: np.ndarray,
+        scales: np.ndarray | None = None,
+        full: np.ndarray | RowFile | None = None,
+    ):
+        """Initialize the store.
+
+        Args:
+            codes: (n, dim) float32, float16 or int8 embeddings
+            scales: Per-row float32 scale, required for int8 codes
+            full: Optional float32 originals of quantized codes (in memory or
+                a :class:`RowFile`), used to re-score top candidates exactly
+
+        """
+        if codes.dtype.name not in QUANTIZATIONS:
+            msg = f"Unsupported embedding dtype {codes.dtype}"
+            raise ValueError(msg)
+        if codes.dtype == np.int8 and scales is None:
+            msg = "int8 embeddings need per-row scales"
+            raise ValueError(msg)
+        self.codes = codes
+        self.scales = scales
+        self.full = full
+
+    def __len__(self) -> int:
+        """Return the number of rows."""
+        return self.codes.shape[0]
+
+    @property
+    def quantization(self) -> str:
+        """Storage type of the codes: "float32", "float16" or "int8"."""
+        return self.codes.dtype.name
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes a search reads: the codes plus their scales."""
+        return self.codes.nbytes + (
+            self.scales.nbytes if self.scales is not None else 0
+        )
+
+    @classmethod
+    def quantize(
+        cls,
+        vectors: np.ndarray,
+        quantization: str = "float32",
+        *,
+        keep_full: bool = False,
+    ) -> Self:
+        """Build a store from float32 vectors.
+
+        Args:
+            vectors: (n, dim) L2-normalized float32 embeddings
+            quantization: "float32", "float16" or "int8" (symmetric, with
+                each row scaled by its largest absolute component)
+            keep_full: Keep the float32 vectors for exact re-scoring
+
+        Returns:
+            New store
+
+        """
+        vectors = np.asarray(vectors, dtype=np.float32)
+        full = vectors if keep_full and quantization != "float32" else None
+        if quantization == "float32":
+            return cls(vectors)
+        if quantization == "float16":
+            return cls(vectors.astype(np.float16), full=full)
+        if quantization == "int8":
+            scales = (np.abs(vectors).max(axis=1) / INT8_MAX).astype(np.float32)
+            divisors = np.where(scales > 0, scales, 1.0)[:, np.newaxis]
+            return cls(np.rint(vectors / divisors).astype(np.int8), scales, full)
+        msg = f"Unknown quantization {quantization!r}; expected one of {list(QUANTIZATIONS)}"
+        raise ValueError(msg)
+
+    def score(
+        self, query_vector: np.ndarray, rows: np.ndarray | None = None
+    ) -> np.ndarray:
+        """Return the dot product of the query with each row.
+
+        Rows are gathered (and for quantized codes, converted to float32) a
+        cache-sized block at a time, so no full-size temporary is made.
+
+        Args:
+            query_vector: float32 query embedding
+            rows: Row numbers to score; None scores every row
+
+        Returns:
+            float32 score per row, in the order of rows
+
+        """
+        query_vector = query_vector.astype(np.float32, copy=False)
+        if rows is None and self.codes.dtype == np.float32:
+            return self.codes @ query_vector
+
+        count = len(self) if rows is None else len(rows)
+        scores = np.empty(count, dtype=np.float32)
+        block = np.empty(
+            (min(count, SCORE_BLOCK_ROWS), self.codes.shape[1]), np.float32
+        )
+        for start in range(0, count, SCORE_BLOCK_ROWS):
+            stop = min(start + SCORE_BLOCK_ROWS, count)
+            gathered = block[: stop - start]
+            if rows is None:
+                gathered[...] = self.codes[start:stop]
+            else:
+                np.take(self.codes, rows[start:stop], axis=0, out=gathered)
+            np.matmul(gathered, query_vector, out=scores[start:stop])
+        if self.scales is not None:
+            scores *= self.scales if rows is None else self.scales[rows]
+        return scores
+
+    def rescore(self, query_vector: np.ndarray, rows: np.ndarray) -> np.ndarray:
+        """Return exact float32 scores for a few rows.
+
+        Raises:
+            ValueError: If the codes are quantized and no originals were kept
+
+        """
+        query_vector = query_vector.astype(np.float32, copy=False)
+        if self.full is not None:
+            return self.full[rows] @ query_vector
+        if self.codes.dtype == np.float32:
+            return self.codes[rows] @ query_vector
+        msg = "Exact re-scoring needs full-precision vectors; quantize with keep_full=True"
+        raise ValueError(msg)
+
+    def dequantize(self) -> np.ndarray:
+        """Return every row as float32 (the codes themselves if unquantized)."""
+        if self.codes.dtype == np.float32:
+            return self.codes
+        if isinstance(self.full, RowFile):
+            return self.full.read()
+        if self.full is not None:
+            return self.full
+        vectors = self.codes.astype(np.float32)
+        if self.scales is not None:
+            vectors *= self.scales[:, np.newaxis]
+        return vectors
+
+    def vectors(self, rows: np.ndarray) -> np.ndarray:
+        """Return some rows as float32 (the originals when they were kept)."""
+        if self.full is not None:
+            return np.asarray(self.full[rows], dtype=np.float32)
+        vectors = self.codes[rows].astype(np.float32)
+        if self.scales is not None:
+            vectors *= self.scales[rows, np.newaxis]
+        return vectors
+
+    def take(self, rows: np.ndarray) -> Self:
+        """Return a store holding only the given rows, in memory."""
+        full = self.full.read() if isinstance(self.full, RowFile) else self.full
+        return type(self)(
+            self.codes[rows],
+            None if self.scales is None else self.scales[rows],
+            None if full is None else full[rows],
+        )
+
+    def append(self, vectors: np.ndarray) -> Self:
+        """Return a store with float32 vectors added, stored like the others."""
+        added = type(self).quantize(
+            vectors, self.quantization, keep_full=self.full is not None
+        )
+        if not len(self):
+            return added
+        full = self.full.read() if isinstance(self.full, RowFile) else self.full
+        return type(self)(
+            np.concatenate([self.codes, added.codes]),
+            None
+            if self.scales is None
+            else np.concatenate([self.scales, added.scales]),
+            None if full is None else np.concatenate([full, added.full]),
+        )
+
+    def save(self, path: Path) -> list[str]:
+        """Write the store into an index directory.
+
+        Returns:
+            Names of the files written
+
+        """
+        arrays = {
+            EMBEDDINGS_FILE: self.codes,
+            SCALES_FILE: self.scales,
+            FULL_EMBEDDINGS_FILE: self.full,
+        }
+        files = []
+        for name, array in arrays.items():
+            if array is None:
+                continue
+            with atomic_write(path / name) as f:
+                np.save(f, array)
+            files.append(name)
+        return files
+
+    @classmethod
+    def load(cls, path: Path, files: Iterable[str], *, mmap: bool = True) -> Self:
+        """Open a store written by :meth:`save`.
+
+        Args:
+            path: Index directory
+            files: Files the index manifest lists
+            mmap: Memory-map the arrays instead of reading them into memory
+
+        Returns:
+            Opened store
+
+        """
+        files = set(files)
+        mode = "r" if mmap else None
+        scales = full = None
+        if SCALES_FILE in files:
+            scales = np.load(path / SCALES_FILE, mmap_mode=mode)
+        if FULL_EMBEDDINGS_FILE in files:
+            # Only the few re-scored rows are ever read from the originals
+            full = (
+                RowFile(path / FULL_EMBEDDINGS_FILE)
+                if mmap
+                else np.load(path / FULL_EMBEDDINGS_FILE)
+            )
+        return cls(np.load(path / EMBEDDINGS_FILE, mmap_mode=mode), scales, full)
+
+
+class ChunkStore(Sequence[Chunk]):
+    """Chunks read on demand from a memory-mapped JSONL file."""
+
+    def __init__(self, data: bytes | mmap.mmap, offsets: np.ndarray):
+        """Initialize the store.
+
+        Args:
+            data: Contents of a chunks file, one JSON chunk per line
+            offsets: (len + 1) byte offset where each line starts, then the
+                end of the data
+
+        """
+        self.data = data
+        self.offsets = offsets
+
+    def __len__(self) -> int:
+        """Return the number of chunks."""
+        return len(self.offsets) - 1
+
+    def __getitem__(self, row: int) -> Chunk:
+        """Parse and return the chunk in a row."""
+        if not -len(self) <= row < len(self):
+            msg = f"chunk row {row} out of range"
+            raise IndexError(msg)
+        row %= len(self)
+        return Chunk.model_validate_json(
+            self.data[self.offsets[row] : self.offsets[row + 1]]
+        )
+
+    def __iter__(self) -> Iterator[Chunk]:
+        """Yield every chunk in row order."""
+        for row in range(len(self)):
+            yield self[row]
+
+    @staticmethod
+    def write(path: Path, chunks: Iterable[Chunk]) -> list[str]:
+        """Write chunks and their line offsets into an index directory.
+
+        Returns:
+            Names of the files written
+
+        """
+        offsets = [0]
+        with atomic_write(path / CHUNKS_FILE) as f:
+            for chunk in chunks:
+                line = chunk.model_dump_json().encode() + b"\n"
+                f.write(line)
+                offsets.append(offsets[-1] + len(line))
+        with atomic_write(path / CHUNK_OFFSETS_FILE) as f:
+            np.save(f, np.array(offsets, dtype=np.int64))
+        return [CHUNKS_FILE, CHUNK_OFFSETS_FILE]
+
+    @classmethod
+    def open(cls, path: Path, files: Iterable[str]) -> Self:
+        """Open the chunks of an index directory.
+
+        Indexes saved without an offsets file have their line offsets found
+        with one scan of the chunks file.
+        """
+        with (path / CHUNKS_FILE).open("rb") as f:
+            size = f.seek(0, 2)
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if size else b""
+        if CHUNK_OFFSETS_FILE in set(files):
+            offsets = np.load(path / CHUNK_OFFSETS_FILE, mmap_mode="r")
+        else:
+            ends = np.flatnonzero(np.frombuffer(data, dtype=np.uint8) == ord("\n")) + 1
+            offsets = np.concatenate(([0], ends)).astype(np.int64)
+        return cls(data, offsets)
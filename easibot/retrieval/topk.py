@@ -0,0 +1,27 @@
+"""Top-k selection over score arrays."""
+
+import numpy as np
+
+
+def top_k_indices(scores: np.ndarray, k: int) -> np.ndarray:
+    """Return the indices of the k highest scores, best first.
+
+    Uses ``argpartition`` (linear time) to find the top k and only sorts
+    those, instead of sorting every score.
+
+    Args:
+        scores: 1-D array of scores
+        k: Number of indices to return
+
+    Returns:
+        Up to k indices ordered by descending score
+
+    """
+    k = min(k, scores.shape[0])
+    if k <= 0:
+        return np.empty(0, dtype=np.intp)
+    if k < scores.shape[0]:
+        candidates = np.argpartition(scores, scores.shape[0] - k)[-k:]
+    else:
+        candidates = np.arange(scores.shape[0])
+    return candidates[np.argsort(-scores[candidates], kind="stable")]
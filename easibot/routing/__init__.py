@@ -0,0 +1,7 @@
+"""Routing classifiers used by the supervisor."""
+
+from .intents import INTENT_MATCHER, IntentMatcher
+from .keywords import KeywordRouter
+from .semantic import SemanticRouter
+
+__all__ = ["INTENT_MATCHER", "IntentMatcher", "KeywordRouter", "SemanticRouter"]
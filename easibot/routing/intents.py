@@ -0,0 +1,191 @@
+"""Precompiled multi-pattern intent matcher shared by routing agents."""
+
+from __future__ import annotations
+
+import re
+from collections import Counter
+from itertools import islice
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+# Keyword phrases per intent, matched case-insensitively on word boundaries so
+# "plan" matches "plan" and "planning" (listed explicitly) but never the middle
+# of "explanation". "DR" only counts as part of a phrase, so "Dr. Smith" does
+# not route to BC/DR. Specialist intents are listed in routing priority order.
+INTENT_KEYWORDS: dict[str, tuple[str, ...]] = {
+    "research": (
+        "search",
+        "searches",
+        "searching",
+        "find",
+        "finding",
+        "research",
+        "researching",
+        "information",
+        "what is",
+    ),
+    "app_rationalization": (
+        "application",
+        "applications",
+        "portfolio",
+        "portfolios",
+        "rationalize",
+        "rationalizing",
+        "rationalization",
+        "rationalise",
+        "rationalisation",
+    ),
+    "bcdr": (
+        "disaster",
+        "disasters",
+        "recovery",
+        "recover",
+        "continuity",
+        "bcdr",
+        "bc/dr",
+        "dr plan",
+        "dr plans",
+        "dr planning",
+        "dr strategy",
+        "dr site",
+        "dr test",
+        "dr testing",
+    ),
+    "tech_strategy": (
+        "strategy",
+        "strategies",
+        "strategic",
+        "roadmap",
+        "roadmaps",
+        "architecture",
+        "architectures",
+    ),
+    "cloud_modernization": (
+        "cloud",
+        "aws",
+        "azure",
+        "migrate",
+        "migrating",
+        "migration",
+        "migrations",
+    ),
+    # Not a specialist: requests for concrete work products
+    "deliverable": (
+        "create",
+        "creating",
+        "develop",
+        "developing",
+        "build",
+        "building",
+        "deliverable",
+        "deliverables",
+        "plan",
+        "plans",
+        "planning",
+        "strategy",
+        # Consumed whole by the BC/DR phrases, so listed here as well
+        "dr plan",
+        "dr plans",
+        "dr planning",
+        "dr strategy",
+    ),
+}
+
+
+def _trie_pattern(phrases: list[str]) -> str:
+    """Build a regex alternation factored as a character trie.
+
+    Factoring shared prefixes ("rationaliz...", "strateg...") means the regex
+    engine tests each input position against one branch per distinct leading
+    character instead of once per phrase.
+    """
+    trie: dict = {}
+    for phrase in phrases:
+        node = trie
+        for char in phrase:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def emit(node: dict) -> str:
+        terminal = "" in node
+        branches = [
+            (r"\s+" if char == " " else re.escape(char)) + emit(child)
+            for char, child in sorted(node.items())
+            if char
+        ]
+        if not branches:
+            return ""
+        if len(branches) == 1 and not terminal:
+            return branches[0]
+        return f"(?:{'|'.join(branches)}){'?' if terminal else ''}"
+
+    return emit(trie)
+
+
+class IntentMatcher:
+    """Score text against every intent in a single regex pass.
+
+    All keyword phrases are compiled once into a trie-factored alternation. Each
+    match is looked up in a phrase-to-intents table, so a keyword shared by two
+    intents (e.g. "strategy") counts for both without scanning the text twice.
+    """
+
+    def __init__(self, intents: dict[str, tuple[str, ...]] = INTENT_KEYWORDS):
+        """Compile the routing table.
+
+        Args:
+            intents: Mapping of intent name to lowercase keyword phrases
+
+        """
+        self.intents = tuple(intents)
+
+        self._phrase_intents: dict[str, tuple[str, ...]] = {}
+        for intent, phrases in intents.items():
+            for phrase in phrases:
+                owners = self._phrase_intents.get(phrase, ())
+                self._phrase_intents[phrase] = (*owners, intent)
+
+        # No leading \b: it makes the scan about 40% slower on long texts, so
+        # matches that start inside a word are skipped in score() instead
+        self._regex = re.compile(rf"{_trie_pattern(list(self._phrase_intents))}\b")
+
+    def score(self, text: str, max_hits: int | None = None) -> dict[str, int]:
+        """Count keyword hits per intent.
+
+        Routing reads the whole text, since the actual request often comes
+        after a long paste.
+
+        Args:
+            text: Text to scan
+            max_hits: Stop scanning after this many hits (None, the default,
+                reads it all)
+
+        Returns:
+            Hit count for every intent, in routing table order
+
+        """
+        text = text.lower()
+        # Count each distinct phrase first: a paste repeats the same few
+        # keywords hundreds of times
+        phrases = Counter(islice(self._phrases(text), max_hits))
+        scores = dict.fromkeys(self.intents, 0)
+        for phrase, count in phrases.items():
+            owners = self._phrase_intents.get(phrase)
+            if owners is None:  # a multi-word phrase with irregular whitespace
+                owners = self._phrase_intents[" ".join(phrase.split())]
+            for intent in owners:
+                scores[intent] += count
+        return scores
+
+    def _phrases(self, text: str) -> Iterator[str]:
+        """Yield the keyword phrases in lowercase text, in order."""
+        for match in self._regex.finditer(text):
+            start = match.start()
+            if not start or not (text[start - 1].isalnum() or text[start - 1] == "_"):
+                yield match[0]
+
+
+# Shared, compiled-once matcher used by the supervisor and research agents
+INTENT_MATCHER = IntentMatcher()
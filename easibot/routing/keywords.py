@@ -0,0 +1,114 @@
+"""Deterministic keyword classifier for supervisor routing."""
+
+from easibot.graph.state import RoutingDecision
+
+from .intents import INTENT_MATCHER, IntentMatcher
+
+# Specialists in routing priority order: the first one with any hit wins.
+ROUTING_PRIORITY: tuple[str, ...] = (
+    "research",
+    "app_rationalization",
+    "bcdr",
+    "tech_strategy",
+    "cloud_modernization",
+)
+
+# Deliverable specialists that may run side by side on a cross-offering request
+PARALLEL_SPECIALISTS: tuple[str, ...] = (
+    "app_rationalization",
+    "bcdr",
+    "tech_strategy",
+    "cloud_modernization",
+)
+
+DEFAULT_SPECIALIST = "research"
+
+# Keyword hits every offering of a cross-offering request needs before the
+# fan-out is trusted without asking the LLM
+PARALLEL_MIN_HITS = 2
+
+
+class KeywordRouter:
+    """Classify a request into a specialist without calling an LLM.
+
+    The winning specialist is the first one (in priority order) with a keyword
+    hit. Confidence is the share of all keyword hits that belong to the winner,
+    so a request that only mentions one offering scores 1.0 while a request that
+    mentions several offerings scores lower and is a candidate for LLM routing.
+
+    A work request (no research keywords) that names two or more parallel
+    specialists is routed to all of them at once. Its confidence is 1.0 only
+    if every one of them has at least ``parallel_min_hits`` hits; otherwise it
+    is below 0.5, so a passing mention of a second offering ("a cloud
+    migration roadmap") goes to the LLM instead of triggering several
+    deliverable calls.
+    """
+
+    def __init__(
+        self,
+        matcher: IntentMatcher = INTENT_MATCHER,
+        priority: tuple[str, ...] = ROUTING_PRIORITY,
+        parallel: tuple[str, ...] = PARALLEL_SPECIALISTS,
+        parallel_min_hits: int = PARALLEL_MIN_HITS,
+    ):
+        """Initialize the router.
+
+        Args:
+            matcher: Compiled intent matcher
+            priority: Specialists in routing priority order
+            parallel: Specialists that may be dispatched concurrently
+            parallel_min_hits: Hits each parallel specialist needs for a
+                confident fan-out
+
+        """
+        self.matcher = matcher
+        self.priority = priority
+        self.parallel = parallel
+        self.parallel_min_hits = parallel_min_hits
+
+    def classify(self, text: str) -> RoutingDecision:
+        """Classify request text into a routing decision.
+
+        Args:
+            text: Raw user request
+
+        Returns:
+            Routing decision with method "keyword"; parallel_specialists is set
+            when several specialists should run concurrently
+
+        """
+        scores = self.matcher.score(text)
+        hits = {specialist: scores[specialist] for specialist in self.priority}
+        total = sum(hits.values())
+
+        if not total:
+            return RoutingDecision(
+                next_specialist=DEFAULT_SPECIALIST,
+                confidence=0.0,
+                method="keyword",
+                reasoning="No routing keywords matched",
+            )
+
+        targets = [specialist for specialist in self.parallel if hits.get(specialist)]
+        if not hits.get(DEFAULT_SPECIALIST) and len(targets) > 1:
+            weakest = min(hits[specialist] for specialist in targets)
+            return RoutingDecision(
+                next_specialist=targets[0],
+                confidence=1.0
+                if weakest >= self.parallel_min_hits
+                else 0.5 * weakest / self.parallel_min_hits,
+                method="keyword",
+                reasoning=(
+                    f"Request spans {len(targets)} offerings, "
+                    f"each with at least {weakest} routing keywords"
+                ),
+                parallel_specialists=targets,
+            )
+
+        winner = next(specialist for specialist, count in hits.items() if count)
+        return RoutingDecision(
+            next_specialist=winner,
+            confidence=hits[winner] / total,
+            method="keyword",
+            reasoning=f"Matched {hits[winner]} of {total} routing keywords",
+        )
@@ -0,0 +1,156 @@
+"""Embedding-centroid semantic router for specialists."""
+
+import json
+from pathlib import Path
+from typing import Self
+
+import numpy as np
+
+from easibot.graph.state import RoutingDecision
+from easibot.tools.embeddings import Embedder, normalize_rows
+
+# Labelled example prompts shipped with the package
+DEFAULT_EXAMPLES_PATH = Path(__file__).parent / "data" / "routing_examples.jsonl"
+
+
+def load_examples(path: str | Path) -> list[tuple[str, str]]:
+    """Load labelled routing examples from a JSONL file.
+
+    Each line must be an object with "text" and "label" keys.
+
+    Args:
+        path: JSONL file path
+
+    Returns:
+        List of (text, label) pairs
+
+    """
+    examples = []
+    with Path(path).open(encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                record = json.loads(line)
+                examples.append((record["text"], record["label"]))
+    return examples
+
+
+def train_centroids(
+    examples: list[tuple[str, str]], embedder: Embedder
+) -> tuple[tuple[str, ...], np.ndarray]:
+    """Compute one L2-normalized centroid per label.
+
+    Args:
+        examples: (text, label) pairs
+        embedder: Embedder used for both training and routing
+
+    Returns:
+        Sorted labels and a (labels, dim) float32 centroid matrix
+
+    """
+    texts, labels = zip(*examples, strict=True)
+    vectors = embedder.embed(list(texts))
+    label_array = np.asarray(labels)
+
+    names = tuple(sorted(set(labels)))
+    centroids = np.stack([vectors[label_array == name].mean(axis=0) for name in names])
+    return names, normalize_rows(centroids).astype(np.float32)
+
+
+class SemanticRouter:
+    """Route requests by cosine similarity to per-specialist centroids.
+
+    The request is embedded once and compared with every centroid in a single
+    matrix-vector product. Confidence is the softmax probability of the best
+    centroid, so it is high only when one specialist clearly stands out.
+    """
+
+    def __init__(
+        self,
+        labels: tuple[str, ...],
+        centroids: np.ndarray,
+        embedder: Embedder,
+        temperature: float = 0.05,
+    ):
+        """Initialize the router.
+
+        Args:
+            labels: Specialist name for each centroid row
+            centroids: (labels, dim) L2-normalized centroid matrix
+            embedder: Embedder used to train the centroids
+            temperature: Softmax temperature applied to cosine similarities
+
+        """
+        self.labels = labels
+        self.centroids = centroids
+        self.embedder = embedder
+        self.temperature = temperature
+
+    @classmethod
+    def load(
+        cls, path: str | Path, embedder: Embedder, temperature: float = 0.05
+    ) -> Self:
+        """Load centroids written by ``save``.
+
+        Raises:
+            ValueError: If the centroids were trained with a different model
+
+        """
+        with np.load(path) as data:
+            model_name = str(data["model_name"])
+            labels = tuple(str(label) for label in data["labels"])
+            centroids = data["centroids"].astype(np.float32)
+
+        if model_name != embedder.model_name:
+            msg = (
+                f"Centroids in {path} were trained with {model_name}, "
+                f"not {embedder.model_name}"
+            )
+            raise ValueError(msg)
+        return cls(labels, centroids, embedder, temperature)
+
+    def save(self, path: str | Path) -> Path:
+        """Write labels, centroids and the embedding model name to an .npz file.
+
+        Args:
+            path: Output path; ".npz" is appended if it has another suffix,
+                as np.savez does
+
+        Returns:
+            Path actually written
+
+        """
+        path = Path(path)
+        if path.suffix != ".npz":
+            path = path.with_name(f"{path.name}.npz")
+        np.savez(
+            path,
+            labels=np.asarray(self.labels),
+            centroids=self.centroids,
+            model_name=np.asarray(self.embedder.model_name),
+        )
+        return path
+
+    def classify(self, text: str) -> RoutingDecision:
+        """Classify request text into a routing decision.
+
+        Args:
+            text: Raw user request
+
+        Returns:
+            Routing decision with method "semantic"
+
+        """
+        query = self.embedder.embed([text])[0]
+        similarities = self.centroids @ query
+
+        logits = similarities / self.temperature
+        probabilities = np.exp(logits - logits.max())
+        probabilities /= probabilities.sum()
+
+        best = int(np.argmax(similarities))
+        return RoutingDecision(
+            next_specialist=self.labels[best],
+            confidence=float(probabilities[best]),
+            method="semantic",
+            reasoning=f"Closest centroid (cosine {similarities[best]:.2f})",
+        )
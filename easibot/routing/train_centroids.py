@@ -0,0 +1,47 @@
+"""Offline command that trains semantic routing centroids.
+
+Usage:
+    python -m easibot.routing.train_centroids --output centroids.npz \
+        [--examples examples.jsonl] [--embedder fastembed] [--model NAME]
+"""
+
+import argparse
+from collections import Counter
+
+from easibot.config import settings
+from easibot.tools.embeddings import get_embedder
+
+from .semantic import (
+    DEFAULT_EXAMPLES_PATH,
+    SemanticRouter,
+    load_examples,
+    train_centroids,
+)
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Train centroids from a labelled example file and save them."""
+    parser = argparse.ArgumentParser(
+        description="Train semantic routing centroids from labelled examples."
+    )
+    parser.add_argument("--examples", default=str(DEFAULT_EXAMPLES_PATH))
+    parser.add_argument("--output", required=True)
+    parser.add_argument("--embedder", default=settings.semantic_router_embedder)
+    parser.add_argument("--model", default=settings.semantic_router_model)
+    args = parser.parse_args(argv)
+
+    examples = load_examples(args.examples)
+    embedder = get_embedder(args.embedder, args.model)
+    labels, centroids = train_centroids(examples, embedder)
+    output = SemanticRouter(labels, centroids, embedder).save(args.output)
+
+    counts = Counter(label for _, label in examples)
+    summary = ", ".join(f"{label}={counts[label]}" for label in labels)
+    parser.exit(
+        message=f"Wrote {len(labels)} centroids ({embedder.model_name}; {summary}) "
+        f"to {output}\n"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -11,7 +11,7 @@ from easibot.graph.state import ConsultantState, Deliverable, ResearchFinding
 class TestAppRationalizationSpecialist:
     """Test cases for AppRationalizationSpecialist."""
 
-    @patch("easibot.agents.app_rationalization.ChatBedrock")
+    @patch("easibot.agents.app_rationalization.get_chat_model")
     def test_specialist_creation(self, mock_bedrock):
         """Test that app rationalization specialist can be instantiated."""
         agent = AppRationalizationSpecialist()
@@ -20,8 +20,8 @@ class TestAppRationalizationSpecialist:
         assert agent.system_prompt is not None
         mock_bedrock.assert_called_once()
 
-    @patch("easibot.agents.app_rationalization.ChatBedrock")
-    def test_work_creates_deliverable(self, mock_bedrock, mock_bedrock_llm):
+    @patch("easibot.agents.app_rationalization.get_chat_model")
+    def test_work_creates_deliverable(self, mock_bedrock, mock_bedrock_llm, run_agent):
         """Test that specialist creates deliverables."""
         mock_bedrock.return_value = mock_bedrock_llm
         agent = AppRationalizationSpecialist()
@@ -33,7 +33,7 @@ class TestAppRationalizationSpecialist:
             max_iterations=10,
         )
 
-        result = agent.work(state)
+        result = run_agent(agent.work, state)
 
         assert "messages" in result
         assert len(result["messages"]) == 1
@@ -49,8 +49,10 @@ class TestAppRationalizationSpecialist:
         assert result["active_specialist"] == "app_rationalization"
         assert result["next_specialist"] == "END"
 
-    @patch("easibot.agents.app_rationalization.ChatBedrock")
-    def test_work_with_research_findings(self, mock_bedrock, mock_bedrock_llm):
+    @patch("easibot.agents.app_rationalization.get_chat_model")
+    def test_work_with_research_findings(
+        self, mock_bedrock, mock_bedrock_llm, run_agent
+    ):
         """Test specialist uses research findings in response."""
         mock_bedrock.return_value = mock_bedrock_llm
         agent = AppRationalizationSpecialist()
@@ -76,7 +78,7 @@ class TestAppRationalizationSpecialist:
             max_iterations=10,
         )
 
-        result = agent.work(state)
+        result = run_agent(agent.work, state)
 
         # Verify LLM was invoked (mock should be called)
         assert mock_bedrock_llm.invoke.called
@@ -86,8 +88,8 @@ class TestAppRationalizationSpecialist:
         assert len(result["deliverables"]) == 1
         assert result["deliverables"][0].type == "assessment"
 
-    @patch("easibot.agents.app_rationalization.ChatBedrock")
-    def test_work_without_user_message(self, mock_bedrock, mock_bedrock_llm):
+    @patch("easibot.agents.app_rationalization.get_chat_model")
+    def test_work_without_user_message(self, mock_bedrock, mock_bedrock_llm, run_agent):
         """Test specialist can work with continuation (no new user message)."""
         mock_bedrock.return_value = mock_bedrock_llm
         agent = AppRationalizationSpecialist()
@@ -99,7 +101,7 @@ class TestAppRationalizationSpecialist:
             max_iterations=10,
         )
 
-        result = agent.work(state)
+        result = run_agent(agent.work, state)
 
         # Should still produce deliverable even without user message
         assert "deliverables" in result
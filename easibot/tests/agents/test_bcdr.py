@@ -11,7 +11,7 @@ from easibot.graph.state import ConsultantState, Deliverable, ResearchFinding
 class TestBCDRSpecialist:
     """Test cases for BCDRSpecialist."""
 
-    @patch("easibot.agents.bcdr.ChatBedrock")
+    @patch("easibot.agents.bcdr.get_chat_model")
     def test_specialist_creation(self, mock_bedrock):
         """Test that BC/DR specialist can be instantiated."""
         agent = BCDRSpecialist()
@@ -20,8 +20,8 @@ class TestBCDRSpecialist:
         assert agent.system_prompt is not None
         mock_bedrock.assert_called_once()
 
-    @patch("easibot.agents.bcdr.ChatBedrock")
-    def test_work_creates_deliverable(self, mock_bedrock, mock_bedrock_llm):
+    @patch("easibot.agents.bcdr.get_chat_model")
+    def test_work_creates_deliverable(self, mock_bedrock, mock_bedrock_llm, run_agent):
         """Test that specialist creates BC/DR deliverables."""
         mock_bedrock.return_value = mock_bedrock_llm
         agent = BCDRSpecialist()
@@ -33,7 +33,7 @@ class TestBCDRSpecialist:
             max_iterations=10,
         )
 
-        result = agent.work(state)
+        result = run_agent(agent.work, state)
 
         assert "messages" in result
         assert len(result["messages"]) == 1
@@ -49,8 +49,10 @@ class TestBCDRSpecialist:
         assert result["active_specialist"] == "bcdr"
         assert result["next_specialist"] == "END"
 
-    @patch("easibot.agents.bcdr.ChatBedrock")
-    def test_work_with_research_findings(self, mock_bedrock, mock_bedrock_llm):
+    @patch("easibot.agents.bcdr.get_chat_model")
+    def test_work_with_research_findings(
+        self, mock_bedrock, mock_bedrock_llm, run_agent
+    ):
         """Test specialist uses research findings for BC/DR planning."""
         mock_bedrock.return_value = mock_bedrock_llm
         agent = BCDRSpecialist()
@@ -76,7 +78,7 @@ class TestBCDRSpecialist:
             max_iterations=10,
         )
 
-        result = agent.work(state)
+        result = run_agent(agent.work, state)
 
         # Verify LLM was invoked
         assert mock_bedrock_llm.invoke.called
@@ -86,9 +88,9 @@ class TestBCDRSpecialist:
         assert len(result["deliverables"]) == 1
         assert result["deliverables"][0].type == "bc_dr_plan"
 
-    @patch("easibot.agents.bcdr.ChatBedrock")
+    @patch("easibot.agents.bcdr.get_chat_model")
     def test_work_creates_bcdr_specific_deliverable(
-        self, mock_bedrock, mock_bedrock_llm
+        self, mock_bedrock, mock_bedrock_llm, run_agent
     ):
         """Test that BC/DR deliverables have correct metadata."""
         mock_bedrock.return_value = mock_bedrock_llm
@@ -101,9 +103,41 @@ class TestBCDRSpecialist:
             max_iterations=10,
         )
 
-        result = agent.work(state)
+        result = run_agent(agent.work, state)
 
         deliverable = result["deliverables"][0]
         assert deliverable.title == "Business Continuity and Disaster Recovery Plan"
         assert deliverable.offering == "bcdr"
         assert deliverable.specialist == "bcdr"
+
+    @patch("easibot.agents.bcdr.get_chat_model")
+    def test_research_context_respects_token_budget(
+        self, mock_bedrock, mock_bedrock_llm, run_agent, monkeypatch
+    ):
+        """Test that only the most relevant findings that fit are sent."""
+        mock_bedrock.return_value = mock_bedrock_llm
+        monkeypatch.setattr("easibot.llm.context.settings.context_token_budget", 30)
+        agent = BCDRSpecialist()
+
+        state = ConsultantState(
+            messages=[HumanMessage(content="Develop RTO/RPO analysis")],
+            research_findings=[
+                ResearchFinding(
+                    source="Old Memo",
+                    content="Backups were once taken weekly.",
+                    relevance_score=0.3,
+                ),
+                ResearchFinding(
+                    source="BC/DR Framework",
+                    content="RTO should align with business criticality.",
+                    relevance_score=0.92,
+                ),
+            ],
+        )
+
+        result = run_agent(agent.work, state)
+
+        prompt = mock_bedrock_llm.invoke.call_args[0][0][-1].content
+        assert "BC/DR Framework" in prompt
+        assert "Old Memo" not in prompt
+        assert 0 < result["messages"][0].response_metadata["context_tokens"] <= 30
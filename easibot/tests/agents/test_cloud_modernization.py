@@ -0,0 +1,80 @@
+"""Tests for the Cloud modernization specialist."""
+
+from unittest.mock import patch
+
+from langchain_core.messages import AIMessage, HumanMessage
+
+from easibot.agents.cloud_modernization import CloudModernizationSpecialist
+from easibot.graph.state import ConsultantState, Deliverable, ResearchFinding
+
+
+class TestCloudModernizationSpecialist:
+    """Test cases for CloudModernizationSpecialist."""
+
+    @patch("easibot.agents.cloud_modernization.get_chat_model")
+    def test_specialist_creation(self, mock_bedrock):
+        """Test that cloud modernization specialist can be instantiated."""
+        agent = CloudModernizationSpecialist()
+        assert agent is not None
+        assert agent.llm is not None
+        assert agent.system_prompt is not None
+        mock_bedrock.assert_called_once()
+
+    @patch("easibot.agents.cloud_modernization.get_chat_model")
+    def test_work_creates_deliverable(self, mock_bedrock, mock_bedrock_llm, run_agent):
+        """Test that specialist creates cloud modernization deliverables."""
+        mock_bedrock.return_value = mock_bedrock_llm
+        agent = CloudModernizationSpecialist()
+
+        state = ConsultantState(
+            messages=[HumanMessage(content="Plan our migration to AWS")],
+            offerings=["cloud-modernization"],
+            iteration_count=1,
+            max_iterations=10,
+        )
+
+        result = run_agent(agent.work, state)
+
+        assert "messages" in result
+        assert len(result["messages"]) == 1
+        assert isinstance(result["messages"][0], AIMessage)
+        assert result["messages"][0].name == "cloud_modernization_specialist"
+
+        assert "deliverables" in result
+        assert len(result["deliverables"]) == 1
+        assert isinstance(result["deliverables"][0], Deliverable)
+        assert result["deliverables"][0].offering == "cloud-modernization"
+        assert result["deliverables"][0].specialist == "cloud_modernization"
+
+        assert result["active_specialist"] == "cloud_modernization"
+        assert result["next_specialist"] == "END"
+
+    @patch("easibot.agents.cloud_modernization.get_chat_model")
+    def test_work_with_research_findings(
+        self, mock_bedrock, mock_bedrock_llm, run_agent
+    ):
+        """Test specialist includes research findings in the prompt."""
+        mock_bedrock.return_value = mock_bedrock_llm
+        agent = CloudModernizationSpecialist()
+
+        state = ConsultantState(
+            messages=[HumanMessage(content="Create a landing zone design")],
+            offerings=["cloud-modernization"],
+            research_findings=[
+                ResearchFinding(
+                    source="Offering Playbook",
+                    content="Start from business goals and current-state discovery.",
+                    relevance_score=0.88,
+                    metadata={"offering": "cloud-modernization"},
+                )
+            ],
+            iteration_count=2,
+            max_iterations=10,
+        )
+
+        result = run_agent(agent.work, state)
+
+        prompt = mock_bedrock_llm.invoke.call_args[0][0][-1].content
+        assert "Offering Playbook" in prompt
+        assert result["deliverables"][0].type == "migration_plan"
+        assert result["deliverables"][0].title == "Cloud Modernization Plan"
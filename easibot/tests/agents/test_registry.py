@@ -0,0 +1,148 @@
+"""Tests for the lazy specialist registry."""
+
+import asyncio
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import get_args
+from unittest.mock import Mock, patch
+
+import pytest
+
+from easibot.agents.registry import (
+    SpecialistRegistry,
+    SpecialistSpec,
+    create_default_registry,
+)
+from easibot.graph.state import SpecialistType
+
+
+class EchoSpecialist:
+    """Minimal specialist used to observe construction."""
+
+    instances = 0
+
+    def __init__(self, greeting: str = "hello"):
+        """Count constructions."""
+        EchoSpecialist.instances += 1
+        self.greeting = greeting
+
+    def work(self, state):
+        """Return the configured greeting."""
+        return {"active_specialist": self.greeting}
+
+
+ECHO_SPEC = SpecialistSpec(name="echo", factory=EchoSpecialist)
+
+
+class TestSpecialistRegistry:
+    """Test cases for SpecialistRegistry."""
+
+    def test_default_registry_covers_specialist_types(self):
+        """Test that every SpecialistType value is registered."""
+        registry = create_default_registry(plugins=False)
+
+        assert set(registry.names()) == set(get_args(SpecialistType))
+        assert set(registry.deliverable_names()) == {
+            "app_rationalization",
+            "bcdr",
+            "tech_strategy",
+            "cloud_modernization",
+        }
+
+    def test_registration_does_not_construct(self):
+        """Test that specialists are built on first use, not on registration."""
+        EchoSpecialist.instances = 0
+        registry = SpecialistRegistry((ECHO_SPEC,))
+        node = registry.node("echo")
+
+        assert not registry.is_loaded("echo")
+        assert EchoSpecialist.instances == 0
+
+        assert node.invoke({}) == {"active_specialist": "hello"}
+        assert node.invoke({}) == {"active_specialist": "hello"}
+        assert registry.is_loaded("echo")
+        assert EchoSpecialist.instances == 1
+
+    def test_async_node_prefers_coroutine_method(self):
+        """Test that ainvoke awaits awork and falls back to work in a thread."""
+
+        class AsyncEchoSpecialist(EchoSpecialist):
+            async def awork(self, state) -> dict:
+                """Return a greeting distinguishable from the sync path."""
+                return {"active_specialist": f"async {self.greeting}"}
+
+        registry = SpecialistRegistry(
+            (ECHO_SPEC, SpecialistSpec(name="async_echo", factory=AsyncEchoSpecialist))
+        )
+
+        assert asyncio.run(registry.node("echo").ainvoke({})) == {
+            "active_specialist": "hello"
+        }
+        assert asyncio.run(registry.node("async_echo").ainvoke({})) == {
+            "active_specialist": "async hello"
+        }
+
+    def test_concurrent_first_use_constructs_once(self):
+        """Test that racing first calls share one instance."""
+        factory = Mock(side_effect=object)
+        registry = SpecialistRegistry((SpecialistSpec(name="racy", factory=factory),))
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            instances = list(pool.map(lambda _: registry.get("racy"), range(32)))
+
+        factory.assert_called_once()
+        assert len({id(instance) for instance in instances}) == 1
+
+    def test_configure_adds_constructor_arguments(self):
+        """Test that configured kwargs reach the constructor."""
+        registry = SpecialistRegistry((ECHO_SPEC,))
+        registry.configure("echo", greeting="hi")
+
+        assert registry.get("echo").greeting == "hi"
+
+    def test_string_factories_are_imported_lazily(self):
+        """Test that "module:attribute" factories resolve on first use."""
+        registry = SpecialistRegistry(
+            (SpecialistSpec(name="ordered", factory="collections:OrderedDict"),)
+        )
+
+        assert type(registry.get("ordered")).__name__ == "OrderedDict"
+
+    @patch("easibot.agents.registry.entry_points")
+    def test_load_plugins(self, mock_entry_points):
+        """Test that entry-point plugins are registered."""
+        entry_point = Mock()
+        entry_point.load.return_value = ECHO_SPEC
+        mock_entry_points.return_value = [entry_point]
+
+        registry = create_default_registry()
+
+        mock_entry_points.assert_called_once_with(group="easibot.specialists")
+        assert "echo" in registry.names()
+
+    @patch("easibot.agents.registry.entry_points")
+    def test_load_plugins_rejects_non_specs(self, mock_entry_points):
+        """Test that malformed plugins fail loudly."""
+        entry_point = Mock()
+        entry_point.name = "broken"
+        entry_point.load.return_value = object()
+        mock_entry_points.return_value = [entry_point]
+
+        with pytest.raises(TypeError, match="broken"):
+            SpecialistRegistry().load_plugins()
+
+
+def test_building_the_graph_imports_no_specialist_module():
+    """Test that specialist modules load only when first routed to."""
+    code = (
+        "import sys, easibot.agent, easibot.agents as agents\n"
+        "loaded = sorted(m for m in sys.modules if m.startswith('easibot.agents.'))\n"
+        "print(loaded, agents.BCDRSpecialist.__module__)"
+    )
+
+    output = subprocess.run(  # noqa: S603 - fixed command, current interpreter
+        [sys.executable, "-c", code], capture_output=True, check=True, text=True
+    ).stdout
+
+    assert output.strip() == "['easibot.agents.registry'] easibot.agents.bcdr"
@@ -5,13 +5,15 @@ from unittest.mock import patch
 from langchain_core.messages import AIMessage, HumanMessage
 
 from easibot.agents.research import ResearchSpecialist
+from easibot.cache import SemanticCache
 from easibot.graph.state import ConsultantState
+from easibot.tools.embeddings import HashingEmbedder
 
 
 class TestResearchSpecialist:
     """Test cases for ResearchSpecialist."""
 
-    @patch("easibot.agents.research.ChatBedrock")
+    @patch("easibot.agents.research.get_chat_model")
     def test_research_specialist_creation(self, mock_bedrock):
         """Test that research specialist can be instantiated."""
         agent = ResearchSpecialist()
@@ -20,8 +22,8 @@ class TestResearchSpecialist:
         assert agent.system_prompt is not None
         mock_bedrock.assert_called_once()
 
-    @patch("easibot.agents.research.ChatBedrock")
-    def test_research_returns_findings(self, mock_bedrock, mock_bedrock_llm):
+    @patch("easibot.agents.research.get_chat_model")
+    def test_research_returns_findings(self, mock_bedrock, mock_bedrock_llm, run_agent):
         """Test that research specialist returns findings."""
         mock_bedrock.return_value = mock_bedrock_llm
         agent = ResearchSpecialist()
@@ -33,7 +35,7 @@ class TestResearchSpecialist:
             max_iterations=10,
         )
 
-        result = agent.research(state)
+        result = run_agent(agent.research, state)
 
         assert "messages" in result
         assert len(result["messages"]) == 1
@@ -47,8 +49,10 @@ class TestResearchSpecialist:
         assert "active_specialist" in result
         assert result["active_specialist"] == "research"
 
-    @patch("easibot.agents.research.ChatBedrock")
-    def test_research_with_offerings_filter(self, mock_bedrock, mock_bedrock_llm):
+    @patch("easibot.agents.research.get_chat_model")
+    def test_research_with_offerings_filter(
+        self, mock_bedrock, mock_bedrock_llm, run_agent
+    ):
         """Test research with offering-specific filtering."""
         mock_bedrock.return_value = mock_bedrock_llm
         agent = ResearchSpecialist()
@@ -60,13 +64,15 @@ class TestResearchSpecialist:
             max_iterations=10,
         )
 
-        result = agent.research(state)
+        result = run_agent(agent.research, state)
 
         assert "research_findings" in result
         assert len(result["research_findings"]) > 0
 
-    @patch("easibot.agents.research.ChatBedrock")
-    def test_research_suggests_specialist(self, mock_bedrock, mock_bedrock_llm):
+    @patch("easibot.agents.research.get_chat_model")
+    def test_research_suggests_specialist(
+        self, mock_bedrock, mock_bedrock_llm, run_agent
+    ):
         """Test that research suggests routing to specialist for deliverables."""
         mock_bedrock.return_value = mock_bedrock_llm
         agent = ResearchSpecialist()
@@ -78,13 +84,15 @@ class TestResearchSpecialist:
             max_iterations=10,
         )
 
-        result = agent.research(state)
+        result = run_agent(agent.research, state)
 
         # Should suggest supervisor for routing when deliverables are requested
         assert result["next_specialist"] == "supervisor"
 
-    @patch("easibot.agents.research.ChatBedrock")
-    def test_research_ends_for_simple_query(self, mock_bedrock, mock_bedrock_llm):
+    @patch("easibot.agents.research.get_chat_model")
+    def test_research_ends_for_simple_query(
+        self, mock_bedrock, mock_bedrock_llm, run_agent
+    ):
         """Test that research ends for simple informational queries."""
         mock_bedrock.return_value = mock_bedrock_llm
         agent = ResearchSpecialist()
@@ -96,13 +104,13 @@ class TestResearchSpecialist:
             max_iterations=10,
         )
 
-        result = agent.research(state)
+        result = run_agent(agent.research, state)
 
         # Simple query should end after research
         assert result["next_specialist"] == "END"
 
-    @patch("easibot.agents.research.ChatBedrock")
-    def test_research_with_no_message(self, mock_bedrock, mock_bedrock_llm):
+    @patch("easibot.agents.research.get_chat_model")
+    def test_research_with_no_message(self, mock_bedrock, mock_bedrock_llm, run_agent):
         """Test research behavior with no user message."""
         mock_bedrock.return_value = mock_bedrock_llm
         agent = ResearchSpecialist()
@@ -111,6 +119,40 @@ class TestResearchSpecialist:
             messages=[], offerings=[], iteration_count=0, max_iterations=10
         )
 
-        result = agent.research(state)
+        result = run_agent(agent.research, state)
 
         assert result == {}
+
+    @patch("easibot.agents.research.get_chat_model")
+    def test_semantic_cache_answers_paraphrase(
+        self, mock_bedrock, mock_bedrock_llm, run_agent
+    ):
+        """Test that a paraphrased question is answered without the LLM."""
+        mock_bedrock.return_value = mock_bedrock_llm
+        embedder = HashingEmbedder()
+        agent = ResearchSpecialist(
+            semantic_cache=SemanticCache(embedder, threshold=0.8)
+        )
+
+        def ask(question: str) -> dict:
+            return run_agent(
+                agent.research,
+                ConsultantState(
+                    messages=[HumanMessage(content=question)],
+                    offerings=["app-rationalization"],
+                ),
+            )
+
+        with patch.object(embedder, "embed", wraps=embedder.embed) as embed:
+            first = ask("What is application rationalization?")
+            second = ask("what is application rationalization exactly")
+
+        # One embedding per turn: the miss's vector is reused to store the answer
+        assert embed.call_count == 2
+        mock_bedrock_llm.invoke.assert_called_once()
+        assert second["messages"][0].content == first["messages"][0].content
+        assert second["research_findings"] == first["research_findings"]
+        assert "semantic_cache" not in first["messages"][0].response_metadata
+        flag = second["messages"][0].response_metadata["semantic_cache"]
+        assert flag["hit"] is True
+        assert flag["matched_query"] == "What is application rationalization?"
@@ -1,17 +1,20 @@
 """Tests for the Supervisor agent."""
 
-from unittest.mock import patch
+import logging
+from unittest.mock import Mock, patch
 
+import pytest
+from botocore.exceptions import ClientError
 from langchain_core.messages import HumanMessage
 
-from easibot.agents.supervisor import SupervisorAgent
-from easibot.graph.state import ConsultantState
+from easibot.agents.supervisor import RouteChoice, SupervisorAgent
+from easibot.graph.state import ConsultantState, RoutingDecision
 
 
 class TestSupervisorAgent:
     """Test cases for SupervisorAgent."""
 
-    @patch("easibot.agents.supervisor.ChatBedrock")
+    @patch("easibot.agents.supervisor.get_chat_model")
     def test_supervisor_creation(self, mock_bedrock):
         """Test that supervisor can be instantiated."""
         agent = SupervisorAgent()
@@ -20,8 +23,8 @@ class TestSupervisorAgent:
         assert agent.system_prompt is not None
         mock_bedrock.assert_called_once()
 
-    @patch("easibot.agents.supervisor.ChatBedrock")
-    def test_route_to_research(self, mock_bedrock, mock_bedrock_llm):
+    @patch("easibot.agents.supervisor.get_chat_model")
+    def test_route_to_research(self, mock_bedrock, mock_bedrock_llm, run_agent):
         """Test routing to research specialist."""
         mock_bedrock.return_value = mock_bedrock_llm
         agent = SupervisorAgent()
@@ -33,14 +36,16 @@ class TestSupervisorAgent:
             max_iterations=10,
         )
 
-        result = agent.route(state)
+        result = run_agent(agent.route, state)
 
         assert "next_specialist" in result
         assert result["next_specialist"] == "research"
         assert result["iteration_count"] == 1
 
-    @patch("easibot.agents.supervisor.ChatBedrock")
-    def test_route_to_app_rationalization(self, mock_bedrock, mock_bedrock_llm):
+    @patch("easibot.agents.supervisor.get_chat_model")
+    def test_route_to_app_rationalization(
+        self, mock_bedrock, mock_bedrock_llm, run_agent
+    ):
         """Test routing to app rationalization specialist."""
         mock_bedrock.return_value = mock_bedrock_llm
         agent = SupervisorAgent()
@@ -54,14 +59,14 @@ class TestSupervisorAgent:
             max_iterations=10,
         )
 
-        result = agent.route(state)
+        result = run_agent(agent.route, state)
 
         assert "next_specialist" in result
         assert result["next_specialist"] == "app_rationalization"
         assert result["iteration_count"] == 1
 
-    @patch("easibot.agents.supervisor.ChatBedrock")
-    def test_route_to_bcdr(self, mock_bedrock, mock_bedrock_llm):
+    @patch("easibot.agents.supervisor.get_chat_model")
+    def test_route_to_bcdr(self, mock_bedrock, mock_bedrock_llm, run_agent):
         """Test routing to BC/DR specialist."""
         mock_bedrock.return_value = mock_bedrock_llm
         agent = SupervisorAgent()
@@ -73,14 +78,14 @@ class TestSupervisorAgent:
             max_iterations=10,
         )
 
-        result = agent.route(state)
+        result = run_agent(agent.route, state)
 
         assert "next_specialist" in result
         assert result["next_specialist"] == "bcdr"
         assert result["iteration_count"] == 1
 
-    @patch("easibot.agents.supervisor.ChatBedrock")
-    def test_max_iterations_reached(self, mock_bedrock, mock_bedrock_llm):
+    @patch("easibot.agents.supervisor.get_chat_model")
+    def test_max_iterations_reached(self, mock_bedrock, mock_bedrock_llm, run_agent):
         """Test that supervisor stops routing at max iterations."""
         mock_bedrock.return_value = mock_bedrock_llm
         agent = SupervisorAgent()
@@ -92,13 +97,13 @@ class TestSupervisorAgent:
             max_iterations=10,
         )
 
-        result = agent.route(state)
+        result = run_agent(agent.route, state)
 
         assert result["next_specialist"] == "END"
         assert "messages" in result
 
-    @patch("easibot.agents.supervisor.ChatBedrock")
-    def test_no_user_message(self, mock_bedrock, mock_bedrock_llm):
+    @patch("easibot.agents.supervisor.get_chat_model")
+    def test_no_user_message(self, mock_bedrock, mock_bedrock_llm, run_agent):
         """Test handling when no user message is present."""
         mock_bedrock.return_value = mock_bedrock_llm
         agent = SupervisorAgent()
@@ -107,6 +112,256 @@ class TestSupervisorAgent:
             messages=[], offerings=[], iteration_count=0, max_iterations=10
         )
 
-        result = agent.route(state)
+        result = run_agent(agent.route, state)
 
         assert result["next_specialist"] == "END"
+
+    @patch("easibot.agents.supervisor.get_chat_model")
+    def test_confident_route_skips_llm(self, mock_bedrock, mock_bedrock_llm, run_agent):
+        """Test that confident keyword routes never call the LLM."""
+        mock_bedrock.return_value = mock_bedrock_llm
+        agent = SupervisorAgent()
+
+        state = ConsultantState(
+            messages=[HumanMessage(content="I need a disaster recovery plan")],
+            offerings=["bcdr"],
+            iteration_count=0,
+            max_iterations=10,
+        )
+
+        result = run_agent(agent.route, state)
+
+        mock_bedrock_llm.invoke.assert_not_called()
+        assert result["routing_decision"].method == "keyword"
+        assert result["routing_decision"].confidence == 1.0
+
+    @patch("easibot.agents.supervisor.get_chat_model")
+    def test_ambiguous_route_uses_llm_decision(
+        self, mock_bedrock, mock_bedrock_llm, run_agent
+    ):
+        """Test that ambiguous requests are routed by the LLM's structured answer."""
+        router_llm = mock_bedrock_llm.with_structured_output.return_value
+        router_llm.invoke.return_value = RouteChoice(
+            next_specialist="bcdr", reasoning="DR focus"
+        )
+        mock_bedrock.return_value = mock_bedrock_llm
+        agent = SupervisorAgent()
+
+        state = ConsultantState(
+            messages=[HumanMessage(content="Some query")],
+            offerings=[],
+            iteration_count=0,
+            max_iterations=10,
+        )
+
+        result = run_agent(agent.route, state)
+
+        router_llm.invoke.assert_called_once()
+        assert result["next_specialist"] == "bcdr"
+        assert result["routing_decision"].method == "llm"
+        assert result["routing_decision"].reasoning == "DR focus"
+
+    @patch("easibot.agents.supervisor.get_chat_model")
+    def test_llm_route_can_fan_out(self, mock_bedrock, mock_bedrock_llm, run_agent):
+        """Test that the LLM tier dispatches several specialists at once."""
+        router_llm = mock_bedrock_llm.with_structured_output.return_value
+        router_llm.invoke.return_value = RouteChoice(
+            next_specialist="app_rationalization",
+            reasoning="Rationalization plus a DR plan",
+            parallel_specialists=["app_rationalization", "bcdr", "research"],
+        )
+        mock_bedrock.return_value = mock_bedrock_llm
+        agent = SupervisorAgent()
+        state = ConsultantState(
+            messages=[
+                HumanMessage(
+                    content="rationalize our portfolio and give me a DR plan "
+                    "for what we keep"
+                )
+            ],
+            offerings=[],
+            iteration_count=0,
+            max_iterations=10,
+        )
+
+        result = run_agent(agent.route, state)
+
+        router_llm.invoke.assert_called_once()
+        assert result["routing_decision"].method == "llm"
+        assert result["next_specialist"] == "app_rationalization"
+        assert result["next_specialists"] == ["app_rationalization", "bcdr"]
+
+    @patch("easibot.agents.supervisor.get_chat_model")
+    def test_llm_route_is_cached(self, mock_bedrock, mock_bedrock_llm, run_agent):
+        """Test that near-identical ambiguous requests reuse the cached route."""
+        router_llm = mock_bedrock_llm.with_structured_output.return_value
+        router_llm.invoke.return_value = RouteChoice(
+            next_specialist="tech_strategy", reasoning="Planning"
+        )
+        mock_bedrock.return_value = mock_bedrock_llm
+        agent = SupervisorAgent()
+
+        first = run_agent(
+            agent.route,
+            ConsultantState(
+                messages=[HumanMessage(content="Some query")],
+                offerings=[],
+                iteration_count=0,
+                max_iterations=10,
+            ),
+        )
+        second = run_agent(
+            agent.route,
+            ConsultantState(
+                messages=[HumanMessage(content="  some   QUERY ")],
+                offerings=[],
+                iteration_count=0,
+                max_iterations=10,
+            ),
+        )
+
+        router_llm.invoke.assert_called_once()
+        assert first["routing_decision"].method == "llm"
+        assert second["routing_decision"].method == "llm_cache"
+        assert second["next_specialist"] == "tech_strategy"
+
+    @patch("easibot.agents.supervisor.get_chat_model")
+    def test_unparseable_llm_answer_falls_back(
+        self, mock_bedrock, mock_bedrock_llm, run_agent
+    ):
+        """Test that an invalid LLM answer falls back to the keyword decision."""
+        mock_bedrock.return_value = mock_bedrock_llm
+        agent = SupervisorAgent()
+
+        state = ConsultantState(
+            messages=[HumanMessage(content="Some query")],
+            offerings=[],
+            iteration_count=0,
+            max_iterations=10,
+        )
+
+        result = run_agent(agent.route, state)
+
+        assert result["next_specialist"] == "research"
+        assert result["routing_decision"].method == "keyword_fallback"
+
+    @patch("easibot.agents.supervisor.get_chat_model")
+    def test_semantic_router_handles_ambiguous_request(
+        self, mock_bedrock, mock_bedrock_llm, run_agent
+    ):
+        """Test that a confident semantic route avoids the LLM call."""
+        mock_bedrock.return_value = mock_bedrock_llm
+        agent = SupervisorAgent()
+        agent.semantic_router = Mock()
+        agent.semantic_router.classify.return_value = RoutingDecision(
+            next_specialist="cloud_modernization", confidence=0.9, method="semantic"
+        )
+
+        state = ConsultantState(
+            messages=[HumanMessage(content="Lift and shift before the lease ends")],
+            offerings=[],
+            iteration_count=0,
+            max_iterations=10,
+        )
+
+        result = run_agent(agent.route, state)
+
+        mock_bedrock_llm.with_structured_output.return_value.invoke.assert_not_called()
+        assert result["next_specialist"] == "cloud_modernization"
+        assert result["routing_decision"].method == "semantic"
+
+    @patch("easibot.agents.supervisor.get_chat_model")
+    def test_plugin_specialists_are_routable(
+        self, mock_bedrock, mock_bedrock_llm, run_agent
+    ):
+        """Test that plugin specialists are offered to and accepted from the LLM."""
+        mock_bedrock.return_value = mock_bedrock_llm
+        agent = SupervisorAgent(extra_specialists={"data_strategy": "Data platforms"})
+
+        choice = agent.route_choice_model(
+            next_specialist="data_strategy", reasoning="Data platform request"
+        )
+        agent.router_llm.invoke.return_value = choice
+
+        state = ConsultantState(
+            messages=[HumanMessage(content="Some query")],
+            offerings=[],
+            iteration_count=0,
+            max_iterations=10,
+        )
+
+        result = run_agent(agent.route, state)
+
+        assert "- data_strategy: Data platforms" in agent.system_prompt
+        assert isinstance(choice, RouteChoice)
+        assert result["next_specialist"] == "data_strategy"
+
+    @patch("easibot.agents.supervisor.get_chat_model")
+    def test_invalid_fast_answer_escalates_to_standard_tier(
+        self, mock_bedrock, mock_bedrock_llm, run_agent
+    ):
+        """Test that an unparseable fast-tier answer is retried on the next tier."""
+        router_llm = mock_bedrock_llm.with_structured_output.return_value
+        router_llm.invoke.side_effect = [
+            None,
+            RouteChoice(next_specialist="bcdr", reasoning="DR focus"),
+        ]
+        mock_bedrock.return_value = mock_bedrock_llm
+        agent = SupervisorAgent()
+
+        state = ConsultantState(
+            messages=[HumanMessage(content="Some query")],
+            offerings=[],
+            iteration_count=0,
+            max_iterations=10,
+        )
+
+        result = run_agent(agent.route, state)
+
+        assert router_llm.invoke.call_count == 2
+        assert result["next_specialist"] == "bcdr"
+        assert result["routing_decision"].model_tier == "standard"
+
+    @patch("easibot.agents.supervisor.get_chat_model")
+    def test_bedrock_error_falls_back_to_keywords_and_logs(
+        self, mock_bedrock, mock_bedrock_llm, run_agent, caplog
+    ):
+        """Test that a failed routing call is logged, not silently swallowed."""
+        router_llm = mock_bedrock_llm.with_structured_output.return_value
+        router_llm.invoke.side_effect = ClientError(
+            {"Error": {"Code": "AccessDeniedException"}}, "InvokeModel"
+        )
+        mock_bedrock.return_value = mock_bedrock_llm
+        agent = SupervisorAgent()
+        state = ConsultantState(
+            messages=[HumanMessage(content="Some query")],
+            offerings=[],
+            iteration_count=0,
+            max_iterations=10,
+        )
+
+        with caplog.at_level(logging.WARNING, logger="easibot.agents.supervisor"):
+            result = run_agent(agent.route, state)
+
+        assert result["routing_decision"].method == "keyword_fallback"
+        assert "LLM routing failed" in caplog.text
+        assert "AccessDeniedException" in caplog.text
+
+    @patch("easibot.agents.supervisor.get_chat_model")
+    def test_unexpected_routing_error_propagates(
+        self, mock_bedrock, mock_bedrock_llm, run_agent
+    ):
+        """Test that programming errors are not hidden behind the fallback."""
+        router_llm = mock_bedrock_llm.with_structured_output.return_value
+        router_llm.invoke.side_effect = TypeError("bad prompt")
+        mock_bedrock.return_value = mock_bedrock_llm
+        agent = SupervisorAgent()
+        state = ConsultantState(
+            messages=[HumanMessage(content="Some query")],
+            offerings=[],
+            iteration_count=0,
+            max_iterations=10,
+        )
+
+        with pytest.raises(TypeError, match="bad prompt"):
+            run_agent(agent.route, state)
@@ -0,0 +1,80 @@
+"""Tests for the Technology strategy specialist."""
+
+from unittest.mock import patch
+
+from langchain_core.messages import AIMessage, HumanMessage
+
+from easibot.agents.tech_strategy import TechStrategySpecialist
+from easibot.graph.state import ConsultantState, Deliverable, ResearchFinding
+
+
+class TestTechStrategySpecialist:
+    """Test cases for TechStrategySpecialist."""
+
+    @patch("easibot.agents.tech_strategy.get_chat_model")
+    def test_specialist_creation(self, mock_bedrock):
+        """Test that technology strategy specialist can be instantiated."""
+        agent = TechStrategySpecialist()
+        assert agent is not None
+        assert agent.llm is not None
+        assert agent.system_prompt is not None
+        mock_bedrock.assert_called_once()
+
+    @patch("easibot.agents.tech_strategy.get_chat_model")
+    def test_work_creates_deliverable(self, mock_bedrock, mock_bedrock_llm, run_agent):
+        """Test that specialist creates technology strategy deliverables."""
+        mock_bedrock.return_value = mock_bedrock_llm
+        agent = TechStrategySpecialist()
+
+        state = ConsultantState(
+            messages=[HumanMessage(content="Draft a three-year technology roadmap")],
+            offerings=["tech-strategy"],
+            iteration_count=1,
+            max_iterations=10,
+        )
+
+        result = run_agent(agent.work, state)
+
+        assert "messages" in result
+        assert len(result["messages"]) == 1
+        assert isinstance(result["messages"][0], AIMessage)
+        assert result["messages"][0].name == "tech_strategy_specialist"
+
+        assert "deliverables" in result
+        assert len(result["deliverables"]) == 1
+        assert isinstance(result["deliverables"][0], Deliverable)
+        assert result["deliverables"][0].offering == "tech-strategy"
+        assert result["deliverables"][0].specialist == "tech_strategy"
+
+        assert result["active_specialist"] == "tech_strategy"
+        assert result["next_specialist"] == "END"
+
+    @patch("easibot.agents.tech_strategy.get_chat_model")
+    def test_work_with_research_findings(
+        self, mock_bedrock, mock_bedrock_llm, run_agent
+    ):
+        """Test specialist includes research findings in the prompt."""
+        mock_bedrock.return_value = mock_bedrock_llm
+        agent = TechStrategySpecialist()
+
+        state = ConsultantState(
+            messages=[HumanMessage(content="Create an architecture assessment")],
+            offerings=["tech-strategy"],
+            research_findings=[
+                ResearchFinding(
+                    source="Offering Playbook",
+                    content="Start from business goals and current-state discovery.",
+                    relevance_score=0.88,
+                    metadata={"offering": "tech-strategy"},
+                )
+            ],
+            iteration_count=2,
+            max_iterations=10,
+        )
+
+        result = run_agent(agent.work, state)
+
+        prompt = mock_bedrock_llm.invoke.call_args[0][0][-1].content
+        assert "Offering Playbook" in prompt
+        assert result["deliverables"][0].type == "roadmap"
+        assert result["deliverables"][0].title == "Technology Strategy Roadmap"
@@ -0,0 +1 @@
+"""Tests for caching layers."""
@@ -0,0 +1,45 @@
+"""Tests for the LRU + TTL cache."""
+
+from unittest.mock import patch
+
+from easibot.cache import LRUCache
+
+
+class TestLRUCache:
+    """Test cases for LRUCache."""
+
+    def test_get_and_set(self):
+        """Test basic storage and hit/miss counting."""
+        cache = LRUCache(maxsize=2)
+        cache.set("a", 1)
+
+        assert cache.get("a") == 1
+        assert cache.get("missing") is None
+        assert cache.hits == 1
+        assert cache.misses == 1
+
+    def test_evicts_least_recently_used(self):
+        """Test that the least recently used entry is evicted first."""
+        cache = LRUCache(maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+
+    @patch("easibot.cache.lru.time.monotonic")
+    def test_entries_expire_after_ttl(self, mock_monotonic):
+        """Test that entries are dropped once their TTL has elapsed."""
+        mock_monotonic.return_value = 100.0
+        cache = LRUCache(maxsize=2, ttl_seconds=10)
+        cache.set("a", 1)
+
+        mock_monotonic.return_value = 105.0
+        assert cache.get("a") == 1
+
+        mock_monotonic.return_value = 111.0
+        assert cache.get("a") is None
+        assert len(cache) == 0
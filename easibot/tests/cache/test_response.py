@@ -0,0 +1,104 @@
+"""Tests for the exact-match LLM response cache."""
+
+from unittest.mock import patch
+
+import pytest
+from langchain_core.language_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
+from langchain_core.outputs import ChatGeneration
+
+from easibot.cache import CacheMissError, ResponseCache, SQLiteResponseStore
+
+ANSWER = [ChatGeneration(message=AIMessage(content="Rationalization trims cost."))]
+
+
+class TestResponseCache:
+    """Test cases for ResponseCache."""
+
+    def test_repeated_call_is_served_from_memory(self):
+        """Test that an identical second call never reaches the model."""
+        cache = ResponseCache()
+        # The fake model can only answer once; a second model call would fail
+        llm = GenericFakeChatModel(
+            messages=iter([AIMessage(content="Only answer")]), cache=cache
+        )
+        messages = [
+            SystemMessage(content="You are a research specialist."),
+            HumanMessage(content="What is application rationalization?"),
+        ]
+
+        first = llm.invoke(messages)
+        second = llm.invoke(messages)
+
+        assert first.content == second.content == "Only answer"
+        assert cache.stats() == {
+            "hits": 1,
+            "misses": 1,
+            "memory_entries": 1,
+            "disk_entries": 0,
+        }
+
+    def test_key_covers_system_prompt(self):
+        """Test that the same question under another system prompt misses."""
+        cache = ResponseCache()
+        cache.update("prompt-a", "model", ANSWER)
+
+        assert cache.lookup("prompt-a", "model") == ANSWER
+        assert cache.lookup("prompt-b", "model") is None
+        assert cache.lookup("prompt-a", "other-model") is None
+
+    def test_disk_tier_survives_restart(self, tmp_path):
+        """Test that a new cache on the same file serves earlier responses."""
+        path = tmp_path / "responses.sqlite"
+        ResponseCache(path=path).update("prompt", "model", ANSWER)
+
+        restarted = ResponseCache(path=path)
+
+        assert restarted.lookup("prompt", "model") == ANSWER
+        assert restarted.stats()["memory_entries"] == 1
+
+    def test_replay_mode_is_read_only_and_strict(self, tmp_path):
+        """Test that replay serves recordings, records nothing and fails misses."""
+        path = tmp_path / "responses.sqlite"
+        ResponseCache(path=path).update("recorded", "model", ANSWER)
+
+        replay = ResponseCache(path=path, replay=True)
+        replay.update("new", "model", ANSWER)
+
+        assert replay.lookup("recorded", "model") == ANSWER
+        with pytest.raises(CacheMissError):
+            replay.lookup("new", "model")
+
+
+class TestSQLiteResponseStore:
+    """Test cases for the disk tier."""
+
+    def test_evicts_least_recently_read(self, tmp_path):
+        """Test that the store keeps at most max_entries rows."""
+        store = SQLiteResponseStore(tmp_path / "store.sqlite", max_entries=2)
+        with patch("easibot.cache.response.time.time") as mock_time:
+            mock_time.return_value = 1.0
+            store.set("a", "1")
+            mock_time.return_value = 2.0
+            store.set("b", "2")
+            mock_time.return_value = 3.0
+            store.get("a")
+            mock_time.return_value = 4.0
+            store.set("c", "3")
+
+        assert len(store) == 2
+        assert store.get("a") == "1"
+        assert store.get("b") is None
+
+    def test_entries_expire_after_ttl(self, tmp_path):
+        """Test that expired rows are not served and are deleted."""
+        store = SQLiteResponseStore(tmp_path / "store.sqlite", ttl_seconds=10)
+        with patch("easibot.cache.response.time.time") as mock_time:
+            mock_time.return_value = 100.0
+            store.set("a", "1")
+            mock_time.return_value = 105.0
+            assert store.get("a") == "1"
+            mock_time.return_value = 111.0
+            assert store.get("a") is None
+
+        assert len(store) == 0
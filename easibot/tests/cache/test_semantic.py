@@ -0,0 +1,75 @@
+"""Tests for the semantic response cache."""
+
+from unittest.mock import patch
+
+from easibot.cache import SemanticCache
+from easibot.tools.embeddings import HashingEmbedder
+
+SCOPE = ("app-rationalization",)
+
+
+class TestSemanticCache:
+    """Test cases for SemanticCache."""
+
+    def test_paraphrase_hits_within_scope(self):
+        """Test that a close paraphrase hits and an unrelated query misses."""
+        cache = SemanticCache(HashingEmbedder(), threshold=0.8)
+        cache.store("What is application rationalization?", SCOPE, "answer")
+
+        value, similarity, matched = cache.lookup(
+            "what is application rationalization exactly", SCOPE
+        )
+
+        assert value == "answer"
+        assert 0.8 <= similarity <= 1.0
+        assert matched == "What is application rationalization?"
+        assert cache.lookup("How do we plan disaster recovery?", SCOPE) is None
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_other_scopes_never_match(self):
+        """Test that answers are not shared across offerings."""
+        cache = SemanticCache(HashingEmbedder(), threshold=0.8)
+        cache.store("What is application rationalization?", SCOPE, "answer")
+
+        assert cache.lookup("What is application rationalization?", ("bcdr",)) is None
+
+    def test_evicts_least_recently_used_when_full(self):
+        """Test that the cache stays bounded and keeps recently used answers."""
+        cache = SemanticCache(HashingEmbedder(), threshold=0.99, maxsize=2)
+        with patch("easibot.cache.semantic.time.monotonic") as mock_monotonic:
+            mock_monotonic.return_value = 1.0
+            cache.store("first question", SCOPE, 1)
+            mock_monotonic.return_value = 2.0
+            cache.store("second question", SCOPE, 2)
+            mock_monotonic.return_value = 3.0
+            cache.lookup("first question", SCOPE)
+            mock_monotonic.return_value = 4.0
+            cache.store("third question", SCOPE, 3)
+
+            assert len(cache) == 2
+            assert cache.lookup("first question", SCOPE)[0] == 1
+            assert cache.lookup("second question", SCOPE) is None
+
+    def test_scopes_of_evicted_entries_are_forgotten(self):
+        """Test that the scope index stays bounded by the cache size."""
+        cache = SemanticCache(HashingEmbedder(), threshold=0.99, maxsize=2)
+        with patch("easibot.cache.semantic.time.monotonic") as mock_monotonic:
+            for step in range(10):
+                mock_monotonic.return_value = float(step)
+                cache.store("first question", (f"offering-{step}",), step)
+
+            assert len(cache._scope_index) == 2  # noqa: SLF001
+            assert cache.lookup("first question", ("offering-9",))[0] == 9
+            assert cache.lookup("first question", ("offering-8",))[0] == 8
+            assert cache.lookup("first question", ("offering-0",)) is None
+
+    def test_entries_expire_after_ttl(self):
+        """Test that expired answers are not served."""
+        cache = SemanticCache(HashingEmbedder(), ttl_seconds=10)
+        with patch("easibot.cache.semantic.time.monotonic") as mock_monotonic:
+            mock_monotonic.return_value = 100.0
+            cache.store("first question", SCOPE, 1)
+            mock_monotonic.return_value = 111.0
+
+            assert cache.lookup("first question", SCOPE) is None
+            assert len(cache) == 0
@@ -0,0 +1,126 @@
+"""Tests for single-flight call coalescing."""
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from easibot.cache import SingleFlight
+
+
+def wait_for_followers(flight: SingleFlight, count: int) -> None:
+    """Block until count callers are waiting on the in-flight call."""
+    deadline = time.monotonic() + 5
+    while flight.stats()["followers"] < count and time.monotonic() < deadline:
+        time.sleep(0.001)
+
+
+class TestSingleFlight:
+    """Test cases for SingleFlight."""
+
+    def test_concurrent_callers_share_one_call(self):
+        """Test that identical concurrent calls run once and all get the result."""
+        flight = SingleFlight()
+        calls = []
+
+        def work() -> dict:
+            calls.append(1)
+            wait_for_followers(flight, 3)
+            return {"answer": [1, 2]}
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(lambda _: flight.do("key", work), range(4)))
+
+        assert len(calls) == 1
+        assert results == [{"answer": [1, 2]}] * 4
+        assert len({id(result) for result in results}) == 4  # followers get copies
+        assert flight.stats() == {"leaders": 1, "followers": 3, "in_flight": 0}
+
+    def test_error_is_shared_and_key_is_released(self):
+        """Test that followers see the leader's error and the next call reruns."""
+        flight = SingleFlight()
+
+        def fail() -> None:
+            wait_for_followers(flight, 1)
+            message = "throttled"
+            raise RuntimeError(message)
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            futures = [pool.submit(flight.do, "key", fail) for _ in range(2)]
+        for future in futures:
+            with pytest.raises(RuntimeError, match="throttled"):
+                future.result()
+
+        assert flight.do("key", lambda: "fresh") == "fresh"
+
+    def test_different_keys_run_separately(self):
+        """Test that only identical keys are coalesced."""
+        flight = SingleFlight()
+
+        assert flight.do("a", lambda: 1) == 1
+        assert flight.do("b", lambda: 2) == 2
+        assert flight.stats()["leaders"] == 2
+
+    def test_async_callers_share_one_call(self):
+        """Test coalescing of concurrent coroutines."""
+        flight = SingleFlight()
+        calls = []
+
+        async def work() -> str:
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return "answer"
+
+        async def run_all() -> list:
+            return await asyncio.gather(*(flight.ado("key", work) for _ in range(5)))
+
+        assert asyncio.run(run_all()) == ["answer"] * 5
+        assert len(calls) == 1
+
+    def test_cancelled_leader_does_not_cancel_followers(self):
+        """Test that the shared call keeps running for followers."""
+        flight = SingleFlight()
+        calls = []
+
+        async def work() -> str:
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return "answer"
+
+        async def run() -> tuple:
+            leader = asyncio.create_task(flight.ado("key", work))
+            await asyncio.sleep(0)
+            followers = [asyncio.create_task(flight.ado("key", work)) for _ in range(2)]
+            await asyncio.sleep(0.01)
+            leader.cancel()
+            return await asyncio.gather(leader, *followers, return_exceptions=True)
+
+        leader, *followers = asyncio.run(run())
+
+        assert isinstance(leader, asyncio.CancelledError)
+        assert followers == ["answer"] * 2
+        assert len(calls) == 1
+        assert flight.stats()["in_flight"] == 0
+
+    def test_call_is_cancelled_when_every_caller_is(self):
+        """Test that an abandoned call stops and the next caller starts afresh."""
+        flight = SingleFlight()
+        finished = []
+
+        async def work() -> str:
+            await asyncio.sleep(1)
+            finished.append(1)
+            return "stale"
+
+        async def run() -> str:
+            callers = [asyncio.create_task(flight.ado("key", work)) for _ in range(2)]
+            await asyncio.sleep(0.01)
+            for caller in callers:
+                caller.cancel()
+            await asyncio.gather(*callers, return_exceptions=True)
+            return await flight.ado("key", lambda: asyncio.sleep(0, "fresh"))
+
+        assert asyncio.run(run()) == "fresh"
+        assert not finished
+        assert flight.stats()["in_flight"] == 0
@@ -0,0 +1,68 @@
+"""Tests for the shared Bedrock client factory."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from easibot.config import (
+    get_bedrock_runtime_client,
+    get_chat_model,
+    get_response_cache,
+    settings,
+)
+from easibot.config.clients import reset_clients
+
+
+@pytest.fixture(autouse=True)
+def fresh_clients():
+    """Isolate the process-wide client cache between tests."""
+    reset_clients()
+    yield
+    reset_clients()
+
+
+class TestBedrockClients:
+    """Test cases for the pooled bedrock-runtime client."""
+
+    def test_client_is_shared(self):
+        """Test that repeated and concurrent lookups return one client."""
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            clients = list(pool.map(lambda _: get_bedrock_runtime_client(), range(16)))
+
+        assert len({id(client) for client in clients}) == 1
+
+    def test_clients_are_per_region(self):
+        """Test that each region gets its own client."""
+        assert get_bedrock_runtime_client("us-east-1") is not (
+            get_bedrock_runtime_client("us-west-2")
+        )
+
+    def test_client_uses_pool_and_retry_settings(self):
+        """Test that pool size, timeouts and retry mode come from settings."""
+        config = get_bedrock_runtime_client().meta.config
+
+        assert config.max_pool_connections == settings.bedrock_max_pool_connections
+        assert config.connect_timeout == settings.bedrock_connect_timeout
+        assert config.read_timeout == settings.bedrock_read_timeout
+        assert config.retries["mode"] == settings.bedrock_retry_mode
+        assert config.retries["total_max_attempts"] == settings.bedrock_max_attempts
+        assert config.tcp_keepalive == settings.bedrock_tcp_keepalive
+
+    def test_chat_models_share_the_client(self):
+        """Test that every chat model is backed by the same runtime client."""
+        first = get_chat_model()
+        second = get_chat_model(max_tokens=64)
+
+        assert first.client is second.client
+        assert first.model_id == settings.bedrock_model_id
+        assert second.max_tokens == 64
+
+    def test_response_cache_is_per_agent_opt_in(self, monkeypatch):
+        """Test that only agents listed in settings get the shared cache."""
+        monkeypatch.setattr(settings, "response_cache_agents", ["research"])
+
+        research = get_chat_model(agent="research")
+        bcdr = get_chat_model(agent="bcdr")
+
+        assert research.cache is get_response_cache()
+        assert bcdr.cache is None
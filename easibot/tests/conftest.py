@@ -1,11 +1,30 @@
 """Pytest configuration and shared fixtures for EASI Bot tests."""
 
-from unittest.mock import Mock
+import asyncio
+import hashlib
+import io
+from pathlib import Path
+from typing import Any
+from unittest.mock import AsyncMock, Mock
 
+import boto3
 import pytest
+from botocore.exceptions import ClientError
 from langchain_core.messages import AIMessage, HumanMessage
 
 from easibot.graph.state import ConsultantState, ResearchFinding
+from easibot.retrieval import Chunk
+
+
+def mirror_async(mock_llm: Mock) -> Mock:
+    """Make ``ainvoke`` on a mock LLM and its structured output follow ``invoke``.
+
+    Tests configure and assert on ``invoke`` only, so the same test covers the
+    sync and async agent paths.
+    """
+    for runnable in (mock_llm, mock_llm.with_structured_output.return_value):
+        runnable.ainvoke = AsyncMock(side_effect=runnable.invoke)
+    return mock_llm
 
 
 @pytest.fixture
@@ -16,7 +35,32 @@ def mock_bedrock_llm():
         content="This is a test response from the LLM.", name="test_agent"
     )
     mock_llm.invoke = Mock(return_value=mock_response)
-    return mock_llm
+    return mirror_async(mock_llm)
+
+
+@pytest.fixture(params=["sync", "async"])
+def run_agent(request):
+    """Call an agent method, or its ``a``-prefixed coroutine counterpart."""
+
+    def run(method, state) -> dict:
+        if request.param == "sync":
+            return method(state)
+        async_method = getattr(method.__self__, f"a{method.__name__}")
+        return asyncio.run(async_method(state))
+
+    return run
+
+
+@pytest.fixture(params=["sync", "async"])
+def run_graph(request):
+    """Run a compiled graph with ``invoke`` or ``ainvoke``."""
+
+    def run(graph, input_state, config) -> dict:
+        if request.param == "sync":
+            return graph.invoke(input_state, config)
+        return asyncio.run(graph.ainvoke(input_state, config))
+
+    return run
 
 
 @pytest.fixture
@@ -60,3 +104,112 @@ def sample_bcdr_state():
         iteration_count=0,
         max_iterations=10,
     )
+
+
+@pytest.fixture
+def kb_chunks():
+    """Small knowledge-base corpus spanning three offerings."""
+    corpus = [
+        ("DR Playbook", "bcdr", "Recovery time objective RTO and recovery point RPO."),
+        ("DR Playbook", "bcdr", "Test failover to the secondary region every quarter."),
+        (
+            "Rationalization Guide",
+            "app-rationalization",
+            "Retire redundant applications.",
+        ),
+        (
+            "Rationalization Guide",
+            "app-rationalization",
+            "Score apps by business value.",
+        ),
+        (
+            "Cloud Guide",
+            "cloud-modernization",
+            "Rehost, replatform or refactor workloads.",
+        ),
+        ("Cloud Guide", "cloud-modernization", "Landing zones set up cloud accounts."),
+    ]
+    return [
+        Chunk(
+            id=f"c{i}", source=source, content=content, metadata={"offering": offering}
+        )
+        for i, (source, offering, content) in enumerate(corpus)
+    ]
+
+
+class FakeS3:
+    """In-memory stand-in for the S3 client calls the RAG index uses.
+
+    Objects are keyed by (bucket, key); ``requests`` records each call's
+    operation and key so tests can assert what was transferred.
+    """
+
+    def __init__(self):
+        """Start with an empty store."""
+        self.objects: dict[tuple[str, str], bytes] = {}
+        self.requests: list[tuple[str, str]] = []
+
+    @staticmethod
+    def etag(body: bytes) -> str:
+        """Return the quoted MD5 ETag S3 reports for a single-part object."""
+        return f'"{hashlib.md5(body).hexdigest()}"'  # noqa: S324 - S3 ETag format
+
+    def _get(self, operation: str, bucket: str, key: str) -> bytes:
+        """Record a request and return the object, or raise S3's 404."""
+        self.requests.append((operation, key))
+        if (bucket, key) not in self.objects:
+            raise ClientError({"Error": {"Code": "404"}}, operation)
+        return self.objects[bucket, key]
+
+    def get_object(self, **request: Any) -> dict[str, Any]:
+        """Return an object, or raise 304 if it still has the IfNoneMatch ETag."""
+        body = self._get("GetObject", request["Bucket"], request["Key"])
+        if request.get("IfNoneMatch") == self.etag(body):
+            raise ClientError({"Error": {"Code": "304"}}, "GetObject")
+        return {"Body": io.BytesIO(body), "ETag": self.etag(body)}
+
+    def head_object(self, **request: Any) -> dict[str, Any]:
+        """Return an object's ETag."""
+        body = self._get("HeadObject", request["Bucket"], request["Key"])
+        return {"ETag": self.etag(body)}
+
+    def put_object(self, **request: Any) -> dict[str, Any]:
+        """Store an object, honouring IfMatch and IfNoneMatch="*"."""
+        self.requests.append(("PutObject", request["Key"]))
+        self._check_condition(request, "PutObject")
+        body = request["Body"]
+        self.objects[request["Bucket"], request["Key"]] = body
+        return {"ETag": self.etag(body)}
+
+    def delete_object(self, **request: Any) -> None:
+        """Delete an object, honouring IfMatch."""
+        self.requests.append(("DeleteObject", request["Key"]))
+        self._check_condition(request, "DeleteObject")
+        self.objects.pop((request["Bucket"], request["Key"]), None)
+
+    def _check_condition(self, request: dict[str, Any], operation: str) -> None:
+        """Raise S3's error for a conditional write whose condition fails."""
+        current = self.objects.get((request["Bucket"], request["Key"]))
+        if "IfMatch" in request and current is None:
+            raise ClientError({"Error": {"Code": "NoSuchKey"}}, operation)
+        if ("IfMatch" in request and request["IfMatch"] != self.etag(current)) or (
+            request.get("IfNoneMatch") == "*" and current is not None
+        ):
+            raise ClientError({"Error": {"Code": "PreconditionFailed"}}, operation)
+
+    def download_file(self, bucket: str, key: str, filename: str) -> None:
+        """Write an object to a local file."""
+        Path(filename).write_bytes(self._get("Download", bucket, key))
+
+    def upload_file(self, filename: str, bucket: str, key: str) -> None:
+        """Store a local file as an object."""
+        self.requests.append(("Upload", key))
+        self.objects[bucket, key] = Path(filename).read_bytes()
+
+
+@pytest.fixture
+def fake_s3(monkeypatch):
+    """Route every boto3 S3 client to one in-memory FakeS3."""
+    s3 = FakeS3()
+    monkeypatch.setattr(boto3, "client", lambda *_args, **_kwargs: s3)
+    return s3
@@ -0,0 +1 @@
+"""Tests for request handlers."""
@@ -0,0 +1,119 @@
+"""Tests for the JSONL batch runner."""
+
+import asyncio
+import json
+from unittest.mock import patch
+
+import pytest
+from langchain_core.messages import AIMessage
+
+from easibot.handlers import batch
+
+
+def write_jsonl(path, rows: list[dict]) -> None:
+    """Write rows as JSON lines."""
+    path.write_text("".join(json.dumps(row) + "\n" for row in rows))
+
+
+def read_jsonl(path) -> list[dict]:
+    """Read JSON lines into dicts."""
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+@pytest.fixture
+def fake_graph():
+    """Graph stand-in that echoes the request and tracks peak concurrency."""
+    in_flight = 0
+    stats = {"peak": 0, "calls": []}
+
+    async def ainvoke(state: dict, config: dict) -> dict:
+        nonlocal in_flight
+        message = state["messages"][0]["content"]
+        stats["calls"].append(message)
+        in_flight += 1
+        stats["peak"] = max(stats["peak"], in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        if message == "fail":
+            error = "Bedrock unavailable"
+            raise RuntimeError(error)
+        return {"messages": [AIMessage(content=f"Re: {message}")]}
+
+    with patch.object(batch.graph, "ainvoke", side_effect=ainvoke):
+        yield stats
+
+
+class TestBatch:
+    """Test cases for run_batch."""
+
+    def test_runs_all_requests_with_bounded_concurrency(self, tmp_path, fake_graph):
+        """Test that every request is answered and concurrency stays bounded."""
+        requests = tmp_path / "requests.jsonl"
+        results = tmp_path / "results.jsonl"
+        write_jsonl(requests, [{"id": f"r{i}", "message": f"q{i}"} for i in range(10)])
+
+        summary = batch.run_batch(requests, results, concurrency=3)
+
+        records = {record["id"]: record for record in read_jsonl(results)}
+        assert set(records) == {f"r{i}" for i in range(10)}
+        assert records["r4"]["response"]["message"] == "Re: q4"
+        assert fake_graph["peak"] == 3
+        assert (summary.succeeded, summary.failed, summary.skipped) == (10, 0, 0)
+        assert summary.latency_p95_ms >= summary.latency_p50_ms > 0
+
+    def test_records_failures_and_invalid_requests(self, tmp_path, fake_graph):
+        """Test that errors become output records instead of aborting the run."""
+        requests = tmp_path / "requests.jsonl"
+        results = tmp_path / "results.jsonl"
+        write_jsonl(
+            requests,
+            [{"id": "bad", "message": "fail"}, {"id": "empty"}, {"message": "q"}],
+        )
+
+        summary = batch.run_batch(requests, results)
+
+        records = {record["id"]: record for record in read_jsonl(results)}
+        assert records["bad"]["status"] == "error"
+        assert records["bad"]["status_code"] == 500
+        assert records["empty"]["status_code"] == 400
+        assert records["line-3"]["status"] == "ok"
+        assert (summary.succeeded, summary.failed) == (1, 2)
+
+    def test_malformed_lines_are_recorded_and_the_rest_run(self, tmp_path, fake_graph):
+        """Test that a line that is not a JSON object fails alone."""
+        requests = tmp_path / "requests.jsonl"
+        results = tmp_path / "results.jsonl"
+        requests.write_text(
+            json.dumps({"id": "r0", "message": "q0"})
+            + '\n{"id": "r1", "message": \n'
+            + "[1, 2]\n"
+            + json.dumps({"id": "r3", "message": "q3"})
+            + "\n"
+        )
+
+        summary = batch.run_batch(requests, results)
+
+        records = {record["id"]: record for record in read_jsonl(results)}
+        assert set(records) == {"r0", "line-2", "line-3", "r3"}
+        assert records["line-2"]["status_code"] == 400
+        assert records["line-2"]["error"].startswith("Invalid JSON")
+        assert records["line-3"]["error"] == "Invalid JSON: Expected a JSON object"
+        assert sorted(fake_graph["calls"]) == ["q0", "q3"]
+        assert (summary.total, summary.succeeded, summary.failed) == (4, 2, 2)
+
+    def test_resume_skips_completed_and_retries_failed(self, tmp_path, fake_graph):
+        """Test that a rerun only processes ids without a successful result."""
+        requests = tmp_path / "requests.jsonl"
+        results = tmp_path / "results.jsonl"
+        write_jsonl(requests, [{"id": f"r{i}", "message": f"q{i}"} for i in range(3)])
+        results.write_text(
+            json.dumps({"id": "r0", "status": "ok"})
+            + "\n"
+            + json.dumps({"id": "r1", "status": "error"})
+            + '\n{"id": "r2", "sta'  # torn write from a crash
+        )
+
+        summary = batch.run_batch(requests, results)
+
+        assert sorted(fake_graph["calls"]) == ["q1", "q2"]
+        assert (summary.total, summary.skipped, summary.succeeded) == (3, 1, 2)
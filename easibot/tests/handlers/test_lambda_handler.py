@@ -0,0 +1,116 @@
+"""Tests for the Lambda handler."""
+
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+from botocore.exceptions import ClientError
+from langchain_core.messages import AIMessage, HumanMessage
+
+from easibot.graph.state import Deliverable
+from easibot.handlers import lambda_handler
+from easibot.llm.resilience import CircuitOpenError
+
+EVENT = {"message": "Create a disaster recovery plan"}
+
+
+@pytest.mark.parametrize(
+    ("error", "status"),
+    [
+        (
+            ClientError({"Error": {"Code": "ThrottlingException"}}, "InvokeModel"),
+            429,
+        ),
+        (CircuitOpenError("model@us-west-2", retry_after=12.3), 503),
+        (ValueError("boom"), 500),
+    ],
+)
+def test_errors_map_to_status_codes(error, status):
+    """Test that overload errors become 429/503 instead of a bare 500."""
+    with patch.object(lambda_handler.graph, "invoke", side_effect=error):
+        response = lambda_handler.handler(EVENT, None)
+
+    assert response["statusCode"] == status
+    assert json.loads(response["body"])["error"] == str(error)
+
+
+def test_open_circuit_sets_retry_after():
+    """Test that a 503 tells the client when the breaker may close."""
+    error = CircuitOpenError("model@us-west-2", retry_after=12.3)
+    with patch.object(lambda_handler.graph, "invoke", side_effect=error):
+        response = lambda_handler.handler(EVENT, None)
+
+    assert response["headers"] == {"Retry-After": "13"}
+
+
+@pytest.mark.parametrize(("thread_id", "runs"), [(None, 1), ("workshop", 3)])
+def test_identical_requests_share_a_run(thread_id, runs):
+    """Test that concurrent one-off requests coalesce but threaded ones do not."""
+    result = {
+        "messages": [AIMessage(content="Plan")],
+        "active_specialist": "bcdr",
+    }
+
+    def slow_invoke(state: object, config: dict) -> dict:
+        time.sleep(0.2)
+        return result
+
+    events = [
+        {"message": text, "offerings": ["bcdr"], "thread_id": thread_id}
+        for text in ("Create a DR plan", "create a  DR plan", "Create a DR\nplan")
+    ]
+    with (
+        patch.object(lambda_handler.graph, "invoke", side_effect=slow_invoke) as run,
+        ThreadPoolExecutor(max_workers=3) as pool,
+    ):
+        responses = list(pool.map(lambda e: lambda_handler.handler(e, None), events))
+
+    assert run.call_count == runs
+    assert {json.loads(r["body"])["message"] for r in responses} == {"Plan"}
+
+
+def test_requests_differing_in_punctuation_do_not_share_a_run():
+    """Test that operators and punctuation keep requests apart."""
+
+    def slow_invoke(state: dict, config: dict) -> dict:
+        time.sleep(0.2)
+        return {"messages": [AIMessage(content=state["messages"][0]["content"])]}
+
+    texts = ("Plan for RTO < 4h", "Plan for RTO > 4h", "Plan for RTO <= 4h?")
+    with (
+        patch.object(lambda_handler.graph, "invoke", side_effect=slow_invoke) as run,
+        ThreadPoolExecutor(max_workers=3) as pool,
+    ):
+        responses = list(
+            pool.map(
+                lambda text: lambda_handler.handler({"message": text}, None), texts
+            )
+        )
+
+    assert run.call_count == 3
+    assert [json.loads(r["body"])["message"] for r in responses] == list(texts)
+
+
+def test_response_keeps_latest_deliverable_per_specialist():
+    """Test that a thread's repeated deliverables are listed once."""
+    plan = Deliverable(
+        title="BC/DR Plan",
+        type="plan",
+        content="v1",
+        offering="bcdr",
+        specialist="bcdr",
+    )
+    result = {
+        "messages": [
+            HumanMessage(content="Update the plan"),
+            AIMessage(content="Plan v2", name="bcdr_specialist"),
+        ],
+        "deliverables": [plan, plan.model_copy(update={"type": "plan_v2"})],
+    }
+
+    body = lambda_handler.response_body(result)
+
+    assert body["message"] == "Plan v2"
+    assert [d["type"] for d in body["deliverables"]] == ["plan_v2"]
@@ -0,0 +1,100 @@
+"""Tests for the streaming handlers."""
+
+import asyncio
+import json
+from unittest.mock import Mock, patch
+
+import pytest
+from langchain_core.language_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage
+
+from easibot.agent import create_consultant_graph
+from easibot.handlers import streaming
+from easibot.tests.conftest import mirror_async
+
+PLAN = "Tier one systems recover within four hours."
+
+
+@pytest.fixture
+def streaming_graph():
+    """Graph whose BC/DR specialist streams a fixed plan token by token."""
+    with (
+        patch("easibot.agents.supervisor.get_chat_model") as mock_supervisor,
+        patch("easibot.agents.bcdr.get_chat_model") as mock_bcdr,
+    ):
+        mock_supervisor.return_value = mirror_async(Mock())
+        mock_bcdr.return_value = GenericFakeChatModel(
+            messages=iter([AIMessage(content=PLAN)])
+        )
+        graph = create_consultant_graph(prefetch_research=False)
+        with patch.object(streaming, "graph", graph):
+            yield graph
+
+
+async def collect(iterator) -> list:
+    """Drain an async iterator into a list."""
+    return [item async for item in iterator]
+
+
+class TestStreaming:
+    """Test cases for token streaming."""
+
+    def test_tokens_precede_metadata_frame(self, streaming_graph):
+        """Test that specialist tokens stream before the final metadata frame."""
+        frames = asyncio.run(
+            collect(
+                streaming.astream(
+                    {"message": "Create a disaster recovery plan", "thread_id": "s-1"}
+                )
+            )
+        )
+
+        tokens = [frame for frame in frames if frame["type"] == "token"]
+        assert len(tokens) > 1
+        assert {frame["specialist"] for frame in tokens} == {"bcdr"}
+        assert "".join(frame["content"] for frame in tokens) == PLAN
+
+        metadata = frames[-1]
+        assert metadata["type"] == "metadata"
+        assert metadata["specialist"] == "bcdr"
+        assert metadata["message"] == PLAN
+        assert metadata["deliverables"][0]["type"] == "bc_dr_plan"
+        assert metadata["routing"]["method"] == "keyword"
+        assert metadata["ttft_ms"] >= 0
+
+    def test_one_off_stream_leaves_no_checkpoint(self, streaming_graph):
+        """Test that a stream without a thread_id deletes its thread afterwards."""
+        frames = asyncio.run(
+            collect(streaming.astream({"message": "Create a disaster recovery plan"}))
+        )
+
+        assert frames[-1]["type"] == "metadata"
+        assert not streaming_graph.checkpointer.storage
+
+    def test_missing_message_yields_error_frame(self, streaming_graph):
+        """Test that an invalid event produces a single error frame."""
+        frames = asyncio.run(collect(streaming.astream({})))
+
+        assert frames == [
+            {"type": "error", "error": "No message provided", "status": 400}
+        ]
+
+    def test_asgi_app_streams_sse(self, streaming_graph):
+        """Test that the ASGI endpoint responds with an SSE stream."""
+        body = json.dumps({"message": "Create a disaster recovery plan"}).encode()
+        sent = []
+
+        async def receive() -> dict:
+            return {"type": "http.request", "body": body, "more_body": False}
+
+        async def send(message) -> None:
+            sent.append(message)
+
+        asyncio.run(streaming.app({"type": "http", "method": "POST"}, receive, send))
+
+        assert sent[0]["status"] == 200
+        assert (b"content-type", b"text/event-stream") in sent[0]["headers"]
+        stream = b"".join(message.get("body", b"") for message in sent[1:]).decode()
+        assert stream.startswith("event: token\n")
+        assert "event: metadata\n" in stream
+        assert sent[-1]["more_body"] is False
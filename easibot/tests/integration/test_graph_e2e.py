@@ -1,38 +1,54 @@
 """End-to-end tests for the complete LangGraph workflow."""
 
-from unittest.mock import Mock, patch
+import asyncio
+import json
+import threading
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 from langchain_core.messages import AIMessage, HumanMessage
 
 from easibot.agent import create_consultant_graph
+from easibot.graph.state import ResearchFinding
+from easibot.handlers import lambda_handler
+from easibot.nodes.prefetch import PREFETCH_TRACKER
+from easibot.tests.conftest import mirror_async
 
 
 @pytest.fixture
 def mock_all_bedrock():
     """Mock all Bedrock LLM instances used in agents."""
     with (
-        patch("easibot.agents.supervisor.ChatBedrock") as mock_supervisor,
-        patch("easibot.agents.research.ChatBedrock") as mock_research,
-        patch("easibot.agents.app_rationalization.ChatBedrock") as mock_app_rat,
-        patch("easibot.agents.bcdr.ChatBedrock") as mock_bcdr,
+        patch("easibot.agents.supervisor.get_chat_model") as mock_supervisor,
+        patch("easibot.agents.research.get_chat_model") as mock_research,
+        patch("easibot.agents.app_rationalization.get_chat_model") as mock_app_rat,
+        patch("easibot.agents.bcdr.get_chat_model") as mock_bcdr,
+        patch("easibot.agents.tech_strategy.get_chat_model") as mock_tech_strategy,
+        patch(
+            "easibot.agents.cloud_modernization.get_chat_model"
+        ) as mock_cloud_modernization,
     ):
         # Create mock LLM responses
         mock_llm = Mock()
         mock_response = AIMessage(content="Test response from agent")
         mock_llm.invoke = Mock(return_value=mock_response)
+        mirror_async(mock_llm)
 
         # Apply to all mocks
         mock_supervisor.return_value = mock_llm
         mock_research.return_value = mock_llm
         mock_app_rat.return_value = mock_llm
         mock_bcdr.return_value = mock_llm
+        mock_tech_strategy.return_value = mock_llm
+        mock_cloud_modernization.return_value = mock_llm
 
         yield {
             "supervisor": mock_supervisor,
             "research": mock_research,
             "app_rat": mock_app_rat,
             "bcdr": mock_bcdr,
+            "tech_strategy": mock_tech_strategy,
+            "cloud_modernization": mock_cloud_modernization,
         }
 
 
@@ -47,8 +63,36 @@ class TestGraphEndToEnd:
         assert "research" in graph.nodes
         assert "app_rationalization" in graph.nodes
         assert "bcdr" in graph.nodes
+        assert "tech_strategy" in graph.nodes
+        assert "cloud_modernization" in graph.nodes
 
-    def test_graph_invoke_research_query(self, mock_all_bedrock):
+    def test_graph_creation_is_lazy(self, mock_all_bedrock):
+        """Test that building the graph constructs no agents or clients."""
+        create_consultant_graph()
+
+        for mock_bedrock in mock_all_bedrock.values():
+            mock_bedrock.assert_not_called()
+
+    def test_only_routed_specialists_are_constructed(self, mock_all_bedrock, run_graph):
+        """Test that a turn builds the supervisor and its target only."""
+        graph = create_consultant_graph()
+
+        input_state = {
+            "messages": [HumanMessage(content="Draft a technology roadmap")],
+            "offerings": ["tech-strategy"],
+        }
+
+        config = {"configurable": {"thread_id": "test-thread-lazy"}}
+        result = run_graph(graph, input_state, config)
+
+        assert result["active_specialist"] == "tech_strategy"
+        assert result["deliverables"][0].offering == "tech-strategy"
+        mock_all_bedrock["supervisor"].assert_called_once()
+        mock_all_bedrock["tech_strategy"].assert_called_once()
+        for name in ("research", "app_rat", "bcdr", "cloud_modernization"):
+            mock_all_bedrock[name].assert_not_called()
+
+    def test_graph_invoke_research_query(self, mock_all_bedrock, run_graph):
         """Test graph invocation with informational query."""
         graph = create_consultant_graph()
 
@@ -58,7 +102,7 @@ class TestGraphEndToEnd:
         }
 
         config = {"configurable": {"thread_id": "test-thread-1"}}
-        result = graph.invoke(input_state, config)
+        result = run_graph(graph, input_state, config)
 
         # Verify we got a result
         assert result is not None
@@ -69,7 +113,7 @@ class TestGraphEndToEnd:
         ai_messages = [msg for msg in result["messages"] if isinstance(msg, AIMessage)]
         assert len(ai_messages) > 0
 
-    def test_graph_invoke_app_rationalization(self, mock_all_bedrock):
+    def test_graph_invoke_app_rationalization(self, mock_all_bedrock, run_graph):
         """Test graph invocation for app rationalization work."""
         graph = create_consultant_graph()
 
@@ -81,7 +125,7 @@ class TestGraphEndToEnd:
         }
 
         config = {"configurable": {"thread_id": "test-thread-2"}}
-        result = graph.invoke(input_state, config)
+        result = run_graph(graph, input_state, config)
 
         assert result is not None
         assert "messages" in result
@@ -96,7 +140,7 @@ class TestGraphEndToEnd:
         ]
         assert len(app_rat_deliverables) > 0
 
-    def test_graph_invoke_bcdr(self, mock_all_bedrock):
+    def test_graph_invoke_bcdr(self, mock_all_bedrock, run_graph):
         """Test graph invocation for BC/DR work."""
         graph = create_consultant_graph()
 
@@ -106,7 +150,7 @@ class TestGraphEndToEnd:
         }
 
         config = {"configurable": {"thread_id": "test-thread-3"}}
-        result = graph.invoke(input_state, config)
+        result = run_graph(graph, input_state, config)
 
         assert result is not None
         assert "deliverables" in result
@@ -115,7 +159,7 @@ class TestGraphEndToEnd:
         bcdr_deliverables = [d for d in result["deliverables"] if d.offering == "bcdr"]
         assert len(bcdr_deliverables) > 0
 
-    def test_graph_state_preservation(self, mock_all_bedrock):
+    def test_graph_state_preservation(self, mock_all_bedrock, run_graph):
         """Test that state is properly preserved through the graph."""
         graph = create_consultant_graph()
 
@@ -126,7 +170,7 @@ class TestGraphEndToEnd:
         }
 
         config = {"configurable": {"thread_id": "test-thread-4"}}
-        result = graph.invoke(input_state, config)
+        result = run_graph(graph, input_state, config)
 
         # Client industry should be preserved
         assert result.get("client_industry") == "Healthcare"
@@ -138,7 +182,7 @@ class TestGraphEndToEnd:
             if isinstance(msg, HumanMessage)
         )
 
-    def test_graph_iteration_control(self, mock_all_bedrock):
+    def test_graph_iteration_control(self, mock_all_bedrock, run_graph):
         """Test that graph respects iteration limits."""
         graph = create_consultant_graph()
 
@@ -149,12 +193,12 @@ class TestGraphEndToEnd:
         }
 
         config = {"configurable": {"thread_id": "test-thread-5"}}
-        result = graph.invoke(input_state, config)
+        result = run_graph(graph, input_state, config)
 
         # Should not exceed max iterations
         assert result.get("iteration_count", 0) <= 3
 
-    def test_graph_with_multiple_offerings(self, mock_all_bedrock):
+    def test_graph_with_multiple_offerings(self, mock_all_bedrock, run_graph):
         """Test graph handling multiple offerings."""
         graph = create_consultant_graph()
 
@@ -168,7 +212,7 @@ class TestGraphEndToEnd:
         }
 
         config = {"configurable": {"thread_id": "test-thread-6"}}
-        result = graph.invoke(input_state, config)
+        result = run_graph(graph, input_state, config)
 
         assert result is not None
         assert "messages" in result
@@ -177,19 +221,19 @@ class TestGraphEndToEnd:
         ai_messages = [msg for msg in result["messages"] if isinstance(msg, AIMessage)]
         assert len(ai_messages) > 0
 
-    def test_graph_empty_message_handling(self, mock_all_bedrock):
+    def test_graph_empty_message_handling(self, mock_all_bedrock, run_graph):
         """Test graph handles edge cases gracefully."""
         graph = create_consultant_graph()
 
         input_state = {"messages": [], "offerings": []}
 
         config = {"configurable": {"thread_id": "test-thread-7"}}
-        result = graph.invoke(input_state, config)
+        result = run_graph(graph, input_state, config)
 
         # Should complete without error
         assert result is not None
 
-    def test_graph_produces_consultant_state(self, mock_all_bedrock):
+    def test_graph_produces_consultant_state(self, mock_all_bedrock, run_graph):
         """Test that graph output conforms to ConsultantState schema."""
         graph = create_consultant_graph()
 
@@ -199,7 +243,7 @@ class TestGraphEndToEnd:
         }
 
         config = {"configurable": {"thread_id": "test-thread-8"}}
-        result = graph.invoke(input_state, config)
+        result = run_graph(graph, input_state, config)
 
         # Verify result has ConsultantState fields
         assert "messages" in result
@@ -218,3 +262,175 @@ class TestGraphEndToEnd:
         # Verify state has expected content
         assert len(result["messages"]) > 0
         assert result["iteration_count"] > 0
+
+
+class TestParallelFanOut:
+    """Tests for concurrent specialist dispatch."""
+
+    def test_cross_offering_request_runs_specialists_concurrently(
+        self, mock_all_bedrock
+    ):
+        """Test that both specialists run at the same time and results merge."""
+        # Both specialist calls must be in flight together to pass the barrier;
+        # sequential execution would time out and break it.
+        barrier = threading.Barrier(2, timeout=5)
+
+        def specialist_invoke(messages) -> AIMessage:
+            barrier.wait()
+            return AIMessage(content="Specialist deliverable")
+
+        for name in ("app_rat", "bcdr"):
+            specialist_llm = Mock()
+            specialist_llm.invoke = Mock(side_effect=specialist_invoke)
+            mock_all_bedrock[name].return_value = specialist_llm
+
+        graph = create_consultant_graph()
+
+        input_state = {
+            "messages": [
+                HumanMessage(
+                    content="Rationalize our portfolio and give me a DR plan "
+                    "for what we keep"
+                )
+            ],
+            "offerings": ["app-rationalization", "bcdr"],
+        }
+
+        config = {"configurable": {"thread_id": "test-thread-fan-out"}}
+        result = graph.invoke(input_state, config)
+
+        assert result["next_specialists"] == ["app_rationalization", "bcdr"]
+        assert {d.offering for d in result["deliverables"]} == {
+            "app-rationalization",
+            "bcdr",
+        }
+        specialist_names = {
+            msg.name for msg in result["messages"] if isinstance(msg, AIMessage)
+        }
+        assert specialist_names == {
+            "app_rationalization_specialist",
+            "bcdr_specialist",
+        }
+
+    def test_cross_offering_request_runs_specialists_concurrently_async(
+        self, mock_all_bedrock
+    ):
+        """Test that ainvoke overlaps specialist calls on one event loop."""
+
+        async def main() -> dict:
+            # Same check as the threaded test, but without any worker threads:
+            # both awaits must be pending at once to pass the barrier.
+            barrier = asyncio.Barrier(2)
+
+            async def specialist_ainvoke(messages) -> AIMessage:
+                await asyncio.wait_for(barrier.wait(), timeout=5)
+                return AIMessage(content="Specialist deliverable")
+
+            for name in ("app_rat", "bcdr"):
+                specialist_llm = Mock()
+                specialist_llm.ainvoke = AsyncMock(side_effect=specialist_ainvoke)
+                mock_all_bedrock[name].return_value = specialist_llm
+
+            graph = create_consultant_graph()
+
+            input_state = {
+                "messages": [
+                    HumanMessage(
+                        content="Rationalize our portfolio and give me a DR plan "
+                        "for what we keep"
+                    )
+                ],
+                "offerings": ["app-rationalization", "bcdr"],
+            }
+
+            config = {"configurable": {"thread_id": "test-thread-fan-out-async"}}
+            return await graph.ainvoke(input_state, config)
+
+        result = asyncio.run(main())
+
+        assert result["next_specialists"] == ["app_rationalization", "bcdr"]
+        assert {d.offering for d in result["deliverables"]} == {
+            "app-rationalization",
+            "bcdr",
+        }
+
+    def test_every_parallel_answer_reaches_the_client(self, mock_all_bedrock):
+        """Test that the handler response merges both specialists' answers."""
+        for name, answer in (
+            ("app_rat", "Retire the duplicate CRM."),
+            ("bcdr", "Replicate the kept CRM to a second region."),
+        ):
+            specialist_llm = Mock()
+            specialist_llm.invoke = Mock(return_value=AIMessage(content=answer))
+            mock_all_bedrock[name].return_value = specialist_llm
+
+        with patch.object(lambda_handler, "graph", create_consultant_graph()):
+            response = lambda_handler.handler(
+                {
+                    "message": "Rationalize our portfolio and give me a DR plan "
+                    "for what we keep",
+                    "offerings": ["app-rationalization", "bcdr"],
+                },
+                None,
+            )
+        body = json.loads(response["body"])
+
+        assert "Retire the duplicate CRM." in body["message"]
+        assert "Replicate the kept CRM to a second region." in body["message"]
+        assert sorted(d["specialist"] for d in body["deliverables"]) == [
+            "app_rationalization",
+            "bcdr",
+        ]
+
+    def test_one_off_requests_leave_no_checkpoints(self, mock_all_bedrock):
+        """Test that only threads named by the client keep their checkpoints."""
+        graph = create_consultant_graph()
+        with patch.object(lambda_handler, "graph", graph):
+            for thread_id in (None, "workshop"):
+                response = lambda_handler.handler(
+                    {
+                        "message": "Create a disaster recovery plan",
+                        "offerings": ["bcdr"],
+                        "thread_id": thread_id,
+                    },
+                    None,
+                )
+                assert response["statusCode"] == 200
+
+        assert set(graph.checkpointer.storage) == {"workshop"}
+
+
+class TestResearchPrefetch:
+    """Tests for speculative retrieval during routing."""
+
+    def test_research_uses_prefetched_findings(self, mock_all_bedrock, run_graph):
+        """Test that research reuses findings prefetched alongside routing."""
+        graph = create_consultant_graph(prefetch_research=True)
+        assert "prefetch" in graph.nodes
+
+        used_before = PREFETCH_TRACKER.stats()["used"]
+        with patch(
+            "easibot.agents.research.ResearchSpecialist._simulate_rag_search",
+            return_value=[
+                ResearchFinding(
+                    source="Guide",
+                    content="Rationalization reduces portfolio cost.",
+                    relevance_score=0.8,
+                )
+            ],
+        ) as mock_search:
+            result = run_graph(
+                graph,
+                {
+                    "messages": [HumanMessage(content="What is rationalization?")],
+                    "offerings": ["app-rationalization"],
+                },
+                {"configurable": {"thread_id": "test-thread-prefetch"}},
+            )
+
+        # One search (the prefetch), not a second one inside research
+        mock_search.assert_called_once()
+        assert result["active_specialist"] == "research"
+        assert len(result["research_findings"]) == 1
+        assert result["prefetch"].key == "test-thread-prefetch:1"
+        assert PREFETCH_TRACKER.stats()["used"] == used_before + 1
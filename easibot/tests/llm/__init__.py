@@ -0,0 +1 @@
+"""Tests for chat model helpers."""
@@ -0,0 +1,67 @@
+"""Tests for token-budgeted research context assembly."""
+
+from easibot.graph.state import ResearchFinding
+from easibot.llm import build_research_context, estimate_tokens
+from easibot.llm.context import truncate_to_sentences
+
+
+def finding(source: str, content: str, score: float) -> ResearchFinding:
+    """Build a finding with the given relevance."""
+    return ResearchFinding(source=source, content=content, relevance_score=score)
+
+
+class TestBuildResearchContext:
+    """Test cases for build_research_context."""
+
+    def test_ranks_by_relevance_and_dedupes(self):
+        """Test that findings are ordered by score and repeats are dropped."""
+        context = build_research_context(
+            [
+                finding("Low", "Rarely relevant.", 0.2),
+                finding("High", "Most relevant.", 0.9),
+                finding("Copy", "most  RELEVANT.", 0.8),
+            ],
+            budget=500,
+            numbered=True,
+        )
+
+        assert [f.source for f in context.findings] == ["High", "Low"]
+        assert context.text == (
+            "Available Research:\n1. [High] Most relevant.\n2. [Low] Rarely relevant.\n"
+        )
+        assert context.dropped == 1
+        assert context.tokens_used == estimate_tokens(context.text)
+
+    def test_stays_within_budget_cutting_at_sentences(self):
+        """Test that an oversized finding is cut at a sentence boundary."""
+        long_content = " ".join(f"Sentence number {i} is here." for i in range(50))
+        context = build_research_context(
+            [finding("Guide", long_content, 0.9), finding("Other", "Short.", 0.1)],
+            budget=60,
+        )
+
+        assert context.tokens_used <= 60
+        assert context.truncated == 1
+        assert context.findings[0].content.endswith("is here.")
+        assert len(context.findings[0].content) < len(long_content)
+
+    def test_empty_when_nothing_fits(self):
+        """Test that no section is produced when the budget is too small."""
+        context = build_research_context(
+            [finding("Guide", "A sentence that cannot fit.", 0.9)], budget=5
+        )
+
+        assert context.text == ""
+        assert context.tokens_used == 0
+        assert context.dropped == 1
+
+
+def test_truncate_to_sentences_keeps_whole_sentences():
+    """Test that truncation never splits a sentence."""
+    text = "First sentence. Second sentence! Third sentence?"
+
+    assert truncate_to_sentences(text, estimate_tokens("First sentence.")) == (
+        "First sentence."
+    )
+    assert truncate_to_sentences(text, 1) == ""
+    assert truncate_to_sentences(text, 100) == text
@@ -0,0 +1,135 @@
+"""Tests for the client-side Bedrock rate governor."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from easibot.llm.rate_limit import RateGovernor, request_priority
+from easibot.llm.rate_limit import settings as rate_settings
+
+MODEL = "test-model"
+
+
+@pytest.fixture
+def limits(monkeypatch):
+    """Allow one request per second and 100 tokens per second for MODEL."""
+    monkeypatch.setattr(rate_settings, "rate_limit_burst_seconds", 1.0)
+    monkeypatch.setattr(
+        rate_settings,
+        "bedrock_model_quotas",
+        {MODEL: {"requests_per_minute": 60, "tokens_per_minute": 6000}},
+    )
+    monkeypatch.setattr(rate_settings, "bedrock_requests_per_minute", None)
+
+
+class TestRateGovernor:
+    """Test cases for RateGovernor."""
+
+    def test_unlimited_model_never_waits(self, limits):
+        """Test that models without a quota pass straight through."""
+        governor = RateGovernor()
+
+        assert governor.acquire("other-model", 10_000) == 0.0
+        assert governor.stats() == {}
+
+    def test_request_quota_spaces_out_calls(self, limits):
+        """Test that a drained request bucket delays the next call."""
+        governor = RateGovernor()
+
+        assert governor.acquire(MODEL, 1) < 0.05
+        waited = governor.acquire(MODEL, 1)
+
+        assert 0.9 < waited < 1.5
+
+    def test_token_quota_delays_large_requests(self, limits, monkeypatch):
+        """Test that estimated tokens are charged against the token bucket."""
+        monkeypatch.setattr(
+            rate_settings,
+            "bedrock_model_quotas",
+            {MODEL: {"requests_per_minute": 6000, "tokens_per_minute": 6000}},
+        )
+        governor = RateGovernor()
+
+        governor.acquire(MODEL, 100)
+        waited = governor.acquire(MODEL, 30)
+
+        assert 0.2 < waited < 0.6
+
+    @pytest.mark.parametrize("source", ["quota", "setting"])
+    def test_tokens_only_quota_is_enforced(self, limits, monkeypatch, source):
+        """Test that a token quota applies without a request quota."""
+        quotas = {MODEL: {"tokens_per_minute": 6000}} if source == "quota" else {}
+        monkeypatch.setattr(rate_settings, "bedrock_model_quotas", quotas)
+        if source == "setting":
+            monkeypatch.setattr(rate_settings, "bedrock_tokens_per_minute", 6000)
+        governor = RateGovernor()
+
+        assert governor.acquire(MODEL, 100) < 0.05
+        waited = governor.acquire(MODEL, 30)
+
+        assert 0.2 < waited < 0.6
+        assert (
+            governor.stats()[f"{MODEL}@{rate_settings.bedrock_region}"]["granted"] == 2
+        )
+
+    def test_interactive_overtakes_queued_batch(self, limits, monkeypatch):
+        """Test that a later interactive caller is served before queued batch work."""
+        monkeypatch.setattr(
+            rate_settings,
+            "bedrock_model_quotas",
+            {MODEL: {"requests_per_minute": 300}},
+        )
+        monkeypatch.setattr(rate_settings, "rate_limit_burst_seconds", 0.2)
+        governor = RateGovernor()
+        key = f"{MODEL}@{rate_settings.bedrock_region}"
+        governor.acquire(MODEL, 1)
+        order = []
+
+        def call(priority: str) -> None:
+            with request_priority(priority):
+                governor.acquire(MODEL, 1)
+            order.append(priority)
+
+        batch = threading.Thread(target=call, args=("batch",))
+        batch.start()
+        while governor.stats()[key]["queue_depth"] < 1:
+            time.sleep(0.001)
+        stats = governor.stats()[key]
+        interactive = threading.Thread(target=call, args=("interactive",))
+        interactive.start()
+        batch.join()
+        interactive.join()
+
+        assert stats["queued_batch"] == 1
+        assert order == ["interactive", "batch"]
+
+    def test_async_callers_and_wait_metrics(self, limits, monkeypatch):
+        """Test aacquire and the reported wait statistics."""
+        monkeypatch.setattr(
+            rate_settings,
+            "bedrock_model_quotas",
+            {MODEL: {"requests_per_minute": 600}},
+        )
+        governor = RateGovernor()
+
+        async def run() -> list[float]:
+            return await asyncio.gather(
+                *(governor.aacquire(MODEL, 1, region="eu-west-1") for _ in range(4))
+            )
+
+        waits = asyncio.run(run())
+        stats = governor.stats()[f"{MODEL}@eu-west-1"]
+
+        # A 1 s burst at 10 requests per second covers all four
+        assert max(waits) < 0.1
+        assert stats["granted"] == 4
+        assert stats["queue_depth"] == 0
+        assert stats["max_wait_ms"] >= stats["avg_wait_ms"] >= 0
+
+
+def test_unknown_priority_is_rejected():
+    """Test that only known priorities can be set."""
+    with pytest.raises(ValueError, match="Unknown priority"), request_priority("vip"):
+        pass
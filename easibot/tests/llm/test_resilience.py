@@ -0,0 +1,325 @@
+"""Tests for retries, circuit breaking and hedging of Bedrock calls."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import TYPE_CHECKING, Any
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from botocore.exceptions import ClientError
+from langchain_core.callbacks import BaseCallbackHandler, CallbackManager
+from langchain_core.runnables.config import var_child_runnable_config
+
+from easibot.llm.rate_limit import RATE_GOVERNOR
+from easibot.llm.resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    Endpoint,
+    ResilientModel,
+    get_circuit_breaker,
+    is_retryable_error,
+    reset_circuit_breakers,
+)
+from easibot.llm.tiers import ModelTiers, resolve_tiers
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Iterator
+    from uuid import UUID
+
+
+class StreamingHandler(BaseCallbackHandler):
+    """Callback handler that consumes streamed tokens, like LangGraph's."""
+
+    def tap_output_aiter(self, _run_id: UUID, output: AsyncIterator) -> AsyncIterator:
+        """Pass async output through."""
+        return output
+
+    def tap_output_iter(self, _run_id: UUID, output: Iterator) -> Iterator:
+        """Pass output through."""
+        return output
+
+
+def throttled() -> ClientError:
+    """Build the error Bedrock raises when a request is throttled."""
+    return ClientError(
+        {"Error": {"Code": "ThrottlingException", "Message": "Rate exceeded"}},
+        "InvokeModel",
+    )
+
+
+def slow_model(answer: str, delay: float) -> Mock:
+    """Build a model that answers after a delay, sync and async."""
+
+    async def answer_later(_: list) -> str:
+        await asyncio.sleep(delay)
+        return answer
+
+    model = Mock()
+    model.invoke.side_effect = lambda _: time.sleep(delay) or answer
+    model.ainvoke = AsyncMock(side_effect=answer_later)
+    return model
+
+
+def resilient(
+    model: Mock, breaker: CircuitBreaker | None = None, **kwargs: Any
+) -> ResilientModel:
+    """Wrap a model with no backoff delay between retries."""
+    wrapped = ResilientModel(
+        Endpoint(model, breaker or CircuitBreaker("test")), **kwargs
+    )
+    wrapped.base_delay = 0.0
+    return wrapped
+
+
+@pytest.fixture(autouse=True)
+def fresh_breakers():
+    """Isolate the process-wide circuit breakers between tests."""
+    reset_circuit_breakers()
+    yield
+    reset_circuit_breakers()
+
+
+@pytest.fixture(params=["sync", "async"])
+def run_sync_or_async(request):
+    """Call a ResilientModel through invoke or ainvoke."""
+
+    def run(model: ResilientModel, messages: list) -> object:
+        if request.param == "sync":
+            return model.invoke(messages)
+        return asyncio.run(model.ainvoke(messages))
+
+    return run
+
+
+class TestCircuitBreaker:
+    """Test cases for CircuitBreaker."""
+
+    def test_opens_at_threshold_and_recovers_after_reset(self):
+        """Test closed -> open -> half-open -> closed transitions."""
+        breaker = CircuitBreaker("m@r", failure_threshold=2, reset_seconds=10)
+        with patch("easibot.llm.resilience.time.monotonic") as clock:
+            clock.return_value = 100.0
+            breaker.record_failure()
+            assert breaker.state == "closed"
+            breaker.record_failure()
+            assert breaker.state == "open"
+            with pytest.raises(CircuitOpenError) as raised:
+                breaker.check()
+            assert raised.value.retry_after == pytest.approx(10)
+
+            clock.return_value = 111.0
+            assert breaker.state == "half_open"
+            breaker.check()
+            breaker.record_success()
+
+        assert breaker.state == "closed"
+
+    def test_failed_trial_reopens(self):
+        """Test that one failure in half-open state reopens the breaker."""
+        breaker = CircuitBreaker("m@r", failure_threshold=1, reset_seconds=10)
+        with patch("easibot.llm.resilience.time.monotonic") as clock:
+            clock.return_value = 100.0
+            breaker.record_failure()
+            clock.return_value = 111.0
+            breaker.record_failure()
+            assert breaker.state == "open"
+
+    def test_half_open_lets_a_single_trial_through(self):
+        """Test that other calls fail fast while the trial call is running."""
+        breaker = CircuitBreaker("m@r", failure_threshold=1, reset_seconds=10)
+        with patch("easibot.llm.resilience.time.monotonic") as clock:
+            clock.return_value = 100.0
+            breaker.record_failure()
+            clock.return_value = 111.0
+            breaker.check()
+
+            with pytest.raises(CircuitOpenError) as raised:
+                breaker.check()
+            assert raised.value.retry_after == pytest.approx(10)
+            assert breaker.retry_after() == pytest.approx(10)
+
+            # A trial that never reports back is replaced after reset_seconds
+            clock.return_value = 121.0
+            breaker.check()
+            breaker.record_success()
+            breaker.check()
+            breaker.check()
+
+        assert breaker.state == "closed"
+
+
+class TestResilientModel:
+    """Test cases for ResilientModel."""
+
+    def test_retries_throttling_then_succeeds(self, run_sync_or_async):
+        """Test that throttled calls are retried with backoff."""
+        model = Mock()
+        model.invoke.side_effect = [throttled(), throttled(), "answer"]
+        model.ainvoke = AsyncMock(side_effect=model.invoke)
+
+        assert run_sync_or_async(resilient(model), ["hi"]) == "answer"
+        assert model.invoke.call_count == 3
+
+    def test_does_not_retry_other_errors(self):
+        """Test that a non-retryable error is raised at once and not counted."""
+        model = Mock()
+        model.invoke.side_effect = ValueError("bad request")
+        breaker = CircuitBreaker("m@r", failure_threshold=1)
+
+        with pytest.raises(ValueError, match="bad request"):
+            resilient(model, breaker).invoke(["hi"])
+
+        model.invoke.assert_called_once()
+        assert breaker.state == "closed"
+
+    def test_other_errors_do_not_reset_failures(self):
+        """Test that a non-retryable error leaves the failure count as it was."""
+        model = Mock()
+        model.invoke.side_effect = [throttled(), ValueError("bad request"), throttled()]
+        breaker = CircuitBreaker("m@r", failure_threshold=2)
+        wrapped = resilient(model, breaker, hedge_after=None)
+        wrapped.max_retries = 0
+
+        for error in (ClientError, ValueError, ClientError):
+            with pytest.raises(error):
+                wrapped.invoke(["hi"])
+
+        assert breaker.state == "open"
+
+    def test_open_circuit_fails_fast(self):
+        """Test that repeated throttling opens the breaker and stops calls."""
+        model = Mock()
+        model.invoke.side_effect = throttled()
+        breaker = CircuitBreaker("m@r", failure_threshold=2)
+        wrapped = resilient(model, breaker)
+
+        with pytest.raises(CircuitOpenError):
+            wrapped.invoke(["hi"])
+        with pytest.raises(CircuitOpenError):
+            wrapped.invoke(["hi"])
+
+        assert model.invoke.call_count == 2
+
+    def test_slow_call_is_hedged(self, run_sync_or_async):
+        """Test that the hedge answers when the primary is slow."""
+        primary = slow_model("primary", delay=1.0)
+        hedge = slow_model("hedge", delay=0.0)
+        wrapped = resilient(
+            primary, hedge=Endpoint(hedge, CircuitBreaker("hedge")), hedge_after=0.05
+        )
+
+        started = time.perf_counter()
+        answer = run_sync_or_async(wrapped, ["hi"])
+
+        assert answer == "hedge"
+        assert time.perf_counter() - started < 0.5
+
+    def test_fast_call_is_not_hedged(self, run_sync_or_async):
+        """Test that no duplicate request is sent before the threshold."""
+        hedge = slow_model("hedge", delay=0.0)
+        wrapped = resilient(
+            slow_model("primary", delay=0.0),
+            hedge=Endpoint(hedge, CircuitBreaker("hedge")),
+            hedge_after=1.0,
+        )
+
+        assert run_sync_or_async(wrapped, ["hi"]) == "primary"
+        hedge.invoke.assert_not_called()
+        hedge.ainvoke.assert_not_called()
+
+    def test_hedge_failure_waits_for_primary(self, run_sync_or_async):
+        """Test that a failed hedge does not fail a primary that succeeds."""
+        hedge = Mock()
+        hedge.invoke.side_effect = ValueError("hedge down")
+        hedge.ainvoke = AsyncMock(side_effect=hedge.invoke)
+        wrapped = resilient(
+            slow_model("primary", delay=0.2),
+            hedge=Endpoint(hedge, CircuitBreaker("hedge")),
+            hedge_after=0.01,
+        )
+
+        assert run_sync_or_async(wrapped, ["hi"]) == "primary"
+
+    def test_only_the_primary_streams_tokens(self, run_sync_or_async):
+        """Test that the hedge's call runs without streaming callbacks."""
+        streamed, traced = StreamingHandler(), BaseCallbackHandler()
+        seen = {}
+
+        def record(name: str, delay: float) -> Mock:
+            def call(_: list) -> str:
+                seen[name] = var_child_runnable_config.get()["callbacks"].handlers
+                time.sleep(delay)
+                return name
+
+            async def acall(_: list) -> str:
+                seen[name] = var_child_runnable_config.get()["callbacks"].handlers
+                await asyncio.sleep(delay)
+                return name
+
+            return Mock(invoke=Mock(side_effect=call), ainvoke=acall)
+
+        wrapped = resilient(
+            record("primary", delay=0.2),
+            hedge=Endpoint(record("hedge", delay=0.0), CircuitBreaker("hedge")),
+            hedge_after=0.05,
+        )
+        token = var_child_runnable_config.set(
+            {"callbacks": CallbackManager([streamed, traced])}
+        )
+        try:
+            run_sync_or_async(wrapped, ["hi"])
+        finally:
+            var_child_runnable_config.reset(token)
+
+        assert seen["primary"] == [streamed, traced]
+        assert seen["hedge"] == [traced]
+
+
+@patch.dict(
+    "easibot.llm.tiers.settings.agent_model_tiers", {"research": ["fast", "standard"]}
+)
+def test_open_circuit_escalates_to_next_tier():
+    """Test that a tier whose breaker is open is skipped without a call."""
+    (_, fast_id), (_, standard_id) = resolve_tiers("research")
+    for _ in range(get_circuit_breaker(fast_id).failure_threshold):
+        get_circuit_breaker(fast_id).record_failure()
+    models = {}
+
+    def factory(model_id: str, **kwargs: object) -> Mock:
+        models[model_id] = Mock(invoke=Mock(return_value=f"from {model_id}"))
+        return models[model_id]
+
+    output, tier = ModelTiers("research", factory).invoke([], validate=bool)
+
+    assert (output, tier) == (f"from {standard_id}", "standard")
+    models[fast_id].invoke.assert_not_called()
+
+
+def test_retryable_errors():
+    """Test which errors are worth retrying."""
+    assert is_retryable_error(throttled())
+    assert not is_retryable_error(
+        ClientError({"Error": {"Code": "ValidationException"}}, "InvokeModel")
+    )
+    assert not is_retryable_error(ValueError("bad"))
+
+
+def test_calls_pass_through_the_rate_governor(monkeypatch):
+    """Test that every attempt on a rate-limited endpoint takes quota."""
+    monkeypatch.setattr(
+        "easibot.llm.rate_limit.settings.bedrock_model_quotas",
+        {"quota-model": {"requests_per_minute": 600}},
+    )
+    RATE_GOVERNOR.reset()
+    model = Mock()
+    model.invoke.side_effect = [throttled(), "answer"]
+    wrapped = ResilientModel(
+        Endpoint(model, CircuitBreaker("q"), "quota-model", "us-east-1", 10)
+    )
+    wrapped.base_delay = 0.0
+
+    assert wrapped.invoke(["hi"]) == "answer"
+    assert RATE_GOVERNOR.stats()["quota-model@us-east-1"]["granted"] == 2
+    RATE_GOVERNOR.reset()
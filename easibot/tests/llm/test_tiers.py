@@ -0,0 +1,139 @@
+"""Tests for per-agent model tiers."""
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from langchain_core.messages import AIMessage
+
+from easibot.llm import ModelTiers, is_complete_response, resolve_tiers
+
+TIERS = {"research": ["fast", "standard"]}
+
+
+def tier_factory(outputs: dict[str, object]) -> Mock:
+    """Build a model factory whose models answer (or raise) per model id."""
+
+    def build(model_id: str, **kwargs: object) -> Mock:
+        model = Mock(name=model_id)
+        model.invoke.side_effect = lambda _: _answer(outputs[model_id])
+        model.ainvoke = AsyncMock(side_effect=model.invoke)
+        return model
+
+    return Mock(side_effect=build)
+
+
+def _answer(output: object) -> object:
+    if isinstance(output, Exception):
+        raise output
+    return output
+
+
+@patch.dict("easibot.llm.tiers.settings.agent_model_tiers", TIERS)
+class TestModelTiers:
+    """Test cases for ModelTiers."""
+
+    def test_resolves_named_tiers_and_literal_ids(self):
+        """Test that tier names map to settings and other names pass through."""
+        with patch.dict(
+            "easibot.llm.tiers.settings.agent_model_tiers", {"bcdr": ["fast", "m-x"]}
+        ):
+            tiers = resolve_tiers("bcdr")
+
+        fast_id = resolve_tiers("research")[0][1]
+        assert tiers == [("fast", fast_id), ("m-x", "m-x")]
+        assert [tier for tier, _ in resolve_tiers("unconfigured")] == ["standard"]
+
+    def test_first_valid_tier_answers_and_later_tiers_stay_unbuilt(self):
+        """Test that a good fast answer never builds the standard model."""
+        _, fast_id = resolve_tiers("research")[0]
+        factory = tier_factory({fast_id: AIMessage("Fast")})
+
+        response, tier = ModelTiers("research", factory).invoke([])
+
+        assert (response.content, tier) == ("Fast", "fast")
+        factory.assert_called_once()
+
+    @pytest.mark.parametrize(
+        "fast_output",
+        [
+            AIMessage(""),
+            AIMessage("Cut", response_metadata={"stop_reason": "max_tokens"}),
+            RuntimeError("throttled"),
+        ],
+    )
+    def test_escalates_on_invalid_output_or_error(self, fast_output):
+        """Test that an empty, truncated or failed answer moves up a tier."""
+        (_, fast_id), (_, standard_id) = resolve_tiers("research")
+        factory = tier_factory(
+            {fast_id: fast_output, standard_id: AIMessage("Standard")}
+        )
+
+        response, tier = ModelTiers("research", factory).invoke([])
+
+        assert (response.content, tier) == ("Standard", "standard")
+        assert factory.call_count == 2
+
+    def test_returns_last_output_when_no_tier_validates(self):
+        """Test that the last answer is kept rather than failing outright."""
+        (_, fast_id), (_, standard_id) = resolve_tiers("research")
+        factory = tier_factory({fast_id: AIMessage(""), standard_id: AIMessage(" ")})
+
+        response, tier = ModelTiers("research", factory).invoke([])
+
+        assert (response.content, tier) == (" ", "standard")
+
+    def test_raises_when_every_tier_fails(self):
+        """Test that the last error propagates if no tier answered."""
+        (_, fast_id), (_, standard_id) = resolve_tiers("research")
+        factory = tier_factory(
+            {fast_id: RuntimeError("fast"), standard_id: RuntimeError("standard")}
+        )
+
+        with pytest.raises(RuntimeError, match="standard"):
+            ModelTiers("research", factory).invoke([])
+
+    def test_async_escalation_and_custom_validation(self):
+        """Test ainvoke with a caller-supplied validity check."""
+        (_, fast_id), (_, standard_id) = resolve_tiers("research")
+        factory = tier_factory(
+            {fast_id: AIMessage("maybe"), standard_id: AIMessage("yes")}
+        )
+        tiers = ModelTiers("research", factory)
+
+        response, tier = asyncio.run(
+            tiers.ainvoke([], validate=lambda r: r.content == "yes")
+        )
+
+        assert (response.content, tier) == ("yes", "standard")
+
+
+def test_is_complete_response():
+    """Test that only non-empty, untruncated answers are complete."""
+    assert is_complete_response(AIMessage("Answer"))
+    assert not is_complete_response(AIMessage("  "))
+    assert not is_complete_response(
+        AIMessage("Answ", response_metadata={"stop_reason": "max_tokens"})
+    )
+
+
+def test_identical_concurrent_calls_share_one_request():
+    """Test that agents sending the same prompt at once make one model call."""
+    started = []
+
+    def build(model_id: str, **kwargs: object) -> Mock:
+        def answer(_: list) -> AIMessage:
+            started.append(1)
+            time.sleep(0.2)
+            return AIMessage("Shared")
+
+        return Mock(invoke=Mock(side_effect=answer))
+
+    tiers = ModelTiers("research", Mock(side_effect=build))
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        results = list(pool.map(lambda _: tiers.invoke([("user", "Same")]), range(3)))
+
+    assert len(started) == 1
+    assert [(r.content, tier) for r, tier in results] == [("Shared", "standard")] * 3
@@ -0,0 +1 @@
+"""Tests for graph node implementations."""
@@ -0,0 +1,101 @@
+"""Tests for speculative knowledge-base prefetch."""
+
+from unittest.mock import Mock
+
+from langchain_core.messages import AIMessage, HumanMessage
+
+from easibot.graph.state import ConsultantState, PrefetchedResearch, ResearchFinding
+from easibot.nodes.prefetch import (
+    PREFETCH_TRACKER,
+    PrefetchTracker,
+    ResearchPrefetcher,
+    consume_prefetch,
+)
+
+FINDING = ResearchFinding(
+    source="BC/DR Framework",
+    content="RTO should align with business criticality.",
+    relevance_score=0.9,
+    metadata={"offering": "bcdr"},
+)
+
+
+class TestPrefetchTracker:
+    """Test cases for PrefetchTracker."""
+
+    def test_used_prefetch(self):
+        """Test that consumed prefetches count as used."""
+        tracker = PrefetchTracker()
+        tracker.record_issued("t1", "t1:1")
+        tracker.record_used("t1:1")
+
+        assert tracker.stats() == {"issued": 1, "used": 1, "wasted": 0, "pending": 0}
+
+    def test_next_turn_retires_unused_prefetch(self):
+        """Test that an unused prefetch is wasted once the thread moves on."""
+        tracker = PrefetchTracker()
+        tracker.record_issued("t1", "t1:1")
+        tracker.record_issued("t1", "t1:2")
+
+        assert tracker.stats() == {"issued": 2, "used": 0, "wasted": 1, "pending": 1}
+
+    def test_pending_table_is_bounded(self):
+        """Test that evicted pending prefetches are counted as wasted."""
+        tracker = PrefetchTracker(max_pending=1)
+        tracker.record_issued("t1", "t1:1")
+        tracker.record_issued("t2", "t2:1")
+        tracker.record_used("t1:1")
+
+        assert tracker.stats() == {"issued": 2, "used": 0, "wasted": 1, "pending": 1}
+
+
+class TestResearchPrefetcher:
+    """Test cases for ResearchPrefetcher."""
+
+    def test_prefetch_loads_findings_for_turn(self):
+        """Test that the node stores findings keyed by thread and turn."""
+        retrieve = Mock(return_value=[FINDING])
+        tracker = PrefetchTracker()
+        prefetcher = ResearchPrefetcher(retrieve, tracker)
+
+        state = ConsultantState(
+            messages=[
+                HumanMessage(content="What is BCDR?"),
+                AIMessage(content="BC/DR is..."),
+                HumanMessage(content="Find RTO guidance"),
+            ],
+            offerings=["bcdr"],
+        )
+
+        result = prefetcher.prefetch(state, {"configurable": {"thread_id": "t1"}})
+
+        retrieve.assert_called_once_with("Find RTO guidance", ["bcdr"])
+        assert result["prefetch"].key == "t1:2"
+        assert result["research_findings"] == [FINDING]
+        assert tracker.stats()["pending"] == 1
+
+    def test_consume_ignores_previous_turn(self):
+        """Test that a prefetch from an earlier turn is not reused."""
+        state = ConsultantState(
+            messages=[
+                HumanMessage(content="First"),
+                HumanMessage(content="Second"),
+            ],
+            prefetch=PrefetchedResearch(key="t9:1", turn=1, findings=[FINDING]),
+        )
+
+        assert consume_prefetch(state) is None
+
+    def test_consume_marks_prefetch_used(self):
+        """Test that consuming this turn's prefetch records a use."""
+        PREFETCH_TRACKER.record_issued("consume-thread", "consume-thread:1")
+        used_before = PREFETCH_TRACKER.stats()["used"]
+        state = ConsultantState(
+            messages=[HumanMessage(content="First")],
+            prefetch=PrefetchedResearch(
+                key="consume-thread:1", turn=1, findings=[FINDING]
+            ),
+        )
+
+        assert consume_prefetch(state).findings == [FINDING]
+        assert PREFETCH_TRACKER.stats()["used"] == used_before + 1
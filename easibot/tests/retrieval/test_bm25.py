@@ -0,0 +1,134 @@
+"""Tests for the BM25 keyword index."""
+
+import math
+from collections import Counter
+
+import numpy as np
+import pytest
+
+from easibot.retrieval import BM25Index
+from easibot.retrieval.bm25 import BM25_FILE, K1, B, tokenize
+
+
+def random_texts(count: int, seed: int = 0) -> list[str]:
+    """Return texts over a small vocabulary, some with rare terms."""
+    rng = np.random.default_rng(seed)
+    words = [f"w{i}" for i in range(40)]
+    return [
+        " ".join(rng.choice(words, rng.integers(1, 30)))
+        + (f" iso{i % 50}" if i % 3 == 0 else "")
+        for i in range(count)
+    ]
+
+
+def reference_scores(texts: list[str], query: str) -> dict[int, float]:
+    """Score every text by the textbook BM25 formula."""
+    docs = [Counter(tokenize(t)) for t in texts]
+    average = sum(d.total() for d in docs) / len(docs)
+    scores: dict[int, float] = {}
+    for term in set(tokenize(query)):
+        df = sum(term in d for d in docs)
+        idf = math.log1p((len(docs) - df + 0.5) / (df + 0.5))
+        for row, doc in enumerate(docs):
+            if tf := doc[term]:
+                norm = K1 * (1 - B + B * doc.total() / average)
+                scores[row] = scores.get(row, 0.0) + idf * tf * (K1 + 1) / (tf + norm)
+    return scores
+
+
+@pytest.mark.parametrize("query", ["iso7", "w3 iso7", "w1 w2 w3 w4"])
+def test_scores_match_the_bm25_formula(query):
+    """Test both the sparse (rare terms) and dense (common terms) paths."""
+    texts = random_texts(600)
+    expected = reference_scores(texts, query)
+
+    rows, scores = BM25Index.build(texts).search(query, top_k=len(texts))
+
+    assert len(rows) == len(expected)
+    np.testing.assert_allclose(
+        scores, [expected[row] for row in rows.tolist()], rtol=1e-5
+    )
+    assert list(scores) == sorted(scores, reverse=True)
+
+
+def test_exact_terms_rank_first():
+    """Test that a rare code outranks chunks sharing only common words."""
+    index = BM25Index.build(
+        [
+            "Business continuity planning for the data centre.",
+            "Align the business continuity programme with ISO 22301.",
+            "Continuity of the business is the goal of the plan.",
+        ]
+    )
+
+    rows, _ = index.search("ISO 22301 business continuity", top_k=3)
+
+    assert rows[0] == 1
+    assert len(index.search("unknown words", top_k=3)[0]) == 0
+
+
+def test_allowed_rows_restrict_results():
+    """Test that only allowed rows are returned."""
+    texts = random_texts(300)
+    index = BM25Index.build(texts)
+
+    rows, _ = index.search("w5 iso3", top_k=300, allowed=np.arange(0, 300, 2))
+
+    assert len(rows)
+    assert all(row % 2 == 0 for row in rows.tolist())
+
+
+def test_take_and_extend_match_a_fresh_build():
+    """Test that incremental updates index the same postings as a rebuild."""
+    texts = random_texts(200)
+    keep = np.setdiff1d(np.arange(150), [3, 40, 41, 99])
+
+    updated = BM25Index.build(texts[:150]).take(keep).extend(texts[150:])
+    fresh = BM25Index.build([texts[row] for row in keep] + texts[150:])
+
+    for query in ["iso9", "w0 w7 iso21"]:
+        rows, scores = updated.search(query, top_k=200)
+        fresh_rows, fresh_scores = fresh.search(query, top_k=200)
+        np.testing.assert_array_equal(np.sort(rows), np.sort(fresh_rows))
+        np.testing.assert_allclose(np.sort(scores), np.sort(fresh_scores), rtol=1e-6)
+    assert set(updated.terms) == set(fresh.terms)
+
+
+@pytest.mark.parametrize("mmap", [True, False])
+def test_round_trips_through_a_directory(tmp_path, mmap):
+    """Test that saved indexes, empty ones included, load unchanged."""
+    index = BM25Index.build(random_texts(100))
+    (tmp_path / "full").mkdir()
+    (tmp_path / "empty").mkdir()
+    index.save(tmp_path / "full")
+    BM25Index.build([]).save(tmp_path / "empty")
+
+    loaded = BM25Index.load(tmp_path / "full", mmap=mmap)
+    empty = BM25Index.load(tmp_path / "empty", mmap=mmap)
+
+    assert isinstance(loaded.rows, np.memmap) == mmap
+    assert loaded.terms == index.terms
+    np.testing.assert_array_equal(loaded.rows, index.rows)
+    np.testing.assert_array_equal(loaded.freqs, index.freqs)
+    assert empty.terms == []
+    assert len(empty.search("anything", top_k=5)[0]) == 0
+
+
+def test_single_file_indexes_still_load(tmp_path):
+    """Test that postings saved inside bm25.npz are read from there."""
+    index = BM25Index.build(random_texts(50))
+    np.savez(
+        tmp_path / BM25_FILE,
+        terms=np.frombuffer("\n".join(index.terms).encode(), dtype=np.uint8),
+        offsets=index.offsets,
+        rows=index.rows,
+        freqs=index.freqs,
+        lengths=index.lengths,
+    )
+
+    loaded = BM25Index.load(tmp_path)
+
+    np.testing.assert_array_equal(loaded.rows, index.rows)
+    rows, _ = loaded.search("w3 iso3", top_k=5)
+    assert len(rows) == 5
+    assert rows.tolist() == index.search("w3 iso3", top_k=5)[0].tolist()
@@ -0,0 +1,45 @@
+"""Tests for reciprocal rank fusion."""
+
+import pytest
+
+from easibot.retrieval import SearchResult, reciprocal_rank_fusion
+
+
+def ranking(*ids: str) -> list[SearchResult]:
+    """Return results with the given ids, best first."""
+    return [
+        SearchResult(id=i, source="s", content=i, metadata={}, score=0.0) for i in ids
+    ]
+
+
+def test_results_found_by_both_lists_rank_first():
+    """Test that agreement between rankings outweighs a single top rank."""
+    fused = reciprocal_rank_fusion([ranking("a", "b", "c"), ranking("d", "b", "e")])
+
+    assert [r.id for r in fused][:3] == ["b", "a", "d"]
+    assert {r.id for r in fused} == {"a", "b", "c", "d", "e"}
+
+
+def test_scores_are_normalized_to_one():
+    """Test that a result ranked first everywhere scores 1.0."""
+    fused = reciprocal_rank_fusion([ranking("a", "b"), ranking("a")], [2.0, 1.0])
+
+    assert fused[0].score == pytest.approx(1.0)
+    assert 0.0 < fused[1].score < 1.0
+
+
+def test_weights_shift_the_order():
+    """Test that a heavier list decides the ranking."""
+    vector, keyword = ranking("v", "k"), ranking("k", "v")
+
+    assert reciprocal_rank_fusion([vector, keyword], [3.0, 1.0])[0].id == "v"
+    assert reciprocal_rank_fusion([vector, keyword], [1.0, 3.0])[0].id == "k"
+    assert reciprocal_rank_fusion([vector, keyword], [1.0, 0.0])[0].id == "v"
+
+
+def test_rejects_unusable_weights():
+    """Test weight validation."""
+    with pytest.raises(ValueError, match="non-negative"):
+        reciprocal_rank_fusion([ranking("a")], [1.0, 1.0])
+    with pytest.raises(ValueError, match="positive"):
+        reciprocal_rank_fusion([ranking("a")], [0.0])
@@ -0,0 +1,104 @@
+"""Tests for exact vector search."""
+
+import numpy as np
+import pytest
+
+from easibot.retrieval import VectorIndex, load_index, top_k_indices
+from easibot.tools.embeddings import HashingEmbedder
+
+
+def test_top_k_indices_matches_full_sort():
+    """Test that the partial sort returns the same order as a full sort."""
+    scores = np.random.default_rng(0).standard_normal(1000)
+
+    np.testing.assert_array_equal(
+        top_k_indices(scores, 10), np.argsort(-scores, kind="stable")[:10]
+    )
+    assert len(top_k_indices(scores[:3], 10)) == 3
+    assert len(top_k_indices(scores, 0)) == 0
+
+
+class TestVectorIndex:
+    """Test cases for VectorIndex."""
+
+    def test_search_ranks_by_cosine_similarity(self, kb_chunks):
+        """Test that the most similar chunk comes first with its score."""
+        embedder = HashingEmbedder()
+        index = VectorIndex.build(kb_chunks, embedder)
+
+        results = index.search(embedder.embed(["RTO and RPO"])[0], top_k=3)
+
+        assert results[0].id == "c0"
+        assert [r.score for r in results] == sorted(
+            (r.score for r in results), reverse=True
+        )
+        assert len(results) == 3
+
+    def test_metadata_filter_restricts_results(self, kb_chunks):
+        """Test that only chunks matching the filter are returned."""
+        embedder = HashingEmbedder()
+        index = VectorIndex.build(kb_chunks, embedder)
+        query = embedder.embed(["RTO and RPO"])[0]
+
+        results = index.search(query, top_k=5, metadata_filter={"offering": ["bcdr"]})
+        cloud = index.search(query, top_k=5, metadata_filter={"offering": "nope"})
+
+        assert {r.metadata["offering"] for r in results} == {"bcdr"}
+        assert len(results) == 2
+        assert cloud == []
+
+    def test_round_trips_through_a_directory(self, kb_chunks, tmp_path):
+        """Test that a saved index loads with the same rows and model name."""
+        index = VectorIndex.build(kb_chunks, HashingEmbedder())
+        index.save(tmp_path / "index")
+
+        loaded = load_index(str(tmp_path / "index"))
+
+        assert loaded.model_name == "hashing-512"
+        assert [c.id for c in loaded.chunks] == [c.id for c in kb_chunks]
+        np.testing.assert_array_equal(loaded.vectors, index.vectors)
+
+
+def test_add_and_remove_keep_rows_aligned(kb_chunks):
+    """Test that rows added and removed in place search like a fresh build."""
+    embedder = HashingEmbedder()
+    index = VectorIndex.build(kb_chunks[:4], embedder)
+    index.quantize("int8")
+    index.build_ivf(nlist=2)
+
+    index.add(kb_chunks[4:], embedder.embed([c.content for c in kb_chunks[4:]]))
+    index.remove(np.array([0, 2]))
+    query = embedder.embed(["Landing zones set up cloud accounts."])[0]
+
+    assert [c.id for c in index.chunks] == ["c1", "c3", "c4", "c5"]
+    assert index.search(query, top_k=1, nprobe=2)[0].id == "c5"
+    assert len(index.metadata_index.resolve({"offering": "bcdr"})) == 1
+    assert sorted(index.ivf.rows.tolist()) == [0, 1, 2, 3]
+
+
+def test_keyword_search_finds_exact_terms(kb_chunks, tmp_path):
+    """Test BM25 search, its filter, and that the postings are saved."""
+    index = VectorIndex.build(kb_chunks, HashingEmbedder())
+    index.save(tmp_path / "index")
+    loaded = VectorIndex.load(tmp_path / "index")
+    loaded.add(
+        [kb_chunks[0].model_copy(update={"id": "c6", "content": "RPO of 15 min."})],
+        HashingEmbedder().embed(["RPO of 15 min."]),
+    )
+
+    results = loaded.keyword_search("what RPO do we need", top_k=3)
+    filtered = loaded.keyword_search("RPO", metadata_filter={"offering": "nope"})
+
+    assert [r.id for r in results] == ["c6", "c0"]
+    assert results[0].score > results[1].score > 0
+    assert filtered == []
+
+
+def test_keyword_search_needs_bm25(kb_chunks):
+    """Test that an index built without postings fails loudly."""
+    index = VectorIndex(
+        HashingEmbedder().embed([c.content for c in kb_chunks]), kb_chunks
+    )
+
+    with pytest.raises(ValueError, match="build_bm25"):
+        index.keyword_search("RPO")
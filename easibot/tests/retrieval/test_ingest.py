@@ -0,0 +1,173 @@
+"""Tests for incremental document ingestion."""
+
+import numpy as np
+import pytest
+
+from easibot.retrieval import (
+    Document,
+    VectorIndex,
+    chunk_document,
+    ingest_document,
+)
+from easibot.tools.embeddings import HashingEmbedder
+
+
+class CountingEmbedder(HashingEmbedder):
+    """Hashing embedder that counts its embed calls."""
+
+    def __init__(self):
+        """Initialize the embedder with no calls made."""
+        super().__init__()
+        self.calls = 0
+
+    def embed(self, texts: list[str]) -> np.ndarray:
+        """Embed texts and count the call."""
+        self.calls += 1
+        return super().embed(texts)
+
+
+def playbook(paragraphs: int = 60, edited: int | None = None) -> str:
+    """Return a multi-paragraph document, optionally with one paragraph edited."""
+    return "\n\n".join(
+        f"Step {i}: {'rewritten' if i == edited else 'verify'} replication for "
+        f"tier {i % 7} workloads before failover to the secondary region."
+        for i in range(paragraphs)
+    )
+
+
+def empty_index() -> VectorIndex:
+    """Return an index with no chunks yet."""
+    return VectorIndex(np.zeros((0, 0), dtype=np.float32), [], "hashing-512")
+
+
+def test_chunk_document_packs_paragraphs_and_splits_long_ones():
+    """Test that chunks respect max_chars and keep every word."""
+    text = playbook(20) + "\n\n" + "A very long sentence. " * 40
+
+    chunks = chunk_document(text, max_chars=300)
+
+    assert all(len(c) <= 300 for c in chunks)
+    assert " ".join(" ".join(chunks).split()) == " ".join(text.split())
+
+
+class TestIngestDocument:
+    """Test cases for ingest_document."""
+
+    def test_reuploading_unchanged_document_embeds_nothing(self):
+        """Test that a second upload of the same text costs no embedding calls."""
+        index, embedder = empty_index(), CountingEmbedder()
+        document = Document(name="dr.md", content=playbook(), offering="bcdr")
+        first = ingest_document(index, embedder, document, max_chars=400)
+        calls = embedder.calls
+
+        again = ingest_document(index, embedder, document, max_chars=400)
+
+        assert first.embedded == first.chunks == len(index)
+        assert embedder.calls == calls
+        assert again.embedded == again.added == again.removed == 0
+        assert again.unchanged == first.chunks
+        assert not again.changed
+
+    def test_edit_reembeds_only_changed_chunks(self):
+        """Test that editing one paragraph re-embeds a few chunks, not all."""
+        index, embedder = empty_index(), CountingEmbedder()
+        ingest_document(
+            index,
+            embedder,
+            Document(name="dr.md", content=playbook(), offering="bcdr"),
+            max_chars=400,
+        )
+        before = len(index)
+
+        result = ingest_document(
+            index,
+            embedder,
+            Document(name="dr.md", content=playbook(edited=30), offering="bcdr"),
+            max_chars=400,
+        )
+
+        assert 1 <= result.embedded <= 3
+        assert result.removed == result.added == result.embedded
+        assert len(index) == before
+        assert len({c.id for c in index.chunks}) == len(index)
+        assert "rewritten" in index.keyword_search("rewritten", top_k=1)[0].content
+        assert len(index.bm25) == len(index)
+
+    def test_writes_offering_metadata_and_batches_embeddings(self):
+        """Test chunk metadata and that embedding happens in batch_size calls."""
+        index, embedder = empty_index(), CountingEmbedder()
+
+        result = ingest_document(
+            index,
+            embedder,
+            Document(
+                name="dr.md",
+                content=playbook(),
+                offering="bcdr",
+                metadata={"type": "playbook"},
+            ),
+            max_chars=200,
+            batch_size=8,
+        )
+
+        assert result.embedding_calls == embedder.calls == -(-result.embedded // 8)
+        assert {c.metadata["offering"] for c in index.chunks} == {"bcdr"}
+        assert {c.metadata["type"] for c in index.chunks} == {"playbook"}
+        assert len(index.metadata_index.resolve({"offering": "bcdr"})) == len(index)
+
+    def test_metadata_change_reuses_vectors(self):
+        """Test that chunks with the same text keep their vectors."""
+        index, embedder = empty_index(), CountingEmbedder()
+        ingest_document(
+            index,
+            embedder,
+            Document(name="dr.md", content=playbook(), offering="bcdr"),
+        )
+        calls = embedder.calls
+
+        result = ingest_document(
+            index,
+            embedder,
+            Document(name="dr.md", content=playbook(), offering="cloud-modernization"),
+        )
+
+        assert embedder.calls == calls
+        assert result.embedded == 0
+        assert result.added == result.removed == len(index)
+        assert not len(index.metadata_index.resolve({"offering": "bcdr"}))
+
+    def test_other_documents_stay_searchable(self, kb_chunks):
+        """Test that updates touch only their document's rows, IVF included."""
+        embedder = HashingEmbedder()
+        index = VectorIndex.build(kb_chunks, embedder)
+        index.build_ivf(nlist=2)
+        ingest_document(
+            index,
+            embedder,
+            Document(name="dr.md", content=playbook(), offering="bcdr"),
+            max_chars=400,
+        )
+
+        ingest_document(
+            index,
+            embedder,
+            Document(name="dr.md", content=playbook(10), offering="bcdr"),
+            max_chars=400,
+        )
+        query = embedder.embed(["retire redundant applications"])[0]
+
+        assert index.search(query, top_k=1)[0].id == "c2"
+        assert index.search(query, top_k=1, nprobe=2)[0].id == "c2"
+        assert len(index.ivf.rows) == len(index)
+        assert [c.id for c in index.chunks[:6]] == [c.id for c in kb_chunks]
+
+    def test_rejects_a_different_embedding_model(self, kb_chunks):
+        """Test that vectors from another model are not mixed into the index."""
+        index = VectorIndex.build(kb_chunks, HashingEmbedder())
+
+        with pytest.raises(ValueError, match="hashing-512"):
+            ingest_document(
+                index,
+                HashingEmbedder(dim=64),
+                Document(name="dr.md", content="text", offering="bcdr"),
+            )
@@ -0,0 +1,110 @@
+"""Tests for the IVF approximate index."""
+
+import json
+
+import numpy as np
+import pytest
+
+from easibot.retrieval import Chunk, IVFIndex, VectorIndex, load_index
+from easibot.tools.embeddings import normalize_rows
+
+
+def clustered_index(size: int = 2000, dim: int = 32) -> VectorIndex:
+    """Build an index of unit vectors drawn around 20 topic centres."""
+    rng = np.random.default_rng(0)
+    centres = rng.standard_normal((20, dim))
+    vectors = normalize_rows(
+        centres[rng.integers(20, size=size)] + 0.3 * rng.standard_normal((size, dim))
+    ).astype(np.float32)
+    chunks = [
+        Chunk(
+            id=str(i),
+            source="s",
+            content="",
+            metadata={"offering": str(i % 2), "tier": "rare" if i < 20 else "common"},
+        )
+        for i in range(size)
+    ]
+    return VectorIndex(vectors, chunks)
+
+
+class TestIVFIndex:
+    """Test cases for IVFIndex."""
+
+    def test_every_row_lands_in_exactly_one_list(self):
+        """Test the CSR layout of the lists."""
+        index = clustered_index()
+        ivf = IVFIndex.build(index.vectors, nlist=16)
+
+        assert ivf.nlist == 16
+        assert ivf.offsets[-1] == len(index)
+        np.testing.assert_array_equal(np.sort(ivf.rows), np.arange(len(index)))
+
+    def test_probing_every_list_matches_exact_search(self):
+        """Test that nprobe == nlist degenerates to exact search."""
+        index = clustered_index()
+        index.build_ivf(nlist=16)
+        query = index.vectors[7]
+
+        exact = index.search(query, top_k=10)
+        approximate = index.search(query, top_k=10, nprobe=16)
+
+        assert [r.id for r in approximate] == [r.id for r in exact]
+
+    def test_few_probes_keep_high_recall(self):
+        """Test that a handful of probes finds most true neighbours."""
+        index = clustered_index()
+        index.build_ivf(nlist=32)
+        recalls = []
+        for row in range(0, 200, 10):
+            exact = {r.id for r in index.search(index.vectors[row], top_k=10)}
+            found = index.search(index.vectors[row], top_k=10, nprobe=4)
+            recalls.append(len(exact & {r.id for r in found}) / 10)
+
+        assert np.mean(recalls) > 0.9
+
+    def test_filter_applies_to_candidates(self):
+        """Test that approximate search honours the metadata filter."""
+        index = clustered_index()
+        index.build_ivf(nlist=16)
+
+        results = index.search(
+            index.vectors[3], top_k=5, metadata_filter={"offering": "1"}, nprobe=4
+        )
+
+        assert results
+        assert {r.metadata["offering"] for r in results} == {"1"}
+
+    def test_selective_filter_is_scored_exactly(self):
+        """Test that a filter smaller than the probed lists skips the IVF lists."""
+        index = clustered_index()
+        index.build_ivf(nlist=16)
+        query = index.vectors[100]
+
+        exact = index.search(query, top_k=5, metadata_filter={"tier": "rare"})
+        approximate = index.search(
+            query, top_k=5, metadata_filter={"tier": "rare"}, nprobe=1
+        )
+
+        assert [r.id for r in approximate] == [r.id for r in exact]
+        assert len(approximate) == 5
+
+    def test_approximate_search_requires_lists(self):
+        """Test the error when nprobe is given without an IVF index."""
+        index = clustered_index(size=10)
+
+        with pytest.raises(ValueError, match="build_ivf"):
+            index.search(index.vectors[0], nprobe=2)
+
+    def test_lists_persist_alongside_embeddings(self, tmp_path):
+        """Test that the IVF file is saved, listed in the manifest and reloaded."""
+        index = clustered_index()
+        index.build_ivf(nlist=16)
+        index.save(tmp_path)
+
+        loaded = load_index(str(tmp_path))
+        manifest = json.loads((tmp_path / "manifest.json").read_text())
+
+        assert "ivf.npz" in manifest["files"]
+        np.testing.assert_array_equal(loaded.ivf.rows, index.ivf.rows)
+        np.testing.assert_array_equal(loaded.ivf.centroids, index.ivf.centroids)
@@ -0,0 +1,218 @@
+"""Tests for loading RAG indexes from S3."""
+
+import json
+import time
+
+import pytest
+
+from easibot.retrieval import (
+    IndexConflictError,
+    VectorIndex,
+    fetch_index,
+    load_index,
+    loader,
+    upload_index,
+    writer_lock,
+)
+from easibot.retrieval.index import IVF_FILE, manifest_files
+from easibot.retrieval.loader import (
+    ETAGS_FILE,
+    LOCK_FILE,
+    VERSION_FIELD,
+    VERSIONS_DIR,
+)
+from easibot.tools.embeddings import HashingEmbedder
+
+URI = "s3://kb-bucket/indexes/main"
+
+
+def downloads(fake_s3) -> list[str]:
+    """Return the keys downloaded or fetched with a GET, in order."""
+    return [key for operation, key in fake_s3.requests if operation == "Download"]
+
+
+def version_keys(fake_s3) -> set[str]:
+    """Return the keys of the versioned data files stored in S3."""
+    return {key for _, key in fake_s3.objects if "/versions/" in key}
+
+
+def manifest_keys(fake_s3) -> set[str]:
+    """Return the keys of the data files the S3 manifest lists."""
+    manifest = json.loads(fake_s3.objects["kb-bucket", "indexes/main/manifest.json"])
+    version = manifest[VERSION_FIELD]
+    return {
+        f"indexes/main/{VERSIONS_DIR}/{version}/{name}"
+        for name in manifest_files(manifest)
+    }
+
+
+class TestDownloadIndex:
+    """Test cases for downloading an index from S3."""
+
+    def test_unchanged_index_is_not_downloaded_again(
+        self, kb_chunks, fake_s3, tmp_path
+    ):
+        """Test that a second load costs one conditional GET and no downloads."""
+        VectorIndex.build(kb_chunks, HashingEmbedder()).save(tmp_path / "built")
+        upload_index(tmp_path / "built", URI)
+        cache = tmp_path / "cache"
+        first = load_index(URI, cache)
+        fake_s3.requests.clear()
+
+        second = load_index(URI, cache)
+
+        assert downloads(fake_s3) == []
+        assert fake_s3.requests == [("GetObject", "indexes/main/manifest.json")]
+        assert len(first) == len(second) == len(kb_chunks)
+
+    def test_only_changed_files_are_downloaded(self, kb_chunks, fake_s3, tmp_path):
+        """Test that files whose ETag is unchanged are kept from the cache."""
+        index = VectorIndex.build(kb_chunks, HashingEmbedder())
+        index.save(tmp_path / "built")
+        upload_index(tmp_path / "built", URI)
+        cache = tmp_path / "cache"
+        load_index(URI, cache)
+
+        # A writer elsewhere adds an IVF index; the other files are unchanged
+        index.build_ivf(nlist=2)
+        index.save(tmp_path / "built")
+        upload_index(tmp_path / "built", URI)
+        fake_s3.requests.clear()
+        loaded = load_index(URI, cache)
+
+        assert [key.rsplit("/", 1)[1] for key in downloads(fake_s3)] == [IVF_FILE]
+        assert loaded.ivf is not None
+
+    def test_missing_local_file_is_restored(self, kb_chunks, fake_s3, tmp_path):
+        """Test that a deleted cache file is downloaded again."""
+        VectorIndex.build(kb_chunks, HashingEmbedder()).save(tmp_path / "built")
+        upload_index(tmp_path / "built", URI)
+        local = fetch_index(URI, tmp_path / "cache")
+        (local / "chunks.jsonl").unlink()
+        fake_s3.requests.clear()
+
+        fetch_index(URI, tmp_path / "cache")
+
+        assert [key.rsplit("/", 1)[1] for key in downloads(fake_s3)] == ["chunks.jsonl"]
+
+    def test_uploaded_directory_needs_no_download(self, kb_chunks, fake_s3, tmp_path):
+        """Test that the writer's own directory is recorded as current."""
+        local = tmp_path / "cache" / "kb-bucket" / "indexes" / "main"
+        VectorIndex.build(kb_chunks, HashingEmbedder()).save(local)
+        upload_index(local, URI)
+        fake_s3.requests.clear()
+
+        assert fetch_index(URI, tmp_path / "cache") == local
+        assert downloads(fake_s3) == []
+        assert (local / ETAGS_FILE).exists()
+
+    def test_missing_index_is_none(self, fake_s3, tmp_path):
+        """Test that an empty prefix has no index yet."""
+        assert fetch_index(URI, tmp_path / "cache") is None
+
+    def test_version_replaced_during_download_is_retried(
+        self, kb_chunks, fake_s3, tmp_path, monkeypatch
+    ):
+        """Test that a download restarts when its version's files are removed."""
+        VectorIndex.build(kb_chunks, HashingEmbedder()).save(tmp_path / "built")
+        upload_index(tmp_path / "built", URI)
+        download_file = fake_s3.download_file
+
+        def replace_first(bucket: str, key: str, filename: str) -> None:
+            monkeypatch.setattr(fake_s3, "download_file", download_file)
+            VectorIndex.build(kb_chunks[:3], HashingEmbedder()).save(tmp_path / "built")
+            upload_index(tmp_path / "built", URI)
+            download_file(bucket, key, filename)
+
+        monkeypatch.setattr(fake_s3, "download_file", replace_first)
+
+        assert len(load_index(URI, tmp_path / "cache")) == 3
+
+
+class TestUploadIndex:
+    """Test cases for uploading an index to S3."""
+
+    def test_stale_copy_is_not_uploaded_over_a_newer_index(
+        self, kb_chunks, fake_s3, tmp_path
+    ):
+        """Test that the manifest write fails if S3 changed since the download."""
+        VectorIndex.build(kb_chunks, HashingEmbedder()).save(tmp_path / "built")
+        upload_index(tmp_path / "built", URI)
+        first = fetch_index(URI, tmp_path / "first")
+        second = fetch_index(URI, tmp_path / "second")
+        VectorIndex.build(kb_chunks[:4], HashingEmbedder()).save(first)
+        upload_index(first, URI)
+        manifest = fake_s3.objects["kb-bucket", "indexes/main/manifest.json"]
+
+        VectorIndex.build(kb_chunks[:2], HashingEmbedder()).save(second)
+        with pytest.raises(IndexConflictError, match=URI):
+            upload_index(second, URI)
+
+        assert fake_s3.objects["kb-bucket", "indexes/main/manifest.json"] == manifest
+        assert len(load_index(URI, tmp_path / "first")) == 4
+        assert version_keys(fake_s3) == manifest_keys(fake_s3)
+
+    def test_data_files_are_invisible_until_the_manifest_is_written(
+        self, kb_chunks, fake_s3, tmp_path, monkeypatch
+    ):
+        """Test that readers keep the old version while a new one uploads."""
+        VectorIndex.build(kb_chunks, HashingEmbedder()).save(tmp_path / "built")
+        upload_index(tmp_path / "built", URI)
+        upload_file = fake_s3.upload_file
+        seen = []
+
+        def upload_and_read(filename: str, bucket: str, key: str) -> None:
+            upload_file(filename, bucket, key)
+            seen.append(len(load_index(URI, tmp_path / "reader")))
+
+        monkeypatch.setattr(fake_s3, "upload_file", upload_and_read)
+        VectorIndex.build(kb_chunks[:2], HashingEmbedder()).save(tmp_path / "built")
+        upload_index(tmp_path / "built", URI)
+
+        assert set(seen) == {len(kb_chunks)}
+        assert len(load_index(URI, tmp_path / "reader")) == 2
+
+    def test_replaced_version_is_removed(self, kb_chunks, fake_s3, tmp_path):
+        """Test that only the current version's files are kept in S3."""
+        VectorIndex.build(kb_chunks, HashingEmbedder()).save(tmp_path / "built")
+        upload_index(tmp_path / "built", URI)
+        VectorIndex.build(kb_chunks[:2], HashingEmbedder()).save(tmp_path / "built")
+        upload_index(tmp_path / "built", URI)
+
+        assert version_keys(fake_s3) == manifest_keys(fake_s3)
+
+
+class TestWriterLock:
+    """Test cases for the S3 writer lock."""
+
+    def test_second_writer_waits_for_the_lock(self, fake_s3, monkeypatch):
+        """Test that a held lock blocks other writers and is released after."""
+        monkeypatch.setattr(loader, "LOCK_POLL_SECONDS", 0)
+
+        with writer_lock(URI, lease_seconds=60):
+            with (
+                pytest.raises(TimeoutError, match="locked"),
+                writer_lock(URI, lease_seconds=0.01),
+            ):
+                pass
+            assert ("kb-bucket", f"indexes/main/{LOCK_FILE}") in fake_s3.objects
+
+        assert not fake_s3.objects
+
+    def test_expired_lock_is_taken_over(self, fake_s3):
+        """Test that a lock left by a crashed writer is replaced."""
+        key = ("kb-bucket", f"indexes/main/{LOCK_FILE}")
+        fake_s3.objects[key] = json.dumps({"expires": time.time() - 1}).encode()
+
+        with writer_lock(URI, lease_seconds=60):
+            held = json.loads(fake_s3.objects[key])
+
+        assert held["expires"] > time.time()
+        assert key not in fake_s3.objects
+
+    def test_local_directories_need_no_lock(self, fake_s3, tmp_path):
+        """Test that local indexes make no S3 requests."""
+        with writer_lock(str(tmp_path), lease_seconds=60):
+            pass
+
+        assert fake_s3.requests == []
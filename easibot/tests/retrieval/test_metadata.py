@@ -0,0 +1,62 @@
+"""Tests for the metadata inverted index."""
+
+import numpy as np
+import pytest
+
+from easibot.retrieval import MetadataIndex
+
+ROWS = [
+    {"offering": "bcdr", "type": "playbook"},
+    {"offering": "bcdr", "type": "template"},
+    {"offering": "cloud-modernization", "type": "playbook"},
+    {"offering": "app-rationalization"},
+    {"offering": "cloud-modernization", "type": "template"},
+]
+
+
+@pytest.fixture
+def index():
+    """Index over ROWS."""
+    return MetadataIndex.build(ROWS)
+
+
+@pytest.mark.parametrize(
+    ("metadata_filter", "expected"),
+    [
+        ({"offering": "bcdr"}, [0, 1]),
+        ({"offering": ["bcdr", "app-rationalization"]}, [0, 1, 3]),
+        ({"offering": "bcdr", "type": "template"}, [1]),
+        (
+            {"$or": [{"offering": "app-rationalization"}, {"type": "template"}]},
+            [1, 3, 4],
+        ),
+        (
+            {
+                "$and": [
+                    {"offering": ["bcdr", "cloud-modernization"]},
+                    {"$or": [{"type": "playbook"}, {"offering": "nope"}]},
+                ]
+            },
+            [0, 2],
+        ),
+        ({"offering": "nope"}, []),
+        ({"type": ["playbook"], "offering": []}, []),
+        ({}, [0, 1, 2, 3, 4]),
+    ],
+)
+def test_resolve(index, metadata_filter, expected):
+    """Test AND across keys, IN for lists and nested $and/$or."""
+    np.testing.assert_array_equal(index.resolve(metadata_filter), expected)
+
+
+def test_postings_are_sorted_row_arrays(index):
+    """Test the compact postings layout."""
+    assert index.count == len(ROWS)
+    assert index.rows("type", "playbook").tolist() == [0, 2]
+    assert index.rows("type", "missing").dtype == np.int64
+
+
+def test_boolean_operator_needs_a_list(index):
+    """Test that a malformed $or is rejected."""
+    with pytest.raises(ValueError, match=r"\$or takes a list"):
+        index.resolve({"$or": {"offering": "bcdr"}})
@@ -0,0 +1,111 @@
+"""Tests for quantized, memory-mapped index storage."""
+
+import numpy as np
+import pytest
+
+from easibot.retrieval import VectorIndex, VectorStore
+from easibot.retrieval.store import SCORE_BLOCK_ROWS, ChunkStore, RowFile
+from easibot.tools.embeddings import HashingEmbedder, normalize_rows
+
+
+@pytest.fixture
+def vectors():
+    """Random unit vectors spanning several scoring blocks."""
+    rng = np.random.default_rng(0)
+    return normalize_rows(rng.standard_normal((3 * SCORE_BLOCK_ROWS + 7, 64))).astype(
+        np.float32
+    )
+
+
+class TestVectorStore:
+    """Test cases for VectorStore."""
+
+    @pytest.mark.parametrize(
+        ("quantization", "itemsize", "tolerance"),
+        [("float32", 4, 1e-6), ("float16", 2, 1e-3), ("int8", 1, 2e-2)],
+    )
+    def test_scores_approximate_float32(
+        self, vectors, quantization, itemsize, tolerance
+    ):
+        """Test that every storage type scores close to the float32 product."""
+        store = VectorStore.quantize(vectors, quantization)
+        query = vectors[3]
+        rows = np.arange(1, len(vectors), 2)
+
+        assert store.codes.itemsize == itemsize
+        np.testing.assert_allclose(store.score(query), vectors @ query, atol=tolerance)
+        np.testing.assert_allclose(
+            store.score(query, rows), vectors[rows] @ query, atol=tolerance
+        )
+
+    def test_int8_memory_is_about_a_quarter(self, vectors):
+        """Test the resident size of int8 codes with their scales."""
+        store = VectorStore.quantize(vectors, "int8")
+
+        assert store.nbytes < vectors.nbytes / 3.5
+        assert store.scales.dtype == np.float32
+
+    def test_rescore_needs_full_precision(self, vectors):
+        """Test that exact re-scoring uses the kept originals."""
+        rows = np.array([0, 5, 9])
+        kept = VectorStore.quantize(vectors, "int8", keep_full=True)
+        dropped = VectorStore.quantize(vectors, "int8")
+
+        np.testing.assert_array_equal(
+            kept.rescore(vectors[0], rows), vectors[rows] @ vectors[0]
+        )
+        with pytest.raises(ValueError, match="keep_full=True"):
+            dropped.rescore(vectors[0], rows)
+
+    def test_unknown_quantization_is_rejected(self, vectors):
+        """Test the error for an unsupported storage type."""
+        with pytest.raises(ValueError, match="Unknown quantization"):
+            VectorStore.quantize(vectors, "int4")
+
+
+class TestSavedIndex:
+    """Test cases for memory-mapped loading of saved indexes."""
+
+    def test_loads_memory_mapped_and_lazily(self, kb_chunks, tmp_path):
+        """Test that arrays are mapped and chunks parsed on demand."""
+        VectorIndex.build(kb_chunks, HashingEmbedder()).save(tmp_path)
+
+        loaded = VectorIndex.load(tmp_path)
+
+        assert isinstance(loaded.vectors, np.memmap)
+        assert isinstance(loaded.chunks, ChunkStore)
+        assert loaded.chunks[-1] == kb_chunks[-1]
+        assert list(loaded.chunks) == kb_chunks
+        np.testing.assert_array_equal(
+            loaded.metadata_index.resolve({"offering": "bcdr"}), [0, 1]
+        )
+
+    def test_quantized_index_round_trips_and_rescores(self, kb_chunks, tmp_path):
+        """Test int8 search with exact re-scoring after a save and load."""
+        embedder = HashingEmbedder()
+        index = VectorIndex.build(kb_chunks, embedder)
+        query = embedder.embed(["RTO and RPO"])[0]
+        expected = index.search(query, top_k=2)
+        index.quantize("int8", keep_full=True)
+        index.save(tmp_path)
+
+        loaded = VectorIndex.load(tmp_path)
+        results = loaded.search(query, top_k=2, rescore=6)
+
+        assert loaded.store.quantization == "int8"
+        assert isinstance(loaded.store.full, RowFile)
+        np.testing.assert_array_equal(loaded.store.dequantize(), index.store.full)
+        assert [r.id for r in results] == [r.id for r in expected]
+        assert [r.score for r in results] == pytest.approx(
+            [r.score for r in expected], abs=1e-6
+        )
+
+    def test_indexes_saved_before_offsets_still_load(self, kb_chunks, tmp_path):
+        """Test the line scan used when the chunk offsets file is missing."""
+        ChunkStore.write(tmp_path, kb_chunks)
+
+        chunks = ChunkStore.open(tmp_path, ["chunks.jsonl"])
+
+        assert list(chunks) == kb_chunks
+        with pytest.raises(IndexError):
+            chunks[len(kb_chunks)]
@@ -0,0 +1,75 @@
+"""Tests for the compiled intent matcher."""
+
+from easibot.routing import INTENT_MATCHER, IntentMatcher
+
+
+class TestIntentMatcher:
+    """Test cases for IntentMatcher."""
+
+    def test_scores_every_intent(self):
+        """Test that the score vector covers every intent in table order."""
+        scores = INTENT_MATCHER.score("Hello there")
+
+        assert list(scores) == [
+            "research",
+            "app_rationalization",
+            "bcdr",
+            "tech_strategy",
+            "cloud_modernization",
+            "deliverable",
+        ]
+        assert not any(scores.values())
+
+    def test_counts_hits_per_intent(self):
+        """Test that repeated keywords are counted, case-insensitively."""
+        scores = INTENT_MATCHER.score("Cloud migration to AWS; more CLOUD please")
+
+        assert scores["cloud_modernization"] == 4
+
+    def test_word_boundaries_prevent_substring_misfires(self):
+        """Test that keywords do not match inside longer words."""
+        scores = INTENT_MATCHER.score("Give me an explanation of the drill")
+
+        assert scores["deliverable"] == 0
+        assert scores["bcdr"] == 0
+
+    def test_dr_counts_only_in_bcdr_phrases(self):
+        """Test that a "Dr." title does not score for BC/DR but a DR plan does."""
+        doctor = INTENT_MATCHER.score("Dr. Smith wants an application inventory")
+        plan = INTENT_MATCHER.score("Write a DR  plan for the payments service")
+
+        assert doctor["bcdr"] == 0
+        assert plan["bcdr"] == 1
+        assert plan["deliverable"] == 1
+
+    def test_shared_keyword_counts_for_each_intent(self):
+        """Test that a keyword listed under two intents scores for both."""
+        scores = INTENT_MATCHER.score("Define our strategy")
+
+        assert scores["tech_strategy"] == 1
+        assert scores["deliverable"] == 1
+
+    def test_multi_word_phrases_tolerate_whitespace(self):
+        """Test that phrases match across irregular whitespace."""
+        scores = INTENT_MATCHER.score("What   is\nBC/DR?")
+
+        assert scores["research"] == 1
+        assert scores["bcdr"] == 1
+
+    def test_request_after_a_long_paste_is_scored(self):
+        """Test that the whole text is read unless a cap is asked for."""
+        text = "Migrate to the cloud. " * 40 + "Please create a disaster recovery plan"
+
+        full = INTENT_MATCHER.score(text)
+        capped = INTENT_MATCHER.score(text, max_hits=10)
+
+        assert sum(capped.values()) == 10
+        assert capped["bcdr"] == 0
+        assert full["cloud_modernization"] == 80
+        assert full["bcdr"] == full["deliverable"] == 2
+
+    def test_custom_routing_table(self):
+        """Test that a matcher can be compiled from a custom table."""
+        matcher = IntentMatcher({"billing": ("invoice", "invoices")})
+
+        assert matcher.score("Two invoices and an invoice") == {"billing": 2}
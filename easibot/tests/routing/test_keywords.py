@@ -0,0 +1,74 @@
+"""Tests for the keyword routing classifier."""
+
+import pytest
+
+from easibot.config import settings
+from easibot.routing import KeywordRouter
+
+
+class TestKeywordRouter:
+    """Test cases for KeywordRouter."""
+
+    def test_single_offering_is_confident(self):
+        """Test that a request naming one offering routes with full confidence."""
+        decision = KeywordRouter().classify("I need a disaster recovery plan")
+
+        assert decision.next_specialist == "bcdr"
+        assert decision.confidence == 1.0
+        assert decision.method == "keyword"
+
+    def test_no_keywords_defaults_to_research(self):
+        """Test that unmatched requests default to research with zero confidence."""
+        decision = KeywordRouter().classify("Some query")
+
+        assert decision.next_specialist == "research"
+        assert decision.confidence == 0.0
+
+    def test_mixed_offerings_lower_confidence(self):
+        """Test that requests spanning several rules are less confident."""
+        decision = KeywordRouter(parallel=()).classify(
+            "Application portfolio review ahead of a cloud move"
+        )
+
+        assert decision.next_specialist == "app_rationalization"
+        assert 0.0 < decision.confidence < 1.0
+
+    def test_priority_order_breaks_ties(self):
+        """Test that the first matching rule wins regardless of hit count."""
+        decision = KeywordRouter().classify("What is application rationalization?")
+
+        assert decision.next_specialist == "research"
+
+    def test_cross_offering_work_fans_out(self):
+        """Test that a work request naming several offerings dispatches each."""
+        decision = KeywordRouter().classify(
+            "Rationalize our application portfolio and write a disaster recovery "
+            "plan with RTO targets for what we keep"
+        )
+
+        assert decision.parallel_specialists == ["app_rationalization", "bcdr"]
+        assert decision.next_specialist == "app_rationalization"
+        assert decision.confidence == 1.0
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "Build a cloud migration roadmap",
+            "Rationalize our portfolio and give me a DR plan for what we keep",
+        ],
+    )
+    def test_passing_mentions_leave_fan_out_to_the_llm(self, text):
+        """Test that an offering with a single hit keeps confidence low."""
+        decision = KeywordRouter().classify(text)
+
+        assert len(decision.parallel_specialists) == 2
+        assert decision.confidence < settings.routing_confidence_threshold
+
+    def test_research_requests_do_not_fan_out(self):
+        """Test that informational requests stay on the research route."""
+        decision = KeywordRouter().classify(
+            "What is application rationalization and disaster recovery?"
+        )
+
+        assert decision.next_specialist == "research"
+        assert decision.parallel_specialists == []
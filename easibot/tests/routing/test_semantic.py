@@ -0,0 +1,78 @@
+"""Tests for the embedding-centroid semantic router."""
+
+import numpy as np
+import pytest
+
+from easibot.routing import SemanticRouter
+from easibot.routing.semantic import (
+    DEFAULT_EXAMPLES_PATH,
+    load_examples,
+    train_centroids,
+)
+from easibot.tools.embeddings import HashingEmbedder
+
+
+@pytest.fixture
+def router():
+    """Semantic router trained on the shipped examples with a hashing embedder."""
+    embedder = HashingEmbedder()
+    labels, centroids = train_centroids(load_examples(DEFAULT_EXAMPLES_PATH), embedder)
+    return SemanticRouter(labels, centroids, embedder)
+
+
+class TestSemanticRouter:
+    """Test cases for SemanticRouter."""
+
+    def test_centroids_cover_every_label(self, router):
+        """Test that one normalized centroid is trained per specialist."""
+        assert set(router.labels) == {
+            "research",
+            "app_rationalization",
+            "bcdr",
+            "tech_strategy",
+            "cloud_modernization",
+        }
+        np.testing.assert_allclose(np.linalg.norm(router.centroids, axis=1), 1.0)
+
+    def test_classify_training_example(self, router):
+        """Test that a labelled example routes to its own specialist."""
+        decision = router.classify(
+            "Define RTO and RPO targets for our critical services"
+        )
+
+        assert decision.next_specialist == "bcdr"
+        assert decision.method == "semantic"
+        assert 0.0 < decision.confidence <= 1.0
+
+    def test_reasoning_reports_the_cosine_similarity(self, router):
+        """Test that the decision names the closest centroid's similarity."""
+        decision = router.classify("Move the on-prem SQL Server estate to Azure")
+
+        assert decision.next_specialist == "cloud_modernization"
+        cosine = float(decision.reasoning.rsplit(" ", 1)[1].rstrip(")"))
+        assert -1.0 <= cosine <= 1.0
+
+    def test_save_and_load_round_trip(self, router, tmp_path):
+        """Test that saved centroids load back unchanged."""
+        path = tmp_path / "centroids.npz"
+        router.save(path)
+
+        loaded = SemanticRouter.load(path, HashingEmbedder())
+
+        assert loaded.labels == router.labels
+        np.testing.assert_allclose(loaded.centroids, router.centroids)
+
+    def test_save_returns_the_npz_path_written(self, router, tmp_path):
+        """Test that a path without .npz reports the file np.savez created."""
+        path = router.save(tmp_path / "centroids")
+
+        assert path == tmp_path / "centroids.npz"
+        assert SemanticRouter.load(path, HashingEmbedder()).labels == router.labels
+
+    def test_load_rejects_different_model(self, router, tmp_path):
+        """Test that centroids cannot be used with a different embedder."""
+        path = tmp_path / "centroids.npz"
+        router.save(path)
+
+        with pytest.raises(ValueError, match="trained with"):
+            SemanticRouter.load(path, HashingEmbedder(dim=64))
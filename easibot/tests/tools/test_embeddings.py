@@ -0,0 +1,36 @@
+"""Tests for embedding backends."""
+
+import numpy as np
+import pytest
+
+from easibot.tools.embeddings import HashingEmbedder, get_embedder
+
+
+class TestHashingEmbedder:
+    """Test cases for HashingEmbedder."""
+
+    def test_embeddings_are_normalized_and_deterministic(self):
+        """Test that rows are unit length and repeatable across calls."""
+        embedder = HashingEmbedder(dim=64)
+
+        first = embedder.embed(["disaster recovery plan", ""])
+        second = embedder.embed(["disaster recovery plan", ""])
+
+        assert first.shape == (2, 64)
+        assert first.dtype == np.float32
+        np.testing.assert_allclose(np.linalg.norm(first[0]), 1.0, rtol=1e-6)
+        np.testing.assert_array_equal(first, second)
+
+    def test_similar_texts_score_higher(self):
+        """Test that overlapping texts are closer than unrelated ones."""
+        vectors = HashingEmbedder().embed(
+            ["disaster recovery plan", "recovery plan for disasters", "cloud bill"]
+        )
+
+        assert vectors[0] @ vectors[1] > vectors[0] @ vectors[2]
+
+
+def test_get_embedder_rejects_unknown_backend():
+    """Test that unknown backends raise a clear error."""
+    with pytest.raises(ValueError, match="Unknown embedding backend"):
+        get_embedder("word2vec")
@@ -0,0 +1,299 @@
+"""Tests for the knowledge-base search tool."""
+
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import Future
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import pytest
+
+from easibot.agents.research import ResearchSpecialist
+from easibot.retrieval import (
+    Chunk,
+    VectorIndex,
+    load_index,
+    local_index_dir,
+    upload_index,
+)
+from easibot.tools import rag_search
+from easibot.tools.embeddings import HashingEmbedder
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+
+@pytest.fixture
+def rag_index(kb_chunks, tmp_path, monkeypatch):
+    """Point settings at a saved hashing-embedder index."""
+    VectorIndex.build(kb_chunks, HashingEmbedder()).save(tmp_path / "index")
+    monkeypatch.setattr(rag_search.settings, "rag_index_uri", str(tmp_path / "index"))
+    monkeypatch.setattr(rag_search.settings, "rag_embedder", "hashing")
+    rag_search.reset_index()
+    yield
+    rag_search.reset_index()
+
+
+class TestSearchKnowledgeBase:
+    """Test cases for search_knowledge_base."""
+
+    def test_returns_ranked_results_with_scores(self, rag_index):
+        """Test that results come back as dicts, best first."""
+        results = rag_search.search_knowledge_base("failover region", top_k=2)
+
+        assert results[0]["id"] == "c1"
+        assert results[0]["score"] >= results[1]["score"]
+        assert set(results[0]) == {"id", "source", "content", "metadata", "score"}
+
+    def test_honors_metadata_filter(self, rag_index):
+        """Test that the offering filter is applied before ranking."""
+        results = rag_search.search_knowledge_base(
+            "failover region", {"offering": ["cloud-modernization"]}
+        )
+
+        assert {r["metadata"]["offering"] for r in results} == {"cloud-modernization"}
+
+    def test_ivf_backend_needs_ivf_lists(self, rag_index, monkeypatch):
+        """Test that selecting the IVF backend for an exact-only index fails loudly."""
+        monkeypatch.setattr(rag_search.settings, "rag_search_backend", "ivf")
+
+        with pytest.raises(ValueError, match="no IVF lists"):
+            rag_search.search_knowledge_base("failover region")
+
+    def test_ivf_backend_searches_approximately(self, kb_chunks, tmp_path, monkeypatch):
+        """Test the IVF backend end to end against an index saved with lists."""
+        index = VectorIndex.build(kb_chunks, HashingEmbedder())
+        index.build_ivf(nlist=2)
+        index.save(tmp_path / "ivf-index")
+        monkeypatch.setattr(
+            rag_search.settings, "rag_index_uri", str(tmp_path / "ivf-index")
+        )
+        monkeypatch.setattr(rag_search.settings, "rag_embedder", "hashing")
+        monkeypatch.setattr(rag_search.settings, "rag_search_backend", "ivf")
+        monkeypatch.setattr(rag_search.settings, "rag_ivf_nprobe", 2)
+        rag_search.reset_index()
+
+        results = rag_search.search_knowledge_base("failover region", top_k=1)
+        rag_search.reset_index()
+
+        assert results[0]["id"] == "c1"
+
+    def test_rescoring_needs_full_precision_vectors(
+        self, kb_chunks, tmp_path, monkeypatch
+    ):
+        """Test that re-scoring an int8 index saved without originals fails loudly."""
+        index = VectorIndex.build(kb_chunks, HashingEmbedder())
+        index.quantize("int8")
+        index.save(tmp_path / "int8-index")
+        monkeypatch.setattr(
+            rag_search.settings, "rag_index_uri", str(tmp_path / "int8-index")
+        )
+        monkeypatch.setattr(rag_search.settings, "rag_embedder", "hashing")
+        monkeypatch.setattr(rag_search.settings, "rag_rescore_candidates", 20)
+        rag_search.reset_index()
+
+        with pytest.raises(ValueError, match="full-precision"):
+            rag_search.search_knowledge_base("failover region")
+        rag_search.reset_index()
+
+    def test_hybrid_mode_fuses_keyword_and_vector_rankings(
+        self, rag_index, monkeypatch
+    ):
+        """Test that hybrid results come from both stages, keyword one in a thread."""
+        monkeypatch.setattr(rag_search.settings, "rag_search_mode", "hybrid")
+        keyword_threads = []
+        keyword_search = VectorIndex.keyword_search
+
+        def record_thread(index: VectorIndex, *args: object) -> list:
+            keyword_threads.append(threading.current_thread().name)
+            return keyword_search(index, *args)
+
+        monkeypatch.setattr(VectorIndex, "keyword_search", record_thread)
+
+        results = rag_search.search_knowledge_base(
+            "RPO", {"offering": ["bcdr", "cloud-modernization"]}, top_k=3
+        )
+
+        assert results[0]["id"] == "c0"
+        assert results[0]["score"] == pytest.approx(1.0)
+        assert len(results) == 3
+        assert {r["metadata"]["offering"] for r in results} <= {
+            "bcdr",
+            "cloud-modernization",
+        }
+        assert keyword_threads[0].startswith("rag-keyword")
+
+    def test_reset_during_a_search_does_not_break_it(self, rag_index, monkeypatch):
+        """Test that a search keeps the embedder it started with."""
+        monkeypatch.setattr(rag_search.settings, "rag_search_mode", "hybrid")
+        keyword_search = VectorIndex.keyword_search
+
+        def reset_first(index: VectorIndex, *args: object) -> list:
+            rag_search.reset_index()
+            return keyword_search(index, *args)
+
+        class InlinePool:
+            """Run the keyword stage before the vector stage starts."""
+
+            def submit(self, fn: Callable, *args: object) -> Future:
+                future = Future()
+                future.set_result(fn(*args))
+                return future
+
+        monkeypatch.setattr(VectorIndex, "keyword_search", reset_first)
+        monkeypatch.setattr(rag_search, "_keyword_pool", InlinePool())
+
+        results = rag_search.search_knowledge_base("RPO", top_k=1)
+
+        assert results[0]["id"] == "c0"
+
+    def test_keyword_weight_lifts_exact_matches(self, rag_index, monkeypatch):
+        """Test that weighting the keyword ranking promotes its top result."""
+        monkeypatch.setattr(rag_search.settings, "rag_search_mode", "hybrid")
+        monkeypatch.setattr(rag_search.settings, "rag_hybrid_vector_weight", 0.0)
+
+        results = rag_search.search_knowledge_base("accounts and RPO", top_k=2)
+
+        assert {r["id"] for r in results} == {"c0", "c5"}
+
+    def test_hybrid_mode_needs_bm25_postings(self, kb_chunks, tmp_path, monkeypatch):
+        """Test that hybrid search on an index saved without BM25 fails loudly."""
+        embedder = HashingEmbedder()
+        VectorIndex(embedder.embed([c.content for c in kb_chunks]), kb_chunks).save(
+            tmp_path / "vector-only"
+        )
+        monkeypatch.setattr(
+            rag_search.settings, "rag_index_uri", str(tmp_path / "vector-only")
+        )
+        monkeypatch.setattr(rag_search.settings, "rag_embedder", "hashing")
+        monkeypatch.setattr(rag_search.settings, "rag_search_mode", "hybrid")
+        rag_search.reset_index()
+
+        with pytest.raises(ValueError, match="no BM25 postings"):
+            rag_search.search_knowledge_base("RPO")
+        rag_search.reset_index()
+
+    def test_without_index_returns_nothing(self, monkeypatch):
+        """Test the unconfigured default."""
+        monkeypatch.setattr(rag_search.settings, "rag_index_uri", None)
+
+        assert rag_search.search_knowledge_base("anything") == []
+
+
+class TestUploadDocumentToRag:
+    """Test cases for upload_document_to_rag."""
+
+    def test_uploaded_document_becomes_searchable(self, rag_index):
+        """Test that an upload is saved into the index and served by searches."""
+        rag_search.search_knowledge_base("warm up the cache")
+
+        uploaded = rag_search.upload_document_to_rag(
+            "Runbook: promote the standby database.\n\nThen repoint DNS.",
+            "runbook.md",
+            "bcdr",
+            {"type": "runbook"},
+        )
+        results = rag_search.search_knowledge_base(
+            "promote the standby database", {"document": "runbook.md"}, top_k=1
+        )
+
+        assert uploaded
+        assert results[0]["source"] == "runbook.md"
+        assert results[0]["metadata"] == {
+            "type": "runbook",
+            "offering": "bcdr",
+            "document": "runbook.md",
+        }
+
+    def test_creates_the_index_on_first_upload(self, tmp_path, monkeypatch):
+        """Test that uploading to an empty location starts a new index."""
+        monkeypatch.setattr(rag_search.settings, "rag_index_uri", str(tmp_path / "kb"))
+        monkeypatch.setattr(rag_search.settings, "rag_embedder", "hashing")
+
+        assert rag_search.upload_document_to_rag("Test failover.", "dr.md", "bcdr")
+        assert len(VectorIndex.load(tmp_path / "kb")) == 1
+
+    def test_writers_with_stale_copies_keep_each_others_documents(
+        self, fake_s3, tmp_path, monkeypatch
+    ):
+        """Test that an S3 upload starts from the latest index, not a stale copy."""
+        uri = "s3://kb-bucket/index"
+        monkeypatch.setattr(rag_search.settings, "rag_index_uri", uri)
+        monkeypatch.setattr(rag_search.settings, "rag_embedder", "hashing")
+        monkeypatch.setattr(
+            rag_search.settings, "rag_cache_dir", str(tmp_path / "this")
+        )
+        fetch_index = rag_search.fetch_index
+        rivals = ["Restore from the vault."]
+
+        def racing_fetch(uri: str) -> Path | None:
+            """Fetch, then let a writer whose lease ran out save another document."""
+            local = fetch_index(uri)
+            if rivals:
+                fetch_index(uri, tmp_path / "other")
+                other = local_index_dir(uri, tmp_path / "other")
+                index = VectorIndex.build(
+                    [Chunk(id="r", source="other.md", content=rivals.pop())],
+                    HashingEmbedder(),
+                )
+                index.save(other)
+                upload_index(other, uri)
+            return local
+
+        monkeypatch.setattr(rag_search, "fetch_index", racing_fetch)
+        rag_search.upload_document_to_rag("Test failover.", "dr.md", "bcdr")
+        index = load_index(uri, tmp_path / "reader")
+
+        assert {c.source for c in index.chunks} == {"dr.md", "other.md"}
+        assert not any(key.endswith("writer.lock") for _, key in fake_s3.objects)
+
+    def test_searches_are_not_blocked_by_an_upload(self, rag_index, monkeypatch):
+        """Test that the loaded index serves searches while an upload runs."""
+        rag_search.search_knowledge_base("warm up the cache")
+        ingesting, release = threading.Event(), threading.Event()
+        ingest_document = rag_search.ingest_document
+
+        def slow_ingest(*args: object, **kwargs: object) -> object:
+            """Hold the upload until the search has run."""
+            ingesting.set()
+            release.wait(5)
+            return ingest_document(*args, **kwargs)
+
+        monkeypatch.setattr(rag_search, "ingest_document", slow_ingest)
+        upload = threading.Thread(
+            target=rag_search.upload_document_to_rag,
+            args=("Promote the standby database.", "runbook.md", "bcdr"),
+        )
+        upload.start()
+        ingesting.wait(5)
+        try:
+            started = time.monotonic()
+            results = rag_search.search_knowledge_base("failover region", top_k=1)
+            elapsed = time.monotonic() - started
+        finally:
+            release.set()
+            upload.join(5)
+
+        assert results[0]["id"] == "c1"
+        assert elapsed < 1
+        after = rag_search.search_knowledge_base("standby database", top_k=1)
+        assert after[0]["source"] == "runbook.md"
+
+    def test_without_index_uploads_nothing(self, monkeypatch):
+        """Test the unconfigured default."""
+        monkeypatch.setattr(rag_search.settings, "rag_index_uri", None)
+
+        assert not rag_search.upload_document_to_rag("text", "doc.md", "bcdr")
+
+
+@patch("easibot.agents.research.get_chat_model")
+def test_research_retrieves_from_configured_index(mock_bedrock, rag_index):
+    """Test that research findings come from the index when one is set."""
+    findings = ResearchSpecialist().retrieve("Score apps by business value", [])
+
+    assert findings[0].content == "Score apps by business value."
+    assert findings[0].metadata == {"offering": "app-rationalization"}
+    assert 0.0 <= findings[0].relevance_score <= 1.0
@@ -0,0 +1,110 @@
+"""Text embedding backends used for semantic routing and retrieval."""
+
+import hashlib
+import re
+from itertools import pairwise
+from typing import Protocol
+
+import numpy as np
+
+
+class Embedder(Protocol):
+    """Anything that turns texts into a 2-D float32 matrix of embeddings."""
+
+    model_name: str
+
+    def embed(self, texts: list[str]) -> np.ndarray:
+        """Embed texts into an array of shape (len(texts), dim)."""
+        ...
+
+
+def normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    """L2-normalize each row so dot products equal cosine similarity."""
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return matrix / np.maximum(norms, 1e-12)
+
+
+class HashingEmbedder:
+    """Dependency-free embedder based on hashed unigrams and bigrams.
+
+    It has no notion of synonyms, but it is deterministic, fast and needs no
+    model download, which makes it suitable for tests and as an offline
+    fallback when no local embedding model is installed.
+    """
+
+    def __init__(self, dim: int = 512):
+        """Initialize the embedder.
+
+        Args:
+            dim: Number of hash buckets (embedding dimension)
+
+        """
+        self.dim = dim
+        self.model_name = f"hashing-{dim}"
+
+    def _bucket(self, token: str) -> int:
+        digest = hashlib.blake2b(token.encode(), digest_size=8).digest()
+        return int.from_bytes(digest, "little") % self.dim
+
+    def embed(self, texts: list[str]) -> np.ndarray:
+        """Embed texts as L2-normalized hashed bag-of-words vectors."""
+        matrix = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for row, text in enumerate(texts):
+            tokens = re.findall(r"\w+", text.lower())
+            features = tokens + [f"{a} {b}" for a, b in pairwise(tokens)]
+            for feature in features:
+                matrix[row, self._bucket(feature)] += 1.0
+        return normalize_rows(matrix)
+
+
+class FastEmbedEmbedder:
+    """Small CPU-local ONNX embedding model served by ``fastembed``.
+
+    Requires the optional ``semantic`` extra (``uv sync --extra semantic``).
+    The model is downloaded and loaded on first use.
+    """
+
+    def __init__(self, model_name: str = "BAAI/bge-small-en-v1.5"):
+        """Initialize the embedder.
+
+        Args:
+            model_name: fastembed model identifier
+
+        """
+        self.model_name = model_name
+        self._model = None
+
+    def embed(self, texts: list[str]) -> np.ndarray:
+        """Embed texts with the local model as L2-normalized float32 rows."""
+        if self._model is None:
+            try:
+                from fastembed import TextEmbedding
+            except ImportError as e:
+                msg = (
+                    "FastEmbedEmbedder requires the 'fastembed' package; "
+                    "install the 'semantic' extra"
+                )
+                raise ImportError(msg) from e
+            self._model = TextEmbedding(model_name=self.model_name)
+
+        vectors = np.asarray(list(self._model.embed(texts)), dtype=np.float32)
+        return normalize_rows(vectors)
+
+
+def get_embedder(backend: str, model_name: str | None = None) -> Embedder:
+    """Create an embedder by backend name.
+
+    Args:
+        backend: "fastembed" or "hashing"
+        model_name: Optional model identifier for model-backed embedders
+
+    Returns:
+        Embedder instance
+
+    """
+    if backend == "hashing":
+        return HashingEmbedder()
+    if backend == "fastembed":
+        return FastEmbedEmbedder(model_name) if model_name else FastEmbedEmbedder()
+    msg = f"Unknown embedding backend: {backend}"
+    raise ValueError(msg)
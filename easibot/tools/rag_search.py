@@ -1,10 +1,120 @@
 """RAG search tools for querying the knowledge base."""
 
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
 from typing import Any
 
 import boto3
+import numpy as np
 
 from easibot.config import settings
+from easibot.retrieval import (
+    Document,
+    IndexConflictError,
+    SearchResult,
+    VectorIndex,
+    fetch_index,
+    ingest_document,
+    load_index,
+    local_index_dir,
+    reciprocal_rank_fusion,
+    upload_index,
+    writer_lock,
+)
+from easibot.tools.embeddings import Embedder, get_embedder
+
+# The index and its query embedder, swapped together so a search that read
+# one never finds the other gone
+_loaded: tuple[VectorIndex, Embedder] | None = None
+_lock = Lock()
+
+SEARCH_BACKENDS = ("exact", "ivf")
+SEARCH_MODES = ("vector", "hybrid")
+
+# Times an upload re-reads the index after another writer changed it
+WRITE_ATTEMPTS = 3
+
+# Runs the keyword stage of hybrid searches while the calling thread embeds
+# the query and scores vectors
+_keyword_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="rag-keyword")
+
+
+def get_index() -> VectorIndex | None:
+    """Return the process-wide RAG index, loading it on first use.
+
+    Returns:
+        Index loaded from settings.rag_index_uri, or None if none is set
+
+    Raises:
+        ValueError: If the index does not fit the configured embedder, search
+            backend or search mode
+
+    """
+    loaded = _load()
+    return loaded[0] if loaded else None
+
+
+def _load() -> tuple[VectorIndex, Embedder] | None:
+    """Return the loaded index with its query embedder, loading them if needed.
+
+    Callers keep the returned pair for the whole search, so a concurrent
+    :func:`reset_index` cannot take the embedder away mid-search.
+    """
+    global _loaded  # noqa: PLW0603
+    if settings.rag_index_uri is None:
+        return None
+
+    with _lock:
+        if _loaded is None:
+            embedder = get_embedder(settings.rag_embedder, settings.rag_embedding_model)
+            index = load_index(settings.rag_index_uri)
+            if index.model_name and index.model_name != embedder.model_name:
+                msg = (
+                    f"RAG index was built with {index.model_name!r} but "
+                    f"queries would be embedded with {embedder.model_name!r}"
+                )
+                raise ValueError(msg)
+            if settings.rag_search_backend not in SEARCH_BACKENDS:
+                msg = (
+                    f"Unknown RAG search backend {settings.rag_search_backend!r}; "
+                    f"expected one of {list(SEARCH_BACKENDS)}"
+                )
+                raise ValueError(msg)
+            if settings.rag_search_mode not in SEARCH_MODES:
+                msg = (
+                    f"Unknown RAG search mode {settings.rag_search_mode!r}; "
+                    f"expected one of {list(SEARCH_MODES)}"
+                )
+                raise ValueError(msg)
+            if settings.rag_search_mode == "hybrid" and index.bm25 is None:
+                msg = (
+                    "RAG_SEARCH_MODE is 'hybrid' but the index has no BM25 "
+                    "postings; rebuild it or upload a document to add them"
+                )
+                raise ValueError(msg)
+            if settings.rag_search_backend == "ivf" and index.ivf is None:
+                msg = "RAG_SEARCH_BACKEND is 'ivf' but the index has no IVF lists"
+                raise ValueError(msg)
+            store = index.store
+            if (
+                settings.rag_rescore_candidates
+                and store.quantization != "float32"
+                and store.full is None
+            ):
+                msg = (
+                    "RAG_RESCORE_CANDIDATES needs full-precision vectors, but the "
+                    f"{store.quantization} index was saved without them"
+                )
+                raise ValueError(msg)
+            _loaded = (index, embedder)
+        return _loaded
+
+
+def reset_index() -> None:
+    """Drop the loaded index so the next search reloads it (used by tests)."""
+    global _loaded  # noqa: PLW0603
+    with _lock:
+        _loaded = None
 
 
 def search_knowledge_base(
@@ -14,34 +124,61 @@ def search_knowledge_base(
 ) -> list[dict]:
     """Search the unified knowledge base with optional metadata filtering.
 
+    In hybrid mode (settings.rag_search_mode) a BM25 keyword search runs in a
+    worker thread while the query is embedded and vectors are scored; the
+    top settings.rag_hybrid_candidates of each are merged by weighted
+    reciprocal rank fusion, so exact terms such as "ISO 22301" or "RPO" are
+    found even when their embeddings are not close to the query's.
+
     Args:
         query: Search query
-        metadata_filter: Optional metadata filters (e.g., {"offering": ["app-rationalization"]})
+        metadata_filter: Optional metadata filters (e.g., {"offering": ["app-rationalization"]});
+            keys are ANDed, lists mean IN, and "$and"/"$or" take nested filters
         top_k: Number of results to return
 
     Returns:
-        List of search results with content and metadata
-
-    TODO: Implement actual vector search
-    - Embed query using Bedrock embeddings
-    - Search vector database (OpenSearch, Pinecone, or S3 + local vector store)
-    - Filter by metadata
-    - Return ranked results
+        List of search results with id, source, content, metadata and score
+        (cosine similarity, or in hybrid mode the fused score in [0, 1]),
+        best first; empty if no index is configured
 
     """
-    # Placeholder implementation
-    # In production, this would:
-    # 1. Use Bedrock to embed the query
-    # 2. Search vector database
-    # 3. Apply metadata filters
-    # 4. Return top-k results with sources
+    loaded = _load()
+    if loaded is None or not len(loaded[0]):
+        return []
+    index, embedder = loaded
 
-    s3 = boto3.client("s3", region_name=settings.aws_region)
+    if settings.rag_search_mode != "hybrid":
+        results = _vector_search(index, embedder, query, top_k, metadata_filter)
+        return [result.model_dump() for result in results]
 
-    # TODO: Implement actual search logic
-    results = []
+    depth = max(top_k, settings.rag_hybrid_candidates)
+    keyword = _keyword_pool.submit(index.keyword_search, query, depth, metadata_filter)
+    vector = _vector_search(index, embedder, query, depth, metadata_filter)
+    fused = reciprocal_rank_fusion(
+        [vector, keyword.result()],
+        [settings.rag_hybrid_vector_weight, settings.rag_hybrid_keyword_weight],
+        settings.rag_rrf_k,
+    )
+    return [result.model_dump() for result in fused[:top_k]]
 
-    return results
+
+def _vector_search(
+    index: VectorIndex,
+    embedder: Embedder,
+    query: str,
+    top_k: int,
+    metadata_filter: dict[str, Any] | None,
+) -> list[SearchResult]:
+    """Embed the query and search the index with the configured backend."""
+    query_vector = embedder.embed([query])[0]
+    nprobe = settings.rag_ivf_nprobe if settings.rag_search_backend == "ivf" else None
+    return index.search(
+        query_vector,
+        top_k,
+        metadata_filter,
+        nprobe,
+        rescore=settings.rag_rescore_candidates,
+    )
 
 
 def upload_document_to_rag(
@@ -52,24 +189,86 @@ def upload_document_to_rag(
 ) -> bool:
     """Upload a document to the RAG knowledge base.
 
+    The document is chunked and only chunks whose text is not already in the
+    index are embedded (see :func:`easibot.retrieval.ingest_document`), so
+    re-uploading an unchanged document costs no embedding calls. The index
+    is updated in place and saved back to settings.rag_index_uri; for an S3
+    index the raw document is also stored in settings.rag_bucket_name under
+    ``documents/<offering>/<document_name>``.
+
+    Writers in different processes take turns: an S3 index is updated under
+    its writer lock (see :func:`easibot.retrieval.writer_lock`), and the
+    manifest is written only if no one else changed it since it was
+    downloaded. If someone did (a writer whose lease ran out), the update is
+    made again on top of their version, up to WRITE_ATTEMPTS times.
+
     Args:
         document_content: Document text content
-        document_name: Name/identifier for the document
+        document_name: Name/identifier for the document; uploading the same
+            name again replaces the previous version
         offering: Offering category (for metadata filtering)
         metadata: Additional metadata
 
     Returns:
-        True if successful
+        True if the document was ingested, False if no index is configured
 
-    TODO: Implement document upload and embedding
+    Raises:
+        ValueError: If the index was built with a different embedding model
+        IndexConflictError: If the index kept changing for WRITE_ATTEMPTS tries
+        TimeoutError: If another writer held the index's lock for
+            settings.rag_writer_lease_seconds
 
     """
-    s3 = boto3.client("s3", region_name=settings.aws_region)
+    uri = settings.rag_index_uri
+    if uri is None:
+        return False
+
+    embedder = get_embedder(settings.rag_embedder, settings.rag_embedding_model)
+    document = Document(
+        name=document_name,
+        content=document_content,
+        offering=offering,
+        metadata=metadata or {},
+    )
+    # Searches keep using the loaded index meanwhile; only the writer lock
+    # is held while the document is embedded and the index saved
+    for attempt in range(1, WRITE_ATTEMPTS + 1):
+        try:
+            with writer_lock(uri, settings.rag_writer_lease_seconds):
+                _ingest(uri, embedder, document)
+            break
+        except IndexConflictError:
+            if attempt == WRITE_ATTEMPTS:
+                raise
+    if uri.startswith("s3://"):
+        s3 = boto3.client("s3", region_name=settings.aws_region)
+        s3.put_object(
+            Bucket=settings.rag_bucket_name,
+            Key=f"documents/{offering}/{document_name}",
+            Body=document_content.encode(),
+        )
+
+    reset_index()
+    return True
 
-    # TODO: Implement document upload logic
-    # 1. Chunk the document
-    # 2. Embed each chunk
-    # 3. Store in vector database with metadata
-    # 4. Store raw document in S3
 
-    return False
+def _ingest(uri: str, embedder: Embedder, document: Document) -> None:
+    """Add a document to the index at uri and save it back if it changed."""
+    local = fetch_index(uri)
+    index = (
+        VectorIndex.load(local)
+        if local is not None
+        else VectorIndex(np.zeros((0, 0), dtype=np.float32), [], embedder.model_name)
+    )
+    result = ingest_document(
+        index,
+        embedder,
+        document,
+        max_chars=settings.rag_chunk_chars,
+        batch_size=settings.rag_embed_batch_size,
+    )
+    if result.changed:
+        local = local or local_index_dir(uri)
+        index.save(local)
+        if uri.startswith("s3://"):
+            upload_index(local, uri)